@@ -0,0 +1,25 @@
+"""
+관리자 API 인증 모듈
+
+이 모듈은 관리자 전용 엔드포인트와 기능(요청 프로파일링 등)의 접근을 제어합니다.
+ADMIN_TOKEN이 설정되어 있고 요청의 X-Admin-Token 헤더가 일치할 때만 허용합니다.
+"""
+import hmac
+from typing import Optional
+
+from fastapi import Header
+
+from app.core.config import settings
+from app.core.exceptions import AdminAuthError
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """관리자 토큰 확인 (ADMIN_TOKEN이 비어 있으면 항상 False)"""
+    if not settings.ADMIN_TOKEN or not token:
+        return False
+    # 비교 시간으로 토큰이 추측되지 않도록 상수 시간 비교
+    return hmac.compare_digest(token.encode("utf-8"), settings.ADMIN_TOKEN.encode("utf-8"))
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """관리자 엔드포인트 의존성 (토큰이 없거나 다르면 403)"""
+    if not is_admin_token(x_admin_token):
+        raise AdminAuthError()
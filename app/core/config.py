@@ -25,13 +25,19 @@ class Settings:
     ELASTICSEARCH_HOST: str = os.getenv("ELASTICSEARCH_HOST", "localhost")
     ELASTICSEARCH_PORT: int = int(os.getenv("ELASTICSEARCH_PORT", "9200"))
     ELASTICSEARCH_INDEX: str = os.getenv("ELASTICSEARCH_INDEX", "trademarks")
-    
+
+    # 비동기 Elasticsearch 클라이언트 커넥션 풀 설정
+    ES_MAX_CONNECTIONS: int = int(os.getenv("ES_MAX_CONNECTIONS", "50"))
+    ES_REQUEST_TIMEOUT: int = int(os.getenv("ES_REQUEST_TIMEOUT", "10"))
+    ES_MAX_RETRIES: int = int(os.getenv("ES_MAX_RETRIES", "3"))
+    ES_RETRY_ON_TIMEOUT: bool = os.getenv("ES_RETRY_ON_TIMEOUT", "true").lower() == "true"
+
     def __init__(self):
         # 디버깅: 실제 설정된 값 확인
         print(f"[DEBUG] Settings.ELASTICSEARCH_HOST: {self.ELASTICSEARCH_HOST}")
         print(f"[DEBUG] Settings.ELASTICSEARCH_PORT: {self.ELASTICSEARCH_PORT}")
     
-    # DB 초기화 설정 (create, update, none)
+    # DB 초기화 설정 (create, update, delta, none)
     DB_INIT_MODE: str = os.getenv("DB_INIT_MODE", "create")
     
     # 데이터 로드 설정 (auto, manual)
@@ -39,7 +45,119 @@ class Settings:
     
     # 데이터 파일 경로
     DATA_FILE_PATH: str = os.getenv("DATA_FILE_PATH", "data/trademark_sample.json")
-    
+
+    # 데이터 적재(벌크 색인) 설정
+    INGEST_STREAMING: bool = os.getenv("INGEST_STREAMING", "true").lower() == "true"
+    INGEST_CHUNK_SIZE: int = int(os.getenv("INGEST_CHUNK_SIZE", "500"))
+    INGEST_MAX_CHUNK_BYTES: int = int(os.getenv("INGEST_MAX_CHUNK_BYTES", str(10 * 1024 * 1024)))
+    INGEST_THREAD_COUNT: int = int(os.getenv("INGEST_THREAD_COUNT", "1"))
+    # 전처리 작업 프로세스 수 (2 이상이면 ProcessPoolExecutor로 병렬 전처리)
+    INGEST_PREPROCESS_WORKERS: int = int(os.getenv("INGEST_PREPROCESS_WORKERS", "1"))
+    INGEST_PREPROCESS_BATCH_SIZE: int = int(os.getenv("INGEST_PREPROCESS_BATCH_SIZE", "200"))
+    INGEST_PREPROCESS_QUEUE_SIZE: int = int(os.getenv("INGEST_PREPROCESS_QUEUE_SIZE", "8"))
+
+    # 인덱스 버전 관리 (ELASTICSEARCH_INDEX 별칭 뒤의 '{이름}_v{n}' 물리 인덱스)
+    # 별칭 전환 후 롤백용으로 남길 이전 버전 수
+    INDEX_RETAINED_VERSIONS: int = int(os.getenv("INDEX_RETAINED_VERSIONS", "1"))
+    # 새 버전 적재 후 병합할 세그먼트 수 (0이면 병합하지 않음)
+    INDEX_FORCE_MERGE_SEGMENTS: int = int(os.getenv("INDEX_FORCE_MERGE_SEGMENTS", "1"))
+
+    # 벌크 적재 모드 (적재 중 refresh 중지, 복제본 0, 종료 시 원래 설정 복원)
+    INGEST_BULK_LOAD_MODE: bool = os.getenv("INGEST_BULK_LOAD_MODE", "true").lower() == "true"
+    # 적재 중 translog 비동기 기록 (노드 장애 시 마지막 sync 이후 적재분 유실 가능)
+    INGEST_TRANSLOG_ASYNC: bool = os.getenv("INGEST_TRANSLOG_ASYNC", "false").lower() == "true"
+
+    # 증분 적재 (DB_INIT_MODE=delta) 시 새 파일에 없는 문서 삭제 여부
+    INGEST_DELTA_DELETE_MISSING: bool = os.getenv("INGEST_DELTA_DELETE_MISSING", "false").lower() == "true"
+
+    # 백그라운드 적재 작업 (작업 상태/체크포인트 저장 경로, 체크포인트 저장 간격(문서 수))
+    INGEST_JOB_DIR: str = os.getenv("INGEST_JOB_DIR", "data/ingest_jobs")
+    INGEST_CHECKPOINT_INTERVAL: int = int(os.getenv("INGEST_CHECKPOINT_INTERVAL", "5000"))
+
+    # pid 시퀀스 설정 (블록 단위 임대)
+    PID_SEQUENCE_INDEX: str = os.getenv("PID_SEQUENCE_INDEX", "trademark_sequences")
+    PID_BLOCK_SIZE: int = int(os.getenv("PID_BLOCK_SIZE", "10000"))
+
+    # 조회수 쓰기 지연(write-behind) 버퍼 설정
+    VIEW_COUNT_FLUSH_INTERVAL: float = float(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", "5"))
+    VIEW_COUNT_MAX_PENDING: int = int(os.getenv("VIEW_COUNT_MAX_PENDING", "1000"))
+
+    # 상세 조회 시 _id GET 실패하면 출원번호 term 검색으로 재조회 (자동 생성 _id를 쓰는 기존 인덱스 호환)
+    DETAIL_LEGACY_LOOKUP: bool = os.getenv("DETAIL_LEGACY_LOOKUP", "true").lower() == "true"
+    # 일괄 상세 조회 설정 (요청당 최대 출원번호 수, mget 요청당 출원번호 수)
+    DETAIL_BATCH_MAX_SIZE: int = int(os.getenv("DETAIL_BATCH_MAX_SIZE", "5000"))
+    DETAIL_BATCH_CHUNK_SIZE: int = int(os.getenv("DETAIL_BATCH_CHUNK_SIZE", "500"))
+
+    # 검색 결과 캐시 설정 (LRU + TTL, 메모리 상한은 바이트 단위)
+    SEARCH_CACHE_ENABLED: bool = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    SEARCH_CACHE_TTL_SECONDS: float = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "60"))
+    SEARCH_CACHE_MAX_BYTES: int = int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+    # 커서 페이지네이션 PIT(point in time) 유지 시간 (다음 페이지 요청까지)
+    SEARCH_CURSOR_KEEP_ALIVE: str = os.getenv("SEARCH_CURSOR_KEEP_ALIVE", "2m")
+
+    # 검색 결과 내보내기 설정 (병렬 slice 수, slice당 요청 크기, PIT 유지 시간)
+    EXPORT_SLICES: int = int(os.getenv("EXPORT_SLICES", "4"))
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+    EXPORT_KEEP_ALIVE: str = os.getenv("EXPORT_KEEP_ALIVE", "5m")
+
+    # 동일한 동시 검색/자동완성 요청 병합(single-flight) 사용 여부
+    SINGLE_FLIGHT_ENABLED: bool = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+
+    # 일괄 검색 설정 (요청당 최대 검색 조건 수, Elasticsearch 내부 동시 실행 수)
+    BATCH_SEARCH_MAX_QUERIES: int = int(os.getenv("BATCH_SEARCH_MAX_QUERIES", "100"))
+    BATCH_SEARCH_MAX_CONCURRENT: int = int(os.getenv("BATCH_SEARCH_MAX_CONCURRENT", "8"))
+
+    # 메모리 자동완성 인덱스 사용 여부 (결과가 없을 때만 Elasticsearch 퍼지 검색)
+    AUTOCOMPLETE_INDEX_ENABLED: bool = os.getenv("AUTOCOMPLETE_INDEX_ENABLED", "true").lower() == "true"
+    # 메모리 자동완성 인덱스 유효 시간(초, 0이면 만료 없음). 다른 워커/프로세스의 재적재나 별칭 전환은
+    # 이 프로세스의 검색 캐시 세대를 바꾸지 않으므로, 만료되면 Elasticsearch를 사용하면서 백그라운드에서 재빌드
+    AUTOCOMPLETE_INDEX_TTL: float = float(os.getenv("AUTOCOMPLETE_INDEX_TTL", "300"))
+
+    # 영문 발음 변환(g2pk) 결과 영구 캐시 설정
+    PRONUNCIATION_CACHE_ENABLED: bool = os.getenv("PRONUNCIATION_CACHE_ENABLED", "true").lower() == "true"
+    PRONUNCIATION_CACHE_PATH: str = os.getenv("PRONUNCIATION_CACHE_PATH", "data/pronunciation_cache.sqlite3")
+    PRONUNCIATION_MEMORY_CACHE_SIZE: int = int(os.getenv("PRONUNCIATION_MEMORY_CACHE_SIZE", "50000"))
+
+    # 영문 발음 사전 설정 (파일 변경 확인 간격, 초)
+    PRONUNCIATION_DICT_PATH: str = os.getenv("PRONUNCIATION_DICT_PATH", "data/pronunciation_dict.json")
+    PRONUNCIATION_DICT_RELOAD_INTERVAL: float = float(os.getenv("PRONUNCIATION_DICT_RELOAD_INTERVAL", "5.0"))
+
+    # 로그 설정 (레벨, JSON Lines 로그 파일 경로/보관 기간, 파일 기록 스레드의 한 번 기록 최대 건수)
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
+    LOG_DIR: str = os.getenv("LOG_DIR", "logs")
+    LOG_RETENTION_DAYS: int = int(os.getenv("LOG_RETENTION_DAYS", "30"))
+    LOG_BATCH_SIZE: int = int(os.getenv("LOG_BATCH_SIZE", "512"))
+    # 로거별 WARNING 미만 로그 샘플링 비율 ('로거=비율,로거=비율', 하위 모듈 포함, 기본값은 샘플링하지 않음)
+    LOG_SAMPLE_RATES: str = os.getenv("LOG_SAMPLE_RATES", "")
+    # 호출이 많은 요청(검색, 자동완성, 상세 조회)의 요청/완료 INFO 로그를 남길 비율
+    HOT_PATH_LOG_SAMPLE_RATE: float = float(os.getenv("HOT_PATH_LOG_SAMPLE_RATE", "0.1"))
+
+    # 요청 로그 샘플링 (완료 로그를 남길 비율, 느린 요청(ms 이상)과 5xx 응답은 항상 기록)
+    REQUEST_LOG_SAMPLE_RATE: float = float(os.getenv("REQUEST_LOG_SAMPLE_RATE", "0.1"))
+    REQUEST_SLOW_LOG_MS: float = float(os.getenv("REQUEST_SLOW_LOG_MS", "500"))
+
+    # Prometheus 지표 수집 및 /metrics 노출 여부
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    # 멀티프로세스 지표 디렉토리 (uvicorn 워커가 여러 개면 지정, 서버 시작 전에 비워야 함)
+    PROMETHEUS_MULTIPROC_DIR: str = os.getenv("PROMETHEUS_MULTIPROC_DIR", "")
+
+    # 관리자 API 토큰 (X-Admin-Token 헤더로 전달, 비어 있으면 관리자 API/프로파일링 비활성화)
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")
+
+    # 요청 단위 프로파일링 (관리자 토큰과 함께 X-Profile: true 헤더 또는 profile=true 쿼리로 요청)
+    # 보관할 보고서 수, 보고서에 남길 Python 함수 수
+    PROFILING_ENABLED: bool = os.getenv("PROFILING_ENABLED", "true").lower() == "true"
+    PROFILE_MAX_REPORTS: int = int(os.getenv("PROFILE_MAX_REPORTS", "50"))
+    PROFILE_TOP_FUNCTIONS: int = int(os.getenv("PROFILE_TOP_FUNCTIONS", "30"))
+
+    # 느린 쿼리 로그 (검색 쿼리 형태(지문)별 처리 시간 통계, 기준(ms) 이상 걸린 검색은 로그로 기록)
+    SLOW_QUERY_LOG_ENABLED: bool = os.getenv("SLOW_QUERY_LOG_ENABLED", "true").lower() == "true"
+    SLOW_QUERY_THRESHOLD_MS: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+    # 보관할 쿼리 지문 수, 지문별 백분위 계산에 쓰는 최근 처리 시간 수
+    SLOW_QUERY_MAX_FINGERPRINTS: int = int(os.getenv("SLOW_QUERY_MAX_FINGERPRINTS", "200"))
+    SLOW_QUERY_SAMPLE_SIZE: int = int(os.getenv("SLOW_QUERY_SAMPLE_SIZE", "1000"))
+
     # 페이징 기본값 설정
     DEFAULT_PAGE_SIZE: int = 10
     MAX_PAGE_SIZE: int = 100
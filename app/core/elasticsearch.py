@@ -1,13 +1,25 @@
-from elasticsearch import Elasticsearch
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from elasticsearch import Elasticsearch, AsyncElasticsearch, AsyncTransport
 from app.core.config import settings
+from app.core.metrics import STAGE_ES_ROUND_TRIP, STAGE_ES_TOOK, current_route, es_endpoint, observe_stage, record_es_error
+from app.core.request_context import get_request_id
+from app.core.slow_query_log import slow_query_log
 import logging
 
 logger = logging.getLogger(__name__)
 
 def get_elasticsearch_client() -> Elasticsearch:
-    """Elasticsearch 클라이언트 연결 설정 및 반환"""
+    """Elasticsearch 클라이언트 연결 설정 및 반환
+
+    동기 클라이언트는 인덱스 생성, 데이터 적재 등 스크립트성 작업 전용입니다.
+    요청 처리 경로에서는 get_async_es_client()를 사용합니다.
+    """
     es_host = f"http://{settings.ELASTICSEARCH_HOST}:{settings.ELASTICSEARCH_PORT}"
-    
+
     try:
         es_client = Elasticsearch([es_host])
         info = es_client.info()
@@ -17,5 +29,119 @@ def get_elasticsearch_client() -> Elasticsearch:
         logger.error(f"Elasticsearch 연결 실패: {str(e)}")
         raise e
 
-# 글로벌 Elasticsearch 클라이언트 인스턴스
-es_client = get_elasticsearch_client()
\ No newline at end of file
+class MetricsAsyncTransport(AsyncTransport):
+    """요청마다 Elasticsearch 왕복 시간, 응답의 took, 오류를 지표로 기록하고 검색 요청은 느린 쿼리 로그에 기록하는 비동기 트랜스포트"""
+
+    async def perform_request(self, method, url, headers=None, params=None, body=None):
+        start = time.perf_counter()
+        try:
+            response = await super().perform_request(method, url, headers=headers, params=params, body=body)
+        except Exception as e:
+            record_es_error(es_endpoint(url), e)
+            raise
+
+        elapsed = time.perf_counter() - start
+        took = response.get("took") if isinstance(response, dict) else None
+        observe_stage(STAGE_ES_ROUND_TRIP, elapsed)
+        if took is not None:
+            observe_stage(STAGE_ES_TOOK, took / 1000)
+
+        # 검색 요청 본문은 직렬화 전 dict로 전달됨
+        if settings.SLOW_QUERY_LOG_ENABLED and isinstance(body, dict) and es_endpoint(url) == "_search":
+            slow_query_log.record(_search_index(url), body, elapsed, took, current_route(), get_request_id())
+        return response
+
+def _search_index(url: str) -> Optional[str]:
+    """검색 요청 경로의 인덱스(별칭) 부분 (PIT 검색처럼 경로에 인덱스가 없으면 None)"""
+    target = url.split("?", 1)[0].lstrip("/").split("/", 1)[0]
+    return None if not target or target.startswith("_") else target
+
+def create_async_elasticsearch_client() -> AsyncElasticsearch:
+    """비동기 Elasticsearch 클라이언트 생성
+
+    aiohttp 기반 커넥션 풀을 사용하며, 노드당 최대 연결 수(maxsize)와
+    타임아웃/재시도 정책은 설정값(ES_MAX_CONNECTIONS 등)으로 조정합니다.
+    METRICS_ENABLED이면 요청마다 왕복 시간/took/오류를 지표로 기록하고,
+    SLOW_QUERY_LOG_ENABLED이면 검색 요청을 쿼리 지문별 처리 시간 통계(느린 쿼리 로그)에 기록합니다.
+    """
+    es_host = f"http://{settings.ELASTICSEARCH_HOST}:{settings.ELASTICSEARCH_PORT}"
+
+    return AsyncElasticsearch(
+        [es_host],
+        maxsize=settings.ES_MAX_CONNECTIONS,
+        timeout=settings.ES_REQUEST_TIMEOUT,
+        max_retries=settings.ES_MAX_RETRIES,
+        retry_on_timeout=settings.ES_RETRY_ON_TIMEOUT,
+        transport_class=(
+            MetricsAsyncTransport
+            if settings.METRICS_ENABLED or settings.SLOW_QUERY_LOG_ENABLED
+            else AsyncTransport
+        )
+    )
+
+# 비동기 클라이언트와 클라이언트가 생성된 이벤트 루프
+_async_es_client: Optional[AsyncElasticsearch] = None
+_async_es_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_async_es_client() -> AsyncElasticsearch:
+    """요청 처리 경로에서 사용할 비동기 Elasticsearch 클라이언트 반환
+
+    aiohttp 세션은 생성된 이벤트 루프에 묶이므로, 실행 중인 루프가 바뀐 경우
+    (테스트 클라이언트 등) 새 클라이언트를 생성하고 이전 클라이언트는 이전 루프에서 닫습니다.
+    마지막 클라이언트는 루프를 종료하기 전에 close_async_es_client()로 닫아야 합니다.
+    """
+    global _async_es_client, _async_es_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_es_client is None or _async_es_loop is not loop:
+        if _async_es_client is not None:
+            _close_on_loop(_async_es_client, _async_es_loop)
+
+        _async_es_client = create_async_elasticsearch_client()
+        _async_es_loop = loop
+        logger.info(f"비동기 Elasticsearch 클라이언트 생성 (maxsize={settings.ES_MAX_CONNECTIONS})")
+
+    return _async_es_client
+
+def _close_on_loop(client: AsyncElasticsearch, loop: asyncio.AbstractEventLoop):
+    """이전 루프의 클라이언트 종료 예약 (aiohttp 세션은 생성된 루프에서만 닫을 수 있음)"""
+    if loop.is_closed():
+        logger.warning("비동기 Elasticsearch 클라이언트를 닫기 전에 이벤트 루프가 종료됨")
+        return
+    loop.call_soon_threadsafe(loop.create_task, client.close())
+
+async def close_async_es_client():
+    """비동기 Elasticsearch 클라이언트 연결 종료"""
+    global _async_es_client, _async_es_loop
+
+    if _async_es_client is not None:
+        await _async_es_client.close()
+        logger.info("비동기 Elasticsearch 클라이언트 연결 종료")
+
+    _async_es_client = None
+    _async_es_loop = None
+
+class LazyElasticsearch:
+    """
+    처음 사용할 때 연결하는 동기 Elasticsearch 클라이언트
+
+    임포트만으로 연결(info 호출)하지 않으므로, 병렬 전처리 작업 프로세스처럼
+    Elasticsearch를 사용하지 않으면서 앱 모듈을 임포트하는 프로세스는 연결하지 않습니다.
+    """
+
+    def __init__(self):
+        self._client: Optional[Elasticsearch] = None
+        self._lock = threading.Lock()
+
+    def _get_client(self) -> Elasticsearch:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = get_elasticsearch_client()
+        return self._client
+
+    def __getattr__(self, name):
+        return getattr(self._get_client(), name)
+
+# 글로벌 Elasticsearch 클라이언트 인스턴스 (스크립트/데이터 적재용)
+es_client = LazyElasticsearch()
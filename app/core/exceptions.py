@@ -38,6 +38,12 @@ class SearchQueryError(TrademarkAPIException):
         super().__init__(status_code=400, detail=detail)
 
 
+class InvalidCursorError(TrademarkAPIException):
+    """잘못되었거나 만료된 커서 오류"""
+    def __init__(self, detail: str = "유효하지 않은 커서입니다"):
+        super().__init__(status_code=400, detail=detail)
+
+
 class InvalidParameterError(TrademarkAPIException):
     """잘못된 매개변수 오류"""
     def __init__(self, detail: str = "유효하지 않은 매개변수입니다"):
@@ -50,4 +56,34 @@ class FileNotFoundError(TrademarkAPIException):
         super().__init__(
             status_code=404, 
             detail=f"파일 '{file_path}'를 찾을 수 없습니다"
-        )
\ No newline at end of file
+        )
+
+
+class IngestJobNotFoundError(TrademarkAPIException):
+    """적재 작업을 찾을 수 없음 오류"""
+    def __init__(self, job_id: str):
+        super().__init__(
+            status_code=404,
+            detail=f"적재 작업 '{job_id}'를 찾을 수 없습니다"
+        )
+
+
+class IngestJobConflictError(TrademarkAPIException):
+    """적재 작업 상태 충돌 오류 (실행 중인 작업이 있거나 재개/취소할 수 없는 상태)"""
+    def __init__(self, detail: str = "적재 작업을 처리할 수 없는 상태입니다"):
+        super().__init__(status_code=409, detail=detail)
+
+
+class AdminAuthError(TrademarkAPIException):
+    """관리자 인증 실패 오류 (관리자 토큰이 없거나 일치하지 않음)"""
+    def __init__(self, detail: str = "관리자 권한이 필요합니다"):
+        super().__init__(status_code=403, detail=detail)
+
+
+class ProfileReportNotFoundError(TrademarkAPIException):
+    """프로파일 보고서를 찾을 수 없음 오류"""
+    def __init__(self, request_id: str):
+        super().__init__(
+            status_code=404,
+            detail=f"요청 '{request_id}'의 프로파일 보고서를 찾을 수 없습니다"
+        )
@@ -2,24 +2,236 @@
 로깅 설정 모듈
 
 이 모듈은 애플리케이션 전체의 로깅을 설정합니다.
+
+- 콘솔 출력과 JSON Lines 파일 하나(BatchedJsonSink)만 사용합니다.
+  에러/성능 로그는 같은 파일에서 level, extra.performance 필드로 구분합니다.
+- 로그 레벨(LOG_LEVEL)보다 낮은 호출은 loguru가 메시지를 만들기 전에 버리므로,
+  자주 호출되는 경로의 debug 로그는 f-string 대신 logger.debug("... {}", 값) 형식으로 작성합니다.
+- 호출이 많은 지점은 get_sampled_logger()(logger.bind(sample_rate=...))로, 로거 전체는 LOG_SAMPLE_RATES로
+  WARNING 미만 로그를 샘플링합니다. 샘플링 여부는 패처에서 레코드마다 한 번 정하므로 콘솔과 파일에 같은 로그가 남습니다.
 """
+import glob
+import json
+import os
+import queue
+import random
 import sys
+import threading
+import traceback
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
 from loguru import logger
-from datetime import datetime
-import os
+
+from app.core.config import settings
+from app.core.request_context import request_id_var
+
+# 샘플링하지 않는 최소 레벨 (WARNING 이상은 항상 기록)
+_SAMPLING_MAX_LEVEL_NO = 30
+
+# 샘플링 결정을 담는 extra 키 (파일 로그에는 기록하지 않음)
+_SAMPLED_KEY = "_sampled"
+
+# 파일 기록 스레드 종료 신호
+_STOP = object()
+
+
+class BatchedJsonSink:
+    """
+    백그라운드 스레드에서 로그를 모아서 기록하는 JSON Lines 파일 싱크
+
+    로그를 호출한 스레드는 레코드 필드를 큐에 넣기만 하고, JSON 직렬화와 파일 쓰기는
+    기록 스레드가 큐에 쌓인 레코드를 batch_size개까지 모아 한 번에 처리합니다.
+    파일은 날짜별('{prefix}_YYYYMMDD.jsonl')로 바뀌며 retention_days가 지난 파일은 삭제합니다.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = "trademark_api",
+        batch_size: int = 512,
+        retention_days: int = 30
+    ):
+        self.directory = directory
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.retention_days = retention_days
+
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._file = None
+        self._file_date: Optional[str] = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, message):
+        """loguru 싱크 인터페이스 (호출 스레드에서는 큐에 넣기만 함)"""
+        record = message.record
+        self._queue.put((
+            record["time"],
+            record["level"].name,
+            record["name"],
+            record["function"],
+            record["line"],
+            record["message"],
+            record["extra"],
+            record["exception"]
+        ))
+
+    def stop(self):
+        """남은 로그를 모두 기록하고 기록 스레드 종료 (logger.remove() 시 호출됨)"""
+        self._queue.put(_STOP)
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            # 기록하는 동안 쌓인 레코드를 한 번에 처리
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if batch[-1] is _STOP:
+                batch.pop()
+                stopping = True
+            elif _STOP in batch:
+                stopping = True
+                batch = [item for item in batch if item is not _STOP]
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                sys.stderr.write(f"로그 파일 기록 실패: {str(e)}\n")
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write_batch(self, batch: List[tuple]):
+        lines: Dict[str, List[str]] = {}
+        for time, level, name, function, line, message, extra, exception in batch:
+            entry: Dict[str, Any] = {
+                "time": time.isoformat(timespec="milliseconds"),
+                "level": level,
+                "request_id": extra.get("request_id"),
+                "logger": name,
+                "function": function,
+                "line": line,
+                "message": message
+            }
+            other = {key: value for key, value in extra.items() if key not in ("request_id", _SAMPLED_KEY)}
+            if other:
+                entry["extra"] = other
+            if exception is not None:
+                entry["exception"] = "".join(
+                    traceback.format_exception(exception.type, exception.value, exception.traceback)
+                )
+            lines.setdefault(time.strftime("%Y%m%d"), []).append(
+                json.dumps(entry, ensure_ascii=False, default=str)
+            )
+
+        for file_date, date_lines in lines.items():
+            f = self._open(file_date)
+            f.write("\n".join(date_lines) + "\n")
+            f.flush()
+
+    def _open(self, file_date: str):
+        if self._file is None or file_date != self._file_date:
+            if self._file is not None:
+                self._file.close()
+            path = os.path.join(self.directory, f"{self.prefix}_{file_date}.jsonl")
+            self._file = open(path, "a", encoding="utf-8")
+            self._file_date = file_date
+            self._remove_expired()
+        return self._file
+
+    def _remove_expired(self):
+        """보관 기간이 지난 로그 파일 삭제"""
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).strftime("%Y%m%d")
+        for path in glob.glob(os.path.join(self.directory, f"{self.prefix}_*.jsonl")):
+            file_date = os.path.basename(path)[len(self.prefix) + 1:-len(".jsonl")]
+            if file_date.isdigit() and file_date < cutoff:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+class LogSampler:
+    """
+    로거별 로그 샘플링 필터
+
+    WARNING 미만 로그를 로거(모듈) 이름별 비율로 남깁니다. 하위 모듈은 가장 가까운 상위 이름의 비율을 따르며,
+    logger.bind(sample_rate=...)로 지정한 비율이 있으면 그 값을 우선합니다.
+    남길지 여부는 패처에서 decide()로 레코드마다 한 번 정하고, 싱크별 필터(__call__)는 그 결정을 따릅니다.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        self.rates = rates
+        self._resolved: Dict[str, Optional[float]] = {}
+
+    @classmethod
+    def from_setting(cls, value: str) -> "LogSampler":
+        """'로거=비율,로거=비율' 형식의 설정값 해석"""
+        rates = {}
+        for item in value.split(","):
+            name, _, rate = item.strip().partition("=")
+            if name and rate:
+                rates[name.strip()] = float(rate)
+        return cls(rates)
+
+    def decide(self, record):
+        """레코드를 남길지 정하여 extra에 기록 (모든 싱크가 같은 결정을 따르도록 패처에서 호출)"""
+        record["extra"][_SAMPLED_KEY] = self._keep(record)
+
+    def __call__(self, record) -> bool:
+        keep = record["extra"].get(_SAMPLED_KEY)
+        return self._keep(record) if keep is None else keep
+
+    def _keep(self, record) -> bool:
+        if record["level"].no >= _SAMPLING_MAX_LEVEL_NO:
+            return True
+
+        rate = record["extra"].get("sample_rate")
+        if rate is None:
+            rate = self._rate_for(record["name"])
+        return rate is None or random.random() < rate
+
+    def _rate_for(self, name: Optional[str]) -> Optional[float]:
+        if name in self._resolved:
+            return self._resolved[name]
+
+        rate = None
+        candidate = name or ""
+        while candidate:
+            if candidate in self.rates:
+                rate = self.rates[candidate]
+                break
+            candidate = candidate.rpartition(".")[0]
+
+        self._resolved[name] = rate
+        return rate
 
 
 def setup_logging():
     """로깅 설정 초기화"""
-    # 기존 핸들러 제거
+    # 기존 핸들러 제거 (파일 싱크는 남은 로그를 기록한 뒤 종료)
     logger.remove()
-    
-    # 로그 디렉토리 생성
-    log_dir = "logs"
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
-    # 콘솔 출력 설정 (INFO 레벨 이상)
+
+    sampler = LogSampler.from_setting(settings.LOG_SAMPLE_RATES)
+
+    def patch_record(record):
+        # 모든 로그에 현재 요청 ID 추가 (요청 밖이면 '-')하고 샘플링 여부를 한 번만 결정
+        _add_request_id(record)
+        sampler.decide(record)
+
+    logger.configure(patcher=patch_record)
+
+    # 콘솔 출력 설정
     logger.add(
         sys.stdout,
         colorize=True,
@@ -27,71 +239,31 @@ def setup_logging():
                "<level>{level: <8}</level> | "
                "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
                "<level>{message}</level>",
-        level="INFO"
+        level=settings.LOG_LEVEL,
+        filter=sampler
     )
-    
-    # 에러 콘솔 출력 설정 (ERROR 레벨 이상)
-    logger.add(
-        sys.stderr,
-        colorize=True,
-        format="<red>{time:YYYY-MM-DD HH:mm:ss.SSS}</red> | "
-               "<level>{level: <8}</level> | "
-               "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-               "<level>{message}</level>",
-        level="ERROR"
-    )
-    
-    # 일반 로그 파일 (DEBUG 레벨 이상)
+
+    # JSON Lines 로그 파일 (에러/성능 로그 포함, 백그라운드 스레드에서 모아서 기록)
     logger.add(
-        f"{log_dir}/trademark_api_{datetime.now().strftime('%Y%m%d')}.log",
-        rotation="1 day",
-        retention="30 days",
-        compression="zip",
-        format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
-        level="DEBUG",
-        enqueue=True,  # 멀티스레드 안전성
+        BatchedJsonSink(
+            settings.LOG_DIR,
+            batch_size=settings.LOG_BATCH_SIZE,
+            retention_days=settings.LOG_RETENTION_DAYS
+        ),
+        format="{message}",
+        level=settings.LOG_LEVEL,
+        filter=sampler,
         catch=True     # 예외 안전성
     )
-    
-    # 에러 전용 로그 파일 (ERROR 레벨 이상)
-    logger.add(
-        f"{log_dir}/trademark_api_error_{datetime.now().strftime('%Y%m%d')}.log",
-        rotation="1 day",
-        retention="30 days",
-        compression="zip",
-        format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
-        level="ERROR",
-        enqueue=True,
-        catch=True
-    )
-    
-    # 성능 로그 파일 (특정 로거용)
-    logger.add(
-        f"{log_dir}/trademark_api_performance_{datetime.now().strftime('%Y%m%d')}.log",
-        rotation="1 day",
-        retention="7 days",
-        compression="zip",
-        format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {message}",
-        filter=lambda record: record["extra"].get("performance", False),
-        level="INFO",
-        enqueue=True
-    )
-    
-    # 초성 검색 로그 파일 (추가)
-    logger.add(
-        f"{log_dir}/trademark_api_chosung_{datetime.now().strftime('%Y%m%d')}.log",
-        rotation="1 day",
-        retention="7 days",
-        compression="zip",
-        format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
-        filter=lambda record: "chosung" in record["message"].lower(),
-        level="DEBUG",
-        enqueue=True
-    )
-    
+
     return logger
 
 
+def _add_request_id(record):
+    """로그 레코드에 현재 요청 ID 추가"""
+    record["extra"].setdefault("request_id", request_id_var.get())
+
+
 def get_performance_logger():
     """성능 로깅을 위한 전용 로거"""
     return logger.bind(performance=True)
@@ -102,17 +274,20 @@ def get_chosung_logger():
     return logger.bind(chosung=True)
 
 
+def get_sampled_logger(sample_rate: float):
+    """WARNING 미만 로그를 sample_rate 비율로만 남기는 로거 (호출이 많은 이벤트용)"""
+    return logger.bind(sample_rate=sample_rate)
+
+
 # 로깅 레벨 설정
 def set_log_level(level: str):
     """런타임에서 로그 레벨 변경"""
     valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
     if level.upper() in valid_levels:
-        # 모든 핸들러의 레벨을 변경하거나 새로 추가
-        logger.remove()
+        # 새로운 레벨로 모든 핸들러를 다시 설정
+        settings.LOG_LEVEL = level.upper()
         setup_logging()
-        
-        # 새로운 레벨로 다시 설정
-        # 이 부분은 실제 구현에서 더 정교하게 처리해야 할 수 있음
+
         logger.info(f"로그 레벨이 {level}로 변경되었습니다.")
     else:
-        logger.warning(f"유효하지 않은 로그 레벨: {level}")
\ No newline at end of file
+        logger.warning(f"유효하지 않은 로그 레벨: {level}")
@@ -0,0 +1,262 @@
+"""
+Prometheus 메트릭 모듈
+
+이 모듈은 /metrics 엔드포인트로 노출할 지표와 수집 도구를 정의합니다.
+
+- 라우트별 요청 처리 시간/요청 수
+- 라우트별 단계 처리 시간 (쿼리 생성, Elasticsearch 왕복, Elasticsearch took, 응답 모델 검증, 직렬화)
+- 캐시 적중/미스, Elasticsearch 오류, 적재 문서 수/시간 카운터
+
+PROMETHEUS_MULTIPROC_DIR을 지정하면 prometheus_client의 멀티프로세스 모드로 동작하여
+uvicorn 워커마다 지표를 공유 디렉토리의 mmap 파일에 기록하고, /metrics는 모든 워커의 값을 합산합니다.
+이 디렉토리는 서버를 시작하기 전에 비워야 합니다 (이전 실행의 값이 합산되지 않도록).
+"""
+import asyncio
+import functools
+import os
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.core.profiling import record_profile_stage
+
+# 멀티프로세스 모드에서는 지표 생성 시 값 파일을 만들므로 prometheus_client 임포트 전에 디렉토리 준비
+if settings.PROMETHEUS_MULTIPROC_DIR:
+    os.makedirs(settings.PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess
+)
+
+# 요청 처리 시간 버킷 (초)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 단계 처리 시간 버킷 (초, 직렬화 등 짧은 단계 포함)
+STAGE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# 라우트가 정해지지 않은 요청 (404, 405 등) 및 요청 밖(적재 등)의 라벨
+UNMATCHED_ROUTE = "unmatched"
+NO_ROUTE = "none"
+
+# 단계 이름
+STAGE_QUERY_BUILD = "query_build"
+STAGE_ES_ROUND_TRIP = "es_round_trip"
+STAGE_ES_TOOK = "es_took"
+STAGE_VALIDATION = "validation"
+STAGE_SERIALIZATION = "serialization"
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "라우트별 요청 처리 시간",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS
+)
+REQUEST_COUNT = Counter(
+    "http_requests_total",
+    "라우트별 요청 수",
+    ["method", "route", "status"]
+)
+STAGE_LATENCY = Histogram(
+    "trademark_stage_duration_seconds",
+    "라우트별 단계 처리 시간",
+    ["route", "stage"],
+    buckets=STAGE_BUCKETS
+)
+CACHE_REQUESTS = Counter(
+    "trademark_cache_requests_total",
+    "캐시 조회 수",
+    ["cache", "result"]
+)
+ES_ERRORS = Counter(
+    "trademark_elasticsearch_errors_total",
+    "Elasticsearch 요청 오류 수",
+    ["endpoint", "error"]
+)
+INGEST_DOCUMENTS = Counter(
+    "trademark_ingest_documents_total",
+    "적재한 문서 수 (처리량은 rate()로 계산)",
+    ["mode", "result"]
+)
+INGEST_SECONDS = Counter(
+    "trademark_ingest_seconds_total",
+    "적재(색인)에 걸린 시간",
+    ["mode"]
+)
+
+class RouteTiming:
+    """요청 하나의 라우트와 엔드포인트 종료/직렬화 시점 (라우트 핸들러 안에서만 유효)"""
+
+    __slots__ = ("route", "endpoint_done", "render_seconds")
+
+    def __init__(self, route: str):
+        self.route = route
+        self.endpoint_done: Optional[float] = None
+        self.render_seconds: Optional[float] = None
+
+# 현재 요청의 라우트 정보 (서비스의 단계 지표에 라우트 라벨을 붙이는 데 사용)
+_route_timing: ContextVar[Optional[RouteTiming]] = ContextVar("route_timing", default=None)
+
+def current_route() -> str:
+    """현재 요청의 라우트 템플릿 (요청 밖이면 'none')"""
+    timing = _route_timing.get()
+    return timing.route if timing is not None else NO_ROUTE
+
+def observe_stage(stage: str, seconds: float):
+    """현재 라우트의 단계 처리 시간 기록 (프로파일링 중인 요청이면 보고서에도 기록)"""
+    if settings.METRICS_ENABLED:
+        STAGE_LATENCY.labels(current_route(), stage).observe(seconds)
+    record_profile_stage(stage, seconds)
+
+class stage_timer:
+    """
+    단계 처리 시간 측정 컨텍스트 관리자
+
+    사용 예:
+        with stage_timer(STAGE_QUERY_BUILD):
+            body = build_search_body(search_params)
+    """
+
+    __slots__ = ("stage", "_start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        observe_stage(self.stage, time.perf_counter() - self._start)
+        return False
+
+def record_cache(cache: str, hit: bool):
+    """캐시 적중/미스 기록"""
+    if settings.METRICS_ENABLED:
+        CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+def record_es_error(endpoint: str, error: BaseException):
+    """Elasticsearch 요청 오류 기록 (오류 종류는 예외 클래스 이름)"""
+    if settings.METRICS_ENABLED:
+        ES_ERRORS.labels(endpoint, type(error).__name__).inc()
+
+def record_ingest(mode: str, success: int, failed: int, seconds: float):
+    """적재 결과 기록"""
+    if settings.METRICS_ENABLED:
+        INGEST_DOCUMENTS.labels(mode, "success").inc(success)
+        INGEST_DOCUMENTS.labels(mode, "failed").inc(failed)
+        INGEST_SECONDS.labels(mode).inc(seconds)
+
+def record_request(method: str, route: Optional[str], status_code: int, seconds: float):
+    """요청 처리 시간 및 요청 수 기록"""
+    if settings.METRICS_ENABLED:
+        route = route or UNMATCHED_ROUTE
+        REQUEST_LATENCY.labels(method, route).observe(seconds)
+        REQUEST_COUNT.labels(method, route, str(status_code)).inc()
+
+def es_endpoint(url: str) -> str:
+    """Elasticsearch 요청 경로를 지표 라벨로 변환 (예: '/trademarks/_search' -> '_search')"""
+    for part in reversed(url.split("?", 1)[0].split("/")):
+        if part.startswith("_"):
+            return part
+    return "root" if url in ("", "/") else "index"
+
+class MetricsJSONResponse(JSONResponse):
+    """직렬화(JSON 인코딩) 시간을 현재 요청에 기록하는 JSON 응답"""
+
+    def render(self, content: Any) -> bytes:
+        timing = _route_timing.get()
+        if timing is None:
+            return super().render(content)
+
+        start = time.perf_counter()
+        body = super().render(content)
+        timing.render_seconds = time.perf_counter() - start
+        return body
+
+class MetricsRoute(APIRoute):
+    """
+    단계 지표를 수집하는 라우트
+
+    요청마다 라우트 템플릿을 컨텍스트에 기록하여 서비스의 단계 지표와 요청 지표에 라우트 라벨을 붙이고,
+    엔드포인트 반환 이후 시간을 응답 모델 검증(FastAPI의 response_model 처리)과 직렬화로 나눠 기록합니다.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, _wrap_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        if not settings.METRICS_ENABLED:
+            return handler
+
+        route = self.path_format
+
+        async def metrics_route_handler(request: Request):
+            # 요청 지표(미들웨어)에서 라우트 라벨로 사용
+            request.scope["route_path"] = route
+
+            timing = RouteTiming(route)
+            token = _route_timing.set(timing)
+            try:
+                response = await handler(request)
+            finally:
+                _route_timing.reset(token)
+
+            if timing.endpoint_done is not None and timing.render_seconds is not None:
+                after_endpoint = time.perf_counter() - timing.endpoint_done
+                validation_seconds = max(after_endpoint - timing.render_seconds, 0.0)
+                STAGE_LATENCY.labels(route, STAGE_VALIDATION).observe(validation_seconds)
+                STAGE_LATENCY.labels(route, STAGE_SERIALIZATION).observe(timing.render_seconds)
+                record_profile_stage(STAGE_VALIDATION, validation_seconds)
+                record_profile_stage(STAGE_SERIALIZATION, timing.render_seconds)
+            return response
+
+        return metrics_route_handler
+
+def _wrap_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """엔드포인트 종료 시점을 기록하는 래퍼 (시그니처는 그대로 유지되어 매개변수 해석에 영향 없음)"""
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_endpoint(*args, **kwargs):
+            result = await endpoint(*args, **kwargs)
+            _mark_endpoint_done()
+            return result
+        return async_endpoint
+
+    @functools.wraps(endpoint)
+    def sync_endpoint(*args, **kwargs):
+        # 스레드풀에서 실행되지만 컨텍스트가 복사되므로 같은 RouteTiming 객체를 갱신
+        result = endpoint(*args, **kwargs)
+        _mark_endpoint_done()
+        return result
+    return sync_endpoint
+
+def _mark_endpoint_done():
+    timing = _route_timing.get()
+    if timing is not None:
+        timing.endpoint_done = time.perf_counter()
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Prometheus 텍스트 형식의 지표
+
+    Returns:
+        Tuple[bytes, str]: (지표 본문, Content-Type)
+    """
+    if settings.PROMETHEUS_MULTIPROC_DIR:
+        # 모든 워커의 값 파일을 합산
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
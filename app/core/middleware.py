@@ -0,0 +1,153 @@
+"""
+요청 처리 시간/추적 미들웨어
+
+이 모듈은 순수 ASGI 미들웨어로 요청 처리 시간을 측정하고 요청 ID를 발급합니다.
+BaseHTTPMiddleware(@app.middleware("http"))와 달리 응답을 별도 태스크와 스트림으로 감싸지 않고
+응답 시작 메시지에 헤더만 추가하므로 요청당 오버헤드가 작습니다.
+
+- X-Process-Time: 요청 수신부터 응답 시작까지 걸린 시간 (초, perf_counter_ns 기준)
+- X-Request-ID: 요청 ID (요청에 올바른 X-Request-ID가 있으면 그대로 사용)
+- 요청 로그는 완료 시 한 줄만 남기며, 느린 요청과 5xx 응답을 제외하면 REQUEST_LOG_SAMPLE_RATE 비율로 샘플링
+
+ProfilingMiddleware는 관리자가 요청한 요청을 cProfile로 프로파일링합니다 (app.core.profiling 참고).
+"""
+import random
+import time
+from typing import Optional
+from urllib.parse import parse_qs
+
+from loguru import logger
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.admin import is_admin_token
+from app.core.config import settings
+from app.core.logging_config import get_performance_logger
+from app.core.metrics import record_request
+from app.core.profiling import finish_profile, start_profile
+from app.core.request_context import get_request_id, new_request_id, request_id_var
+
+_REQUEST_ID_HEADER = b"x-request-id"
+_ADMIN_TOKEN_HEADER = b"x-admin-token"
+_PROFILE_HEADER = b"x-profile"
+
+class RequestTimingMiddleware:
+    """요청 처리 시간 측정, 요청 ID 발급, 요청 지표/샘플링 로그 기록"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: Optional[float] = None,
+        slow_request_ms: Optional[float] = None
+    ):
+        self.app = app
+        self.sample_rate = sample_rate if sample_rate is not None else settings.REQUEST_LOG_SAMPLE_RATE
+        slow_request_ms = slow_request_ms if slow_request_ms is not None else settings.REQUEST_SLOW_LOG_MS
+        self.slow_request_ns = int(slow_request_ms * 1_000_000)
+        self.perf_logger = get_performance_logger()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        request_id = new_request_id(_header(scope, _REQUEST_ID_HEADER))
+        token = request_id_var.set(request_id)
+        # 응답을 시작하지 못하고 예외가 나면 상위 ServerErrorMiddleware가 500으로 응답
+        status_code = 500
+
+        async def send_with_headers(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", f"{(time.perf_counter_ns() - start_ns) / 1e9:.6f}")
+                headers.append("X-Request-ID", request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        except Exception as e:
+            logger.error(f"Request failed - Method: {scope['method']}, Path: {scope['path']}, Error: {str(e)}")
+            raise
+        finally:
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            # 라우트 템플릿은 라우트 핸들러(MetricsRoute)에서 scope에 기록
+            record_request(scope["method"], scope.get("route_path"), status_code, elapsed_ns / 1e9)
+
+            if status_code >= 500 or elapsed_ns >= self.slow_request_ns or random.random() < self.sample_rate:
+                self.perf_logger.info(
+                    f"Request completed - Method: {scope['method']}, Path: {scope['path']}, "
+                    f"Time: {elapsed_ns / 1e9:.3f}s, Status: {status_code}"
+                )
+            request_id_var.reset(token)
+
+class ProfilingMiddleware:
+    """
+    관리자가 요청한 요청 프로파일링
+
+    X-Admin-Token 헤더가 ADMIN_TOKEN과 일치하고 X-Profile: true 헤더 또는 profile=true 쿼리가 있으면
+    요청 전체를 cProfile로 측정하고, 보고서를 요청 ID로 보관한 뒤 X-Profile-Report 헤더로 조회 경로를 알려줍니다.
+    요청 ID를 사용하므로 RequestTimingMiddleware 안쪽에 등록합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or not settings.PROFILING_ENABLED
+            or not settings.ADMIN_TOKEN
+            or not _profile_requested(scope)
+            or not is_admin_token(_header(scope, _ADMIN_TOKEN_HEADER))
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = get_request_id()
+        started = start_profile(request_id, scope["method"], scope["path"])
+        if started is None:
+            # 같은 워커에서 다른 요청을 프로파일링 중이면 프로파일링 없이 처리
+            await self.app(scope, receive, _append_header(send, "X-Profile", "busy"))
+            return
+
+        session, token = started
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_with_report(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Profile-Report", f"/admin/profiles/{request_id}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_report)
+        finally:
+            finish_profile(session, token, status_code, (time.perf_counter_ns() - start_ns) / 1e9)
+
+def _profile_requested(scope: Scope) -> bool:
+    """X-Profile: true 헤더 또는 profile=true 쿼리 여부"""
+    value = _header(scope, _PROFILE_HEADER)
+    if value is None and b"profile=" in scope["query_string"]:
+        values = parse_qs(scope["query_string"].decode("latin-1")).get("profile")
+        value = values[-1] if values else None
+    return value is not None and value.lower() in ("true", "1")
+
+def _append_header(send: Send, name: str, value: str) -> Send:
+    """응답 시작 메시지에 헤더를 추가하는 send"""
+    async def send_with_header(message: Message):
+        if message["type"] == "http.response.start":
+            MutableHeaders(scope=message).append(name, value)
+        await send(message)
+    return send_with_header
+
+def _header(scope: Scope, name: bytes) -> Optional[str]:
+    """요청 헤더 값 (헤더 이름은 소문자 바이트)"""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
@@ -0,0 +1,222 @@
+"""
+요청 단위 프로파일링 모듈
+
+이 모듈은 관리자가 요청한 요청 하나를 프로파일링하고 보고서를 요청 ID로 보관합니다.
+느린 요청의 시간이 Python 쿼리 생성, Elasticsearch 왕복, 응답 모델 검증/직렬화 중 어디에 쓰였는지 확인하는 용도입니다.
+
+- Python: cProfile 함수별 호출 수/자체 시간/누적 시간 (자체 시간 상위 PROFILE_TOP_FUNCTIONS개)
+- 단계: 쿼리 생성, Elasticsearch 왕복/took, 응답 모델 검증, 직렬화 시간 (지표의 단계 기록과 같은 지점에서 측정)
+- Elasticsearch: 검색 본문에 "profile": true를 추가하여 받은 샤드별 쿼리/컬렉터/fetch 시간
+
+cProfile은 이벤트 루프 스레드 전체를 측정하므로 프로파일링 중 같은 워커에서 함께 처리된 다른 요청의 코드도 집계되고,
+스레드풀에서 실행되는 동기 엔드포인트는 측정되지 않습니다. 프로파일러는 워커당 하나만 실행할 수 있어
+동시에 들어온 다른 프로파일링 요청은 프로파일링 없이 처리합니다.
+보고서는 워커 메모리에 최근 PROFILE_MAX_REPORTS개를 보관하고 로그 파일(extra.profile)에도 기록합니다.
+"""
+import cProfile
+import os
+import pstats
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from app.core.config import settings
+
+_SITE_PACKAGES = f"site-packages{os.sep}"
+
+class ProfileSession:
+    """프로파일링 중인 요청 하나의 측정 결과"""
+
+    def __init__(self, request_id: str, method: str, path: str):
+        self.request_id = request_id
+        self.method = method
+        self.path = path
+        self.created_at = datetime.now()
+        self.profiler = cProfile.Profile()
+        self.stages: List[Dict[str, Any]] = []
+        self.elasticsearch: List[Dict[str, Any]] = []
+
+    def add_stage(self, stage: str, seconds: float):
+        """단계 처리 시간 추가 (같은 단계가 여러 번 실행되면 실행 순서대로 모두 남김)"""
+        self.stages.append({"stage": stage, "ms": round(seconds * 1000, 3)})
+
+    def add_es_profile(self, response: Dict[str, Any]):
+        """Elasticsearch 검색 응답(본문에 "profile": true 지정)의 프로파일 추가"""
+        self.elasticsearch.append(summarize_es_profile(response))
+
+    def build_report(self, status_code: int, elapsed_seconds: float) -> Dict[str, Any]:
+        """보고서 생성 (프로파일러를 멈춘 뒤 호출)"""
+        return {
+            "request_id": self.request_id,
+            "method": self.method,
+            "path": self.path,
+            "status": status_code,
+            "created_at": self.created_at.isoformat(timespec="seconds"),
+            "wall_ms": round(elapsed_seconds * 1000, 3),
+            "stages": self.stages,
+            "python": summarize_python_profile(self.profiler, settings.PROFILE_TOP_FUNCTIONS),
+            "elasticsearch": self.elasticsearch
+        }
+
+class ProfileStore:
+    """최근 프로파일 보고서 보관소 (요청 ID 기준, 오래된 보고서부터 제거)"""
+
+    def __init__(self, max_reports: int):
+        self.max_reports = max_reports
+        self._reports: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, report: Dict[str, Any]):
+        with self._lock:
+            self._reports[report["request_id"]] = report
+            self._reports.move_to_end(report["request_id"])
+            while len(self._reports) > self.max_reports:
+                self._reports.popitem(last=False)
+
+    def get(self, request_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._reports.get(request_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        """보고서 요약 목록 (최근 순)"""
+        with self._lock:
+            reports = list(self._reports.values())
+        return [
+            {key: report[key] for key in ("request_id", "method", "path", "status", "created_at", "wall_ms")}
+            for report in reversed(reports)
+        ]
+
+    def clear(self):
+        with self._lock:
+            self._reports.clear()
+
+# 전역 보고서 보관소
+profile_store = ProfileStore(settings.PROFILE_MAX_REPORTS)
+
+# 현재 요청의 프로파일링 상태 (프로파일링하지 않는 요청은 None)
+_active_profile: ContextVar[Optional[ProfileSession]] = ContextVar("active_profile", default=None)
+
+# cProfile은 스레드에 프로파일 함수를 하나만 걸 수 있으므로 워커당 한 요청씩만 프로파일링
+_profiler_lock = threading.Lock()
+
+def current_profile() -> Optional[ProfileSession]:
+    """현재 요청의 프로파일링 상태 (프로파일링 중이 아니면 None)"""
+    return _active_profile.get()
+
+def record_profile_stage(stage: str, seconds: float):
+    """프로파일링 중인 요청이면 단계 처리 시간 기록"""
+    session = _active_profile.get()
+    if session is not None:
+        session.add_stage(stage, seconds)
+
+def start_profile(request_id: str, method: str, path: str) -> Optional[Tuple[ProfileSession, Token]]:
+    """
+    요청 프로파일링 시작
+
+    Returns:
+        Optional[Tuple[ProfileSession, Token]]: (프로파일링 상태, 컨텍스트 토큰), 다른 요청을 프로파일링 중이면 None
+    """
+    if not _profiler_lock.acquire(blocking=False):
+        return None
+
+    session = ProfileSession(request_id, method, path)
+    token = _active_profile.set(session)
+    session.profiler.enable()
+    return session, token
+
+def finish_profile(session: ProfileSession, token: Token, status_code: int, elapsed_seconds: float) -> Dict[str, Any]:
+    """요청 프로파일링 종료, 보고서 보관 및 로그 기록"""
+    try:
+        session.profiler.disable()
+    finally:
+        _active_profile.reset(token)
+        _profiler_lock.release()
+
+    report = session.build_report(status_code, elapsed_seconds)
+    profile_store.put(report)
+    logger.bind(profile=report).info(
+        "요청 프로파일 저장 - 요청 ID: {}, 경로: {}, 처리 시간: {}ms",
+        session.request_id, session.path, report["wall_ms"]
+    )
+    return report
+
+def summarize_python_profile(profiler: cProfile.Profile, top: int) -> Dict[str, Any]:
+    """cProfile 결과를 자체 시간(tottime) 상위 top개 함수로 요약"""
+    stats = pstats.Stats(profiler)
+    functions = []
+    for (filename, line, name), (primitive_calls, calls, tottime, cumtime, _) in stats.stats.items():
+        functions.append({
+            "function": pstats.func_std_string((_short_path(filename), line, name)),
+            "calls": calls,
+            "primitive_calls": primitive_calls,
+            "tottime_ms": round(tottime * 1000, 3),
+            "cumtime_ms": round(cumtime * 1000, 3)
+        })
+    functions.sort(key=lambda function: function["tottime_ms"], reverse=True)
+
+    return {
+        "total_calls": stats.total_calls,
+        "total_ms": round(stats.total_tt * 1000, 3),
+        "functions": functions[:top]
+    }
+
+def summarize_es_profile(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Elasticsearch 프로파일 응답을 샤드별 쿼리/컬렉터/fetch 시간(ms) 트리로 요약 (세부 breakdown 제외)"""
+    shards = []
+    for shard in response.get("profile", {}).get("shards", []):
+        summary = {
+            "id": shard.get("id"),
+            "searches": [
+                {
+                    "query": [_timing_node(node) for node in search.get("query", [])],
+                    "rewrite_ms": _ns_to_ms(search.get("rewrite_time", 0)),
+                    "collector": [_collector_node(node) for node in search.get("collector", [])]
+                }
+                for search in shard.get("searches", [])
+            ]
+        }
+        if shard.get("aggregations"):
+            summary["aggregations"] = [_timing_node(node) for node in shard["aggregations"]]
+        if shard.get("fetch"):
+            summary["fetch"] = _timing_node(shard["fetch"])
+        shards.append(summary)
+
+    return {"took_ms": response.get("took"), "shards": shards}
+
+def _timing_node(node: Dict[str, Any]) -> Dict[str, Any]:
+    """쿼리/집계/fetch 프로파일 노드 (type, description, 시간, 하위 노드)"""
+    summary = {
+        "type": node.get("type"),
+        "description": node.get("description"),
+        "time_ms": _ns_to_ms(node.get("time_in_nanos", 0))
+    }
+    if node.get("children"):
+        summary["children"] = [_timing_node(child) for child in node["children"]]
+    return summary
+
+def _collector_node(node: Dict[str, Any]) -> Dict[str, Any]:
+    """컬렉터 프로파일 노드 (name, reason, 시간, 하위 노드)"""
+    summary = {
+        "name": node.get("name"),
+        "reason": node.get("reason"),
+        "time_ms": _ns_to_ms(node.get("time_in_nanos", 0))
+    }
+    if node.get("children"):
+        summary["children"] = [_collector_node(child) for child in node["children"]]
+    return summary
+
+def _ns_to_ms(nanos: int) -> float:
+    return round(nanos / 1e6, 3)
+
+def _short_path(filename: str) -> str:
+    """보고서용 파일 경로 (site-packages 또는 작업 디렉토리 기준 상대 경로)"""
+    if _SITE_PACKAGES in filename:
+        return filename.split(_SITE_PACKAGES, 1)[1]
+    cwd = os.getcwd() + os.sep
+    if filename.startswith(cwd):
+        return filename[len(cwd):]
+    return filename
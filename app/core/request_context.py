@@ -0,0 +1,34 @@
+"""
+요청 컨텍스트 모듈
+
+이 모듈은 현재 요청의 ID를 contextvars로 보관합니다.
+미들웨어가 요청마다 값을 설정하면 같은 요청을 처리하는 서비스 코드와 로그에서
+인자로 넘기지 않아도 요청 ID를 조회할 수 있습니다.
+"""
+import re
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+
+# 요청 밖(시작/종료 이벤트, 적재 작업 등)의 요청 ID
+NO_REQUEST_ID = "-"
+
+# 클라이언트/프록시가 보낸 요청 ID로 허용하는 형식 (로그/헤더 주입 방지)
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default=NO_REQUEST_ID)
+
+def get_request_id() -> str:
+    """현재 요청 ID (요청 밖이면 '-')"""
+    return request_id_var.get()
+
+def new_request_id(incoming: Optional[str] = None) -> str:
+    """
+    요청 ID 발급
+
+    상위 프록시/클라이언트가 보낸 X-Request-ID가 올바른 형식이면 그대로 사용하여
+    서비스 간 추적이 이어지게 하고, 없으면 UUID4를 발급합니다.
+    """
+    if incoming and _REQUEST_ID_PATTERN.match(incoming):
+        return incoming
+    return uuid.uuid4().hex
@@ -0,0 +1,221 @@
+"""
+느린 쿼리 로그 모듈
+
+이 모듈은 Elasticsearch 검색 요청을 쿼리 형태(지문)별로 묶어 처리 시간 통계를 보관합니다.
+검색어, 필터 값, 페이지 같은 값(literal)을 '?'로 바꾼 쿼리 구조로 지문을 만들기 때문에
+초성 전용/한글 포함/영문 검색처럼 search_trademarks가 만드는 쿼리 모드가 각각 하나의 지문이 됩니다.
+
+- 지문별 호출 수, 처리 시간(wall) p50/p95/p99/최대, Elasticsearch took p50/p95/p99, 평균 (wall - took)
+- 가장 느렸던 요청의 실제 쿼리 예시 (요청 ID, 라우트 포함)
+- SLOW_QUERY_THRESHOLD_MS 이상 걸린 검색은 WARNING 로그로도 기록
+
+지문 수(SLOW_QUERY_MAX_FINGERPRINTS)와 지문별 백분위 계산에 쓰는 최근 처리 시간 수(SLOW_QUERY_SAMPLE_SIZE)는
+제한되며, 지문 수를 넘으면 가장 오래 사용되지 않은 지문부터 제거합니다. 통계는 워커별로 보관됩니다.
+"""
+import hashlib
+import math
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from app.core.config import settings
+
+# 값을 그대로 남기는 키 (쿼리 종류/옵션이라 쿼리 형태에 속함)
+_SHAPE_KEYS = frozenset({"type", "operator", "order", "format", "field", "fields", "fuzziness", "mode", "_source"})
+
+# 지문에서 제외하는 최상위 키 (요청별로 달라지거나 형태와 무관한 옵션)
+_IGNORED_KEYS = frozenset({"profile", "pit", "search_after", "track_total_hits"})
+
+# 쿼리 값을 대신하는 자리 표시자
+_PLACEHOLDER = "?"
+
+def fingerprint_query(body: Dict[str, Any]) -> str:
+    """
+    검색 요청 본문의 지문 생성
+
+    값을 '?'로 바꾼 구조를 한 번 순회하며 바로 해시합니다 (요청마다 호출되므로 중간 dict를 만들지 않음).
+    키 순서도 구조에 포함되지만 본문은 같은 코드가 같은 순서로 만들기 때문에 같은 형태는 같은 지문이 됩니다.
+
+    Args:
+        body (Dict[str, Any]): Elasticsearch 검색 요청 본문
+
+    Returns:
+        str: 지문 ID (SHA-1 앞 12자리)
+    """
+    tokens: List[str] = []
+    for key, value in body.items():
+        if key not in _IGNORED_KEYS:
+            tokens.append(key)
+            _shape_tokens(value, key, tokens)
+    return hashlib.sha1("\x1f".join(tokens).encode("utf-8")).hexdigest()[:12]
+
+def query_shape(body: Dict[str, Any]) -> Dict[str, Any]:
+    """값을 '?'로 바꾼 쿼리 형태 (지문을 처음 기록할 때만 생성)"""
+    return {key: _normalize(value, key) for key, value in body.items() if key not in _IGNORED_KEYS}
+
+def _shape_tokens(value: Any, key: Optional[str], tokens: List[str]):
+    if isinstance(value, dict):
+        tokens.append("{")
+        for child_key, child_value in value.items():
+            tokens.append(child_key)
+            _shape_tokens(child_value, child_key, tokens)
+        tokens.append("}")
+    elif isinstance(value, list) and all(isinstance(item, dict) for item in value):
+        tokens.append("[")
+        for item in value:
+            _shape_tokens(item, None, tokens)
+        tokens.append("]")
+    else:
+        tokens.append(repr(_normalize(value, key)))
+
+def _normalize(value: Any, key: Optional[str] = None) -> Any:
+    """값을 자리 표시자로 바꾸고 구조(키, 절 순서)는 유지"""
+    if isinstance(value, dict):
+        return {child_key: _normalize(child_value, child_key) for child_key, child_value in value.items()}
+    if isinstance(value, list):
+        if all(isinstance(item, dict) for item in value):
+            return [_normalize(item) for item in value]
+        # 값 목록(terms 쿼리 등)은 개수와 무관하게 하나의 형태로 취급
+        return value if key in _SHAPE_KEYS else [_PLACEHOLDER]
+    return value if key in _SHAPE_KEYS else _PLACEHOLDER
+
+def _percentile(ordered: List[float], percent: float) -> float:
+    """정렬된 목록의 백분위 값 (nearest-rank)"""
+    index = max(0, min(len(ordered) - 1, math.ceil(percent / 100 * len(ordered)) - 1))
+    return round(ordered[index], 3)
+
+class QueryStats:
+    """지문 하나의 처리 시간 통계"""
+
+    __slots__ = ("fingerprint", "shape", "count", "slow_count", "total_wall_ms", "total_took_ms",
+                 "took_count", "wall_samples", "took_samples", "routes", "example")
+
+    def __init__(self, fingerprint: str, shape: Any, sample_size: int):
+        self.fingerprint = fingerprint
+        self.shape = shape
+        self.count = 0
+        self.slow_count = 0
+        self.total_wall_ms = 0.0
+        self.total_took_ms = 0.0
+        self.took_count = 0
+        self.wall_samples: deque = deque(maxlen=sample_size)
+        self.took_samples: deque = deque(maxlen=sample_size)
+        self.routes: Dict[str, int] = {}
+        self.example: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        wall = sorted(self.wall_samples)
+        took = sorted(self.took_samples)
+        return {
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "slow_count": self.slow_count,
+            "total_wall_ms": round(self.total_wall_ms, 3),
+            "wall_ms": {
+                "p50": _percentile(wall, 50),
+                "p95": _percentile(wall, 95),
+                "p99": _percentile(wall, 99),
+                "max": round(wall[-1], 3)
+            } if wall else None,
+            "took_ms": {
+                "p50": _percentile(took, 50),
+                "p95": _percentile(took, 95),
+                "p99": _percentile(took, 99)
+            } if took else None,
+            # Elasticsearch 밖에서 쓰인 시간 (네트워크, 직렬화, 커넥션 풀 대기 등)
+            "mean_overhead_ms": round(
+                self.total_wall_ms / self.count - self.total_took_ms / self.took_count, 3
+            ) if self.took_count else None,
+            "routes": self.routes,
+            "shape": self.shape,
+            "example": self.example
+        }
+
+class SlowQueryLog:
+    """쿼리 지문별 처리 시간 통계 보관소 (지문 수 제한, 가장 오래 사용되지 않은 지문부터 제거)"""
+
+    def __init__(self, max_fingerprints: int, sample_size: int):
+        self.max_fingerprints = max_fingerprints
+        self.sample_size = sample_size
+        self._stats: "OrderedDict[str, QueryStats]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        index: Optional[str],
+        body: Dict[str, Any],
+        wall_seconds: float,
+        took_ms: Optional[float],
+        route: str,
+        request_id: str
+    ):
+        """
+        검색 요청 하나의 처리 시간 기록
+
+        Args:
+            index (Optional[str]): 검색 대상 (요청 경로의 인덱스 부분, PIT 검색은 None)
+            body (Dict[str, Any]): 검색 요청 본문
+            wall_seconds (float): Elasticsearch 왕복 시간 (초)
+            took_ms (Optional[float]): 응답의 took (ms)
+            route (str): 요청 라우트 템플릿
+            request_id (str): 요청 ID
+        """
+        fingerprint = fingerprint_query(body)
+        wall_ms = wall_seconds * 1000
+        slow = wall_ms >= settings.SLOW_QUERY_THRESHOLD_MS
+
+        with self._lock:
+            stats = self._stats.get(fingerprint)
+            if stats is None:
+                stats = QueryStats(fingerprint, query_shape(body), self.sample_size)
+                self._stats[fingerprint] = stats
+                while len(self._stats) > self.max_fingerprints:
+                    self._stats.popitem(last=False)
+            else:
+                self._stats.move_to_end(fingerprint)
+
+            stats.count += 1
+            stats.total_wall_ms += wall_ms
+            stats.wall_samples.append(wall_ms)
+            if took_ms is not None:
+                stats.took_count += 1
+                stats.total_took_ms += took_ms
+                stats.took_samples.append(took_ms)
+            if slow:
+                stats.slow_count += 1
+            stats.routes[route] = stats.routes.get(route, 0) + 1
+
+            # 가장 느렸던 요청을 예시로 보관 (검색 후에는 본문을 변경하지 않으므로 복사하지 않고 참조)
+            if stats.example is None or wall_ms > stats.example["wall_ms"]:
+                stats.example = {
+                    "request_id": request_id,
+                    "route": route,
+                    "index": index,
+                    "wall_ms": round(wall_ms, 3),
+                    "took_ms": took_ms,
+                    "seen_at": datetime.now().isoformat(timespec="seconds"),
+                    "body": body
+                }
+
+        if slow:
+            logger.bind(slow_query=fingerprint).warning(
+                "느린 검색 쿼리 - 지문: {}, 처리 시간: {:.1f}ms, took: {}ms, 라우트: {}, 요청 ID: {}",
+                fingerprint, wall_ms, took_ms, route, request_id
+            )
+
+    def snapshot(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """지문별 통계 (총 처리 시간이 긴 순)"""
+        with self._lock:
+            stats = [item.to_dict() for item in self._stats.values()]
+        stats.sort(key=lambda item: item["total_wall_ms"], reverse=True)
+        return stats[:limit] if limit is not None else stats
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+
+# 전역 느린 쿼리 로그
+slow_query_log = SlowQueryLog(settings.SLOW_QUERY_MAX_FINGERPRINTS, settings.SLOW_QUERY_SAMPLE_SIZE)
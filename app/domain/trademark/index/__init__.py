@@ -1,5 +1,22 @@
 # 인덱스 패키지 초기화
 from app.domain.trademark.index.trademark_mapping import trademark_mapping
+from app.domain.trademark.index.index_versions import (
+    create_index_version,
+    swap_index_alias,
+    delete_old_index_versions,
+    delete_index_versions
+)
+from app.domain.trademark.index.bulk_load_mode import bulk_load_mode
 from app.domain.trademark.index.create_trademark_index import create_trademark_index
+from app.domain.trademark.index.migrate_document_ids import migrate_document_ids
 
-__all__ = ['trademark_mapping', 'create_trademark_index']
\ No newline at end of file
+__all__ = [
+    'trademark_mapping',
+    'create_trademark_index',
+    'migrate_document_ids',
+    'create_index_version',
+    'swap_index_alias',
+    'delete_old_index_versions',
+    'delete_index_versions',
+    'bulk_load_mode'
+]
\ No newline at end of file
@@ -0,0 +1,128 @@
+"""
+벌크 적재 모드 함수
+
+이 모듈은 대량 색인 동안 인덱스 설정을 적재에 유리하게 바꾸고,
+끝나면 (실패하더라도) 원래 설정으로 되돌리는 컨텍스트 관리자를 제공합니다.
+
+- refresh_interval: -1 (적재 중 주기적 refresh와 작은 세그먼트 생성 중지)
+- number_of_replicas: 0 (복제본 색인 생략, 복원 시 병합된 세그먼트를 복사)
+- translog.durability: async (선택, 노드 장애 시 마지막 sync 이후 적재분 유실 가능)
+"""
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional
+
+from app.core.elasticsearch import es_client
+from app.core.config import settings
+from app.domain.trademark.index.trademark_mapping import trademark_mapping
+
+logger = logging.getLogger(__name__)
+
+# 적재 중 변경하는 설정 (flat_settings 키)
+_REFRESH_INTERVAL = "index.refresh_interval"
+_NUMBER_OF_REPLICAS = "index.number_of_replicas"
+_TRANSLOG_DURABILITY = "index.translog.durability"
+
+# 복제본 할당 대기 시간
+REPLICA_WAIT_TIMEOUT = "60s"
+
+def _read_settings(index_name: str) -> Dict[str, Optional[str]]:
+    """
+    적재 중 변경할 설정의 현재 값 조회
+
+    인덱스에 명시되지 않은 설정은 None으로 반환하며, 복원 시 None을 넣으면 기본값으로 돌아갑니다.
+    중단된 적재를 이어서 진행하는 경우에도 원래 설정으로 복원할 수 있도록 합니다.
+    """
+    response = es_client.indices.get_settings(
+        index=index_name,
+        name=[_REFRESH_INTERVAL, _NUMBER_OF_REPLICAS, _TRANSLOG_DURABILITY],
+        flat_settings=True
+    )
+    # 별칭이면 실제 인덱스 이름으로 응답
+    index_settings = next(iter(response.values()))["settings"]
+    original = {
+        key: index_settings.get(key)
+        for key in (_REFRESH_INTERVAL, _NUMBER_OF_REPLICAS, _TRANSLOG_DURABILITY)
+    }
+
+    # 이전 적재가 비정상 종료되어 적재용 설정이 남아 있으면 매핑에 정의된 설정으로 복원
+    if original[_REFRESH_INTERVAL] == "-1":
+        mapping_settings = trademark_mapping["settings"]["index"]
+        logger.warning(f"인덱스 '{index_name}'에 이전 적재의 설정이 남아 있어 매핑 설정으로 복원합니다.")
+        original = {
+            _REFRESH_INTERVAL: mapping_settings["refresh_interval"],
+            _NUMBER_OF_REPLICAS: str(mapping_settings["number_of_replicas"]),
+            _TRANSLOG_DURABILITY: None
+        }
+    return original
+
+@contextmanager
+def bulk_load_mode(
+    index_name: str,
+    force_merge_segments: int = 0,
+    async_translog: Optional[bool] = None,
+    enabled: Optional[bool] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    벌크 적재 모드
+
+    블록이 정상 종료되면 refresh 후 세그먼트를 병합하고, 예외가 나도 원래 설정은 항상 복원합니다.
+    병합은 복제본을 복원하기 전에 하므로 복제본은 병합된 세그먼트를 그대로 복사합니다.
+
+    Args:
+        index_name (str): 대상 인덱스 (또는 하나의 인덱스를 가리키는 별칭)
+        force_merge_segments (int): 적재 후 병합할 세그먼트 수 (0이면 병합하지 않음)
+        async_translog (bool, optional): translog 비동기 기록 여부. 기본값은 INGEST_TRANSLOG_ASYNC
+        enabled (bool, optional): 설정 변경 여부. 기본값은 INGEST_BULK_LOAD_MODE
+
+    Yields:
+        Dict[str, Any]: 적재 모드 통계 (블록 종료 후 병합/복원 시간이 채워짐)
+    """
+    if enabled is None:
+        enabled = settings.INGEST_BULK_LOAD_MODE
+    if async_translog is None:
+        async_translog = settings.INGEST_TRANSLOG_ASYNC
+
+    stats: Dict[str, Any] = {"enabled": enabled, "force_merge_seconds": 0.0}
+    if not enabled:
+        yield stats
+        return
+
+    original = _read_settings(index_name)
+    tuned = {_REFRESH_INTERVAL: "-1", _NUMBER_OF_REPLICAS: "0"}
+    if async_translog:
+        tuned[_TRANSLOG_DURABILITY] = "async"
+
+    es_client.indices.put_settings(index=index_name, body=tuned, flat_settings=True)
+    logger.info(f"벌크 적재 모드 시작 - 인덱스: {index_name}, 설정: {tuned}, 원래 설정: {original}")
+
+    try:
+        yield stats
+
+        es_client.indices.refresh(index=index_name)
+        if force_merge_segments > 0:
+            start = time.perf_counter()
+            es_client.indices.forcemerge(
+                index=index_name,
+                max_num_segments=force_merge_segments,
+                request_timeout=3600
+            )
+            stats["force_merge_seconds"] = round(time.perf_counter() - start, 3)
+            logger.info(
+                f"세그먼트 병합 완료 - 인덱스: {index_name}, "
+                f"max_num_segments={force_merge_segments}, {stats['force_merge_seconds']}초"
+            )
+
+    finally:
+        es_client.indices.put_settings(index=index_name, body=original, flat_settings=True)
+        logger.info(f"벌크 적재 모드 종료 - 인덱스: {index_name}, 설정 복원: {original}")
+
+        if int(original[_NUMBER_OF_REPLICAS] or 0) > 0:
+            health = es_client.cluster.health(
+                index=index_name,
+                wait_for_status="green",
+                timeout=REPLICA_WAIT_TIMEOUT
+            )
+            if health.get("timed_out"):
+                logger.warning(f"인덱스 '{index_name}' 복제본 할당 대기 시간 초과 (상태: {health.get('status')})")
@@ -6,7 +6,7 @@
 import logging
 from app.core.elasticsearch import es_client
 from app.core.config import settings
-from app.domain.trademark.index.trademark_mapping import trademark_mapping
+from app.domain.trademark.index.index_versions import create_index_version, swap_index_alias
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +14,12 @@ def create_trademark_index():
     """
     상표 데이터 인덱스 생성
     
+    ELASTICSEARCH_INDEX는 버전별 물리 인덱스('{이름}_v{n}')를 가리키는 별칭으로 생성합니다.
+    
     DB_INIT_MODE 설정에 따라 다르게 동작:
-    - create: 기존 인덱스 삭제 후 새로 생성
+    - create: 인덱스가 없으면 생성, 있으면 유지 (데이터 적재 시 새 버전을 만들어 교체)
     - update: 인덱스가 없으면 생성, 있으면 유지
+    - delta: 인덱스가 없으면 생성, 있으면 유지 (데이터 적재 시 바뀐 문서만 반영)
     - none: 아무 작업 안함
     """
     index_name = settings.ELASTICSEARCH_INDEX
@@ -29,34 +32,25 @@ def create_trademark_index():
         logger.info(f"DB 초기화 모드가 'none'이므로 인덱스 작업을 건너뜁니다.")
         return
     
-    # 인덱스 존재 여부 확인
-    index_exists = es_client.indices.exists(index=index_name)
-    
-    # create 모드이고 인덱스가 존재하면 삭제
-    if init_mode == "create" and index_exists:
-        try:
-            logger.info(f"DB 초기화 모드가 'create'이므로 기존 인덱스 '{index_name}'를 삭제합니다.")
-            es_client.indices.delete(index=index_name)
-            index_exists = False
-            logger.info(f"인덱스 '{index_name}' 삭제 완료")
-        except Exception as e:
-            logger.error(f"인덱스 '{index_name}' 삭제 실패: {str(e)}")
-            raise e
-    
-    # update 모드이고 인덱스가 존재하면 유지
-    if init_mode == "update" and index_exists:
-        logger.info(f"인덱스 '{index_name}'가 이미 존재하고 DB 초기화 모드가 'update'이므로 유지합니다.")
+    # 인덱스(별칭)가 존재하면 유지
+    # create 모드에서도 기존 인덱스를 삭제하지 않으므로 재적재 중에도 검색이 중단되지 않음
+    if es_client.indices.exists(index=index_name):
+        if init_mode == "create":
+            logger.info(f"인덱스 '{index_name}'가 이미 존재합니다. 데이터 적재 시 새 버전으로 교체합니다.")
+        else:
+            logger.info(f"인덱스 '{index_name}'가 이미 존재하고 DB 초기화 모드가 '{init_mode}'이므로 유지합니다.")
         return
     
-    # 인덱스가 없거나 create 모드인 경우 새로 생성
-    if not index_exists:
-        try:
-            logger.info(f"인덱스 '{index_name}'를 생성합니다.")
-            response = es_client.indices.create(
-                index=index_name,
-                body=trademark_mapping
-            )
-            logger.info(f"인덱스 '{index_name}' 생성 성공: {response}")
-        except Exception as e:
-            logger.error(f"인덱스 '{index_name}' 생성 실패: {str(e)}")
-            raise e
\ No newline at end of file
+    # 첫 버전을 생성하고 별칭 연결
+    try:
+        logger.info(f"인덱스 '{index_name}'를 생성합니다.")
+        physical_index = create_index_version(index_name)
+        swap_index_alias(index_name, physical_index)
+        logger.info(f"인덱스 '{index_name}' 생성 성공 (물리 인덱스: {physical_index})")
+        
+        # 인덱스가 새로 만들어졌으므로 검색 캐시 무효화
+        from app.domain.trademark.services.search_cache import bump_index_generation
+        bump_index_generation()
+    except Exception as e:
+        logger.error(f"인덱스 '{index_name}' 생성 실패: {str(e)}")
+        raise e
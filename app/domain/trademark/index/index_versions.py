@@ -0,0 +1,121 @@
+"""
+상표 인덱스 버전 관리 함수
+
+이 모듈은 읽기 별칭(ELASTICSEARCH_INDEX) 뒤에 버전별 물리 인덱스('{별칭}_v{n}')를 두고,
+새 버전을 만들어 적재한 뒤 별칭을 원자적으로 전환하는 함수를 제공합니다.
+재적재 중에도 검색은 기존 버전을 그대로 사용하므로 중단 시간이 없습니다.
+"""
+import logging
+import re
+from typing import Dict, Any, Iterable, List, Tuple
+
+from elasticsearch import NotFoundError
+
+from app.core.elasticsearch import es_client
+from app.domain.trademark.index.trademark_mapping import trademark_mapping
+
+logger = logging.getLogger(__name__)
+
+def versioned_index_name(alias: str, version: int) -> str:
+    """버전별 물리 인덱스 이름"""
+    return f"{alias}_v{version}"
+
+def list_index_versions(alias: str) -> List[Tuple[int, str]]:
+    """
+    별칭의 버전별 물리 인덱스 목록
+
+    Returns:
+        List[Tuple[int, str]]: (버전, 인덱스 이름) 목록 (버전 오름차순)
+    """
+    pattern = re.compile(rf"^{re.escape(alias)}_v(\d+)$")
+    indices = es_client.indices.get_alias(index=f"{alias}_v*")
+
+    versions = []
+    for index_name in indices:
+        match = pattern.match(index_name)
+        if match:
+            versions.append((int(match.group(1)), index_name))
+    return sorted(versions)
+
+def get_alias_targets(alias: str) -> List[str]:
+    """별칭이 가리키는 인덱스 목록 (별칭이 없으면 빈 목록)"""
+    try:
+        return sorted(es_client.indices.get_alias(name=alias))
+    except NotFoundError:
+        return []
+
+def create_index_version(alias: str) -> str:
+    """
+    다음 버전의 물리 인덱스 생성
+
+    Args:
+        alias (str): 읽기 별칭
+
+    Returns:
+        str: 생성한 인덱스 이름
+    """
+    versions = list_index_versions(alias)
+    index_name = versioned_index_name(alias, versions[-1][0] + 1 if versions else 1)
+
+    es_client.indices.create(index=index_name, body=trademark_mapping)
+    logger.info(f"인덱스 '{index_name}' 생성")
+    return index_name
+
+def swap_index_alias(alias: str, index_name: str) -> List[str]:
+    """
+    별칭을 새 인덱스로 원자적으로 전환
+
+    별칭 도입 이전의 같은 이름 물리 인덱스가 있으면 같은 요청에서 삭제하므로
+    별칭이 없는 순간이 생기지 않습니다.
+
+    Returns:
+        List[str]: 이전에 별칭이 가리키던 인덱스 목록
+    """
+    previous = get_alias_targets(alias)
+
+    actions: List[Dict[str, Any]] = [
+        {"remove": {"index": target, "alias": alias}}
+        for target in previous
+        if target != index_name
+    ]
+    if not previous and es_client.indices.exists(index=alias):
+        logger.info(f"별칭 도입 이전의 물리 인덱스 '{alias}'를 삭제하고 별칭으로 전환합니다.")
+        actions.append({"remove_index": {"index": alias}})
+    actions.append({"add": {"index": index_name, "alias": alias}})
+
+    es_client.indices.update_aliases(body={"actions": actions})
+    logger.info(f"별칭 '{alias}' 전환: {previous or '-'} -> {index_name}")
+    return previous
+
+def delete_old_index_versions(alias: str, keep: int, exclude: Iterable[str] = ()) -> List[str]:
+    """
+    별칭이 가리키지 않는 이전 버전 삭제
+
+    Args:
+        alias (str): 읽기 별칭
+        keep (int): 롤백용으로 남길 최신 이전 버전 수
+        exclude (Iterable[str], optional): 삭제하지 않고 남길 버전 수에도 포함하지 않을 인덱스
+            (이어서 적재할 작업이 적재 중이던 새 버전 등 별칭으로 전환된 적이 없는 인덱스)
+
+    Returns:
+        List[str]: 삭제한 인덱스 목록
+    """
+    live = set(get_alias_targets(alias))
+    excluded = set(exclude)
+    old = [
+        index_name for _, index_name in reversed(list_index_versions(alias))
+        if index_name not in live and index_name not in excluded
+    ]
+
+    deleted = old[max(keep, 0):]
+    for index_name in deleted:
+        es_client.indices.delete(index=index_name, ignore=[404])
+        logger.info(f"이전 인덱스 버전 '{index_name}' 삭제")
+    return deleted
+
+def delete_index_versions(alias: str):
+    """별칭과 모든 버전의 물리 인덱스 삭제 (별칭 도입 이전의 물리 인덱스 포함)"""
+    for _, index_name in list_index_versions(alias):
+        es_client.indices.delete(index=index_name, ignore=[404])
+    if es_client.indices.exists(index=alias):
+        es_client.indices.delete(index=alias, ignore=[404])
@@ -0,0 +1,103 @@
+"""
+문서 _id 마이그레이션 함수
+
+이 모듈은 자동 생성 _id로 색인된 기존 상표 인덱스를 출원번호(없으면 pid)를
+_id로 사용하는 새 인덱스로 재색인하는 함수를 제공합니다.
+
+실행 방법:
+    python -m app.domain.trademark.index.migrate_document_ids --swap
+"""
+import argparse
+import logging
+from typing import Dict, Any, Optional
+
+from app.core.elasticsearch import es_client
+from app.core.config import settings
+from app.domain.trademark.index.index_versions import swap_index_alias
+from app.domain.trademark.index.trademark_mapping import trademark_mapping
+
+logger = logging.getLogger(__name__)
+
+# 재색인 시 _id를 출원번호(없으면 pid)로 지정하는 스크립트
+REINDEX_ID_SCRIPT = """
+if (ctx._source.applicationNumber != null) {
+  ctx._id = ctx._source.applicationNumber;
+} else if (ctx._source.pid != null) {
+  ctx._id = ctx._source.pid;
+}
+"""
+
+def migrate_document_ids(
+    source_index: Optional[str] = None,
+    dest_index: Optional[str] = None,
+    swap: bool = False
+) -> Dict[str, Any]:
+    """
+    기존 인덱스를 출원번호 _id 기반 인덱스로 재색인
+
+    Args:
+        source_index (str, optional): 원본 인덱스. 기본값은 ELASTICSEARCH_INDEX
+        dest_index (str, optional): 대상 인덱스. 기본값은 '{source_index}_v1'
+        swap (bool, optional): True이면 원본 이름의 별칭이 대상 인덱스를 가리키도록 전환.
+            원본이 물리 인덱스면 같은 요청에서 삭제하고, 별칭이면 기존 대상 인덱스는 남겨 둠
+
+    Returns:
+        Dict[str, Any]: 재색인 결과 (대상 인덱스, 처리 건수, 실패 목록 등)
+    """
+    source_index = source_index or settings.ELASTICSEARCH_INDEX
+    dest_index = dest_index or f"{source_index}_v1"
+
+    if not es_client.indices.exists(index=source_index):
+        raise ValueError(f"원본 인덱스 '{source_index}'가 존재하지 않습니다")
+
+    if es_client.indices.exists(index=dest_index):
+        raise ValueError(f"대상 인덱스 '{dest_index}'가 이미 존재합니다")
+
+    logger.info(f"대상 인덱스 '{dest_index}'를 생성합니다.")
+    es_client.indices.create(index=dest_index, body=trademark_mapping)
+
+    logger.info(f"'{source_index}' -> '{dest_index}' 재색인 시작")
+    response = es_client.reindex(
+        body={
+            "source": {"index": source_index},
+            "dest": {"index": dest_index, "op_type": "index"},
+            "script": {"source": REINDEX_ID_SCRIPT, "lang": "painless"}
+        },
+        refresh=True,
+        wait_for_completion=True,
+        request_timeout=3600
+    )
+
+    failures = response.get("failures", [])
+    logger.info(
+        f"재색인 완료: 총 {response.get('total')}개, 생성 {response.get('created')}개, "
+        f"갱신 {response.get('updated')}개, 실패 {len(failures)}개"
+    )
+
+    if failures:
+        # 실패가 있으면 원본을 유지하고 전환하지 않음
+        logger.error(f"재색인 실패가 있어 인덱스 전환을 건너뜁니다: {failures[:3]}")
+    elif swap:
+        # 원본 삭제와 별칭 추가를 한 요청으로 처리하여 원본 이름이 아무것도 가리키지 않는 순간이 없도록 함
+        swap_index_alias(source_index, dest_index)
+
+    return {
+        "source_index": source_index,
+        "dest_index": dest_index,
+        "total": response.get("total"),
+        "created": response.get("created"),
+        "updated": response.get("updated"),
+        "failures": failures,
+        "swapped": swap and not failures
+    }
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="상표 인덱스 문서 _id 마이그레이션")
+    parser.add_argument("--source", help="원본 인덱스 (기본값: ELASTICSEARCH_INDEX)")
+    parser.add_argument("--dest", help="대상 인덱스 (기본값: {source}_v1)")
+    parser.add_argument("--swap", action="store_true", help="원본 이름을 대상 인덱스의 별칭으로 전환")
+    args = parser.parse_args()
+
+    print(migrate_document_ids(args.source, args.dest, args.swap))
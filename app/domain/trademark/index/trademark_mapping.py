@@ -19,6 +19,11 @@ trademark_mapping = {
                 "type": "integer",
                 "null_value": 0
             },
+            # 원본 레코드 내용 해시 (증분 적재 시 변경 여부 비교용, 검색하지 않음)
+            "contentHash": {
+                "type": "keyword",
+                "index": False
+            },
             
             # 상표명 필드 (한글/영문) - 다중 분석기 활용
             "productName": {
@@ -6,25 +6,56 @@ RESTful API 설계 원칙에 따라 리소스 중심으로 구성되었습니다
 """
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from loguru import logger
 
+from app.core.config import settings
+from app.core.logging_config import get_sampled_logger
+from app.core.metrics import MetricsRoute, MetricsJSONResponse
 from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams, SortOption, SortField, SortOrder
 from app.domain.trademark.schemas.trademark_response import TrademarkResponse
 from app.domain.trademark.schemas.trademark_detail_response import TrademarkDetailResponse
+from app.domain.trademark.schemas.trademark_batch_detail import TrademarkBatchDetailRequest, TrademarkBatchDetailResponse
+from app.domain.trademark.schemas.trademark_batch_search import TrademarkBatchSearchRequest, TrademarkBatchSearchResponse
 from app.domain.trademark.schemas.autocomplete_schema import AutocompleteResponse
 from app.domain.trademark.services.search_trademarks import search_trademarks
-from app.domain.trademark.services.load_trademark_data import load_trademark_data
+from app.domain.trademark.services.search_cursor import search_trademarks_by_cursor
+from app.domain.trademark.services.search_batch import search_trademarks_batch
+from app.domain.trademark.services.export_service import open_export, resolve_export_fields, EXPORT_MEDIA_TYPES
+from app.domain.trademark.services.ingest_jobs import ingest_jobs
 from app.domain.trademark.services.autocomplete_service import get_autocomplete_suggestions
-from app.domain.trademark.services.view_count_service import increment_view_count
-from app.domain.trademark.services.trademark_detail_service import get_trademark_by_application_number
+from app.domain.trademark.services.view_count_service import increment_view_count, view_count_buffer
+from app.domain.trademark.services.search_cache import search_cache
+from app.domain.trademark.services.autocomplete_index import autocomplete_index
+from app.domain.trademark.services.pronunciation_cache import pronunciation_cache
+from app.domain.trademark.services.pronunciation_dict import pronunciation_dict
+from app.domain.trademark.services.single_flight import search_flight, autocomplete_flight
+from app.domain.trademark.services.trademark_detail_service import (
+    get_trademark_by_application_number,
+    get_trademarks_by_application_numbers
+)
 from app.core.exceptions import (
     SearchQueryError,
-    DataLoadingError,
     IndexNotFoundError,
-    InvalidParameterError
+    InvalidParameterError,
+    InvalidCursorError,
+    ElasticsearchConnectionError,
+    FileNotFoundError,
+    IngestJobNotFoundError,
+    IngestJobConflictError
 )
 
-router = APIRouter(prefix="/api/trademarks", tags=["trademarks"])
+# 호출이 많은 검색/자동완성/상세 조회의 요청·완료 로그만 샘플링 (적재, 내보내기 등 운영 로그는 항상 기록)
+request_logger = get_sampled_logger(settings.HOT_PATH_LOG_SAMPLE_RATE)
+
+# 라우트별 단계 지표(응답 모델 검증, 직렬화) 수집
+router = APIRouter(
+    prefix="/api/trademarks",
+    tags=["trademarks"],
+    route_class=MetricsRoute,
+    default_response_class=MetricsJSONResponse
+)
 
 
 @router.get("/", response_model=TrademarkResponse)
@@ -39,10 +70,11 @@ async def search_trademark_endpoint(
     size: int = Query(10, ge=1, le=100, description="페이지당 결과 수"),
     sort_field: Optional[List[str]] = Query(None, description="정렬 필드 (예: applicationDate,productName)"),
     sort_order: Optional[List[str]] = Query(None, description="정렬 방향 (asc 또는 desc)"),
+    cursor: Optional[str] = Query(None, description="커서 토큰 ('*'이면 커서 페이지네이션 시작, 이후 응답의 next_cursor 전달)"),
 ) -> TrademarkResponse:
     """상표 검색 API"""
     try:
-        logger.info(f"상표 검색 요청 - 검색어: '{query}', 페이지: {page}")
+        request_logger.info(f"상표 검색 요청 - 검색어: '{query}', 페이지: {page}")
         
         # 정렬 옵션 처리
         sort_options = None
@@ -76,10 +108,13 @@ async def search_trademark_endpoint(
             sort=sort_options
         )
         
-        # 검색 실행
-        result = await search_trademarks(search_params)
+        # 검색 실행 (커서가 있으면 PIT + search_after 페이지네이션)
+        if cursor is not None:
+            result = await search_trademarks_by_cursor(search_params, cursor)
+        else:
+            result = await search_trademarks(search_params)
         
-        logger.info(f"검색 완료 - 총 {result['total']}개 결과")
+        request_logger.info(f"검색 완료 - 총 {result['total']}개 결과")
         
         return TrademarkResponse(**result)
     
@@ -92,11 +127,41 @@ async def search_trademark_endpoint(
     except InvalidParameterError as e:
         logger.error(f"잘못된 매개변수 오류: {str(e)}")
         raise e
+    except InvalidCursorError as e:
+        logger.error(f"커서 오류: {str(e)}")
+        raise e
     except Exception as e:
         logger.error(f"예상치 못한 검색 오류: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다")
 
 
+@router.post("/search/batch", response_model=TrademarkBatchSearchResponse)
+async def batch_search_endpoint(
+    request: TrademarkBatchSearchRequest = Body(..., description="검색 조건 목록")
+) -> TrademarkBatchSearchResponse:
+    """상표 일괄 검색 API
+    
+    여러 검색 조건을 한 번의 요청으로 실행합니다.
+    결과와 오류는 요청 순서대로 검색 조건별로 반환합니다.
+    """
+    try:
+        request_logger.info(f"일괄 검색 요청 - {len(request.searches)}개 검색 조건")
+        
+        responses = await search_trademarks_batch(request.searches)
+        
+        failed = sum(1 for response in responses if response["status"] != 200)
+        request_logger.info(f"일괄 검색 완료 - 성공 {len(responses) - failed}개, 실패 {failed}개")
+        
+        return TrademarkBatchSearchResponse(responses=responses)
+    
+    except (SearchQueryError, ElasticsearchConnectionError) as e:
+        logger.error(f"일괄 검색 오류: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"예상치 못한 일괄 검색 오류: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다")
+
+
 @router.get("/autocomplete", response_model=AutocompleteResponse)
 async def autocomplete_endpoint(
     query: str = Query(..., min_length=1, description="검색어"),
@@ -107,11 +172,11 @@ async def autocomplete_endpoint(
     초성 검색, 오타 교정, n-gram 기반 유사 문자열 매칭, 영문 발음 변환 기능을 지원합니다.
     """
     try:
-        logger.info(f"자동완성 요청 - 검색어: '{query}', 크기: {size}")
+        request_logger.info(f"자동완성 요청 - 검색어: '{query}', 크기: {size}")
         
         result = await get_autocomplete_suggestions(query, size)
         
-        logger.info(f"자동완성 완료 - {result.total}개 제안")
+        request_logger.info(f"자동완성 완료 - {result.total}개 제안")
         
         return result
     
@@ -126,6 +191,51 @@ async def autocomplete_endpoint(
         raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다")
 
 
+@router.get("/export")
+async def export_trademarks_endpoint(
+    query: str = Query(None, description="검색어 (상표명)"),
+    status: str = Query(None, description="상표 등록 상태"),
+    main_code: str = Query(None, description="상품 주 분류 코드"),
+    sub_code: str = Query(None, description="상품 유사군 코드"),
+    start_date: str = Query(None, description="검색 시작일 (YYYY-MM-DD)"),
+    end_date: str = Query(None, description="검색 종료일 (YYYY-MM-DD)"),
+    export_format: str = Query("ndjson", alias="format", description="내보내기 형식 (ndjson 또는 csv)"),
+    fields: Optional[str] = Query(None, description="내보낼 필드 (쉼표 구분, 기본값은 전체)"),
+) -> StreamingResponse:
+    """상표 검색 결과 전체 내보내기 API
+    
+    검색 조건에 맞는 모든 상표를 NDJSON 또는 CSV로 스트리밍합니다 (순서 보장 없음).
+    """
+    try:
+        logger.info(f"내보내기 요청 - 검색어: '{query}', 형식: {export_format}")
+        
+        search_params = TrademarkSearchParams(
+            query=query,
+            status=status,
+            main_code=main_code,
+            sub_code=sub_code,
+            start_date=start_date,
+            end_date=end_date
+        )
+        export_fields = resolve_export_fields(fields)
+        body = await open_export(search_params, export_format, export_fields)
+        
+        # 전송 완료/연결 끊김과 관계없이 응답 후 PIT 닫기 (본문을 읽기 전에 끊긴 경우 포함)
+        return StreamingResponse(
+            body,
+            media_type=EXPORT_MEDIA_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="trademarks.{export_format}"'},
+            background=BackgroundTask(body.aclose)
+        )
+    
+    except (SearchQueryError, IndexNotFoundError, InvalidParameterError, ElasticsearchConnectionError) as e:
+        logger.error(f"내보내기 오류: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"예상치 못한 내보내기 오류: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다")
+
+
 @router.get("/{application_number}", response_model=TrademarkDetailResponse)
 async def get_trademark_detail(
     application_number: str = Path(..., description="상표 출원번호"),
@@ -137,7 +247,7 @@ async def get_trademark_detail(
     increment_count가 True이면 조회수도 함께 증가시킵니다.
     """
     try:
-        logger.info(f"상표 상세 조회 요청 - 출원번호: {application_number}")
+        request_logger.info(f"상표 상세 조회 요청 - 출원번호: {application_number}")
         
         # 상표 정보 조회
         trademark = await get_trademark_by_application_number(application_number)
@@ -146,7 +256,7 @@ async def get_trademark_detail(
             logger.warning(f"상표를 찾을 수 없음 - 출원번호: {application_number}")
             raise HTTPException(status_code=404, detail=f"출원번호가 '{application_number}'인 상표를 찾을 수 없습니다")
         
-        # 조회수 증가 (요청된 경우)
+        # 조회수 증가 (요청된 경우) - 버퍼에 누적만 하고 반영은 기다리지 않음
         if increment_count and "pid" in trademark:
             pid = trademark["pid"]
             success = await increment_view_count(pid)
@@ -155,7 +265,7 @@ async def get_trademark_detail(
                 trademark["viewCount"] = trademark.get("viewCount", 0) + 1
                 logger.debug(f"조회수 증가 성공 - pid: {pid}, 현재 조회수: {trademark['viewCount']}")
         
-        logger.info(f"상표 상세 조회 완료 - 출원번호: {application_number}")
+        request_logger.info(f"상표 상세 조회 완료 - 출원번호: {application_number}")
         
         return TrademarkDetailResponse(data=trademark)
     
@@ -167,23 +277,50 @@ async def get_trademark_detail(
         raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다")
 
 
-@router.post("/load-data")
+@router.post("/batch", response_model=TrademarkBatchDetailResponse, response_model_exclude_unset=True)
+async def get_trademark_details_batch(
+    request: TrademarkBatchDetailRequest = Body(..., description="조회할 출원번호 목록")
+) -> TrademarkBatchDetailResponse:
+    """상표 일괄 상세 조회 API
+    
+    여러 출원번호의 상표 상세 정보를 한 번에 조회합니다 (조회수는 증가시키지 않음).
+    결과는 요청 순서대로 반환하고, 찾지 못한 출원번호는 not_found로 반환합니다.
+    """
+    try:
+        request_logger.info(f"상표 일괄 상세 조회 요청 - {len(request.application_numbers)}개")
+        
+        results, not_found = await get_trademarks_by_application_numbers(
+            request.application_numbers,
+            request.fields
+        )
+        
+        request_logger.info(f"상표 일괄 상세 조회 완료 - 찾음 {len(results)}개, 없음 {len(not_found)}개")
+        
+        return TrademarkBatchDetailResponse(total=len(results), results=results, not_found=not_found)
+    
+    except (IndexNotFoundError, InvalidParameterError, SearchQueryError, ElasticsearchConnectionError) as e:
+        logger.error(f"상표 일괄 상세 조회 오류: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"예상치 못한 상표 일괄 상세 조회 오류: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다")
+
+
+@router.post("/load-data", status_code=202)
 async def load_data_endpoint(file_path: str = Query(..., description="데이터 파일 경로")):
-    """데이터 수동 로드 API"""
+    """데이터 수동 로드 API
+    
+    적재는 이벤트 루프를 막지 않도록 백그라운드 작업으로 실행하고 작업 상태를 바로 반환합니다
+    (POST /load-data/jobs와 같음). 진행 상황은 GET /load-data/jobs/{job_id}로 조회합니다.
+    """
     try:
         logger.info(f"데이터 로드 요청 - 파일 경로: {file_path}")
         
-        result = await load_trademark_data(file_path)
+        job = ingest_jobs.start(file_path)
         
-        logger.info(f"데이터 로드 완료: {result['success']}개 성공, {result['failed']}개 실패")
-        
-        return {
-            "message": "데이터 로드가 완료되었습니다",
-            "success": result['success'],
-            "failed": result['failed']
-        }
+        return job.to_dict()
     
-    except DataLoadingError as e:
+    except (FileNotFoundError, IngestJobConflictError) as e:
         logger.error(f"데이터 로드 오류: {str(e)}")
         raise e
     except Exception as e:
@@ -191,27 +328,96 @@ async def load_data_endpoint(file_path: str = Query(..., description="데이터
         raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다")
 
 
+@router.post("/load-data/jobs", status_code=202)
+async def start_load_job_endpoint(file_path: str = Query(..., description="데이터 파일 경로")):
+    """백그라운드 데이터 적재 작업 시작 API
+    
+    적재를 백그라운드에서 실행하고 작업 ID를 바로 반환합니다.
+    진행 상황은 GET /load-data/jobs/{job_id}로 조회합니다.
+    """
+    try:
+        logger.info(f"적재 작업 시작 요청 - 파일 경로: {file_path}")
+        
+        job = ingest_jobs.start(file_path)
+        
+        return job.to_dict()
+    
+    except (FileNotFoundError, IngestJobConflictError) as e:
+        logger.error(f"적재 작업 시작 오류: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"예상치 못한 적재 작업 시작 오류: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다")
+
+
+@router.get("/load-data/jobs/{job_id}")
+async def get_load_job_endpoint(job_id: str = Path(..., description="적재 작업 ID")):
+    """적재 작업 상태 조회 API (처리 건수, 처리 속도, 진행률, 남은 예상 시간)"""
+    try:
+        return ingest_jobs.get(job_id).to_dict()
+    
+    except IngestJobNotFoundError as e:
+        logger.warning(f"적재 작업 없음: {job_id}")
+        raise e
+    except Exception as e:
+        logger.error(f"예상치 못한 적재 작업 조회 오류: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다")
+
+
+@router.post("/load-data/jobs/{job_id}/cancel", status_code=202)
+async def cancel_load_job_endpoint(job_id: str = Path(..., description="적재 작업 ID")):
+    """적재 작업 취소 API (현재 벌크 요청이 끝나면 중단)"""
+    try:
+        logger.info(f"적재 작업 취소 요청 - 작업: {job_id}")
+        
+        return ingest_jobs.cancel(job_id).to_dict()
+    
+    except (IngestJobNotFoundError, IngestJobConflictError) as e:
+        logger.error(f"적재 작업 취소 오류: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"예상치 못한 적재 작업 취소 오류: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다")
+
+
+@router.post("/load-data/jobs/{job_id}/resume", status_code=202)
+async def resume_load_job_endpoint(job_id: str = Path(..., description="적재 작업 ID")):
+    """실패했거나 중단된 적재 작업을 마지막 체크포인트부터 이어서 실행하는 API"""
+    try:
+        logger.info(f"적재 작업 재개 요청 - 작업: {job_id}")
+        
+        return ingest_jobs.resume(job_id).to_dict()
+    
+    except (FileNotFoundError, IngestJobNotFoundError, IngestJobConflictError) as e:
+        logger.error(f"적재 작업 재개 오류: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"예상치 못한 적재 작업 재개 오류: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다")
+
+
 @router.get("/status")
 async def check_status():
     """검색 시스템 상태 확인 API"""
     try:
         logger.info("시스템 상태 확인 요청")
         
-        from app.core.elasticsearch import es_client
+        from app.core.elasticsearch import get_async_es_client
         from app.core.config import settings
         
         index_name = settings.ELASTICSEARCH_INDEX
+        es = get_async_es_client()
         
         # Elasticsearch 연결 확인
-        es_info = es_client.info()
+        es_info = await es.info()
         
         # 인덱스 확인
-        index_exists = es_client.indices.exists(index=index_name)
+        index_exists = await es.indices.exists(index=index_name)
         
         # 문서 수 확인
         count = 0
         if index_exists:
-            count = es_client.count(index=index_name)["count"]
+            count = (await es.count(index=index_name))["count"]
         
         status = {
             "elasticsearch": {
@@ -222,6 +428,15 @@ async def check_status():
                 "name": index_name,
                 "exists": index_exists,
                 "document_count": count
+            },
+            "view_count_buffer": view_count_buffer.stats(),
+            "search_cache": search_cache.stats(),
+            "autocomplete_index": autocomplete_index.stats(),
+            "pronunciation_cache": pronunciation_cache.stats(),
+            "pronunciation_dict": pronunciation_dict.stats(),
+            "single_flight": {
+                "search": search_flight.stats(),
+                "autocomplete": autocomplete_flight.stats()
             }
         }
         
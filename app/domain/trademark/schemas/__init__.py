@@ -2,11 +2,18 @@
 from app.domain.trademark.schemas.trademark_response import TrademarkResponse
 from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams
 from app.domain.trademark.schemas.autocomplete_schema import AutocompleteSuggestion, AutocompleteRequest, AutocompleteResponse
+from app.domain.trademark.schemas.trademark_batch_detail import TrademarkBatchDetailRequest, TrademarkBatchDetailResponse
+from app.domain.trademark.schemas.trademark_batch_search import TrademarkBatchSearchRequest, TrademarkBatchSearchItem, TrademarkBatchSearchResponse
 
 __all__ = [
     'TrademarkResponse', 
     'TrademarkSearchParams',
     'AutocompleteSuggestion',
     'AutocompleteRequest',
-    'AutocompleteResponse'
+    'AutocompleteResponse',
+    'TrademarkBatchDetailRequest',
+    'TrademarkBatchDetailResponse',
+    'TrademarkBatchSearchRequest',
+    'TrademarkBatchSearchItem',
+    'TrademarkBatchSearchResponse'
 ]
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""
+상표 일괄 상세 조회 스키마
+
+이 모듈은 여러 출원번호를 한 번에 조회하는 API 요청/응답 모델을 정의합니다.
+"""
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from app.core.config import settings
+from app.domain.trademark.models.trademark_base import TrademarkBase
+
+class TrademarkBatchDetailRequest(BaseModel):
+    """상표 일괄 상세 조회 요청 모델"""
+    application_numbers: List[str] = Field(
+        ...,
+        description="조회할 출원번호 목록",
+        min_items=1,
+        max_items=settings.DETAIL_BATCH_MAX_SIZE
+    )
+    fields: Optional[List[str]] = Field(None, description="반환할 필드 목록 (기본값은 전체)")
+
+class TrademarkBatchDetailResponse(BaseModel):
+    """상표 일괄 상세 조회 응답 모델"""
+    total: int = Field(..., description="찾은 상표 수")
+    results: List[TrademarkBase] = Field(..., description="상표 상세 정보 목록 (요청 순서)")
+    not_found: List[str] = Field(..., description="찾지 못한 출원번호 목록 (요청 순서)")
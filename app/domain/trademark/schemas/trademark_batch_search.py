@@ -0,0 +1,29 @@
+"""
+상표 일괄 검색 스키마
+
+이 모듈은 여러 검색 조건을 한 번에 실행하는 API 요청/응답 모델을 정의합니다.
+"""
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from app.core.config import settings
+from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams
+from app.domain.trademark.schemas.trademark_response import TrademarkResponse
+
+class TrademarkBatchSearchRequest(BaseModel):
+    """상표 일괄 검색 요청 모델"""
+    searches: List[TrademarkSearchParams] = Field(
+        ...,
+        description="검색 조건 목록",
+        min_items=1,
+        max_items=settings.BATCH_SEARCH_MAX_QUERIES
+    )
+
+class TrademarkBatchSearchItem(BaseModel):
+    """검색 조건별 결과 모델"""
+    status: int = Field(..., description="HTTP 상태 코드 (성공 시 200)")
+    result: Optional[TrademarkResponse] = Field(None, description="검색 결과 (성공 시)")
+    error: Optional[str] = Field(None, description="오류 메시지 (실패 시)")
+
+class TrademarkBatchSearchResponse(BaseModel):
+    """상표 일괄 검색 응답 모델"""
+    responses: List[TrademarkBatchSearchItem] = Field(..., description="요청 순서의 검색 조건별 결과")
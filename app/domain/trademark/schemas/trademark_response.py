@@ -3,7 +3,7 @@
 
 이 모듈은 상표 검색 API 응답을 위한 스키마를 정의합니다.
 """
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 from app.domain.trademark.models.trademark_base import TrademarkBase
 
@@ -12,4 +12,5 @@ class TrademarkResponse(BaseModel):
     total: int = Field(..., description="총 검색 결과 수")
     page: int = Field(..., description="현재 페이지")
     size: int = Field(..., description="페이지당 결과 수")
-    results: List[TrademarkBase] = Field(..., description="상표 검색 결과 목록")
\ No newline at end of file
+    results: List[TrademarkBase] = Field(..., description="상표 검색 결과 목록")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (커서 페이지네이션 사용 시, 마지막 페이지면 null)")
\ No newline at end of file
@@ -1,5 +1,6 @@
 # 서비스 패키지 초기화
 from app.domain.trademark.services.load_trademark_data import load_trademark_data
+from app.domain.trademark.services.delta_ingest import load_trademark_delta
 from app.domain.trademark.services.search_trademarks import search_trademarks
 from app.domain.trademark.services.process_trademark_data import process_trademark_data
 from app.domain.trademark.services.helpers import format_date, process_list_field
@@ -7,11 +8,12 @@ from app.domain.trademark.services.autocomplete_service import get_autocomplete_
 from app.domain.trademark.services.chosung_utils import extract_chosung, is_chosung_query, has_korean
 from app.domain.trademark.services.pronunciation_utils import english_to_korean_pronunciation
 from app.domain.trademark.services.view_count_service import increment_view_count
-from app.domain.trademark.services.trademark_detail_service import get_trademark_by_pid, get_trademark_by_application_number
+from app.domain.trademark.services.trademark_detail_service import get_trademark_by_pid, get_trademark_by_application_number, get_trademarks_by_application_numbers
 from app.domain.trademark.services.pid_utils import generate_next_pid, is_valid_pid
 
 __all__ = [
     'load_trademark_data',
+    'load_trademark_delta',
     'search_trademarks',
     'process_trademark_data',
     'format_date',
@@ -24,6 +26,7 @@ __all__ = [
     'increment_view_count',
     'get_trademark_by_pid',
     'get_trademark_by_application_number',
+    'get_trademarks_by_application_numbers',
     'generate_next_pid',
     'is_valid_pid'
 ]
@@ -0,0 +1,299 @@
+"""
+메모리 기반 자동완성 인덱스
+
+이 모듈은 상표명, 영문 상표명, 상표명 초성, 영문 발음 초성으로 구성한
+정렬 배열 기반 접두사 인덱스를 제공합니다. 접두사 범위는 이진 탐색으로 찾고,
+짧은 접두사(1~2글자)는 상위 결과를 미리 계산해 두어 요청마다 Elasticsearch를 호출하지 않고
+마이크로초 단위로 응답합니다.
+"""
+import bisect
+import heapq
+import re
+import threading
+import time
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Tuple
+
+from loguru import logger
+
+from app.core.config import settings
+from app.domain.trademark.schemas.autocomplete_schema import AutocompleteSuggestion
+from app.domain.trademark.services.search_cache import search_cache
+
+# 필드별 가중치 (Elasticsearch 자동완성 쿼리의 boost와 같은 순서)
+FIELD_WEIGHTS = {
+    "productName": 5.0,
+    "productName_chosung": 5.0,
+    "productNameEngPronunciation_chosung": 4.0,
+    "productNameEng": 3.0
+}
+
+# 상표명 중간 단어에서 시작하는 일치의 가중치 비율
+WORD_START_FACTOR = 0.8
+
+# 상위 결과를 미리 계산해 둘 접두사 최대 길이와 결과 수
+PRECOMPUTED_PREFIX_LENGTH = 2
+PRECOMPUTED_TOP_K = 20
+
+# 접두사 범위 상한 계산용 문자
+_PREFIX_END = "\U0010ffff"
+
+_WORD_PATTERN = re.compile(r"\S+")
+
+def normalize_key(text: str) -> str:
+    """검색 키 정규화 (소문자 변환, 공백 제거)"""
+    return "".join(text.lower().split())
+
+class _Entry(NamedTuple):
+    """자동완성 대상 상표 (상표명/영문명 조합별 1건)"""
+    text: str
+    product_name_eng: Optional[str]
+    view_count: int
+    fields: Dict[str, str]
+
+class _Posting(NamedTuple):
+    """정렬된 키 하나가 가리키는 상표와 필드 위치"""
+    entry: int
+    field: str
+    offset: int
+    weight: float
+
+class _Snapshot(NamedTuple):
+    """빌드가 끝난 읽기 전용 인덱스"""
+    index_name: str
+    generation: int
+    built_at: float
+    entries: List[_Entry]
+    keys: List[str]
+    postings: List[_Posting]
+    top_by_prefix: Dict[str, List[Tuple[float, int, int]]]
+
+class AutocompleteIndex:
+    """
+    접두사 자동완성 인덱스
+
+    빌드 결과는 불변 스냅샷으로 만들어 참조만 교체하므로, 재빌드 중에도
+    기존 스냅샷으로 요청을 처리할 수 있습니다.
+    스냅샷은 AUTOCOMPLETE_INDEX_TTL이 지나면 만료되어, 다른 워커/프로세스에서
+    재적재하거나 별칭을 전환한 경우에도 오래된 데이터를 계속 제공하지 않습니다.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[_Snapshot] = None
+        self._rebuild_lock = threading.Lock()
+        self._rebuilding = False
+
+    def is_ready(self, index_name: str) -> bool:
+        """해당 인덱스의 최신 데이터로 빌드되어 있고 만료되지 않았는지 확인"""
+        snapshot = self._snapshot
+        return (
+            snapshot is not None
+            and snapshot.index_name == index_name
+            and snapshot.generation == search_cache.generation
+            and not self.is_expired(index_name)
+        )
+
+    def is_expired(self, index_name: str) -> bool:
+        """해당 인덱스의 스냅샷이 유효 시간(AUTOCOMPLETE_INDEX_TTL)을 넘겼는지 확인"""
+        snapshot = self._snapshot
+        return (
+            snapshot is not None
+            and snapshot.index_name == index_name
+            and settings.AUTOCOMPLETE_INDEX_TTL > 0
+            and time.monotonic() - snapshot.built_at >= settings.AUTOCOMPLETE_INDEX_TTL
+        )
+
+    def schedule_rebuild(self, index_name: str) -> bool:
+        """
+        백그라운드 스레드에서 재빌드 (이미 재빌드 중이면 무시)
+
+        Returns:
+            bool: 재빌드를 시작했는지 여부
+        """
+        with self._rebuild_lock:
+            if self._rebuilding:
+                return False
+            self._rebuilding = True
+
+        threading.Thread(
+            target=self._rebuild_in_background,
+            args=(index_name,),
+            name="autocomplete-rebuild",
+            daemon=True
+        ).start()
+        return True
+
+    def _rebuild_in_background(self, index_name: str):
+        try:
+            self.rebuild(index_name)
+        except Exception as e:
+            logger.error(f"자동완성 인덱스 재빌드 실패: {str(e)}")
+        finally:
+            with self._rebuild_lock:
+                self._rebuilding = False
+
+    def rebuild(self, index_name: str = None) -> int:
+        """
+        Elasticsearch 인덱스 전체를 읽어 자동완성 인덱스 재빌드
+
+        Returns:
+            int: 자동완성 대상 상표 수
+        """
+        from elasticsearch.helpers import scan
+        from app.core.elasticsearch import es_client
+
+        index_name = index_name or settings.ELASTICSEARCH_INDEX
+        # 읽는 도중 데이터가 바뀌면 무효화되도록 시작 시점의 세대를 기록
+        generation = search_cache.generation
+
+        start_time = time.perf_counter()
+        records = (
+            hit["_source"]
+            for hit in scan(
+                es_client,
+                index=index_name,
+                query={"_source": list(FIELD_WEIGHTS) + ["viewCount"]},
+                size=1000
+            )
+        )
+        count = self.build(records, index_name, generation)
+
+        logger.info(
+            f"자동완성 인덱스 빌드 완료 - 인덱스: {index_name}, 상표 {count}개, "
+            f"키 {len(self._snapshot.keys)}개, {time.perf_counter() - start_time:.2f}초"
+        )
+        return count
+
+    def build(self, records: Iterable[Dict[str, Any]], index_name: str, generation: int) -> int:
+        """상표 레코드 목록으로 스냅샷을 만들어 교체"""
+        grouped: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+
+        # 같은 상표명/영문명 조합은 하나로 합치고 조회수를 합산
+        for record in records:
+            text = record.get("productName") or record.get("productNameEng")
+            if not text:
+                continue
+            key = (text, record.get("productNameEng"))
+            group = grouped.get(key)
+            if group is None:
+                group = grouped[key] = {"view_count": 0, "fields": {}}
+            group["view_count"] += record.get("viewCount") or 0
+            for field in FIELD_WEIGHTS:
+                value = record.get(field)
+                if value and field not in group["fields"]:
+                    group["fields"][field] = value
+
+        entries = [
+            _Entry(text, eng, group["view_count"], group["fields"])
+            for (text, eng), group in grouped.items()
+        ]
+
+        pairs = []
+        for entry_idx, entry in enumerate(entries):
+            for field, value in entry.fields.items():
+                weight = FIELD_WEIGHTS[field]
+                for i, match in enumerate(_WORD_PATTERN.finditer(value)):
+                    key = normalize_key(value[match.start():])
+                    factor = 1.0 if i == 0 else WORD_START_FACTOR
+                    pairs.append((key, _Posting(entry_idx, field, match.start(), weight * factor)))
+
+        pairs.sort(key=lambda pair: pair[0])
+        keys = [key for key, _ in pairs]
+        postings = [posting for _, posting in pairs]
+
+        snapshot = _Snapshot(index_name, generation, time.monotonic(), entries, keys, postings, {})
+        snapshot.top_by_prefix.update(_precompute_top_by_prefix(snapshot))
+
+        self._snapshot = snapshot
+        return len(entries)
+
+    def suggest(self, query: str, size: int = 10) -> List[AutocompleteSuggestion]:
+        """접두사 일치 상위 결과 반환 (점수, 조회수 순)"""
+        snapshot = self._snapshot
+        prefix = normalize_key(query or "")
+        if snapshot is None or not prefix:
+            return []
+
+        ranked = snapshot.top_by_prefix.get(prefix) if size <= PRECOMPUTED_TOP_K else None
+        if ranked is None:
+            lo = bisect.bisect_left(snapshot.keys, prefix)
+            hi = bisect.bisect_left(snapshot.keys, prefix + _PREFIX_END, lo)
+            ranked = _rank(snapshot, range(lo, hi), len(prefix), size)
+
+        return [
+            _to_suggestion(snapshot, posting_idx, score, len(prefix))
+            for score, _, posting_idx in ranked[:size]
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """인덱스 상태"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return {"ready": False}
+        return {
+            "ready": self.is_ready(snapshot.index_name),
+            "index": snapshot.index_name,
+            "trademarks": len(snapshot.entries),
+            "keys": len(snapshot.keys)
+        }
+
+def _rank(snapshot: _Snapshot, posting_range: Iterable[int], prefix_len: int, size: int) -> List[Tuple[float, int, int]]:
+    """접두사 범위의 키를 상표별 최고 점수로 모아 상위 size개 반환"""
+    best: Dict[int, Tuple[float, int]] = {}
+    for i in posting_range:
+        posting = snapshot.postings[i]
+        # 키 길이 대비 입력 길이가 길수록(더 정확히 일치할수록) 높은 점수
+        score = posting.weight * (1.0 + prefix_len / len(snapshot.keys[i]))
+        current = best.get(posting.entry)
+        if current is None or score > current[0]:
+            best[posting.entry] = (score, i)
+
+    return heapq.nlargest(
+        size,
+        ((score, snapshot.entries[entry].view_count, posting_idx) for entry, (score, posting_idx) in best.items()),
+        key=lambda item: (item[0], item[1])
+    )
+
+def _precompute_top_by_prefix(snapshot: _Snapshot) -> Dict[str, List[Tuple[float, int, int]]]:
+    """짧은 접두사별 상위 결과 미리 계산"""
+    top_by_prefix = {}
+    keys = snapshot.keys
+
+    for length in range(1, PRECOMPUTED_PREFIX_LENGTH + 1):
+        start = 0
+        while start < len(keys):
+            # 접두사보다 짧은 키는 정렬상 앞에 오므로 건너뜀
+            if len(keys[start]) < length:
+                start += 1
+                continue
+            prefix = keys[start][:length]
+            end = bisect.bisect_left(keys, prefix + _PREFIX_END, start)
+            top_by_prefix[prefix] = _rank(snapshot, range(start, end), length, PRECOMPUTED_TOP_K)
+            start = end
+
+    return top_by_prefix
+
+def _to_suggestion(snapshot: _Snapshot, posting_idx: int, score: float, prefix_len: int) -> AutocompleteSuggestion:
+    """인덱스 항목을 자동완성 제안으로 변환 (일치 구간 하이라이트 포함)"""
+    posting = snapshot.postings[posting_idx]
+    entry = snapshot.entries[posting.entry]
+    value = entry.fields[posting.field]
+
+    return AutocompleteSuggestion(
+        text=entry.text,
+        productNameEng=entry.product_name_eng,
+        score=round(score, 4),
+        highlight={posting.field: [_highlight(value, posting.offset, prefix_len)]}
+    )
+
+def _highlight(text: str, offset: int, length: int) -> str:
+    """offset부터 공백을 제외한 length글자를 <mark>로 감쌈"""
+    end = offset
+    consumed = 0
+    while end < len(text) and consumed < length:
+        if not text[end].isspace():
+            consumed += 1
+        end += 1
+    return f"{text[:offset]}<mark>{text[offset:end]}</mark>{text[end:]}"
+
+# 전역 자동완성 인덱스 인스턴스
+autocomplete_index = AutocompleteIndex()
@@ -3,16 +3,20 @@
 
 이 모듈은 상표명 자동완성 로직을 제공합니다.
 초성 검색을 지원합니다.
+메모리 자동완성 인덱스에서 먼저 접두사 일치를 찾고, 결과가 없을 때만
+Elasticsearch 퍼지 검색을 사용합니다.
 """
 from typing import List, Dict, Any
 from elasticsearch import NotFoundError
 from loguru import logger
 
-from app.core.elasticsearch import es_client
+from app.core.elasticsearch import get_async_es_client
 from app.core.config import settings
 from app.domain.trademark.schemas.autocomplete_schema import AutocompleteSuggestion, AutocompleteResponse
 from app.core.exceptions import SearchQueryError, IndexNotFoundError
 from app.domain.trademark.services.chosung_utils import is_chosung_query, has_korean
+from app.domain.trademark.services.autocomplete_index import autocomplete_index
+from app.domain.trademark.services.single_flight import autocomplete_flight
 
 async def get_autocomplete_suggestions(query: str, size: int = 10) -> AutocompleteResponse:
     """
@@ -31,17 +35,41 @@ async def get_autocomplete_suggestions(query: str, size: int = 10) -> Autocomple
     """
     index_name = settings.ELASTICSEARCH_INDEX
     
+    # 메모리 자동완성 인덱스 우선 조회
+    if settings.AUTOCOMPLETE_INDEX_ENABLED and autocomplete_index.is_ready(index_name):
+        suggestions = autocomplete_index.suggest(query, size)
+        if suggestions:
+            return AutocompleteResponse(
+                suggestions=suggestions,
+                total=len(suggestions)
+            )
+        logger.debug("메모리 자동완성 결과 없음 - Elasticsearch 퍼지 검색 사용: {}", query)
+    elif settings.AUTOCOMPLETE_INDEX_ENABLED and autocomplete_index.is_expired(index_name):
+        # 다른 워커의 재적재/별칭 전환이 반영되도록 재빌드하는 동안 Elasticsearch 사용
+        autocomplete_index.schedule_rebuild(index_name)
+    
+    # 동일한 동시 자동완성 요청은 Elasticsearch 호출 하나로 병합
+    if settings.SINGLE_FLIGHT_ENABLED:
+        return await autocomplete_flight.do(
+            (index_name, query, size),
+            lambda: _search_autocomplete(index_name, query, size)
+        )
+    
+    return await _search_autocomplete(index_name, query, size)
+
+async def _search_autocomplete(index_name: str, query: str, size: int) -> AutocompleteResponse:
+    """Elasticsearch 자동완성 검색 실행"""
     try:
         # 쿼리 분석
         chosung_only = is_chosung_query(query)
         has_korean_chars = has_korean(query)
         
-        logger.debug(f"자동완성 쿼리 분석 - 쿼리: {query}, 초성만: {chosung_only}, 한글 포함: {has_korean_chars}")
+        logger.debug("자동완성 쿼리 분석 - 쿼리: {}, 초성만: {}, 한글 포함: {}", query, chosung_only, has_korean_chars)
         
         # 1. 기본 검색 쿼리
         if chosung_only:
             # 초성 검색인 경우
-            logger.debug(f"초성 자동완성 검색 모드 적용: {query}")
+            logger.debug("초성 자동완성 검색 모드 적용: {}", query)
             base_query = {
                 "match_phrase_prefix": {
                     "productName_chosung": {
@@ -71,7 +99,7 @@ async def get_autocomplete_suggestions(query: str, size: int = 10) -> Autocomple
         # 2. 한글이 포함된 일반 검색인 경우 초성 검색도 추가
         mixed_query = None
         if has_korean_chars and not chosung_only:
-            logger.debug(f"한글 포함 - 초성 부분 검색도 활성화")
+            logger.debug("한글 포함 - 초성 부분 검색도 활성화")
             mixed_query = {
                 "match": {
                     "productName_chosung": {
@@ -93,10 +121,10 @@ async def get_autocomplete_suggestions(query: str, size: int = 10) -> Autocomple
             }
         }
         
-        logger.debug(f"자동완성 최종 쿼리: {final_query}")
+        logger.debug("자동완성 최종 쿼리: {}", final_query)
         
         # 4. Elasticsearch 검색 실행
-        response = es_client.search(
+        response = await get_async_es_client().search(
             index=index_name,
             body={
                 "query": final_query,
@@ -148,7 +176,7 @@ async def get_autocomplete_suggestions(query: str, size: int = 10) -> Autocomple
             )
             suggestions.append(suggestion)
             
-            logger.debug(f"자동완성 결과: {original_name} (초성: {chosung_info}), 점수: {hit['_score']}")
+            logger.debug("자동완성 결과: {} (초성: {}), 점수: {}", original_name, chosung_info, hit["_score"])
         
         return AutocompleteResponse(
             suggestions=suggestions,
@@ -0,0 +1,229 @@
+"""
+상표 데이터 증분 적재 함수
+
+이 모듈은 출원번호를 키로 새 데이터 파일과 색인된 문서를 비교하여
+바뀐 레코드만 전처리하고 반영하는 함수를 제공합니다.
+원본 레코드의 내용 해시(contentHash)가 같으면 초성 추출, 발음 변환을 포함한 전처리를 건너뛰고,
+바뀐 문서는 pid와 조회수(viewCount)를 유지한 채 덮어씁니다.
+"""
+import logging
+import time
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
+
+from elasticsearch.helpers import scan, streaming_bulk
+
+from app.core.elasticsearch import es_client
+from app.core.config import settings
+from app.core.metrics import record_ingest
+from app.domain.trademark.index.create_trademark_index import create_trademark_index
+from app.domain.trademark.index.trademark_mapping import trademark_mapping
+from app.domain.trademark.services.helpers import content_hash
+from app.domain.trademark.services.process_trademark_data import process_trademark_data
+from app.domain.trademark.services.search_cache import bump_index_generation
+from app.domain.trademark.services.pronunciation_cache import pronunciation_cache
+from app.domain.trademark.services.trademark_file_reader import iter_trademark_records_with_offsets
+from app.domain.trademark.services.load_trademark_data import (
+    PROGRESS_LOG_INTERVAL,
+    rebuild_autocomplete_index,
+    get_peak_rss_mb
+)
+
+if TYPE_CHECKING:
+    from app.domain.trademark.services.ingest_jobs import IngestJob
+
+logger = logging.getLogger(__name__)
+
+# 기존 문서의 조회수를 유지하면서 문서 전체를 교체하는 스크립트
+DELTA_UPSERT_SCRIPT = (
+    "def viewCount = ctx._source.viewCount; "
+    "ctx._source.clear(); "
+    "ctx._source.putAll(params.doc); "
+    "if (viewCount != null) { ctx._source.viewCount = viewCount }"
+)
+
+async def load_trademark_delta(
+    file_path: str,
+    delete_missing: Optional[bool] = None,
+    chunk_size: Optional[int] = None,
+    job: Optional["IngestJob"] = None
+) -> Dict[str, Any]:
+    """
+    상표 데이터 증분 적재
+
+    Args:
+        file_path (str): 데이터 파일 경로 (JSON 배열 또는 NDJSON)
+        delete_missing (bool, optional): 파일에 없는 문서 삭제 여부. 기본값은 INGEST_DELTA_DELETE_MISSING
+        chunk_size (int, optional): 기존 문서 조회 및 벌크 요청당 문서 수
+        job (IngestJob, optional): 백그라운드 적재 작업 (레코드마다 진행 상황 기록, 항상 파일 처음부터 적재)
+
+    Returns:
+        Dict[str, Any]: 생성/변경/미변경/삭제/실패 건수 및 처리 속도
+    """
+    if delete_missing is None:
+        delete_missing = settings.INGEST_DELTA_DELETE_MISSING
+    chunk_size = chunk_size or settings.INGEST_CHUNK_SIZE
+    index_name = settings.ELASTICSEARCH_INDEX
+
+    try:
+        if not es_client.indices.exists(index=index_name):
+            create_trademark_index()
+        else:
+            # 내용 해시 필드가 없던 기존 인덱스에도 매핑 추가
+            es_client.indices.put_mapping(
+                index=index_name,
+                body={"properties": {"contentHash": trademark_mapping["mappings"]["properties"]["contentHash"]}}
+            )
+
+        start_time = time.perf_counter()
+        stats = {"created": 0, "updated": 0, "unchanged": 0, "deleted": 0, "failed": 0}
+        seen_ids: Set[str] = set()
+
+        records = iter_trademark_records_with_offsets(file_path)
+        actions = _generate_delta_actions(records, index_name, chunk_size, stats, seen_ids, job)
+        for ok, item in streaming_bulk(es_client, actions, chunk_size=chunk_size, raise_on_error=False):
+            result = item["update"]
+            if not ok:
+                stats["failed"] += 1
+                logger.warning(f"문서 증분 반영 실패: {item}")
+            elif result.get("result") == "created":
+                stats["created"] += 1
+            else:
+                stats["updated"] += 1
+
+            processed = stats["created"] + stats["updated"] + stats["failed"]
+            if processed % PROGRESS_LOG_INTERVAL == 0:
+                logger.info(f"증분 반영 진행 중: {processed}개 반영, {stats['unchanged']}개 미변경")
+
+            if job is not None:
+                job.advance(ok)
+
+        if delete_missing:
+            stats["deleted"] = _delete_missing_documents(index_name, seen_ids, chunk_size)
+
+        changed = stats["created"] + stats["updated"] + stats["deleted"]
+        if changed:
+            es_client.indices.refresh(index=index_name)
+            bump_index_generation()
+            rebuild_autocomplete_index(index_name)
+
+        pronunciation_cache.flush()
+
+        elapsed = time.perf_counter() - start_time
+        total = len(seen_ids) + stats["failed"]
+        docs_per_sec = total / elapsed if elapsed > 0 else 0.0
+        peak_rss_mb = get_peak_rss_mb()
+        record_ingest("delta", total - stats["failed"], stats["failed"], elapsed)
+
+        logger.info(
+            f"증분 적재 완료: 생성 {stats['created']}개, 변경 {stats['updated']}개, "
+            f"미변경 {stats['unchanged']}개, 삭제 {stats['deleted']}개, 실패 {stats['failed']}개, "
+            f"{elapsed:.2f}초, {docs_per_sec:.1f} docs/sec"
+        )
+
+        return {
+            "success": stats["created"] + stats["updated"] + stats["unchanged"],
+            **stats,
+            "elapsed_seconds": round(elapsed, 3),
+            "docs_per_sec": round(docs_per_sec, 1),
+            "peak_rss_mb": peak_rss_mb
+        }
+
+    except Exception as e:
+        logger.error(f"상표 데이터 증분 적재 실패: {str(e)}")
+        raise e
+
+def _generate_delta_actions(
+    records: Iterable[Tuple[Dict[str, Any], int]],
+    index_name: str,
+    chunk_size: int,
+    stats: Dict[str, int],
+    seen_ids: Set[str],
+    job: Optional["IngestJob"] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    레코드를 청크 단위로 기존 문서와 비교하여 바뀐 레코드만 upsert 작업으로 변환
+
+    출원번호가 없는 레코드는 기존 문서와 대응시킬 수 없으므로 실패로 집계합니다.
+    """
+    batch: List[Tuple[Dict[str, Any], int]] = []
+    for record, offset in records:
+        application_number = record.get("applicationNumber")
+        if not application_number or application_number == "null":
+            stats["failed"] += 1
+            logger.warning(f"출원번호가 없는 레코드는 증분 적재할 수 없습니다: {record.get('productName')}")
+            if job is not None:
+                job.advance(False, offset)
+            continue
+
+        batch.append((record, offset))
+        if len(batch) >= chunk_size:
+            yield from _delta_batch_actions(batch, index_name, stats, seen_ids, job)
+            batch = []
+
+    if batch:
+        yield from _delta_batch_actions(batch, index_name, stats, seen_ids, job)
+
+def _delta_batch_actions(
+    batch: List[Tuple[Dict[str, Any], int]],
+    index_name: str,
+    stats: Dict[str, int],
+    seen_ids: Set[str],
+    job: Optional["IngestJob"] = None
+) -> Iterator[Dict[str, Any]]:
+    """청크 하나의 기존 문서 해시/pid를 mget으로 조회한 뒤 바뀐 레코드의 작업 생성"""
+    ids = [str(record["applicationNumber"]) for record, _ in batch]
+    response = es_client.mget(index=index_name, body={"ids": ids}, _source_includes=["contentHash", "pid"])
+    existing = {doc["_id"]: doc["_source"] for doc in response["docs"] if doc.get("found")}
+
+    for document_id, (record, offset) in zip(ids, batch):
+        seen_ids.add(document_id)
+        record_hash = content_hash(record)
+        current = existing.get(document_id)
+
+        if current is not None and current.get("contentHash") == record_hash:
+            stats["unchanged"] += 1
+            if job is not None:
+                job.advance(True, offset)
+            continue
+
+        # 기존 문서의 pid를 유지하여 새 pid를 발급하지 않음
+        if current is not None and current.get("pid"):
+            record = dict(record, pid=current["pid"])
+
+        processed = process_trademark_data(record)
+        processed["contentHash"] = record_hash
+
+        yield {
+            "_op_type": "update",
+            "_index": index_name,
+            "_id": document_id,
+            "script": {
+                "source": DELTA_UPSERT_SCRIPT,
+                "lang": "painless",
+                "params": {"doc": processed}
+            },
+            "upsert": processed
+        }
+
+def _delete_missing_documents(index_name: str, seen_ids: Set[str], chunk_size: int) -> int:
+    """파일에 없는 문서 삭제 (파일에서 읽은 문서가 없으면 전체 삭제를 막기 위해 건너뜀)"""
+    if not seen_ids:
+        logger.warning("증분 적재 파일에서 읽은 문서가 없어 누락 문서 삭제를 건너뜁니다.")
+        return 0
+
+    missing = (
+        hit["_id"]
+        for hit in scan(es_client, index=index_name, query={"query": {"match_all": {}}, "_source": False})
+        if hit["_id"] not in seen_ids
+    )
+    actions = ({"_op_type": "delete", "_index": index_name, "_id": document_id} for document_id in missing)
+
+    deleted = 0
+    for ok, item in streaming_bulk(es_client, actions, chunk_size=chunk_size, raise_on_error=False):
+        if ok:
+            deleted += 1
+        else:
+            logger.warning(f"누락 문서 삭제 실패: {item}")
+
+    logger.info(f"새 파일에 없는 문서 {deleted}개를 삭제했습니다.")
+    return deleted
@@ -0,0 +1,257 @@
+"""
+상표 검색 결과 내보내기
+
+이 모듈은 검색 조건에 맞는 전체 상표를 NDJSON 또는 CSV로 스트리밍하는 함수를 제공합니다.
+PIT(point in time)를 여러 slice로 나누어 병렬로 읽고, 크기가 제한된 큐를 거쳐
+배치 단위로 내보내므로 결과 수와 관계없이 API 프로세스의 메모리 사용량이 일정합니다.
+PIT는 응답 본문(ExportStream)이 닫힐 때 닫으므로, 본문을 끝까지 읽지 않거나 전혀 읽지 않아도 남지 않습니다.
+"""
+import asyncio
+import csv
+import io
+import json
+from typing import Dict, Any, AsyncIterator, List, Optional
+
+from elasticsearch import NotFoundError
+from loguru import logger
+
+from app.core.elasticsearch import get_async_es_client
+from app.core.config import settings
+from app.core.exceptions import (
+    SearchQueryError,
+    IndexNotFoundError,
+    ElasticsearchConnectionError,
+    InvalidParameterError
+)
+from app.domain.trademark.models.trademark_base import TrademarkBase
+from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams
+from app.domain.trademark.services.search_trademarks import build_search_query
+
+# 내보낼 수 있는 필드 (기본값은 전체)
+EXPORT_FIELDS = list(TrademarkBase.__fields__)
+
+# 내보내기 형식별 Content-Type
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv"
+}
+
+# CSV에서 리스트 필드 값 구분자
+CSV_LIST_SEPARATOR = "|"
+
+# slice 작업 종료 표시
+_SLICE_DONE = object()
+
+class ExportStream:
+    """
+    내보내기 응답 본문
+
+    끝까지 읽거나 읽는 중 오류가 나면 PIT를 닫고, 그 전에 aclose()를 호출하면(연결 끊김 등)
+    slice 작업을 취소하고 PIT를 닫습니다. 본문을 전혀 읽지 않았어도 aclose()로 PIT가 닫히므로,
+    응답 전송이 끝난 뒤 항상 aclose()를 호출합니다(StreamingResponse의 background).
+    """
+
+    def __init__(self, chunks: AsyncIterator[str], pit_id: str):
+        self._chunks = chunks
+        self._pit_id = pit_id
+        self._closed = False
+
+    def __aiter__(self) -> "ExportStream":
+        return self
+
+    async def __anext__(self) -> str:
+        try:
+            return await self._chunks.__anext__()
+        except Exception:
+            # 끝까지 읽었거나(StopAsyncIteration) 오류가 난 경우
+            await self.aclose()
+            raise
+
+    async def aclose(self):
+        """slice 작업 취소 및 PIT 닫기 (여러 번 호출해도 한 번만 닫음)"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._chunks.aclose()
+        finally:
+            try:
+                await get_async_es_client().close_point_in_time(body={"id": self._pit_id})
+            except Exception as e:
+                logger.warning(f"PIT 닫기 실패: {str(e)}")
+
+def resolve_export_fields(fields: Optional[str]) -> List[str]:
+    """
+    쉼표로 구분된 필드 목록 검증
+
+    Raises:
+        InvalidParameterError: 내보낼 수 없는 필드가 포함된 경우
+    """
+    if not fields:
+        return EXPORT_FIELDS
+
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in EXPORT_FIELDS]
+    if unknown or not requested:
+        raise InvalidParameterError(f"내보낼 수 없는 필드: {', '.join(unknown)}")
+    return requested
+
+async def open_export(
+    search_params: TrademarkSearchParams,
+    export_format: str,
+    fields: List[str]
+) -> ExportStream:
+    """
+    내보내기 스트림 생성
+
+    응답을 시작하기 전에 PIT를 열어 인덱스 오류를 일반 오류 응답으로 반환할 수 있게 하고,
+    이후 결과는 반환된 스트림으로 읽습니다. 스트림은 다 읽은 뒤에도 aclose()로 닫아야 합니다.
+
+    Args:
+        search_params (TrademarkSearchParams): 검색 조건 (페이지, 정렬은 무시)
+        export_format (str): "ndjson" 또는 "csv"
+        fields (List[str]): 내보낼 필드 목록
+
+    Returns:
+        ExportStream: 응답 본문 조각을 반환하는 비동기 이터레이터
+
+    Raises:
+        InvalidParameterError: 지원하지 않는 형식
+        IndexNotFoundError: 인덱스를 찾을 수 없는 경우
+        ElasticsearchConnectionError: Elasticsearch 연결 오류
+        SearchQueryError: 기타 Elasticsearch 오류
+    """
+    if export_format not in EXPORT_MEDIA_TYPES:
+        raise InvalidParameterError(f"지원하지 않는 내보내기 형식: {export_format}")
+
+    index_name = settings.ELASTICSEARCH_INDEX
+    keep_alive = settings.EXPORT_KEEP_ALIVE
+
+    try:
+        pit = await get_async_es_client().open_point_in_time(index=index_name, keep_alive=keep_alive)
+    except NotFoundError:
+        logger.error(f"인덱스 '{index_name}'를 찾을 수 없습니다")
+        raise IndexNotFoundError(index_name)
+    except ConnectionError as e:
+        logger.error(f"Elasticsearch 연결 오류: {str(e)}")
+        raise ElasticsearchConnectionError()
+    except Exception as e:
+        logger.error(f"내보내기 PIT 생성 오류: {str(e)}", exc_info=True)
+        raise SearchQueryError(detail=str(e))
+
+    # 점수 계산이 필요 없으므로 filter 문맥으로 실행
+    query = {"bool": {"filter": [build_search_query(search_params)]}}
+    batches = _iter_sliced_batches(pit["id"], query, fields, settings.EXPORT_SLICES, settings.EXPORT_BATCH_SIZE)
+
+    if export_format == "csv":
+        return ExportStream(_format_csv(batches, fields), pit["id"])
+    return ExportStream(_format_ndjson(batches), pit["id"])
+
+async def _iter_sliced_batches(
+    pit_id: str,
+    query: Dict[str, Any],
+    fields: List[str],
+    slices: int,
+    batch_size: int
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    PIT를 slice별로 병렬 조회하여 문서 배치를 반환 (slice 간 순서는 보장하지 않음)
+
+    각 slice는 큐가 가득 차면 대기하므로 응답 전송 속도에 맞춰 조회합니다.
+    """
+    client = get_async_es_client()
+    keep_alive = settings.EXPORT_KEEP_ALIVE
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(2, slices * 2))
+
+    async def read_slice(slice_id: int):
+        search_after = None
+        try:
+            while True:
+                body = {
+                    "query": query,
+                    "size": batch_size,
+                    "_source": fields,
+                    "pit": {"id": pit_id, "keep_alive": keep_alive},
+                    "sort": ["_shard_doc"],
+                    "track_total_hits": False
+                }
+                if slices > 1:
+                    body["slice"] = {"id": slice_id, "max": slices}
+                if search_after is not None:
+                    body["search_after"] = search_after
+
+                response = await client.search(body=body)
+                hits = response["hits"]["hits"]
+                if hits:
+                    await queue.put([hit["_source"] for hit in hits])
+                if len(hits) < batch_size:
+                    break
+                search_after = hits[-1]["sort"]
+            await queue.put(_SLICE_DONE)
+        except Exception as e:
+            await queue.put(e)
+
+    tasks = [asyncio.ensure_future(read_slice(slice_id)) for slice_id in range(slices)]
+    exported = 0
+
+    try:
+        remaining = slices
+        while remaining:
+            item = await queue.get()
+            if item is _SLICE_DONE:
+                remaining -= 1
+                continue
+            if isinstance(item, Exception):
+                raise item
+            exported += len(item)
+            yield item
+
+        logger.info(f"내보내기 완료 - {exported}건, slice {slices}개")
+
+    except Exception as e:
+        # 응답 전송이 시작된 뒤라 오류 응답을 보낼 수 없으므로, 다시 발생시켜 서버가 연결을 끊도록 함
+        # (정상 종료하면 클라이언트는 잘린 결과를 완전한 200 응답으로 받음)
+        logger.error(f"내보내기 중 오류 ({exported}건 전송 후): {str(e)}", exc_info=True)
+        raise
+
+    finally:
+        # PIT는 ExportStream에서 닫음
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+async def _format_ndjson(batches: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[str]:
+    """문서 배치를 NDJSON 조각으로 변환"""
+    try:
+        async for batch in batches:
+            yield "".join(json.dumps(doc, ensure_ascii=False) + "\n" for doc in batch)
+    finally:
+        # 클라이언트 연결이 끊긴 경우에도 slice 작업 취소
+        await batches.aclose()
+
+async def _format_csv(batches: AsyncIterator[List[Dict[str, Any]]], fields: List[str]) -> AsyncIterator[str]:
+    """문서 배치를 CSV 조각으로 변환 (첫 조각은 헤더, 리스트 값은 '|'로 연결)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    try:
+        # Excel에서 한글이 깨지지 않도록 BOM 포함 (헤더 전송 중 연결이 끊겨도 PIT를 닫도록 try 안에서 전송)
+        writer.writerow(fields)
+        yield "\ufeff" + buffer.getvalue()
+
+        async for batch in batches:
+            buffer.seek(0)
+            buffer.truncate()
+            for doc in batch:
+                writer.writerow([_csv_value(doc.get(field)) for field in fields])
+            yield buffer.getvalue()
+    finally:
+        await batches.aclose()
+
+def _csv_value(value: Any) -> Any:
+    """CSV 셀 값 변환"""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(str(item) for item in value)
+    return value
@@ -3,11 +3,19 @@
 
 이 모듈은 데이터 처리에 필요한 헬퍼 함수들을 제공합니다.
 """
+import hashlib
+import json
 import logging
 from typing import List, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# 내용 해시 버전 (전처리 로직이 바뀌어 모든 문서를 다시 전처리해야 하면 올림)
+CONTENT_HASH_VERSION = "1"
+
+# 내용 해시에서 제외할 필드 (색인 시 부여되거나 서비스 중 바뀌는 값)
+_CONTENT_HASH_EXCLUDED = {"pid", "viewCount", "contentHash"}
+
 def format_date(date_str: str) -> Optional[str]:
     """YYYYMMDD 형식의 날짜 문자열을 ISO 형식으로 변환"""
     if not date_str or date_str == "null":
@@ -31,4 +39,18 @@ def process_list_field(field_value: Any) -> List:
         return None
     if isinstance(field_value, list):
         return field_value
-    return [field_value]  # 단일 값인 경우 리스트로 변환
\ No newline at end of file
+    return [field_value]  # 단일 값인 경우 리스트로 변환
+
+def get_document_id(trademark: dict) -> Optional[str]:
+    """색인 시 사용할 문서 _id 반환 (출원번호 우선, 없으면 pid)"""
+    application_number = trademark.get("applicationNumber")
+    if application_number and application_number != "null":
+        return str(application_number)
+    pid = trademark.get("pid")
+    return str(pid) if pid else None
+
+def content_hash(trademark: dict) -> str:
+    """원본 레코드의 내용 해시 (키 순서와 무관, pid/viewCount 제외)"""
+    content = {key: value for key, value in trademark.items() if key not in _CONTENT_HASH_EXCLUDED}
+    payload = json.dumps(content, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.blake2b(f"{CONTENT_HASH_VERSION}:{payload}".encode("utf-8"), digest_size=16).hexdigest()
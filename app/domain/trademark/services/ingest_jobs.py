@@ -0,0 +1,391 @@
+"""
+백그라운드 데이터 적재 작업
+
+이 모듈은 데이터 적재를 HTTP 요청과 분리된 백그라운드 작업으로 실행하는 클래스를 제공합니다.
+작업마다 ID를 발급하고 진행 상황(처리 건수, 처리 속도, 남은 시간)을 조회하거나 취소할 수 있습니다.
+파일 오프셋 체크포인트를 디스크에 기록하므로, 프로세스가 비정상 종료되거나 적재가 실패해도
+처음부터 다시 적재하지 않고 마지막 체크포인트부터 이어서 진행할 수 있습니다.
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, Optional, Set
+
+from loguru import logger
+
+from app.core.config import settings
+from app.core.exceptions import FileNotFoundError, IngestJobNotFoundError, IngestJobConflictError
+
+# 작업 상태
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+# 체크포인트는 실행 중인데 현재 프로세스에 작업이 없는 경우 (프로세스 비정상 종료)
+JOB_INTERRUPTED = "interrupted"
+
+# 실행 중으로 보는 상태
+ACTIVE_STATUSES = (JOB_PENDING, JOB_RUNNING)
+# 이어서 적재할 수 있는 상태
+RESUMABLE_STATUSES = (JOB_FAILED, JOB_INTERRUPTED)
+
+class IngestCancelled(Exception):
+    """작업 취소/중단 요청으로 적재를 멈출 때 발생"""
+
+class IngestJob:
+    """
+    적재 작업 하나의 상태와 진행 상황
+
+    진행 상황은 적재 스레드에서 advance()로 갱신하고, 요청 처리 스레드에서 to_dict()로 조회합니다.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        file_path: str,
+        mode: str,
+        start_offset: int = 0,
+        processed: int = 0,
+        failed: int = 0,
+        index_name: Optional[str] = None,
+        created_at: Optional[str] = None
+    ):
+        self.job_id = job_id
+        self.file_path = file_path
+        self.mode = mode
+        self.start_offset = start_offset
+        self.offset = start_offset
+        self.processed = processed
+        self.failed = failed
+        # create 모드에서 적재 중인 새 버전 인덱스 (재개 시 같은 인덱스에 이어서 적재)
+        self.index_name = index_name
+        self.file_size = os.path.getsize(file_path) if os.path.exists(file_path) else None
+
+        self.status = JOB_PENDING
+        self.error: Optional[str] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.created_at = created_at or datetime.now().isoformat()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+
+        self._run_started: Optional[float] = None
+        self._run_processed = 0
+        self._since_checkpoint = 0
+        self._stop_reason: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def discard_on_failure(self) -> bool:
+        """적재를 멈춘 뒤 적재 중이던 새 버전 인덱스를 버릴지 여부 (사용자가 취소한 경우만)"""
+        return self._stop_reason == JOB_CANCELLED
+
+    def request_stop(self, reason: str = JOB_CANCELLED):
+        """적재 중단 요청 (cancelled: 취소, interrupted: 종료 시 중단, 이후 재개 가능)"""
+        self._stop_reason = reason
+
+    def mark_running(self):
+        self.status = JOB_RUNNING
+        self.started_at = datetime.now().isoformat()
+        self._run_started = time.perf_counter()
+        self.save_checkpoint()
+
+    def advance(self, ok: bool, offset: Optional[int] = None):
+        """
+        레코드 하나의 처리 결과 반영 (적재 스레드에서 호출)
+
+        Args:
+            ok (bool): 색인 성공 여부
+            offset (int, optional): 이 레코드까지 처리가 끝난 파일 바이트 오프셋
+
+        Raises:
+            IngestCancelled: 중단 요청을 받은 경우
+        """
+        with self._lock:
+            self.processed += 1
+            self._run_processed += 1
+            if not ok:
+                self.failed += 1
+            if offset is not None:
+                self.offset = offset
+
+        self._since_checkpoint += 1
+        if self._since_checkpoint >= settings.INGEST_CHECKPOINT_INTERVAL:
+            self.save_checkpoint()
+
+        if self._stop_reason is not None:
+            raise IngestCancelled(self._stop_reason)
+
+    def restart(self):
+        """처음부터 다시 적재하도록 진행 상황 초기화 (이어서 적재할 새 버전 인덱스가 없어진 경우)"""
+        with self._lock:
+            self.start_offset = 0
+            self.offset = 0
+            self.processed = 0
+            self.failed = 0
+        self.save_checkpoint()
+
+    def finish(self, status: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        self.status = status
+        self.result = result
+        self.error = error
+        self.finished_at = datetime.now().isoformat()
+        self.save_checkpoint()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """작업 상태 및 진행 상황 (처리 속도, 진행률, 남은 예상 시간 포함)"""
+        with self._lock:
+            processed, failed, offset = self.processed, self.failed, self.offset
+            run_processed = self._run_processed
+
+        elapsed = time.perf_counter() - self._run_started if self._run_started else 0.0
+        docs_per_sec = run_processed / elapsed if elapsed > 0 else 0.0
+
+        progress, eta_seconds = None, None
+        if self.file_size:
+            progress = round(min(offset / self.file_size, 1.0), 4)
+            bytes_per_sec = (offset - self.start_offset) / elapsed if elapsed > 0 else 0.0
+            if self.status == JOB_RUNNING and bytes_per_sec > 0:
+                eta_seconds = round((self.file_size - offset) / bytes_per_sec, 1)
+
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "file_path": self.file_path,
+            "mode": self.mode,
+            "processed": processed,
+            "failed": failed,
+            "docs_per_sec": round(docs_per_sec, 1),
+            "offset": offset,
+            "file_size": self.file_size,
+            "progress": progress,
+            "eta_seconds": eta_seconds,
+            "index": self.index_name,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "result": self.result
+        }
+
+    def checkpoint_path(self) -> str:
+        return os.path.join(settings.INGEST_JOB_DIR, f"{self.job_id}.json")
+
+    def save_checkpoint(self):
+        """작업 상태와 파일 오프셋을 디스크에 기록 (임시 파일에 쓴 뒤 교체하여 기록 중 종료되어도 안전)"""
+        self._since_checkpoint = 0
+        with self._lock:
+            state = {
+                "job_id": self.job_id,
+                "file_path": self.file_path,
+                "mode": self.mode,
+                "status": self.status,
+                "offset": self.offset,
+                "processed": self.processed,
+                "failed": self.failed,
+                "index": self.index_name,
+                "created_at": self.created_at,
+                "finished_at": self.finished_at,
+                "error": self.error
+            }
+
+        try:
+            os.makedirs(settings.INGEST_JOB_DIR, exist_ok=True)
+            path = self.checkpoint_path()
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"적재 작업 체크포인트 저장 실패 - 작업: {self.job_id}, 오류: {str(e)}")
+
+    @classmethod
+    def from_checkpoint(cls, state: Dict[str, Any]) -> "IngestJob":
+        """체크포인트로 작업 복원 (실행 중이던 작업은 interrupted 상태)"""
+        job = cls(
+            job_id=state["job_id"],
+            file_path=state["file_path"],
+            mode=state["mode"],
+            start_offset=state["offset"],
+            processed=state["processed"],
+            failed=state["failed"],
+            index_name=state.get("index"),
+            created_at=state.get("created_at")
+        )
+        job.status = JOB_INTERRUPTED if state["status"] in ACTIVE_STATUSES else state["status"]
+        job.finished_at = state.get("finished_at")
+        job.error = state.get("error")
+        return job
+
+class IngestJobManager:
+    """
+    적재 작업 실행 및 조회
+
+    같은 인덱스에 대한 적재가 겹치지 않도록 작업은 한 번에 하나만 실행합니다.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, IngestJob] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def start(self, file_path: str) -> IngestJob:
+        """
+        새 적재 작업 시작
+
+        Raises:
+            FileNotFoundError: 데이터 파일이 없는 경우
+            IngestJobConflictError: 실행 중인 작업이 있는 경우
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(file_path)
+
+        job = IngestJob(uuid.uuid4().hex, file_path, settings.DB_INIT_MODE.lower())
+        return self._submit(job)
+
+    def resume(self, job_id: str) -> IngestJob:
+        """
+        실패했거나 중단된 작업을 마지막 체크포인트부터 이어서 실행
+
+        증분 적재(delta)는 누락 문서 판별에 파일 전체가 필요하므로 처음부터 다시 실행합니다.
+        (바뀌지 않은 레코드는 건너뛰므로 다시 실행해도 빠르게 따라잡습니다)
+
+        Raises:
+            IngestJobNotFoundError: 작업이 없는 경우
+            IngestJobConflictError: 재개할 수 없는 상태이거나 실행 중인 작업이 있는 경우
+        """
+        previous = self.get(job_id)
+        if previous.status not in RESUMABLE_STATUSES:
+            raise IngestJobConflictError(f"'{previous.status}' 상태의 작업은 재개할 수 없습니다")
+        if not os.path.exists(previous.file_path):
+            raise FileNotFoundError(previous.file_path)
+
+        if previous.mode == "delta":
+            job = IngestJob(job_id, previous.file_path, previous.mode, created_at=previous.created_at)
+        else:
+            job = IngestJob(
+                job_id,
+                previous.file_path,
+                previous.mode,
+                start_offset=previous.offset,
+                processed=previous.processed,
+                failed=previous.failed,
+                index_name=previous.index_name,
+                created_at=previous.created_at
+            )
+
+        logger.info(f"적재 작업 재개 - 작업: {job_id}, 오프셋: {job.start_offset}, 처리: {job.processed}개")
+        return self._submit(job)
+
+    def cancel(self, job_id: str) -> IngestJob:
+        """
+        실행 중인 작업 취소 (create 모드에서 적재 중이던 새 버전 인덱스는 삭제)
+
+        Raises:
+            IngestJobNotFoundError: 작업이 없는 경우
+            IngestJobConflictError: 실행 중이 아닌 작업인 경우
+        """
+        job = self.get(job_id)
+        if job.status not in ACTIVE_STATUSES:
+            raise IngestJobConflictError(f"'{job.status}' 상태의 작업은 취소할 수 없습니다")
+
+        job.request_stop(JOB_CANCELLED)
+        logger.info(f"적재 작업 취소 요청 - 작업: {job_id}")
+        return job
+
+    def resumable_index_names(self) -> Set[str]:
+        """
+        실행 중이거나 재개할 수 있는 작업이 적재 중인 새 버전 인덱스 (오래된 버전 정리에서 제외)
+
+        다른 프로세스에서 실패/중단된 작업도 포함하도록 체크포인트 디렉토리의 작업을 모두 확인합니다.
+        """
+        job_ids = set(self._jobs)
+        try:
+            job_ids.update(name[:-len(".json")] for name in os.listdir(settings.INGEST_JOB_DIR) if name.endswith(".json"))
+        except OSError:
+            pass
+
+        index_names = set()
+        for job_id in job_ids:
+            try:
+                job = self.get(job_id)
+            except IngestJobNotFoundError:
+                continue
+            if job.index_name and job.status in ACTIVE_STATUSES + RESUMABLE_STATUSES:
+                index_names.add(job.index_name)
+        return index_names
+
+    def get(self, job_id: str) -> IngestJob:
+        """
+        작업 조회 (현재 프로세스에 없으면 체크포인트에서 복원)
+
+        Raises:
+            IngestJobNotFoundError: 작업이 없는 경우
+        """
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+
+        # 작업 ID가 경로로 해석되지 않도록 검증
+        if not job_id.isalnum():
+            raise IngestJobNotFoundError(job_id)
+
+        path = os.path.join(settings.INGEST_JOB_DIR, f"{job_id}.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return IngestJob.from_checkpoint(json.load(f))
+        except (OSError, ValueError, KeyError):
+            raise IngestJobNotFoundError(job_id)
+
+    def shutdown(self):
+        """애플리케이션 종료 시 실행 중인 작업을 중단하고 종료를 기다림 (이후 재개 가능)"""
+        for job in list(self._jobs.values()):
+            if job.status in ACTIVE_STATUSES:
+                job.request_stop(JOB_INTERRUPTED)
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _submit(self, job: IngestJob) -> IngestJob:
+        with self._lock:
+            running = [other for other in self._jobs.values() if other.status in ACTIVE_STATUSES]
+            if running:
+                raise IngestJobConflictError(f"실행 중인 적재 작업이 있습니다: {running[0].job_id}")
+
+            self._jobs[job.job_id] = job
+            job.save_checkpoint()
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingest-job")
+            self._executor.submit(self._run, job)
+
+        logger.info(f"적재 작업 등록 - 작업: {job.job_id}, 파일: {job.file_path}, 모드: {job.mode}")
+        return job
+
+    def _run(self, job: IngestJob):
+        """작업 스레드에서 적재 실행"""
+        from app.domain.trademark.services.load_trademark_data import load_trademark_data
+
+        job.mark_running()
+        try:
+            # 적재 함수는 동기 Elasticsearch 클라이언트를 사용하므로 작업 스레드의 이벤트 루프에서 실행
+            result = asyncio.run(load_trademark_data(job.file_path, streaming=True, job=job))
+            job.finish(JOB_COMPLETED, result=result)
+            logger.info(f"적재 작업 완료 - 작업: {job.job_id}, 결과: {result}")
+
+        except IngestCancelled as e:
+            job.finish(str(e))
+            logger.info(f"적재 작업 중단 - 작업: {job.job_id}, 상태: {e}, 처리: {job.processed}개")
+
+        except Exception as e:
+            job.finish(JOB_FAILED, error=str(e))
+            logger.error(f"적재 작업 실패 - 작업: {job.job_id}, 오류: {str(e)}", exc_info=True)
+
+# 전역 적재 작업 관리자
+ingest_jobs = IngestJobManager()
@@ -2,67 +2,333 @@
 상표 데이터 로드 및 색인 함수
 
 이 모듈은 JSON 파일에서 상표 데이터를 로드하고 Elasticsearch에 색인하는 함수를 제공합니다.
+대용량 파일을 위해 레코드 단위로 읽어 청크 단위로 색인하는 스트리밍 모드를 지원합니다.
 """
 import json
 import logging
-from typing import Dict, Any
-from elasticsearch.helpers import bulk
+import sys
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, Any, Iterable, Iterator, Optional
+from elasticsearch.helpers import bulk, streaming_bulk, parallel_bulk
+
+try:
+    import resource
+except ImportError:  # Windows 등 resource 모듈이 없는 환경
+    resource = None
 
 from app.core.elasticsearch import es_client
 from app.core.config import settings
+from app.core.metrics import record_ingest
+from app.domain.trademark.index.bulk_load_mode import bulk_load_mode
+from app.domain.trademark.index.create_trademark_index import create_trademark_index
+from app.domain.trademark.index.index_versions import (
+    create_index_version,
+    swap_index_alias,
+    delete_old_index_versions
+)
 from app.domain.trademark.services.process_trademark_data import process_trademark_data
+from app.domain.trademark.services.parallel_preprocess import preprocess_parallel
+from app.domain.trademark.services.helpers import get_document_id, content_hash
+from app.domain.trademark.services.search_cache import bump_index_generation
+from app.domain.trademark.services.autocomplete_index import autocomplete_index
+from app.domain.trademark.services.ingest_jobs import ingest_jobs
+from app.domain.trademark.services.pronunciation_cache import pronunciation_cache
+from app.domain.trademark.services.pronunciation_dict import pronunciation_dict
+from app.domain.trademark.services.trademark_file_reader import (
+    iter_trademark_records,
+    iter_trademark_records_with_offsets
+)
+
+if TYPE_CHECKING:
+    from app.domain.trademark.services.ingest_jobs import IngestJob
 
 logger = logging.getLogger(__name__)
 
-async def load_trademark_data(file_path: str) -> Dict[str, int]:
-    """상표 데이터 JSON 파일 로드 및 Elasticsearch에 색인"""
+# 진행 상황 로그 출력 간격 (문서 수)
+PROGRESS_LOG_INTERVAL = 10000
+
+async def load_trademark_data(
+    file_path: str,
+    streaming: Optional[bool] = None,
+    chunk_size: Optional[int] = None,
+    max_chunk_bytes: Optional[int] = None,
+    thread_count: Optional[int] = None,
+    preprocess_workers: Optional[int] = None,
+    bulk_load: Optional[bool] = None,
+    force_merge_segments: Optional[int] = None,
+    job: Optional["IngestJob"] = None
+) -> Dict[str, Any]:
+    """
+    상표 데이터 JSON 파일 로드 및 Elasticsearch에 색인
+
+    DB_INIT_MODE가 'delta'이면 바뀐 레코드만 반영하는 증분 적재(load_trademark_delta)로 처리합니다.
+
+    Args:
+        file_path (str): 데이터 파일 경로 (JSON 배열 또는 NDJSON)
+        streaming (bool, optional): 스트리밍 모드 여부. 기본값은 INGEST_STREAMING 설정
+        chunk_size (int, optional): 벌크 요청당 문서 수
+        max_chunk_bytes (int, optional): 벌크 요청당 최대 바이트 수
+        thread_count (int, optional): 벌크 요청 스레드 수 (2 이상이면 parallel_bulk 사용)
+        preprocess_workers (int, optional): 전처리 작업 프로세스 수 (2 이상이면 병렬 전처리)
+        bulk_load (bool, optional): 벌크 적재 모드 사용 여부. 기본값은 INGEST_BULK_LOAD_MODE 설정
+        force_merge_segments (int, optional): 적재 후 병합할 세그먼트 수 (0이면 병합하지 않음).
+            기본값은 새 버전 적재 시 INDEX_FORCE_MERGE_SEGMENTS, 기존 인덱스 적재 시 0
+        job (IngestJob, optional): 백그라운드 적재 작업. 지정하면 스트리밍 모드로 적재하며
+            레코드마다 진행 상황과 파일 오프셋을 기록하고, 작업의 오프셋/인덱스부터 이어서 적재합니다.
+
+    Returns:
+        Dict[str, Any]: 성공/실패 건수 및 처리 속도, 최대 메모리 사용량
+    """
+    # 작업은 시작할 때의 모드로 재개
+    init_mode = job.mode if job is not None else settings.DB_INIT_MODE.lower()
+
+    if init_mode == "delta":
+        from app.domain.trademark.services.delta_ingest import load_trademark_delta
+        return await load_trademark_delta(file_path, chunk_size=chunk_size, job=job)
+
+    if job is not None:
+        # 파일 오프셋 체크포인트는 스트리밍 모드에서만 기록 가능
+        streaming = True
+    elif streaming is None:
+        streaming = settings.INGEST_STREAMING
+    if preprocess_workers is None:
+        preprocess_workers = settings.INGEST_PREPROCESS_WORKERS
+
+    alias = settings.ELASTICSEARCH_INDEX
+    # create 모드면 새 버전 인덱스에 적재한 뒤 별칭을 전환 (적재 중에도 기존 버전으로 검색)
+    rebuild = init_mode == "create"
+    index_name = alias
+    if force_merge_segments is None:
+        # 기존 인덱스는 적재 후에도 갱신이 계속되므로 기본적으로 병합하지 않음
+        force_merge_segments = settings.INDEX_FORCE_MERGE_SEGMENTS if rebuild else 0
+
     try:
-        # 우선 인덱스 존재 여부 확인
-        index_name = settings.ELASTICSEARCH_INDEX
-        if not es_client.indices.exists(index=index_name):
-            from app.domain.trademark.index.create_trademark_index import create_trademark_index
+        if rebuild and job is not None and job.index_name and es_client.indices.exists(index=job.index_name):
+            # 중단된 작업의 새 버전 인덱스에 이어서 적재
+            index_name = job.index_name
+            logger.info(f"중단된 적재를 인덱스 '{index_name}'의 오프셋 {job.start_offset}부터 이어서 진행합니다.")
+        elif rebuild:
+            if job is not None and (job.start_offset or job.processed):
+                # 앞부분이 빠진 새 인덱스로 별칭이 전환되지 않도록 처음부터 다시 적재
+                logger.warning(f"중단된 작업의 인덱스 '{job.index_name}'를 찾을 수 없어 처음부터 다시 적재합니다.")
+                job.restart()
+            index_name = create_index_version(alias)
+            logger.info(f"DB 초기화 모드가 'create'이므로 새 인덱스 '{index_name}'에 적재합니다.")
+        elif not es_client.indices.exists(index=alias):
             create_trademark_index()
-            logger.info(f"인덱스 '{index_name}'를 새로 생성했습니다.")
-        
-        # 이미 데이터가 있는 경우 create 모드면 삭제
-        if settings.DB_INIT_MODE.lower() == "create":
-            try:
-                # 기존 문서 삭제 쿼리
-                es_client.delete_by_query(
-                    index=index_name,
-                    body={"query": {"match_all": {}}},
-                    refresh=True
+            logger.info(f"인덱스 '{alias}'를 새로 생성했습니다.")
+
+        start_time = time.perf_counter()
+
+        with bulk_load_mode(index_name, force_merge_segments=force_merge_segments, enabled=bulk_load) as load_stats:
+            if streaming:
+                offsets: Optional[Deque[int]] = None
+                if job is not None:
+                    job.index_name = index_name if rebuild else None
+                    offsets = deque()
+                    records = _iter_records_tracking_offsets(file_path, job.start_offset, offsets)
+                else:
+                    records = iter_trademark_records(file_path)
+
+                success, failed_count = _streaming_index(
+                    records,
+                    index_name,
+                    chunk_size=chunk_size or settings.INGEST_CHUNK_SIZE,
+                    max_chunk_bytes=max_chunk_bytes or settings.INGEST_MAX_CHUNK_BYTES,
+                    thread_count=thread_count or settings.INGEST_THREAD_COUNT,
+                    preprocess_workers=preprocess_workers,
+                    job=job,
+                    offsets=offsets
+                )
+            else:
+                # JSON 파일 전체 로드
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    trademarks = json.load(f)
+
+                logger.info(f"총 {len(trademarks)}개의 상표 데이터를 로드했습니다.")
+
+                # 벌크 색인 실행 (청크마다 refresh하지 않고 적재 완료 후 한 번만 refresh)
+                success, failed = bulk(
+                    es_client,
+                    generate_index_actions(trademarks, index_name, preprocess_workers)
                 )
-                logger.info(f"DB 초기화 모드가 'create'이므로 기존 문서를 모두 삭제했습니다.")
-            except Exception as e:
-                logger.error(f"기존 문서 삭제 실패: {str(e)}")
-        
-        # JSON 파일 로드
-        with open(file_path, 'r', encoding='utf-8') as f:
-            trademarks = json.load(f)
-        
-        logger.info(f"총 {len(trademarks)}개의 상표 데이터를 로드했습니다.")
-        
-        # 상표 데이터 전처리 및 색인 작업 생성
-        actions = []
-        for tm in trademarks:
-            processed_tm = process_trademark_data(tm)
-            
-            # 색인 작업 추가
-            actions.append({
-                "_index": index_name,
-                "_source": processed_tm
-            })
-        
-        # 벌크 색인 실행
-        success, failed = bulk(es_client, actions, refresh=True)
-        logger.info(f"색인 완료: {success}개 성공, {failed}개 실패")
-        
-        # failed가 리스트로 반환되면 그 길이를 반환
-        failed_count = len(failed) if isinstance(failed, list) else failed
-        
-        return {"success": success, "failed": failed_count}
-    
+                es_client.indices.refresh(index=index_name)
+
+                # failed가 리스트로 반환되면 그 길이를 반환
+                failed_count = len(failed) if isinstance(failed, list) else failed
+
+            # 색인 처리량은 병합/설정 복원 시간을 제외하고 측정
+            indexing_elapsed = time.perf_counter() - start_time
+
+        if rebuild:
+            # 별칭 전환 후 오래된 버전 정리 (재개할 수 있는 작업이 적재 중이던 인덱스는 유지)
+            swap_index_alias(alias, index_name)
+            delete_old_index_versions(alias, settings.INDEX_RETAINED_VERSIONS, exclude=ingest_jobs.resumable_index_names())
+
+        # 이번 적재에서 새로 변환한 발음을 디스크에 기록
+        pronunciation_cache.flush()
+        logger.info(f"발음 캐시: {pronunciation_cache.stats()}, 발음 사전: {pronunciation_dict.stats()}")
+
+        # 데이터가 바뀌었으므로 검색 캐시 무효화 및 자동완성 인덱스 재빌드
+        bump_index_generation()
+        rebuild_autocomplete_index(alias)
+
+        elapsed = time.perf_counter() - start_time
+        docs_per_sec = (success + failed_count) / indexing_elapsed if indexing_elapsed > 0 else 0.0
+        peak_rss_mb = get_peak_rss_mb()
+        record_ingest(init_mode, success, failed_count, indexing_elapsed)
+
+        logger.info(
+            f"색인 완료: {success}개 성공, {failed_count}개 실패, "
+            f"{elapsed:.2f}초 (색인 {indexing_elapsed:.2f}초, 병합 {load_stats['force_merge_seconds']}초), "
+            f"{docs_per_sec:.1f} docs/sec, 벌크 적재 모드: {load_stats['enabled']}, 최대 RSS: {peak_rss_mb} MB"
+        )
+
+        return {
+            "success": success,
+            "failed": failed_count,
+            "index": index_name,
+            "elapsed_seconds": round(elapsed, 3),
+            "indexing_seconds": round(indexing_elapsed, 3),
+            "force_merge_seconds": load_stats["force_merge_seconds"],
+            "bulk_load_mode": load_stats["enabled"],
+            "docs_per_sec": round(docs_per_sec, 1),
+            "peak_rss_mb": peak_rss_mb
+        }
+
     except Exception as e:
         logger.error(f"상표 데이터 로드 실패: {str(e)}")
-        raise e
\ No newline at end of file
+        if rebuild and index_name != alias and (job is None or job.discard_on_failure):
+            # 전환 전이므로 별칭은 기존 버전을 그대로 가리킴. 적재하던 인덱스만 삭제
+            # (백그라운드 작업이 실패/중단된 경우에는 이어서 적재할 수 있도록 유지)
+            es_client.indices.delete(index=index_name, ignore=[404])
+        raise e
+
+def generate_index_actions(
+    records: Iterable[Dict[str, Any]],
+    index_name: str,
+    preprocess_workers: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """
+    상표 레코드를 전처리하여 벌크 색인 작업으로 하나씩 변환
+
+    출원번호(없으면 pid)를 문서 _id로 사용하여 상세 조회 시 GET으로 바로 찾을 수 있게 합니다.
+    원본 레코드의 내용 해시(contentHash)를 함께 저장하여 이후 증분 적재에서 변경 여부를 비교합니다.
+    preprocess_workers가 2 이상이면 전처리를 작업 프로세스에서 병렬로 실행합니다.
+    """
+    records = (dict(tm, contentHash=content_hash(tm)) for tm in records)
+
+    if preprocess_workers > 1:
+        processed_records = preprocess_parallel(
+            records,
+            workers=preprocess_workers,
+            batch_size=settings.INGEST_PREPROCESS_BATCH_SIZE,
+            queue_size=settings.INGEST_PREPROCESS_QUEUE_SIZE
+        )
+    else:
+        processed_records = (process_trademark_data(tm) for tm in records)
+
+    for processed_tm in processed_records:
+        action = {
+            "_index": index_name,
+            "_source": processed_tm
+        }
+        document_id = get_document_id(processed_tm)
+        if document_id:
+            action["_id"] = document_id
+        yield action
+
+def _streaming_index(
+    records: Iterable[Dict[str, Any]],
+    index_name: str,
+    chunk_size: int,
+    max_chunk_bytes: int,
+    thread_count: int,
+    preprocess_workers: int = 1,
+    job: Optional["IngestJob"] = None,
+    offsets: Optional[Deque[int]] = None
+):
+    """
+    레코드 제너레이터를 청크 단위로 벌크 색인
+
+    전체 데이터를 메모리에 올리지 않으므로 파일 크기와 무관하게
+    메모리 사용량이 청크 크기 수준으로 유지됩니다.
+    벌크 결과는 레코드 순서대로 반환되므로, job이 있으면 결과마다 해당 레코드의
+    파일 오프셋(offsets의 앞쪽부터)을 작업 진행 상황으로 기록합니다.
+
+    Returns:
+        tuple: (성공 건수, 실패 건수)
+    """
+    actions = generate_index_actions(records, index_name, preprocess_workers)
+
+    if thread_count > 1:
+        results = parallel_bulk(
+            es_client,
+            actions,
+            thread_count=thread_count,
+            chunk_size=chunk_size,
+            max_chunk_bytes=max_chunk_bytes,
+            queue_size=thread_count,
+            raise_on_error=False
+        )
+    else:
+        results = streaming_bulk(
+            es_client,
+            actions,
+            chunk_size=chunk_size,
+            max_chunk_bytes=max_chunk_bytes,
+            raise_on_error=False
+        )
+
+    success, failed = 0, 0
+    try:
+        for ok, item in results:
+            if ok:
+                success += 1
+            else:
+                failed += 1
+                logger.warning(f"문서 색인 실패: {item}")
+
+            processed = success + failed
+            if processed % PROGRESS_LOG_INTERVAL == 0:
+                logger.info(f"색인 진행 중: {processed}개 처리")
+
+            if job is not None:
+                job.advance(ok, offsets.popleft() if offsets else None)
+    finally:
+        # 작업 취소 등으로 중간에 멈춘 경우 벌크 스레드/전처리 프로세스 정리
+        results.close()
+
+    # 청크마다 refresh하지 않고 적재 완료 후 한 번만 refresh
+    es_client.indices.refresh(index=index_name)
+
+    return success, failed
+
+def _iter_records_tracking_offsets(
+    file_path: str,
+    start_offset: int,
+    offsets: Deque[int]
+) -> Iterator[Dict[str, Any]]:
+    """start_offset부터 레코드를 읽으며 레코드 끝 오프셋을 순서대로 offsets에 추가"""
+    for record, offset in iter_trademark_records_with_offsets(file_path, start_offset=start_offset):
+        offsets.append(offset)
+        yield record
+
+def rebuild_autocomplete_index(index_name: str):
+    """자동완성 인덱스 재빌드 (실패해도 Elasticsearch 자동완성으로 동작하므로 적재는 계속 진행)"""
+    if not settings.AUTOCOMPLETE_INDEX_ENABLED:
+        return
+    try:
+        autocomplete_index.rebuild(index_name)
+    except Exception as e:
+        logger.error(f"자동완성 인덱스 빌드 실패: {str(e)}")
+
+def get_peak_rss_mb() -> Optional[float]:
+    """프로세스 최대 RSS(MB) 반환 (확인할 수 없는 환경이면 None)"""
+    if resource is None:
+        return None
+    # Linux는 KB 단위, macOS는 바이트 단위
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
@@ -0,0 +1,149 @@
+"""
+상표 데이터 병렬 전처리
+
+이 모듈은 process_trademark_data(초성 추출, g2pk 발음 변환 등 CPU 작업)를
+ProcessPoolExecutor로 배치 단위 병렬 실행하는 함수를 제공합니다.
+배치 결과는 입력 순서대로 크기가 제한된 큐에 넣어 벌크 색인 쪽으로 전달하므로,
+색인이 밀리면 전처리도 함께 멈춥니다(backpressure).
+"""
+import multiprocessing
+import queue
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, List, Tuple
+
+from loguru import logger
+
+from app.domain.trademark.services.pid_utils import generate_next_pid
+
+# 작업 프로세스당 동시에 처리 중인 배치 수
+IN_FLIGHT_PER_WORKER = 2
+
+# 전처리 스레드 종료 표시
+_DONE = object()
+
+def _init_worker():
+    """
+    작업 프로세스 초기화 (프로세스당 한 번)
+
+    레코드마다 남기는 debug 로그가 표준 에러로 쏟아지지 않도록 경고 이상만 출력하고,
+    발음 변환 모듈을 임포트하여 g2pk 모델을 미리 로드합니다.
+    동기 Elasticsearch 클라이언트는 처음 사용할 때 연결하므로 서비스 패키지를 임포트해도 연결하지 않습니다.
+    """
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    from app.domain.trademark.services import pronunciation_utils  # noqa: F401 (g2pk 초기화)
+
+def _process_batch(records: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int, int]:
+    """
+    작업 프로세스에서 배치 전처리
+
+    Returns:
+        tuple: (전처리된 레코드 목록, 사전 사용 단어 수, 그 외 단어 수)
+    """
+    from app.domain.trademark.services.process_trademark_data import process_trademark_data
+    from app.domain.trademark.services.pronunciation_cache import pronunciation_cache
+    from app.domain.trademark.services.pronunciation_dict import pronunciation_dict
+
+    before = pronunciation_dict.stats()
+    processed = [process_trademark_data(record) for record in records]
+    after = pronunciation_dict.stats()
+
+    # 작업 프로세스는 atexit이 실행되지 않으므로 배치마다 발음 캐시 기록
+    pronunciation_cache.flush()
+
+    return (
+        processed,
+        after["dict_words"] - before["dict_words"],
+        after["other_words"] - before["other_words"]
+    )
+
+def _batched(records: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """레코드를 batch_size개씩 묶음 (pid가 없는 레코드는 여기서 pid 할당)"""
+    batch = []
+    for record in records:
+        # pid 채번은 Elasticsearch 카운터를 사용하므로 작업 프로세스가 아닌 부모 프로세스에서 수행
+        if not record.get("pid"):
+            record = dict(record, pid=generate_next_pid())
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def preprocess_parallel(
+    records: Iterable[Dict[str, Any]],
+    workers: int,
+    batch_size: int,
+    queue_size: int
+) -> Iterator[Dict[str, Any]]:
+    """
+    레코드를 작업 프로세스에서 병렬 전처리하여 입력 순서대로 반환
+
+    Args:
+        records: 원본 상표 레코드
+        workers (int): 작업 프로세스 수
+        batch_size (int): 작업 프로세스에 한 번에 넘길 레코드 수
+        queue_size (int): 색인 대기 중인 전처리 완료 배치의 최대 수
+
+    Yields:
+        Dict[str, Any]: 전처리된 상표 데이터
+    """
+    from app.domain.trademark.services.pronunciation_dict import pronunciation_dict
+
+    results: "queue.Queue" = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # 소비자가 중단한 경우 대기하지 않고 종료
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        # 작업 프로세스가 부모의 스레드(로그, 커넥션 풀)를 복제하지 않도록 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as executor:
+                in_flight = deque()
+                for batch in _batched(records, batch_size):
+                    if stop.is_set():
+                        break
+                    in_flight.append(executor.submit(_process_batch, batch))
+                    if len(in_flight) >= workers * IN_FLIGHT_PER_WORKER:
+                        if not put(in_flight.popleft().result()):
+                            break
+                while in_flight and not stop.is_set():
+                    if not put(in_flight.popleft().result()):
+                        break
+                for future in in_flight:
+                    future.cancel()
+            put(_DONE)
+        except BaseException as e:
+            put(e)
+
+    producer = threading.Thread(target=produce, name="trademark-preprocess", daemon=True)
+    producer.start()
+    logger.info(f"병렬 전처리 시작 - 작업 프로세스 {workers}개, 배치 {batch_size}건, 큐 {queue_size}배치")
+
+    try:
+        while True:
+            item = results.get()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            processed, dict_words, other_words = item
+            pronunciation_dict.record(dict_words, other_words)
+            yield from processed
+    finally:
+        stop.set()
+        producer.join()
@@ -2,77 +2,151 @@
 상표 고유 ID(pid) 관리 유틸리티
 
 이 모듈은 일련번호 기반의 상표 고유 ID 생성 기능을 제공합니다.
+pid는 Elasticsearch에 저장된 카운터 문서에서 블록 단위(PID_BLOCK_SIZE)로 임대하며,
+블록 내 할당은 메모리에서만 이루어집니다. 카운터 갱신은 낙관적 동시성 제어
+(if_seq_no/if_primary_term)를 사용하므로 여러 워커/프로세스에서도 pid가 중복되지 않습니다.
 """
+import threading
+from typing import Dict
+
 from loguru import logger
-from elasticsearch import NotFoundError
+from elasticsearch import NotFoundError, ConflictError
 
 from app.core.elasticsearch import es_client
 from app.core.config import settings
 
-# 메모리 기반 pid 카운터 (fallback용)
-_pid_counter = 1
+# 블록 임대 최대 재시도 횟수 (동시 임대 충돌 시)
+MAX_LEASE_RETRIES = 20
 
-def generate_next_pid() -> str:
-    """
-    다음 일련번호 기반 상표 고유 ID 생성
+# 기존 문서의 숫자형 pid 최댓값 계산 스크립트 (카운터 최초 생성 시 1회만 사용)
+_MAX_NUMERIC_PID_SCRIPT = """
+if (doc['pid'].size() == 0) { return 0; }
+try { return Long.parseLong(doc['pid'].value); } catch (NumberFormatException e) { return 0; }
+"""
 
-    일련번호 형식으로 1부터 시작하여 순차적으로 증가하는 ID 생성
-    (예: "1", "2", "3", ...)
+class PidSequence:
+    """
+    블록 임대 방식의 pid 시퀀스
 
-    Returns:
-        str: 다음 상표 고유 ID
+    카운터 문서의 next_value는 아직 임대되지 않은 첫 번째 pid를 가리킵니다.
+    블록을 임대하면 [next_value, next_value + block_size) 구간을 이 인스턴스가 독점합니다.
+    사용하지 않고 종료된 블록의 나머지 pid는 재사용되지 않습니다(일련번호에 공백이 생길 수 있음).
     """
-    global _pid_counter
 
-    try:
-        index_name = settings.ELASTICSEARCH_INDEX
+    def __init__(self, index_name: str, block_size: int = None):
+        self.index_name = index_name
+        self.block_size = block_size or settings.PID_BLOCK_SIZE
+        self._lock = threading.Lock()
+        # 현재 임대한 블록 [_next, _end)
+        self._next = 0
+        self._end = 0
+
+    def next_pid(self) -> str:
+        """다음 pid 반환 (블록 소진 시에만 Elasticsearch 호출)"""
+        with self._lock:
+            if self._next >= self._end:
+                self._lease_block()
+            pid = self._next
+            self._next += 1
+        return str(pid)
+
+    def _lease_block(self):
+        """카운터 문서를 낙관적 동시성 제어로 증가시켜 새 블록 임대"""
+        sequence_index = settings.PID_SEQUENCE_INDEX
+
+        for attempt in range(MAX_LEASE_RETRIES):
+            try:
+                counter = es_client.get(index=sequence_index, id=self.index_name)
+            except NotFoundError:
+                self._initialize_counter()
+                continue
+
+            start = counter["_source"]["next_value"]
+            end = start + self.block_size
+
+            try:
+                es_client.index(
+                    index=sequence_index,
+                    id=self.index_name,
+                    body={"next_value": end},
+                    if_seq_no=counter["_seq_no"],
+                    if_primary_term=counter["_primary_term"]
+                )
+            except ConflictError:
+                # 다른 워커가 먼저 임대한 경우 다시 시도
+                logger.debug(f"pid 블록 임대 충돌 - 재시도 {attempt + 1}회")
+                continue
+
+            self._next, self._end = start, end
+            logger.info(f"pid 블록 임대 - 인덱스: {self.index_name}, 구간: [{start}, {end})")
+            return
+
+        raise RuntimeError(f"pid 블록 임대 실패 - 인덱스: {self.index_name}, 재시도 {MAX_LEASE_RETRIES}회 초과")
+
+    def _initialize_counter(self):
+        """카운터 문서 최초 생성 (기존 문서의 최대 pid 다음 값부터 시작)"""
+        first_value = self._find_max_numeric_pid() + 1
 
-        # 인덱스가 존재하지 않으면 첫 번째 ID 반환
-        if not es_client.indices.exists(index=index_name):
-            logger.info(f"인덱스 '{index_name}'가 존재하지 않아 첫 번째 ID '1' 반환")
-            return "1"
+        try:
+            es_client.index(
+                index=settings.PID_SEQUENCE_INDEX,
+                id=self.index_name,
+                body={"next_value": first_value},
+                op_type="create"
+            )
+            logger.info(f"pid 카운터 생성 - 인덱스: {self.index_name}, 시작값: {first_value}")
+        except ConflictError:
+            # 다른 워커가 먼저 생성한 경우 그대로 사용
+            logger.debug(f"pid 카운터가 이미 생성됨 - 인덱스: {self.index_name}")
+
+    def _find_max_numeric_pid(self) -> int:
+        """상표 인덱스에 이미 존재하는 숫자형 pid의 최댓값 조회"""
+        if not es_client.indices.exists(index=self.index_name):
+            return 0
 
-        # 현재 최대 pid 조회
         response = es_client.search(
-            index=index_name,
+            index=self.index_name,
             body={
                 "size": 0,
                 "aggs": {
                     "max_pid": {
                         "max": {
-                            "field": "pid.keyword"
+                            "script": {"source": _MAX_NUMERIC_PID_SCRIPT}
                         }
                     }
                 }
             }
         )
 
-        # 집계 결과에서 최대 pid 추출
         max_pid = response["aggregations"]["max_pid"]["value"]
+        return int(max_pid) if max_pid else 0
 
-        # 결과가 없거나 유효하지 않은 경우 → 메모리 fallback
-        if max_pid is None or max_pid == 0:
-            pid = str(_pid_counter)
-            _pid_counter += 1
-            logger.info(f"유효한 최대 pid가 없어 메모리 기반 첫 번째 ID '{pid}' 반환")
-            return pid
+# 인덱스별 pid 시퀀스
+_sequences: Dict[str, PidSequence] = {}
+_sequences_lock = threading.Lock()
 
-        # 숫자 형태로 변환
-        try:
-            next_pid = str(int(max_pid) + 1)
-            logger.debug(f"다음 pid 생성: {next_pid}")
-            return next_pid
-        except (ValueError, TypeError):
-            # 현재 최대 pid가 숫자 형태가 아닌 경우 (예: UUID)
-            logger.warning(f"기존 pid '{max_pid}'가 숫자 형태가 아님. 첫 번째 ID '1' 반환")
-            return "1"
-
-    except Exception as e:
-        # 오류 발생 시 안전하게 메모리 기반 pid 반환
-        pid = str(_pid_counter)
-        _pid_counter += 1
-        logger.error(f"pid 생성 중 오류 발생 → 메모리 기반 pid 반환: {pid}, 오류: {str(e)}")
-        return pid
+def get_pid_sequence(index_name: str = None) -> PidSequence:
+    """인덱스별 pid 시퀀스 반환 (프로세스 내 싱글턴)"""
+    index_name = index_name or settings.ELASTICSEARCH_INDEX
+
+    with _sequences_lock:
+        sequence = _sequences.get(index_name)
+        if sequence is None:
+            sequence = PidSequence(index_name)
+            _sequences[index_name] = sequence
+        return sequence
+
+def generate_next_pid() -> str:
+    """
+    다음 일련번호 기반 상표 고유 ID 생성
+
+    일련번호 형식으로 1부터 시작하여 순차적으로 증가하는 ID 생성
+    (예: "1", "2", "3", ...)
+
+    Returns:
+        str: 다음 상표 고유 ID
+    """
+    return get_pid_sequence().next_pid()
 
 def is_valid_pid(pid: str) -> bool:
     """
@@ -71,7 +71,7 @@ def process_trademark_data(data: Dict[str, Any]) -> Dict[str, Any]:
             chosung = extract_chosung(data['productName'])
             if chosung:
                 processed_data['productName_chosung'] = chosung
-                logger.debug(f"상표명 '{data['productName']}'의 초성: {chosung}")
+                logger.debug("상표명 '{}'의 초성: {}", data["productName"], chosung)
         except Exception as e:
             logger.error(f"초성 추출 중 오류 발생 - 상표명: {data['productName']}, 오류: {str(e)}", exc_info=True)
     
@@ -81,13 +81,13 @@ def process_trademark_data(data: Dict[str, Any]) -> Dict[str, Any]:
             eng_pronunciation = english_to_korean_pronunciation(data['productNameEng'])
             if eng_pronunciation:
                 processed_data['productNameEngPronunciation'] = eng_pronunciation
-                logger.debug(f"영문 상표명 '{data['productNameEng']}'의 한글 발음: {eng_pronunciation}")
+                logger.debug("영문 상표명 '{}'의 한글 발음: {}", data["productNameEng"], eng_pronunciation)
                 
                 # 발음의 초성도 추출하여 저장
                 chosung = extract_chosung(eng_pronunciation)
                 if chosung:
                     processed_data['productNameEngPronunciation_chosung'] = chosung
-                    logger.debug(f"영문 상표명 발음 '{eng_pronunciation}'의 초성: {chosung}")
+                    logger.debug("영문 상표명 발음 '{}'의 초성: {}", eng_pronunciation, chosung)
         except Exception as e:
             logger.error(f"발음 변환 중 오류 발생 - 영문 상표명: {data['productNameEng']}, 오류: {str(e)}", exc_info=True)
     
@@ -0,0 +1,151 @@
+"""
+영문 발음 변환 캐시
+
+이 모듈은 g2pk 변환 결과를 단어 단위로 저장하는 영구 캐시를 제공합니다.
+메모리 LRU를 앞단에 두고 SQLite 파일에 결과를 보관하므로, 같은 영문 상표명을
+다시 적재할 때 g2pk 변환을 건너뛸 수 있습니다.
+캐시된 결과는 g2pk 버전과 무관하게 재사용되므로 g2pk를 교체한 경우 캐시 파일을 삭제합니다.
+"""
+import atexit
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+from loguru import logger
+
+from app.core.config import settings
+
+# 디스크에 한 번에 기록할 최소 건수
+WRITE_BATCH_SIZE = 200
+
+def normalize_word(word: str) -> str:
+    """캐시 키 정규화 (소문자, 앞뒤 공백 제거)"""
+    return word.strip().lower()
+
+class PronunciationCache:
+    """
+    메모리 LRU + SQLite 발음 변환 캐시
+
+    SQLite 연결은 프로세스별로 열며(fork 이후 재연결), 새 결과는 모아서 기록합니다.
+    """
+
+    def __init__(self, path: str, memory_size: int):
+        self.path = path
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._pending: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+        # 통계
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """현재 프로세스의 SQLite 연결 반환 (없으면 생성)"""
+        if self._conn is None or self._conn_pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS pronunciation ("
+                "word TEXT PRIMARY KEY, pronunciation TEXT NOT NULL)"
+            )
+            conn.commit()
+            if self._conn_pid is not None:
+                # fork 이전 프로세스의 미기록 항목은 부모가 기록하므로 비움
+                self._pending = []
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def get(self, word: str) -> Optional[str]:
+        """캐시 조회 (메모리 -> 디스크 순)"""
+        key = normalize_word(word)
+
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return value
+
+            try:
+                row = self._connection().execute(
+                    "SELECT pronunciation FROM pronunciation WHERE word = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"발음 캐시 조회 실패: {str(e)}")
+                row = None
+
+            if row is None:
+                self._misses += 1
+                return None
+
+            self._disk_hits += 1
+            self._remember(key, row[0])
+            return row[0]
+
+    def put(self, word: str, pronunciation: str):
+        """캐시 저장 (디스크 기록은 WRITE_BATCH_SIZE 단위로 모아서 수행)"""
+        key = normalize_word(word)
+
+        with self._lock:
+            self._remember(key, pronunciation)
+            self._pending.append((key, pronunciation))
+            if len(self._pending) >= WRITE_BATCH_SIZE:
+                self._write_pending()
+
+    def flush(self):
+        """미기록 항목을 디스크에 기록"""
+        with self._lock:
+            self._write_pending()
+
+    def _remember(self, key: str, value: str):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _write_pending(self):
+        if not self._pending:
+            return
+        try:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO pronunciation (word, pronunciation) VALUES (?, ?)",
+                self._pending
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"발음 캐시 기록 실패: {str(e)}")
+        self._pending = []
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중 통계"""
+        with self._lock:
+            total = self._memory_hits + self._disk_hits + self._misses
+            hits = self._memory_hits + self._disk_hits
+            return {
+                "memory_entries": len(self._memory),
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": round(hits / total, 4) if total else 0.0
+            }
+
+# 전역 발음 변환 캐시 인스턴스
+pronunciation_cache = PronunciationCache(
+    settings.PRONUNCIATION_CACHE_PATH,
+    settings.PRONUNCIATION_MEMORY_CACHE_SIZE
+)
+
+# 종료 시 미기록 항목 저장
+atexit.register(pronunciation_cache.flush)
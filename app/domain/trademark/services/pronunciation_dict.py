@@ -0,0 +1,150 @@
+"""
+영문 발음 사전
+
+이 모듈은 data/pronunciation_dict.json의 영문 상표명 발음을 단어 단위 트라이로 컴파일하여
+g2pk보다 먼저 조회하는 발음 사전을 제공합니다. "andy warhol"처럼 여러 단어로 된 항목은
+최장 일치로 찾고, 파일이 바뀌면 다음 조회 시 다시 컴파일합니다.
+"""
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+
+from loguru import logger
+
+from app.core.config import settings
+
+# 트라이 노드에서 발음을 저장하는 키 (단어 토큰과 겹치지 않는 값)
+_TERMINAL = ""
+
+_SPECIAL_CHARS = re.compile(r'[^\w\s]')
+
+def tokenize(text: str) -> List[str]:
+    """발음 변환과 같은 방식으로 정규화한 단어 목록 (소문자, 특수 문자 제거)"""
+    return _SPECIAL_CHARS.sub('', text.lower()).split()
+
+class _CompiledDict(NamedTuple):
+    """컴파일된 사전 (읽기 전용)"""
+    trie: Dict[str, Any]
+    entries: int
+    mtime: Optional[float]
+
+class PronunciationDict:
+    """
+    최장 일치 발음 사전
+
+    컴파일 결과는 불변 객체로 만들어 참조만 교체하므로, 재로드 중에도 잠금 없이 조회할 수 있습니다.
+    """
+
+    def __init__(self, path: str, reload_interval: float = 5.0):
+        self.path = path
+        self.reload_interval = reload_interval
+        self._compiled = _CompiledDict({}, 0, None)
+        self._loaded = False
+        self._last_checked = 0.0
+        self._reload_lock = threading.Lock()
+
+        # 통계 (단어 수 기준)
+        self._dict_words = 0
+        self._other_words = 0
+
+    def load(self) -> int:
+        """
+        사전 파일을 읽어 컴파일
+
+        Returns:
+            int: 사전 항목 수
+        """
+        with self._reload_lock:
+            try:
+                mtime = os.path.getmtime(self.path)
+                with open(self.path, "r", encoding="utf-8") as f:
+                    raw = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"발음 사전 로드 실패: {str(e)}, 경로: {self.path}")
+                self._loaded = True
+                return self._compiled.entries
+
+            self._compiled = compile_entries(raw, mtime)
+            self._loaded = True
+            self._last_checked = time.monotonic()
+            logger.info(f"발음 사전 로드 완료 - {self._compiled.entries}개 항목, 경로: {self.path}")
+            return self._compiled.entries
+
+    def _reload_if_changed(self):
+        """reload_interval마다 파일 수정 시각을 확인하여 바뀌었으면 재로드"""
+        if not self._loaded:
+            self.load()
+            return
+
+        now = time.monotonic()
+        if now - self._last_checked < self.reload_interval:
+            return
+        self._last_checked = now
+
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime != self._compiled.mtime:
+            self.load()
+
+    def match(self, words: List[str], start: int) -> Optional[Tuple[str, int]]:
+        """
+        words[start]부터 시작하는 가장 긴 사전 항목 조회
+
+        Returns:
+            Optional[Tuple[str, int]]: (발음, 일치한 단어 수), 없으면 None
+        """
+        self._reload_if_changed()
+
+        node = self._compiled.trie
+        found = None
+        for i in range(start, len(words)):
+            node = node.get(words[i])
+            if node is None:
+                break
+            if _TERMINAL in node:
+                found = (node[_TERMINAL], i - start + 1)
+        return found
+
+    def record(self, dict_words: int, other_words: int):
+        """변환 결과의 사전 사용 단어 수 기록"""
+        self._dict_words += dict_words
+        self._other_words += other_words
+
+    def stats(self) -> Dict[str, Any]:
+        """사전 상태 및 사전 적중 비율"""
+        total = self._dict_words + self._other_words
+        return {
+            "entries": self._compiled.entries,
+            "dict_words": self._dict_words,
+            "other_words": self._other_words,
+            "dict_share": round(self._dict_words / total, 4) if total else 0.0
+        }
+
+def compile_entries(raw: Dict[str, str], mtime: Optional[float] = None) -> _CompiledDict:
+    """사전 항목을 단어 단위 트라이로 컴파일 (정규화 후 중복되는 키는 먼저 나온 항목 사용)"""
+    trie: Dict[str, Any] = {}
+    entries = 0
+
+    for key, pronunciation in raw.items():
+        words = tokenize(key)
+        if not words or not pronunciation:
+            continue
+        node = trie
+        for word in words:
+            node = node.setdefault(word, {})
+        if _TERMINAL not in node:
+            node[_TERMINAL] = pronunciation
+            entries += 1
+
+    return _CompiledDict(trie, entries, mtime)
+
+# 전역 발음 사전 인스턴스 (첫 조회 시 로드)
+pronunciation_dict = PronunciationDict(
+    settings.PRONUNCIATION_DICT_PATH,
+    settings.PRONUNCIATION_DICT_RELOAD_INTERVAL
+)
@@ -2,12 +2,17 @@
 발음 변환 유틸리티 함수
 
 이 모듈은 영어 텍스트를 한글 발음으로 변환하는 함수를 제공합니다.
-g2pk 라이브러리를 사용하여 영어 텍스트를 한글 발음으로 변환합니다.
+발음 사전(data/pronunciation_dict.json)을 먼저 조회하고, 사전에 없는 단어는
+g2pk 라이브러리를 사용하여 한글 발음으로 변환합니다.
 """
 from loguru import logger
 import re
 from typing import Optional
 
+from app.core.config import settings
+from app.domain.trademark.services.pronunciation_cache import pronunciation_cache
+from app.domain.trademark.services.pronunciation_dict import pronunciation_dict, tokenize
+
 try:
     # g2pk(그래프 투 포네틱 코리안) 라이브러리 임포트
     from g2pk import G2p
@@ -31,22 +36,29 @@ def english_to_korean_pronunciation(text: str) -> Optional[str]:
     if text is None or not text:
         return None
     
-    # 소문자로 변환
-    text_lower = text.lower()
-    
-    # 특수 문자 제거
-    text_clean = re.sub(r'[^\w\s]', '', text_lower)
-    
-    # 단어 분리
-    words = text_clean.split()
+    # 소문자 변환, 특수 문자 제거 후 단어 분리
+    words = tokenize(text)
     result = []
-    
-    for word in words:
+    dict_words = 0
+
+    i = 0
+    while i < len(words):
+        # 발음 사전 최장 일치 우선 (여러 단어 항목 포함)
+        matched = pronunciation_dict.match(words, i)
+        if matched is not None:
+            korean_pron, length = matched
+            result.append(korean_pron)
+            dict_words += length
+            i += length
+            continue
+
+        word = words[i]
+        i += 1
+
         # g2pk 라이브러리를 사용한 자동 변환
         if G2PK_AVAILABLE and g2p:
             try:
-                korean_pron = g2p(word, 'eng')
-                result.append(korean_pron)
+                result.append(g2p_with_cache(word))
             except Exception as e:
                 logger.error(f"g2pk 변환 오류: {str(e)}, 단어: {word}")
                 # 변환 실패 시 기본 변환 규칙 적용
@@ -54,10 +66,31 @@ def english_to_korean_pronunciation(text: str) -> Optional[str]:
         else:
             # g2pk 사용 불가능한 경우 기본 변환 규칙 적용
             result.append(basic_eng_to_kor_pronunciation(word))
-    
+
+    pronunciation_dict.record(dict_words, len(words) - dict_words)
+
     # 결과 조합
     return ' '.join(result)
 
+def g2p_with_cache(word: str) -> str:
+    """
+    g2pk 단어 변환 (영구 캐시 사용)
+
+    Args:
+        word (str): 변환할 영어 단어 (소문자, 특수 문자 제거 상태)
+
+    Returns:
+        str: 한글 발음
+    """
+    if not settings.PRONUNCIATION_CACHE_ENABLED:
+        return g2p(word, 'eng')
+
+    korean_pron = pronunciation_cache.get(word)
+    if korean_pron is None:
+        korean_pron = g2p(word, 'eng')
+        pronunciation_cache.put(word, korean_pron)
+    return korean_pron
+
 def basic_eng_to_kor_pronunciation(word: str) -> str:
     """
     기본 영한 발음 변환 규칙 (g2pk 없을 때 사용)
@@ -0,0 +1,104 @@
+"""
+상표 일괄 검색
+
+이 모듈은 여러 검색 조건을 Elasticsearch _msearch 한 번으로 실행하는 함수를 제공합니다.
+각 검색 조건은 search_trademarks와 같은 쿼리 구성 로직을 사용하며,
+결과와 오류는 검색 조건별로 반환합니다.
+"""
+from typing import Dict, Any, List
+
+from loguru import logger
+
+from app.core.elasticsearch import get_async_es_client
+from app.core.config import settings
+from app.core.metrics import STAGE_QUERY_BUILD, stage_timer, record_cache
+from app.core.exceptions import SearchQueryError, ElasticsearchConnectionError
+from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams
+from app.domain.trademark.services.search_cache import search_cache, make_fingerprint
+from app.domain.trademark.services.search_trademarks import build_search_body, format_search_response
+
+async def search_trademarks_batch(search_params_list: List[TrademarkSearchParams]) -> List[Dict[str, Any]]:
+    """
+    여러 검색 조건을 한 번의 _msearch로 실행
+
+    캐시에 있는 검색 조건은 캐시 결과를 사용하고, 나머지만 _msearch로 실행합니다.
+    Elasticsearch 내부 동시 실행 수는 BATCH_SEARCH_MAX_CONCURRENT로 제한합니다.
+
+    Args:
+        search_params_list (List[TrademarkSearchParams]): 검색 매개변수 목록
+
+    Returns:
+        List[Dict[str, Any]]: 요청 순서의 검색 조건별 결과
+            성공: {"status": 200, "result": 검색 결과}
+            실패: {"status": HTTP 상태 코드, "error": 오류 메시지}
+
+    Raises:
+        ElasticsearchConnectionError: Elasticsearch 연결 오류
+        SearchQueryError: _msearch 요청 자체가 실패한 경우
+    """
+    index_name = settings.ELASTICSEARCH_INDEX
+    cache_generation = search_cache.generation
+
+    responses: List[Dict[str, Any]] = [None] * len(search_params_list)
+    cache_keys: List[str] = [None] * len(search_params_list)
+    pending: List[int] = []
+    body: List[Dict[str, Any]] = []
+
+    with stage_timer(STAGE_QUERY_BUILD):
+        for i, search_params in enumerate(search_params_list):
+            if settings.SEARCH_CACHE_ENABLED:
+                cache_keys[i] = make_fingerprint(index_name, search_params.dict())
+                cached = search_cache.get(cache_keys[i])
+                record_cache("search", cached is not None)
+                if cached is not None:
+                    responses[i] = {"status": 200, "result": cached}
+                    continue
+
+            pending.append(i)
+            body.append({"index": index_name})
+            body.append(build_search_body(search_params))
+
+    logger.debug("일괄 검색 - 요청 {}개, 캐시 적중 {}개", len(search_params_list), len(search_params_list) - len(pending))
+
+    if not pending:
+        return responses
+
+    try:
+        msearch_response = await get_async_es_client().msearch(
+            body=body,
+            max_concurrent_searches=settings.BATCH_SEARCH_MAX_CONCURRENT
+        )
+
+    except ConnectionError as e:
+        logger.error(f"Elasticsearch 연결 오류: {str(e)}")
+        raise ElasticsearchConnectionError()
+
+    except Exception as e:
+        logger.error(f"일괄 검색 실행 오류: {str(e)}", exc_info=True)
+        raise SearchQueryError(detail=str(e))
+
+    for i, response in zip(pending, msearch_response["responses"]):
+        error = response.get("error")
+        if error:
+            responses[i] = {"status": response.get("status", 500), "error": _error_message(error, index_name)}
+            logger.warning(f"일괄 검색 하위 쿼리 오류 - 순번: {i}, 오류: {responses[i]['error']}")
+            continue
+
+        result = format_search_response(response, search_params_list[i])
+        if cache_keys[i] is not None:
+            search_cache.put(cache_keys[i], result, cache_generation)
+        responses[i] = {"status": 200, "result": result}
+
+    return responses
+
+def _error_message(error: Any, index_name: str) -> str:
+    """_msearch 하위 응답 오류를 메시지로 변환"""
+    if not isinstance(error, dict):
+        return str(error)
+    if error.get("type") == "index_not_found_exception":
+        return f"인덱스 '{index_name}'를 찾을 수 없습니다"
+
+    # 샤드 오류는 root_cause에 실제 원인이 있음
+    root_causes = error.get("root_cause") or []
+    reason = root_causes[0].get("reason") if root_causes else None
+    return reason or error.get("reason") or error.get("type", "검색 쿼리 처리에 실패했습니다")
@@ -0,0 +1,166 @@
+"""
+검색 결과 캐시
+
+이 모듈은 search_trademarks 앞단에서 동작하는 프로세스 내 LRU + TTL 캐시를 제공합니다.
+캐시 키는 정규화된 검색 매개변수의 지문(fingerprint)이고 각 항목에는 인덱스 세대(generation)
+번호가 기록됩니다. 데이터 적재나 인덱스 재생성 시 세대 번호를 올려 이전 결과를 무효화합니다.
+세대 번호는 프로세스 단위이므로 다른 워커의 캐시는 TTL이 지나야 갱신됩니다.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable, NamedTuple
+
+from loguru import logger
+
+from app.core.config import settings
+
+class _CacheEntry(NamedTuple):
+    """캐시 항목"""
+    value: Any
+    generation: int
+    expires_at: float
+    size: int
+
+class SearchResultCache:
+    """
+    LRU + TTL 검색 결과 캐시
+
+    항목 수가 아닌 추정 바이트 수(max_bytes)를 상한으로 하며, 상한을 넘으면
+    가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = None,
+        ttl_seconds: float = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_bytes = max_bytes if max_bytes is not None else settings.SEARCH_CACHE_MAX_BYTES
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.SEARCH_CACHE_TTL_SECONDS
+        self._clock = clock
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._bytes = 0
+
+        # 통계
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def generation(self) -> int:
+        """현재 인덱스 세대 번호"""
+        return self._generation
+
+    def bump_generation(self) -> int:
+        """인덱스 세대 번호를 올려 기존 캐시 항목을 모두 무효화"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._bytes = 0
+            logger.info(f"검색 캐시 세대 변경: {self._generation}")
+            return self._generation
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (만료되었거나 세대가 다르면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if entry.generation != self._generation or entry.expires_at <= self._clock():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def put(self, key: str, value: Any, generation: int):
+        """
+        캐시 저장
+
+        조회를 시작한 뒤 세대가 바뀌었으면(적재 중 실행된 검색 등) 저장하지 않습니다.
+        """
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _CacheEntry(value, generation, self._clock() + self.ttl_seconds, size)
+            self._bytes += size
+
+            # 메모리 상한 초과 시 LRU 항목 제거
+            while self._bytes > self.max_bytes and self._entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "generation": self._generation,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 4) if total else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations
+            }
+
+def estimate_size(value: Any) -> int:
+    """캐시 항목의 메모리 사용량 추정 (JSON 직렬화 바이트 수 기준)"""
+    return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+
+def make_fingerprint(index_name: str, params: Dict[str, Any]) -> str:
+    """
+    정규화된 매개변수 지문 생성
+
+    키 순서와 검색어 앞뒤 공백에 관계없이 같은 조건이면 같은 지문을 반환합니다.
+    """
+    canonical = dict(params)
+    if isinstance(canonical.get("query"), str):
+        canonical["query"] = canonical["query"].strip()
+
+    payload = json.dumps(
+        {"index": index_name, "params": canonical},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+# 전역 검색 결과 캐시 인스턴스
+search_cache = SearchResultCache()
+
+def bump_index_generation() -> int:
+    """데이터 변경 시 호출하여 검색 캐시 무효화"""
+    return search_cache.bump_generation()
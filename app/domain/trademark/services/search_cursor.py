@@ -0,0 +1,162 @@
+"""
+상표 검색 커서 페이지네이션
+
+이 모듈은 PIT(point in time)와 search_after를 사용한 커서 기반 검색 함수를 제공합니다.
+from/size 방식은 깊은 페이지일수록 샤드마다 from+size개를 모아 정렬해야 하지만,
+커서 방식은 직전 페이지의 마지막 정렬 값 이후만 찾으므로 페이지 깊이와 무관하게 지연 시간이 일정합니다.
+"""
+import base64
+import json
+from typing import Dict, Any
+
+from elasticsearch import NotFoundError
+from loguru import logger
+
+from app.core.elasticsearch import get_async_es_client
+from app.core.config import settings
+from app.core.metrics import STAGE_QUERY_BUILD, stage_timer
+from app.core.exceptions import (
+    SearchQueryError,
+    IndexNotFoundError,
+    ElasticsearchConnectionError,
+    InvalidCursorError
+)
+from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams
+from app.domain.trademark.services.search_cache import make_fingerprint
+from app.domain.trademark.services.search_trademarks import (
+    SEARCH_HIGHLIGHT,
+    build_search_query,
+    build_sort_options,
+    format_search_hits
+)
+from app.domain.trademark.services.trademark_detail_service import is_index_not_found
+
+# 커서 페이지네이션 시작을 나타내는 커서 값
+CURSOR_START = "*"
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """커서 상태를 불투명한 토큰 문자열로 변환"""
+    payload = json.dumps(state, separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    커서 토큰을 상태로 복원
+
+    Raises:
+        InvalidCursorError: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise InvalidCursorError()
+
+    if not isinstance(state, dict) or not {"pit", "after", "fp", "page", "total"} <= state.keys():
+        raise InvalidCursorError()
+    return state
+
+def _params_fingerprint(index_name: str, search_params: TrademarkSearchParams) -> str:
+    """커서와 검색 조건의 일치 여부 확인용 지문 (페이지 번호, 크기 제외)"""
+    return make_fingerprint(index_name, search_params.dict(exclude={"page", "size"}))
+
+async def search_trademarks_by_cursor(search_params: TrademarkSearchParams, cursor: str) -> Dict[str, Any]:
+    """
+    커서 기반 상표 검색
+
+    첫 요청은 cursor에 CURSOR_START('*')를 전달하고, 이후에는 응답의 next_cursor를 그대로 전달합니다.
+    PIT는 요청마다 SEARCH_CURSOR_KEEP_ALIVE만큼 연장되고, 마지막 페이지에서 닫힙니다.
+
+    Args:
+        search_params (TrademarkSearchParams): 검색 매개변수 (page는 무시)
+        cursor (str): 커서 토큰
+
+    Returns:
+        Dict[str, Any]: 검색 결과 (next_cursor 포함)
+
+    Raises:
+        InvalidCursorError: 잘못되었거나 만료된 커서, 검색 조건이 다른 커서
+        IndexNotFoundError: 인덱스를 찾을 수 없는 경우
+        ElasticsearchConnectionError: Elasticsearch 연결 오류
+        SearchQueryError: 검색 쿼리 오류
+    """
+    index_name = settings.ELASTICSEARCH_INDEX
+    fingerprint = _params_fingerprint(index_name, search_params)
+    keep_alive = settings.SEARCH_CURSOR_KEEP_ALIVE
+
+    state = None
+    if cursor != CURSOR_START:
+        state = decode_cursor(cursor)
+        if state["fp"] != fingerprint:
+            raise InvalidCursorError("커서를 발급한 검색 조건과 요청의 검색 조건이 다릅니다")
+
+    client = get_async_es_client()
+
+    try:
+        if state is None:
+            pit = await client.open_point_in_time(index=index_name, keep_alive=keep_alive)
+            pit_id = pit["id"]
+            page = 1
+        else:
+            pit_id = state["pit"]
+            page = state["page"] + 1
+
+        with stage_timer(STAGE_QUERY_BUILD):
+            body = {
+                "query": build_search_query(search_params),
+                "size": search_params.size,
+                "sort": build_sort_options(search_params.sort),
+                "pit": {"id": pit_id, "keep_alive": keep_alive},
+                "_source": True,
+                "highlight": SEARCH_HIGHLIGHT
+            }
+            if state is not None:
+                body["search_after"] = state["after"]
+                # 전체 건수는 첫 페이지에서 구한 값을 재사용
+                body["track_total_hits"] = False
+
+        logger.debug("커서 검색 실행 - 페이지: {}, 사이즈: {}", page, search_params.size)
+        response = await client.search(body=body)
+
+        hits = response["hits"]["hits"]
+        total = response["hits"]["total"]["value"] if state is None else state["total"]
+        pit_id = response.get("pit_id", pit_id)
+
+        next_cursor = None
+        if len(hits) < search_params.size:
+            # 마지막 페이지이므로 PIT를 바로 닫음 (닫지 못해도 keep_alive 후 만료)
+            try:
+                await client.close_point_in_time(body={"id": pit_id})
+            except Exception as e:
+                logger.warning(f"PIT 닫기 실패: {str(e)}")
+        else:
+            next_cursor = encode_cursor({
+                "pit": pit_id,
+                "after": hits[-1]["sort"],
+                "fp": fingerprint,
+                "page": page,
+                "total": total
+            })
+
+        return {
+            "total": total,
+            "page": page,
+            "size": search_params.size,
+            "results": format_search_hits(hits),
+            "next_cursor": next_cursor
+        }
+
+    except NotFoundError as e:
+        if is_index_not_found(e):
+            logger.error(f"인덱스 '{index_name}'를 찾을 수 없습니다")
+            raise IndexNotFoundError(index_name)
+        logger.warning(f"만료된 커서: {str(e)}")
+        raise InvalidCursorError("커서가 만료되었습니다. 첫 페이지부터 다시 검색하세요")
+
+    except ConnectionError as e:
+        logger.error(f"Elasticsearch 연결 오류: {str(e)}")
+        raise ElasticsearchConnectionError()
+
+    except Exception as e:
+        logger.error(f"커서 검색 실행 오류: {str(e)}", exc_info=True)
+        raise SearchQueryError(detail=str(e))
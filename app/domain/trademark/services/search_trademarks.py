@@ -4,15 +4,50 @@
 이 모듈은 검색 매개변수에 따라 상표 데이터를 검색하는 함수를 제공합니다.
 초성 검색 및 발음 변환 기능이 포함되어 있습니다.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from elasticsearch import NotFoundError
 from loguru import logger
 
-from app.core.elasticsearch import es_client
+from app.core.elasticsearch import get_async_es_client
 from app.core.config import settings
+from app.core.metrics import STAGE_QUERY_BUILD, stage_timer, record_cache
+from app.core.profiling import current_profile
 from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams, SortOption
 from app.core.exceptions import SearchQueryError, IndexNotFoundError, ElasticsearchConnectionError
 from app.domain.trademark.services.chosung_utils import is_chosung_query, has_korean
+from app.domain.trademark.services.search_cache import search_cache, make_fingerprint
+from app.domain.trademark.services.single_flight import search_flight
+
+# 검색 결과 하이라이트 설정
+SEARCH_HIGHLIGHT = {
+    "fields": {
+        "productName": {
+            "number_of_fragments": 0,
+            "pre_tags": ["<mark>"],
+            "post_tags": ["</mark>"]
+        },
+        "productName_chosung": {
+            "number_of_fragments": 0,
+            "pre_tags": ["<mark>"],
+            "post_tags": ["</mark>"]
+        },
+        "productNameEng": {
+            "number_of_fragments": 0,
+            "pre_tags": ["<mark>"],
+            "post_tags": ["</mark>"]
+        },
+        "productNameEngPronunciation": {
+            "number_of_fragments": 0,
+            "pre_tags": ["<mark>"],
+            "post_tags": ["</mark>"]
+        },
+        "productNameEngPronunciation_chosung": {
+            "number_of_fragments": 0,
+            "pre_tags": ["<mark>"],
+            "post_tags": ["</mark>"]
+        }
+    }
+}
 
 async def search_trademarks(search_params: TrademarkSearchParams) -> Dict[str, Any]:
     """
@@ -31,8 +66,125 @@ async def search_trademarks(search_params: TrademarkSearchParams) -> Dict[str, A
     """
     index_name = settings.ELASTICSEARCH_INDEX
     
-    logger.debug(f"검색 시작 - 인덱스: {index_name}, 검색어: {search_params.query}")
+    logger.debug("검색 시작 - 인덱스: {}, 검색어: {}", index_name, search_params.query)
+    
+    # 프로파일링 중인 요청은 Elasticsearch 프로파일을 받아야 하므로 캐시 조회/요청 병합을 거치지 않음
+    profiling = current_profile() is not None
+    
+    # 캐시 조회 (같은 조건의 검색은 데이터가 바뀌기 전까지 재사용)
+    cache_key = None
+    cache_generation = search_cache.generation
+    if settings.SEARCH_CACHE_ENABLED and not profiling:
+        cache_key = make_fingerprint(index_name, search_params.dict())
+        cached = search_cache.get(cache_key)
+        record_cache("search", cached is not None)
+        if cached is not None:
+            logger.debug("검색 캐시 적중 - 검색어: {}", search_params.query)
+            return cached
+    
+    # 동일 조건의 동시 검색은 Elasticsearch 호출 하나로 병합
+    if settings.SINGLE_FLIGHT_ENABLED and not profiling:
+        flight_key = cache_key or make_fingerprint(index_name, search_params.dict())
+        return await search_flight.do(
+            flight_key,
+            lambda: _execute_search(index_name, search_params, cache_key, cache_generation)
+        )
+    
+    return await _execute_search(index_name, search_params, cache_key, cache_generation)
+
+async def _execute_search(
+    index_name: str,
+    search_params: TrademarkSearchParams,
+    cache_key: Optional[str],
+    cache_generation: int
+) -> Dict[str, Any]:
+    """Elasticsearch 검색 실행 및 결과 캐시 저장"""
+    with stage_timer(STAGE_QUERY_BUILD):
+        body = build_search_body(search_params)
+    
+    # 프로파일링 중인 요청은 샤드별 쿼리/컬렉터 시간도 함께 요청
+    profile = current_profile()
+    if profile is not None:
+        body["profile"] = True
+    
+    try:
+        logger.debug("Elasticsearch 검색 실행 - 페이지: {}, 사이즈: {}", search_params.page, search_params.size)
+        logger.debug("최종 쿼리: {}", body["query"])
+        
+        # 검색 실행
+        response = await get_async_es_client().search(index=index_name, body=body)
+        if profile is not None:
+            profile.add_es_profile(response)
+        
+        result = format_search_response(response, search_params)
+        
+        if cache_key is not None:
+            search_cache.put(cache_key, result, cache_generation)
+        
+        return result
+    
+    except NotFoundError as e:
+        logger.error(f"인덱스 '{index_name}'를 찾을 수 없습니다")
+        raise IndexNotFoundError(index_name)
+    
+    except ConnectionError as e:
+        logger.error(f"Elasticsearch 연결 오류: {str(e)}")
+        raise ElasticsearchConnectionError()
+    
+    except Exception as e:
+        logger.error(f"상표 검색 실행 오류: {str(e)}", exc_info=True)
+        raise SearchQueryError(detail=str(e))
+
+def build_search_body(search_params: TrademarkSearchParams) -> Dict[str, Any]:
+    """
+    검색 매개변수를 Elasticsearch 검색 요청 본문(쿼리, 페이징, 정렬, 하이라이트)으로 변환
+
+    Args:
+        search_params (TrademarkSearchParams): 검색 매개변수
+
+    Returns:
+        Dict[str, Any]: Elasticsearch 검색 요청 본문
+    """
+    # 페이징 처리
+    from_idx = (search_params.page - 1) * search_params.size
+    
+    # 정렬 처리
+    sort_list = build_sort_options(search_params.sort)
+    logger.debug("정렬 옵션: {}", sort_list)
+    
+    return {
+        "query": build_search_query(search_params),
+        "from": from_idx,
+        "size": search_params.size,
+        "sort": sort_list,
+        "_source": True,
+        "highlight": SEARCH_HIGHLIGHT
+    }
+
+def format_search_response(response: Dict[str, Any], search_params: TrademarkSearchParams) -> Dict[str, Any]:
+    """Elasticsearch 검색 응답을 검색 결과 형식으로 변환"""
+    hits = response["hits"]["hits"]
+    total = response["hits"]["total"]["value"]
+    
+    logger.debug("검색 결과 - 총 {}개", total)
     
+    return {
+        "total": total,
+        "page": search_params.page,
+        "size": search_params.size,
+        "results": format_search_hits(hits)
+    }
+
+def build_search_query(search_params: TrademarkSearchParams) -> Dict[str, Any]:
+    """
+    검색 매개변수를 Elasticsearch bool 쿼리로 변환
+
+    Args:
+        search_params (TrademarkSearchParams): 검색 매개변수
+
+    Returns:
+        Dict[str, Any]: Elasticsearch 쿼리
+    """
     # 기본 검색 쿼리 구성
     query = {
         "bool": {
@@ -50,11 +202,11 @@ async def search_trademarks(search_params: TrademarkSearchParams) -> Dict[str, A
         chosung_only = is_chosung_query(query_text)
         has_korean_chars = has_korean(query_text)
         
-        logger.debug(f"쿼리 분석 - 초성 전용: {chosung_only}, 한글 포함: {has_korean_chars}")
+        logger.debug("쿼리 분석 - 초성 전용: {}, 한글 포함: {}", chosung_only, has_korean_chars)
         
         if chosung_only:
             # 초성 검색인 경우 - 한글 상표명과 영문 상표명 발음의 초성 모두 검색
-            logger.debug(f"초성 검색 모드 적용: {query_text}")
+            logger.debug("초성 검색 모드 적용: {}", query_text)
             
             query["bool"]["should"] = [
                 # 한글 상표명 초성 검색
@@ -169,7 +321,7 @@ async def search_trademarks(search_params: TrademarkSearchParams) -> Dict[str, A
             
             # 한글이 포함된 경우 초성 필드도 부분적으로 검색
             if has_korean_chars:
-                logger.debug(f"한글 포함 - 초성 부분 검색도 활성화")
+                logger.debug("한글 포함 - 초성 부분 검색도 활성화")
                 query["bool"]["should"].append({
                     "match": {
                         "productName_chosung": {
@@ -188,28 +340,28 @@ async def search_trademarks(search_params: TrademarkSearchParams) -> Dict[str, A
                     }
                 })
         
-        logger.debug(f"검색어 적용: {query_text}")
+        logger.debug("검색어 적용: {}", query_text)
     
     # 상태 필터
     if search_params.status:
         query["bool"]["filter"].append({
             "term": {"registerStatus": search_params.status}
         })
-        logger.debug(f"상태 필터 적용: {search_params.status}")
+        logger.debug("상태 필터 적용: {}", search_params.status)
     
     # 상품 주 분류 코드 필터
     if search_params.main_code:
         query["bool"]["filter"].append({
             "term": {"asignProductMainCodeList": search_params.main_code}
         })
-        logger.debug(f"주 분류 코드 필터 적용: {search_params.main_code}")
+        logger.debug("주 분류 코드 필터 적용: {}", search_params.main_code)
     
     # 상품 유사군 코드 필터
     if search_params.sub_code:
         query["bool"]["filter"].append({
             "term": {"asignProductSubCodeList": search_params.sub_code}
         })
-        logger.debug(f"유사군 코드 필터 적용: {search_params.sub_code}")
+        logger.debug("유사군 코드 필터 적용: {}", search_params.sub_code)
     
     # 날짜 범위 필터
     if search_params.start_date or search_params.end_date:
@@ -222,95 +374,23 @@ async def search_trademarks(search_params: TrademarkSearchParams) -> Dict[str, A
         query["bool"]["filter"].append({
             "range": {"applicationDate": date_range}
         })
-        logger.debug(f"날짜 범위 필터 적용: {date_range}")
-    
-    # 페이징 처리
-    from_idx = (search_params.page - 1) * search_params.size
+        logger.debug("날짜 범위 필터 적용: {}", date_range)
     
-    # 정렬 처리
-    sort_list = build_sort_options(search_params.sort)
-    logger.debug(f"정렬 옵션: {sort_list}")
-    
-    try:
-        logger.debug(f"Elasticsearch 검색 실행 - 페이지: {search_params.page}, 사이즈: {search_params.size}")
-        logger.debug(f"최종 쿼리: {query}")
-        
-        # 검색 실행
-        response = es_client.search(
-            index=index_name,
-            body={
-                "query": query,
-                "from": from_idx,
-                "size": search_params.size,
-                "sort": sort_list,
-                "_source": True,
-                "highlight": {
-                    "fields": {
-                        "productName": {
-                            "number_of_fragments": 0,
-                            "pre_tags": ["<mark>"],
-                            "post_tags": ["</mark>"]
-                        },
-                        "productName_chosung": {
-                            "number_of_fragments": 0,
-                            "pre_tags": ["<mark>"],
-                            "post_tags": ["</mark>"]
-                        },
-                        "productNameEng": {
-                            "number_of_fragments": 0,
-                            "pre_tags": ["<mark>"],
-                            "post_tags": ["</mark>"]
-                        },
-                        "productNameEngPronunciation": {
-                            "number_of_fragments": 0,
-                            "pre_tags": ["<mark>"],
-                            "post_tags": ["</mark>"]
-                        },
-                        "productNameEngPronunciation_chosung": {
-                            "number_of_fragments": 0,
-                            "pre_tags": ["<mark>"],
-                            "post_tags": ["</mark>"]
-                        }
-                    }
-                }
-            }
-        )
-        
-        # 검색 결과 처리
-        hits = response["hits"]["hits"]
-        total = response["hits"]["total"]["value"]
-        
-        logger.debug(f"검색 결과 - 총 {total}개")
+    return query
+
+def format_search_hits(hits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """검색 결과 hit 목록을 응답 형식(원본 문서 + 하이라이트)으로 변환"""
+    results = []
+    for hit in hits:
+        source = hit["_source"]
         
-        results = []
-        for hit in hits:
-            source = hit["_source"]
-            
-            # 하이라이트 정보 추가
-            if "highlight" in hit:
-                source["highlight"] = hit["highlight"]
-            
-            # Pydantic 모델로 변환
-            results.append(source)
+        # 하이라이트 정보 추가
+        if "highlight" in hit:
+            source["highlight"] = hit["highlight"]
         
-        return {
-            "total": total,
-            "page": search_params.page,
-            "size": search_params.size,
-            "results": results
-        }
+        results.append(source)
     
-    except NotFoundError as e:
-        logger.error(f"인덱스 '{index_name}'를 찾을 수 없습니다")
-        raise IndexNotFoundError(index_name)
-    
-    except ConnectionError as e:
-        logger.error(f"Elasticsearch 연결 오류: {str(e)}")
-        raise ElasticsearchConnectionError()
-    
-    except Exception as e:
-        logger.error(f"상표 검색 실행 오류: {str(e)}", exc_info=True)
-        raise SearchQueryError(detail=str(e))
+    return results
 
 def build_sort_options(sort_options: List[SortOption] = None) -> List[Dict]:
     """
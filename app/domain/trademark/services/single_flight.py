@@ -0,0 +1,75 @@
+"""
+동일 요청 병합 (single-flight)
+
+이 모듈은 같은 키로 동시에 들어온 비동기 호출을 하나의 실행으로 합치는 클래스를 제공합니다.
+인기 상표로 같은 검색/자동완성 요청이 몰리면 Elasticsearch에는 한 번만 요청하고
+나머지 요청은 진행 중인 결과를 함께 기다립니다.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from loguru import logger
+
+class SingleFlight:
+    """
+    키별 진행 중 호출 병합
+
+    실행은 별도 태스크로 수행하고 각 요청은 shield로 기다리므로,
+    먼저 들어온 요청의 클라이언트가 연결을 끊어도 나머지 요청은 결과를 받습니다.
+    태스크는 이벤트 루프에 묶이므로 다른 루프의 호출과는 병합하지 않습니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+
+        # 통계
+        self._calls = 0
+        self._executions = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키에 해당하는 호출이 진행 중이면 그 결과를, 없으면 func를 실행한 결과를 반환
+
+        Args:
+            key: 요청 식별 키 (정규화된 요청 매개변수)
+            func: 실제 호출을 수행하는 코루틴 함수
+
+        Returns:
+            func의 결과 (예외도 모든 대기 요청에 그대로 전달)
+        """
+        self._calls += 1
+        loop = asyncio.get_running_loop()
+
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(func())
+            self._in_flight[key] = task
+            self._executions += 1
+            task.add_done_callback(lambda done, key=key: self._on_done(key, done))
+        else:
+            logger.debug("[{}] 진행 중인 요청에 병합: {}", self.name, key)
+
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # 모든 대기 요청이 취소된 경우에도 "예외가 확인되지 않음" 경고가 남지 않도록 확인
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """병합 통계"""
+        coalesced = self._calls - self._executions
+        return {
+            "calls": self._calls,
+            "executions": self._executions,
+            "coalesced": coalesced,
+            "coalescing_ratio": round(coalesced / self._calls, 4) if self._calls else 0.0,
+            "in_flight": len(self._in_flight)
+        }
+
+# 전역 병합 인스턴스 (검색, 자동완성)
+search_flight = SingleFlight("search")
+autocomplete_flight = SingleFlight("autocomplete")
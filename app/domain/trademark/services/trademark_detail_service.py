@@ -3,12 +3,16 @@
 
 이 모듈은 상표 상세 정보 조회 기능을 제공합니다.
 """
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
 from loguru import logger
 from elasticsearch import NotFoundError
 
-from app.core.elasticsearch import es_client
+from app.core.elasticsearch import get_async_es_client
 from app.core.config import settings
-from app.core.exceptions import SearchQueryError, IndexNotFoundError, ElasticsearchConnectionError
+from app.core.exceptions import SearchQueryError, IndexNotFoundError, ElasticsearchConnectionError, InvalidParameterError
+from app.domain.trademark.models.trademark_base import TrademarkBase
 
 async def get_trademark_by_pid(pid: str) -> dict:
     """
@@ -28,7 +32,7 @@ async def get_trademark_by_pid(pid: str) -> dict:
     index_name = settings.ELASTICSEARCH_INDEX
     
     try:
-        response = es_client.search(
+        response = await get_async_es_client().search(
             index=index_name,
             body={
                 "query": {
@@ -64,6 +68,10 @@ async def get_trademark_by_pid(pid: str) -> dict:
 async def get_trademark_by_application_number(application_number: str) -> dict:
     """
     출원번호로 상표 정보 조회
+
+    출원번호를 문서 _id로 사용하여 실시간 GET으로 조회하므로 검색(query/fetch) 단계와
+    스코어링을 거치지 않습니다. 자동 생성 _id로 색인된 기존 인덱스는
+    DETAIL_LEGACY_LOOKUP 설정에 따라 term 검색으로 다시 조회합니다.
     
     Args:
         application_number (str): 상표 출원번호
@@ -79,7 +87,24 @@ async def get_trademark_by_application_number(application_number: str) -> dict:
     index_name = settings.ELASTICSEARCH_INDEX
     
     try:
-        response = es_client.search(
+        try:
+            response = await get_async_es_client().get(
+                index=index_name,
+                id=application_number,
+                realtime=True
+            )
+            return response["_source"]
+        except NotFoundError as e:
+            # 인덱스가 없는 경우와 문서가 없는 경우를 구분
+            if is_index_not_found(e):
+                raise
+        
+        if not settings.DETAIL_LEGACY_LOOKUP:
+            logger.warning(f"상표를 찾을 수 없음 - 출원번호: {application_number}")
+            return None
+        
+        # 기존 인덱스 호환: 출원번호 term 검색
+        response = await get_async_es_client().search(
             index=index_name,
             body={
                 "query": {
@@ -109,4 +134,110 @@ async def get_trademark_by_application_number(application_number: str) -> dict:
     
     except Exception as e:
         logger.error(f"상표 조회 실행 오류: {str(e)}", exc_info=True)
-        raise SearchQueryError(detail=str(e))
\ No newline at end of file
+        raise SearchQueryError(detail=str(e))
+
+
+async def get_trademarks_by_application_numbers(
+    application_numbers: List[str],
+    fields: Optional[List[str]] = None
+) -> Tuple[List[dict], List[str]]:
+    """
+    여러 출원번호의 상표 정보를 일괄 조회
+
+    중복을 제거한 출원번호를 DETAIL_BATCH_CHUNK_SIZE개씩 나누어 청크마다 mget 한 번으로 조회하고,
+    찾지 못한 출원번호는 DETAIL_LEGACY_LOOKUP 설정에 따라 청크당 terms 검색 한 번으로 다시 조회합니다.
+    조회수는 증가시키지 않습니다.
+
+    Args:
+        application_numbers (List[str]): 출원번호 목록
+        fields (List[str], optional): 반환할 필드 목록 (기본값은 전체)
+
+    Returns:
+        Tuple[List[dict], List[str]]: (요청 순서의 상표 정보 목록, 요청 순서의 찾지 못한 출원번호 목록)
+
+    Raises:
+        IndexNotFoundError: 인덱스를 찾을 수 없는 경우
+        ElasticsearchConnectionError: Elasticsearch 연결 오류
+        SearchQueryError: 검색 쿼리 오류
+    """
+    index_name = settings.ELASTICSEARCH_INDEX
+    source = fields if fields else True
+
+    unknown = [field for field in fields or [] if field not in TrademarkBase.__fields__]
+    if unknown:
+        raise InvalidParameterError(f"조회할 수 없는 필드: {', '.join(unknown)}")
+
+    # 요청 순서를 유지하면서 중복 제거
+    unique_numbers = list(dict.fromkeys(application_numbers))
+    chunk_size = settings.DETAIL_BATCH_CHUNK_SIZE
+    chunks = [unique_numbers[i:i + chunk_size] for i in range(0, len(unique_numbers), chunk_size)]
+
+    try:
+        found: Dict[str, dict] = {}
+        for chunk_found in await asyncio.gather(*(_fetch_chunk(index_name, chunk, source) for chunk in chunks)):
+            found.update(chunk_found)
+
+    except NotFoundError as e:
+        logger.error(f"인덱스 '{index_name}'를 찾을 수 없습니다")
+        raise IndexNotFoundError(index_name)
+
+    except ConnectionError as e:
+        logger.error(f"Elasticsearch 연결 오류: {str(e)}")
+        raise ElasticsearchConnectionError()
+
+    except IndexNotFoundError:
+        raise
+
+    except Exception as e:
+        logger.error(f"상표 일괄 조회 실행 오류: {str(e)}", exc_info=True)
+        raise SearchQueryError(detail=str(e))
+
+    results = [found[number] for number in unique_numbers if number in found]
+    not_found = [number for number in unique_numbers if number not in found]
+
+    logger.debug("상표 일괄 조회 - 요청 {}개, 찾음 {}개, 청크 {}개", len(unique_numbers), len(results), len(chunks))
+    return results, not_found
+
+
+async def _fetch_chunk(index_name: str, chunk: List[str], source) -> Dict[str, dict]:
+    """출원번호 청크 하나를 mget(+ 기존 인덱스 호환 terms 검색)으로 조회"""
+    response = await get_async_es_client().mget(
+        index=index_name,
+        body={"ids": chunk},
+        _source=source,
+        realtime=True
+    )
+
+    found = {}
+    for doc in response["docs"]:
+        error = doc.get("error")
+        if error:
+            if error.get("type") == "index_not_found_exception":
+                raise IndexNotFoundError(index_name)
+            raise SearchQueryError(detail=str(error))
+        if doc.get("found"):
+            found[doc["_id"]] = doc["_source"]
+
+    missing = [number for number in chunk if number not in found]
+    if missing and settings.DETAIL_LEGACY_LOOKUP:
+        # 기존 인덱스 호환: 자동 생성 _id로 색인된 문서를 출원번호 terms 검색으로 조회
+        # (출원번호별 1건만 반환하도록 collapse, 출원번호는 fields로 받아 _source 필터와 무관하게 매칭)
+        response = await get_async_es_client().search(
+            index=index_name,
+            body={
+                "query": {"terms": {"applicationNumber": missing}},
+                "collapse": {"field": "applicationNumber"},
+                "size": len(missing),
+                "_source": source
+            }
+        )
+        for hit in response["hits"]["hits"]:
+            number = hit["fields"]["applicationNumber"][0]
+            found.setdefault(number, hit["_source"])
+
+    return found
+
+
+def is_index_not_found(error: NotFoundError) -> bool:
+    """NotFoundError가 인덱스 부재로 인한 것인지 확인 (문서 부재와 구분)"""
+    return error.error == "index_not_found_exception"
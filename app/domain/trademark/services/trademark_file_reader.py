@@ -0,0 +1,192 @@
+"""
+상표 데이터 파일 스트리밍 리더
+
+이 모듈은 대용량 상표 데이터 파일을 전체를 메모리에 올리지 않고
+레코드 단위로 읽어들이는 제너레이터를 제공합니다.
+JSON 배열 형식과 NDJSON(JSON Lines) 형식을 모두 지원합니다.
+"""
+import codecs
+import json
+import logging
+from typing import Dict, Any, Iterator, Tuple
+
+logger = logging.getLogger(__name__)
+
+# NDJSON 형식으로 간주하는 확장자
+NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+
+# 파일 읽기 단위 (바이트 수)
+DEFAULT_READ_SIZE = 64 * 1024
+
+# 레코드 하나의 최대 크기 (NDJSON은 바이트 수, JSON 배열은 문자 수)
+# 잘못된 원소를 파싱하려고 파일 나머지를 모두 버퍼에 올리지 않도록 제한
+DEFAULT_MAX_RECORD_SIZE = 16 * 1024 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+_WHITESPACE_BYTES = b" \t\r\n"
+
+def iter_trademark_records(
+    file_path: str,
+    read_size: int = DEFAULT_READ_SIZE,
+    max_record_size: int = DEFAULT_MAX_RECORD_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    상표 데이터 파일을 레코드 단위로 순회
+
+    확장자가 .ndjson/.jsonl이거나 첫 문자가 '['가 아니면 NDJSON으로,
+    그렇지 않으면 JSON 배열로 간주하여 점진적으로 파싱합니다.
+
+    Args:
+        file_path (str): 데이터 파일 경로
+        read_size (int, optional): 한 번에 읽을 바이트 수
+        max_record_size (int, optional): 레코드 하나의 최대 크기
+
+    Yields:
+        Dict[str, Any]: 상표 레코드
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 레코드가 max_record_size보다 큰 경우 (바이트 오프셋 포함)
+    """
+    for record, _ in iter_trademark_records_with_offsets(file_path, read_size=read_size, max_record_size=max_record_size):
+        yield record
+
+def iter_trademark_records_with_offsets(
+    file_path: str,
+    start_offset: int = 0,
+    read_size: int = DEFAULT_READ_SIZE,
+    max_record_size: int = DEFAULT_MAX_RECORD_SIZE
+) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """
+    상표 데이터 파일을 레코드와 레코드 끝의 바이트 오프셋 단위로 순회
+
+    반환된 오프셋을 start_offset으로 다시 전달하면 그 다음 레코드부터 읽으므로,
+    중단된 적재를 마지막 체크포인트부터 이어서 진행할 수 있습니다.
+
+    Args:
+        file_path (str): 데이터 파일 경로
+        start_offset (int, optional): 읽기 시작 바이트 오프셋 (이전에 반환된 오프셋)
+        read_size (int, optional): 한 번에 읽을 바이트 수
+        max_record_size (int, optional): 레코드 하나의 최대 크기
+
+    Yields:
+        Tuple[Dict[str, Any], int]: (상표 레코드, 레코드 끝 바이트 오프셋)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 레코드가 max_record_size보다 큰 경우 (바이트 오프셋 포함)
+    """
+    with open(file_path, 'rb') as f:
+        # UTF-8 BOM 건너뜀
+        data_start = len(codecs.BOM_UTF8) if f.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8 else 0
+
+        if file_path.lower().endswith(NDJSON_EXTENSIONS):
+            is_array = False
+        else:
+            # 첫 번째 유효 문자로 형식 판별
+            f.seek(data_start)
+            is_array = _peek_first_byte(f) == b"["
+
+        f.seek(max(start_offset, data_start))
+        if is_array:
+            yield from _iter_json_array(f, read_size, max_record_size, started=start_offset > data_start)
+        else:
+            yield from _iter_ndjson(f, max_record_size)
+
+def _peek_first_byte(f) -> bytes:
+    """공백을 제외한 첫 바이트 확인"""
+    while True:
+        char = f.read(1)
+        if not char or char not in _WHITESPACE_BYTES:
+            return char
+
+def _iter_ndjson(f, max_record_size: int) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """NDJSON 파일 순회 (한 줄에 하나의 JSON 객체)"""
+    line_no = 0
+    while True:
+        line_start = f.tell()
+        line = f.readline(max_record_size + 1)
+        if not line:
+            return
+        line_no += 1
+        if len(line) > max_record_size:
+            raise ValueError(
+                f"NDJSON {line_no}번째 줄(바이트 오프셋 {line_start})이 최대 레코드 크기({max_record_size})를 넘습니다"
+            )
+
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line.decode("utf-8")), f.tell()
+        except json.JSONDecodeError as e:
+            logger.error(f"NDJSON 파싱 실패 - {line_no}번째 줄: {str(e)}")
+            raise
+
+def _iter_json_array(
+    f,
+    read_size: int,
+    max_record_size: int,
+    started: bool = False
+) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """
+    JSON 배열 파일을 원소 단위로 점진적 파싱
+
+    started가 True이면 배열 중간(이전 원소 끝)에서 읽기를 시작한 것으로 봅니다.
+    원소가 버퍼 경계에 걸려 파싱에 실패하면 더 읽어서 재시도하되, 원소가 max_record_size를 넘도록
+    파싱되지 않으면 잘못된 원소로 보고 파일 나머지를 읽지 않고 ValueError를 발생시킵니다.
+    """
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer, pos = "", 0
+    # buffer[pos]의 파일 내 바이트 오프셋
+    offset = f.tell()
+
+    def read_chunk():
+        data = f.read(read_size)
+        return text_decoder.decode(data, final=not data), bool(data)
+
+    while True:
+        # 버퍼를 모두 소비했으면 다음 청크를 읽음
+        if pos >= len(buffer):
+            chunk, has_data = read_chunk()
+            if not has_data:
+                raise ValueError("JSON 배열이 ']'로 끝나지 않았습니다")
+            buffer, pos = chunk, 0
+            continue
+
+        char = buffer[pos]
+
+        # 원소 사이의 공백과 쉼표 건너뜀
+        if char in _WHITESPACE or char == ",":
+            pos += 1
+            offset += 1
+            continue
+
+        if not started:
+            if char != "[":
+                raise ValueError("JSON 배열 형식이 아닙니다")
+            started = True
+            pos += 1
+            offset += 1
+            continue
+
+        if char == "]":
+            return
+
+        try:
+            record, end = _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            if len(buffer) - pos > max_record_size:
+                raise ValueError(
+                    f"JSON 배열 원소(바이트 오프셋 {offset})가 최대 레코드 크기({max_record_size})를 넘도록 "
+                    f"파싱되지 않습니다: {e.msg}"
+                ) from e
+            # 원소가 버퍼 경계에 걸린 경우 더 읽어서 재시도
+            chunk, has_data = read_chunk()
+            if not has_data:
+                raise ValueError(f"JSON 배열 원소(바이트 오프셋 {offset})를 파싱할 수 없습니다: {e.msg}") from e
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+
+        offset += len(buffer[pos:end].encode("utf-8"))
+        pos = end
+        yield record, offset
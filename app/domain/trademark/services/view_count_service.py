@@ -2,78 +2,280 @@
 상표 조회수 관련 서비스
 
 이 모듈은 상표 조회수 증가 기능을 제공합니다.
+조회수는 프로세스 내 버퍼에 pid별로 누적된 뒤, 주기적으로 또는 버퍼가 가득 차면
+스크립트 기반 벌크 업데이트(ctx._source.viewCount += n)로 한 번에 반영됩니다.
 """
+import asyncio
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Set, Tuple
+
 from loguru import logger
-from elasticsearch import NotFoundError
+from elasticsearch.helpers import async_bulk
 
-from app.core.elasticsearch import es_client
+from app.core.elasticsearch import get_async_es_client
 from app.core.config import settings
-from app.core.exceptions import SearchQueryError, IndexNotFoundError, ElasticsearchConnectionError
+
+# 조회수 누적 스크립트 (viewCount가 없는 문서도 처리)
+INCREMENT_SCRIPT = (
+    "if (ctx._source.viewCount == null) { ctx._source.viewCount = params.n } "
+    "else { ctx._source.viewCount += params.n }"
+)
+
+# pid -> 문서 _id 조회 시 한 번에 조회할 pid 수
+RESOLVE_BATCH_SIZE = 1000
+
+class ViewCountBuffer:
+    """
+    조회수 쓰기 지연(write-behind) 버퍼
+
+    (인덱스, pid)별 증가량을 메모리에 누적하고, flush 시 pid를 문서 _id로 일괄 조회한 뒤
+    스크립트 업데이트를 벌크로 전송합니다. refresh를 강제하지 않으며,
+    증가량은 스크립트로 더해지므로 동시 조회 시에도 증가분이 유실되지 않습니다.
+    """
+
+    def __init__(self, flush_interval: float = None, max_pending: int = None):
+        self.flush_interval = flush_interval or settings.VIEW_COUNT_FLUSH_INTERVAL
+        self.max_pending = max_pending or settings.VIEW_COUNT_MAX_PENDING
+
+        self._pending: Dict[Tuple[str, str], int] = {}
+        self._oldest_pending_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+        # 통계
+        self._last_flush_at: Optional[datetime] = None
+        self._flushed_views = 0
+        self._flush_count = 0
+        self._failed_flushes = 0
+        self._dropped_views = 0
+
+    def add(self, pid: str, count: int = 1):
+        """조회수 증가량 누적 (버퍼가 가득 차면 백그라운드 flush 예약)"""
+        key = (settings.ELASTICSEARCH_INDEX, pid)
+        self._pending[key] = self._pending.get(key, 0) + count
+
+        if self._oldest_pending_at is None:
+            self._oldest_pending_at = time.monotonic()
+
+        if len(self._pending) >= self.max_pending:
+            task = asyncio.ensure_future(self.flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> int:
+        """
+        누적된 조회수를 Elasticsearch에 반영
+
+        벌크 업데이트에 실패한 문서의 증가분은 버퍼에 되돌려 다음 flush에서 재시도하고,
+        재시도해도 소용없는 실패(문서 없음, 스크립트 오류 등)는 로그를 남기고 버립니다.
+
+        Returns:
+            int: 반영된 조회수 합계
+        """
+        if not self._pending:
+            return 0
+
+        # 현재 버퍼를 분리하여 flush 중에도 새 증가분을 받을 수 있도록 함
+        pending, self._pending = self._pending, {}
+        self._oldest_pending_at = None
+
+        by_index: Dict[str, Dict[str, int]] = {}
+        for (index_name, pid), count in pending.items():
+            by_index.setdefault(index_name, {})[pid] = count
+
+        flushed = 0
+        retry: Dict[Tuple[str, str], int] = {}
+        try:
+            # 인덱스별로 반영하여 벌크 결과의 _id를 pid로 되돌릴 수 있도록 함 (결과의 _index는 별칭이 아닌 물리 인덱스)
+            for index_name in list(by_index):
+                counts = by_index[index_name]
+                flushed += await self._flush_index(index_name, counts, retry)
+                del by_index[index_name]
+
+            self._flushed_views += flushed
+            self._flush_count += 1
+            self._last_flush_at = datetime.now()
+            logger.debug(f"조회수 flush 완료 - {len(pending)}개 상표, 조회수 {flushed}")
+            return flushed
+
+        except Exception as e:
+            # 반영하지 못한 인덱스의 증가분은 모두 재시도
+            self._failed_flushes += 1
+            self._flushed_views += flushed
+            for index_name, counts in by_index.items():
+                for pid, count in counts.items():
+                    retry[(index_name, pid)] = retry.get((index_name, pid), 0) + count
+            logger.error(f"조회수 flush 실행 오류: {str(e)}", exc_info=True)
+            return flushed
+
+        finally:
+            self._requeue(retry)
+
+    async def _flush_index(self, index_name: str, counts: Dict[str, int], retry: Dict[Tuple[str, str], int]) -> int:
+        """
+        인덱스 하나의 조회수 반영
+
+        Args:
+            index_name (str): 인덱스(별칭) 이름
+            counts (Dict[str, int]): pid별 증가량
+            retry (Dict[Tuple[str, str], int]): 재시도할 증가분을 추가할 dict
+
+        Returns:
+            int: 반영된 조회수 합계
+        """
+        document_pids = await self._resolve_document_ids(index_name, list(counts))
+
+        missing = len(counts) - len(set(document_pids.values()))
+        if missing:
+            logger.warning(f"조회수 반영 대상 문서를 찾지 못함 - 인덱스: {index_name}, {missing}개 상표")
+
+        if not document_pids:
+            return 0
+
+        actions = [
+            {
+                "_op_type": "update",
+                "_index": index_name,
+                "_id": document_id,
+                "script": {
+                    "source": INCREMENT_SCRIPT,
+                    "lang": "painless",
+                    "params": {"n": counts[pid]}
+                }
+            }
+            for document_id, pid in document_pids.items()
+        ]
+        _, errors = await async_bulk(
+            get_async_es_client(),
+            actions,
+            raise_on_error=False,
+            raise_on_exception=False
+        )
+
+        failed_ids = set()
+        retried, dropped = 0, 0
+        for error in errors:
+            result = next(iter(error.values()))
+            pid = document_pids.get(result.get("_id"))
+            if pid is None:
+                continue
+            failed_ids.add(result["_id"])
+            if _is_retryable(result.get("status")):
+                retry[(index_name, pid)] = retry.get((index_name, pid), 0) + counts[pid]
+                retried += counts[pid]
+            else:
+                dropped += counts[pid]
+
+        if errors:
+            self._dropped_views += dropped
+            logger.warning(
+                f"조회수 반영 실패 {len(errors)}건 - 재시도 조회수 {retried}, 버린 조회수 {dropped}: {errors[:3]}"
+            )
+
+        return sum(counts[pid] for document_id, pid in document_pids.items() if document_id not in failed_ids)
+
+    def _requeue(self, retry: Dict[Tuple[str, str], int]):
+        """반영하지 못한 증가분을 버퍼에 되돌림"""
+        if not retry:
+            return
+        for key, count in retry.items():
+            self._pending[key] = self._pending.get(key, 0) + count
+        if self._oldest_pending_at is None:
+            self._oldest_pending_at = time.monotonic()
+
+    async def _resolve_document_ids(self, index_name: str, pids: List[str]) -> Dict[str, str]:
+        """pid를 문서 _id로 조회 (_id -> pid)"""
+        document_pids: Dict[str, str] = {}
+        for i in range(0, len(pids), RESOLVE_BATCH_SIZE):
+            batch = pids[i:i + RESOLVE_BATCH_SIZE]
+            wanted = set(batch)
+            response = await get_async_es_client().search(
+                index=index_name,
+                body={
+                    "query": {"terms": {"pid": batch}},
+                    "_source": ["pid"],
+                    "size": len(batch)
+                }
+            )
+
+            for hit in response["hits"]["hits"]:
+                pid = hit["_source"].get("pid")
+                if pid in wanted:
+                    document_pids[hit["_id"]] = pid
+
+        return document_pids
+
+    async def _run_periodic_flush(self):
+        """flush_interval마다 버퍼 flush"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self):
+        """주기적 flush 백그라운드 작업 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run_periodic_flush())
+            logger.info(f"조회수 버퍼 시작 - flush 주기: {self.flush_interval}초, 최대 대기: {self.max_pending}개")
+
+    async def close(self):
+        """주기적 flush 중단 후 남은 조회수 반영"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+        flushed = await self.flush()
+        logger.info(f"조회수 버퍼 종료 - 마지막 flush 조회수: {flushed}")
+
+    def stats(self) -> Dict[str, Any]:
+        """버퍼 상태 (대기 건수, flush 지연 등)"""
+        flush_lag = 0.0
+        if self._oldest_pending_at is not None:
+            flush_lag = time.monotonic() - self._oldest_pending_at
+
+        return {
+            "pending_trademarks": len(self._pending),
+            "pending_views": sum(self._pending.values()),
+            "flush_lag_seconds": round(flush_lag, 3),
+            "last_flush_at": self._last_flush_at.isoformat() if self._last_flush_at else None,
+            "flush_count": self._flush_count,
+            "flushed_views": self._flushed_views,
+            "failed_flushes": self._failed_flushes,
+            "dropped_views": self._dropped_views
+        }
+
+def _is_retryable(status: Any) -> bool:
+    """벌크 항목 실패를 재시도할지 여부 (버전 충돌, 과부하, 서버/연결 오류)"""
+    if not isinstance(status, int):
+        # 연결 오류 등은 상태 코드가 없음
+        return True
+    return status in (409, 429) or status >= 500
+
+# 전역 조회수 버퍼 인스턴스
+view_count_buffer = ViewCountBuffer()
 
 async def increment_view_count(pid: str) -> bool:
     """
     상표 조회수 증가
-    
+
+    조회수는 버퍼에 누적되며 Elasticsearch 반영은 백그라운드에서 이루어지므로
+    호출자는 쓰기 완료를 기다리지 않습니다.
+
     Args:
         pid (str): 상표 고유 ID
-        
+
     Returns:
-        bool: 성공 여부
-        
-    Raises:
-        IndexNotFoundError: 인덱스를 찾을 수 없는 경우
-        ElasticsearchConnectionError: Elasticsearch 연결 오류
-        SearchQueryError: 검색 쿼리 오류
+        bool: 버퍼 등록 성공 여부
     """
-    index_name = settings.ELASTICSEARCH_INDEX
-    
-    try:
-        # 현재 조회수 조회
-        response = es_client.search(
-            index=index_name,
-            body={
-                "query": {
-                    "term": {
-                        "pid": pid
-                    }
-                },
-                "_source": ["viewCount"]
-            }
-        )
-        
-        hits = response["hits"]["hits"]
-        if not hits:
-            logger.warning(f"상표를 찾을 수 없음 - pid: {pid}")
-            return False
-        
-        # 현재 조회수
-        current_view_count = hits[0]["_source"].get("viewCount", 0)
-        new_view_count = current_view_count + 1
-        
-        # 조회수 업데이트
-        update_response = es_client.update(
-            index=index_name,
-            id=hits[0]["_id"],
-            body={
-                "doc": {
-                    "viewCount": new_view_count
-                }
-            },
-            refresh=True
-        )
-        
-        logger.debug(f"조회수 증가: {pid}, {current_view_count} -> {new_view_count}")
-        
-        return update_response["result"] == "updated"
-    
-    except NotFoundError as e:
-        logger.error(f"인덱스 '{index_name}'를 찾을 수 없습니다")
-        raise IndexNotFoundError(index_name)
-    
-    except ConnectionError as e:
-        logger.error(f"Elasticsearch 연결 오류: {str(e)}")
-        raise ElasticsearchConnectionError()
-    
-    except Exception as e:
-        logger.error(f"조회수 증가 실행 오류: {str(e)}", exc_info=True)
-        raise SearchQueryError(detail=str(e))
\ No newline at end of file
+    if not pid:
+        return False
+
+    view_count_buffer.add(pid)
+    return True
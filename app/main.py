@@ -3,24 +3,33 @@
 
 이 모듈은 FastAPI 애플리케이션을 초기화하고 구성합니다.
 """
+import asyncio
 import os
-import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, Request, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from loguru import logger
 
+from app.core.admin import require_admin
 from app.core.config import settings
-from app.core.elasticsearch import es_client
-from app.core.logging_config import setup_logging, get_performance_logger
+from app.core.elasticsearch import es_client, get_async_es_client, close_async_es_client
+from app.core.logging_config import setup_logging
+from app.core.exceptions import ProfileReportNotFoundError
+from app.core.metrics import MetricsRoute, MetricsJSONResponse, render_metrics
+from app.core.middleware import ProfilingMiddleware, RequestTimingMiddleware
+from app.core.profiling import profile_store
+from app.core.slow_query_log import slow_query_log
 from app.domain.trademark.index import create_trademark_index
 from app.domain.trademark.routers import trademark_router 
+from app.domain.trademark.services.view_count_service import view_count_buffer
+from app.domain.trademark.services.ingest_jobs import ingest_jobs
+from app.domain.trademark.services.autocomplete_index import autocomplete_index
+from app.domain.trademark.services.pronunciation_dict import pronunciation_dict
 
 # 로깅 설정
 setup_logging()
-perf_logger = get_performance_logger()
 
 logger.info(f"{settings.PROJECT_NAME} 애플리케이션 초기화 시작")
 
@@ -31,6 +40,9 @@ async def lifespan(app: FastAPI):
     # 시작 이벤트
     logger.info(f"{settings.PROJECT_NAME} 애플리케이션 시작")
     
+    # 발음 사전 컴파일 (이후 파일이 바뀌면 자동 재로드)
+    pronunciation_dict.load()
+    
     try:
         # Elasticsearch 연결 확인
         es_info = es_client.info()
@@ -77,9 +89,23 @@ async def lifespan(app: FastAPI):
         logger.critical(f"애플리케이션 시작 중 치명적 오류 발생: {str(e)}", exc_info=True)
         raise e  # 치명적 오류는 애플리케이션 종료
     
+    # 메모리 자동완성 인덱스 빌드 (데이터를 적재한 경우 적재 직후 이미 빌드됨)
+    if settings.AUTOCOMPLETE_INDEX_ENABLED and not autocomplete_index.is_ready(settings.ELASTICSEARCH_INDEX):
+        try:
+            if es_client.indices.exists(index=settings.ELASTICSEARCH_INDEX):
+                autocomplete_index.rebuild(settings.ELASTICSEARCH_INDEX)
+        except Exception as e:
+            logger.error(f"자동완성 인덱스 빌드 실패: {str(e)}")
+    
+    # 조회수 버퍼 주기적 flush 시작
+    view_count_buffer.start()
+    
     yield
     
-    # 종료 이벤트
+    # 종료 이벤트 - 실행 중인 적재 작업을 중단(이후 재개 가능)하고 남은 조회수를 반영한 뒤 연결 종료
+    await asyncio.to_thread(ingest_jobs.shutdown)
+    await view_count_buffer.close()
+    await close_async_es_client()
     logger.info(f"{settings.PROJECT_NAME} 애플리케이션 종료")
 
 # FastAPI 앱 초기화
@@ -89,8 +115,11 @@ app = FastAPI(
     description="상표 데이터를 검색하고 필터링할 수 있는 API",
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=MetricsJSONResponse
 )
+# 앱에 직접 등록하는 라우트도 라우트별 지표 수집
+app.router.route_class = MetricsRoute
 
 # CORS 설정
 app.add_middleware(
@@ -101,38 +130,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 요청 처리 시간 미들웨어
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """요청 처리 시간을 측정하여 응답 헤더에 추가하는 미들웨어"""
-    start_time = time.time()
-    request_id = str(time.time_ns())[-6:]  # 간단한 요청 ID 생성
-    
-    # 요청 컨텍스트 로깅
-    logger.bind(request_id=request_id).info(
-        f"Request start - Method: {request.method}, Path: {request.url.path}"
-    )
-    
-    try:
-        response = await call_next(request)
-        
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
-        response.headers["X-Request-ID"] = request_id
-        
-        # 성능 로깅
-        perf_logger.info(
-            f"Request completed - Path: {request.url.path}, "
-            f"Time: {process_time:.3f}s, Status: {response.status_code}"
-        )
-        
-        return response
-        
-    except Exception as e:
-        logger.bind(request_id=request_id).error(
-            f"Request failed - Path: {request.url.path}, Error: {str(e)}"
-        )
-        raise
+# 관리자 요청 프로파일링 미들웨어 (요청 ID를 사용하므로 요청 ID 미들웨어 안쪽에 등록)
+app.add_middleware(ProfilingMiddleware)
+
+# 요청 처리 시간/요청 ID 미들웨어 (순수 ASGI, 가장 바깥에서 실행되도록 마지막에 등록)
+app.add_middleware(RequestTimingMiddleware)
 
 # 전역 예외 핸들러
 @app.exception_handler(Exception)
@@ -160,19 +162,21 @@ def read_root():
     }
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """API 헬스 체크 엔드포인트"""
     try:
+        es = get_async_es_client()
+        
         # Elasticsearch 연결 확인
-        es_info = es_client.info()
+        es_info = await es.info()
         
         # 인덱스 확인
-        index_exists = es_client.indices.exists(index=settings.ELASTICSEARCH_INDEX)
+        index_exists = await es.indices.exists(index=settings.ELASTICSEARCH_INDEX)
         
         # 문서 수 확인
         count = 0
         if index_exists:
-            count = es_client.count(index=settings.ELASTICSEARCH_INDEX)["count"]
+            count = (await es.count(index=settings.ELASTICSEARCH_INDEX))["count"]
         
         health_status = {
             "status": "healthy",
@@ -198,6 +202,42 @@ def health_check():
             "detail": str(e)
         }
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 지표 엔드포인트"""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="지표 수집이 비활성화되어 있습니다")
+    
+    content, content_type = render_metrics()
+    return Response(content=content, headers={"Content-Type": content_type})
+
+@app.get("/admin/profiles", include_in_schema=False, dependencies=[Depends(require_admin)])
+def list_profile_reports():
+    """보관 중인 요청 프로파일 보고서 목록 (최근 순)"""
+    return {"reports": profile_store.list()}
+
+@app.get("/admin/profiles/{request_id}", include_in_schema=False, dependencies=[Depends(require_admin)])
+def get_profile_report(request_id: str):
+    """요청 ID의 프로파일 보고서 (Python 함수별 시간, 단계별 시간, Elasticsearch 샤드별 프로파일)"""
+    report = profile_store.get(request_id)
+    if report is None:
+        raise ProfileReportNotFoundError(request_id)
+    return report
+
+@app.get("/admin/slow-queries", include_in_schema=False, dependencies=[Depends(require_admin)])
+def get_slow_queries(limit: int = Query(50, ge=1, le=1000, description="조회할 쿼리 지문 수")):
+    """쿼리 지문별 검색 처리 시간 통계 (총 처리 시간이 긴 순)"""
+    return {
+        "threshold_ms": settings.SLOW_QUERY_THRESHOLD_MS,
+        "queries": slow_query_log.snapshot(limit)
+    }
+
+@app.delete("/admin/slow-queries", include_in_schema=False, dependencies=[Depends(require_admin)])
+def reset_slow_queries():
+    """쿼리 지문별 통계 초기화"""
+    slow_query_log.clear()
+    return {"message": "느린 쿼리 통계를 초기화했습니다"}
+
 # API 라우터 등록
 app.include_router(trademark_router)
 
@@ -205,7 +245,7 @@ if __name__ == "__main__":
     import uvicorn
     
     # 로그 레벨 설정
-    log_level = os.getenv("LOG_LEVEL", "info").lower()
+    log_level = settings.LOG_LEVEL.lower()
     logger.info(f"로그 레벨: {log_level}")
     
     uvicorn.run(
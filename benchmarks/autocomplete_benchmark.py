@@ -0,0 +1,89 @@
+"""
+자동완성 마이크로벤치마크
+
+get_autocomplete_suggestions를 메모리 자동완성 인덱스 사용/미사용(Elasticsearch)으로
+각각 실행하여 요청당 지연 시간을 비교합니다.
+
+실행 방법 (Elasticsearch 실행 및 데이터 적재 후):
+    python -m benchmarks.autocomplete_benchmark --repeat 200
+
+가짜 Elasticsearch로 실행 (데이터 적재 포함, benchmarks/elasticsearch_setup.py 참고):
+    BENCHMARK_ELASTICSEARCH=fake python -m benchmarks.autocomplete_benchmark --repeat 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from benchmarks.elasticsearch_setup import setup_benchmark_elasticsearch
+
+# 앱 모듈은 임포트 시 Elasticsearch에 접속하므로 먼저 접속 대상을 정함
+setup_benchmark_elasticsearch()
+
+from app.core.config import settings
+from app.core.elasticsearch import close_async_es_client
+from app.domain.trademark.services.autocomplete_index import autocomplete_index
+from app.domain.trademark.services.autocomplete_service import get_autocomplete_suggestions
+
+# 초성, 한글, 영문, 중간 단어 접두사를 섞은 입력
+DEFAULT_QUERIES = ["ㅍ", "ㅍㄹ", "프", "프레", "프레스", "ㄱㅎㅅ", "간호", "타이", "f", "fre", "fresca", "samsung"]
+
+
+async def measure(queries: List[str], repeat: int) -> List[float]:
+    """검색어별로 repeat회 호출한 지연 시간(us) 목록 반환"""
+    latencies = []
+    for _ in range(repeat):
+        for query in queries:
+            start = time.perf_counter()
+            await get_autocomplete_suggestions(query, 10)
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+    return latencies
+
+
+def report(label: str, latencies: List[float]):
+    """지연 시간 분포 출력"""
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"[{label}] n={len(latencies)} "
+        f"mean={statistics.mean(latencies):.1f}us "
+        f"p50={statistics.median(latencies):.1f}us "
+        f"p99={p99:.1f}us"
+    )
+
+
+async def main(repeat: int):
+    autocomplete_index.rebuild(settings.ELASTICSEARCH_INDEX)
+    print(f"자동완성 인덱스: {autocomplete_index.stats()}")
+
+    original = settings.AUTOCOMPLETE_INDEX_ENABLED
+    try:
+        settings.AUTOCOMPLETE_INDEX_ENABLED = False
+        await measure(DEFAULT_QUERIES, 2)  # 워밍업
+        report("elasticsearch", await measure(DEFAULT_QUERIES, repeat))
+
+        settings.AUTOCOMPLETE_INDEX_ENABLED = True
+        await measure(DEFAULT_QUERIES, 2)
+        report("memory index", await measure(DEFAULT_QUERIES, repeat))
+    finally:
+        settings.AUTOCOMPLETE_INDEX_ENABLED = original
+
+    # 서비스 계층 오버헤드를 제외한 인덱스 자체 조회 시간
+    latencies = []
+    for _ in range(repeat):
+        for query in DEFAULT_QUERIES:
+            start = time.perf_counter()
+            autocomplete_index.suggest(query, 10)
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+    report("memory index (suggest only)", latencies)
+
+    await close_async_es_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="자동완성 마이크로벤치마크")
+    parser.add_argument("--repeat", type=int, default=200, help="검색어별 반복 횟수")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.repeat))
@@ -0,0 +1,80 @@
+"""
+벌크 적재 모드 벤치마크
+
+같은 데이터 파일을 벌크 적재 모드 없이(refresh_interval 5s, 매핑 설정 그대로)와
+벌크 적재 모드로 각각 임시 인덱스에 적재하여 색인 처리량(docs/sec)을 비교합니다.
+운영 인덱스(ELASTICSEARCH_INDEX)는 건드리지 않습니다.
+
+실행 방법 (Elasticsearch 실행 후):
+    python -m benchmarks.bulk_load_benchmark --file data/trademark_sample.json --rounds 3
+
+가짜 Elasticsearch로 실행 (빈 서버, benchmarks/elasticsearch_setup.py 참고):
+    BENCHMARK_ELASTICSEARCH=fake python -m benchmarks.bulk_load_benchmark --file data/trademark_sample.json --rounds 3
+"""
+import argparse
+import asyncio
+import statistics
+from typing import Dict, Any, List
+
+from benchmarks.elasticsearch_setup import setup_benchmark_elasticsearch
+
+# 앱 모듈은 임포트 시 Elasticsearch에 접속하므로 먼저 접속 대상을 정함
+setup_benchmark_elasticsearch(load_data=False)
+
+from app.core.config import settings
+from app.domain.trademark.index.index_versions import delete_index_versions
+from app.domain.trademark.services.load_trademark_data import load_trademark_data
+
+# 벤치마크용 임시 인덱스 별칭
+BENCHMARK_INDEX = "trademarks_bulk_benchmark"
+
+
+async def run(file_path: str, bulk_load: bool, force_merge_segments: int) -> Dict[str, Any]:
+    """임시 인덱스에 한 번 적재한 결과 반환"""
+    delete_index_versions(BENCHMARK_INDEX)
+    try:
+        return await load_trademark_data(
+            file_path,
+            bulk_load=bulk_load,
+            force_merge_segments=force_merge_segments
+        )
+    finally:
+        delete_index_versions(BENCHMARK_INDEX)
+
+
+def report(label: str, results: List[Dict[str, Any]]):
+    """적재 결과 출력"""
+    rates = [result["docs_per_sec"] for result in results]
+    merges = [result["force_merge_seconds"] for result in results]
+    print(
+        f"[{label}] docs={results[0]['success'] + results[0]['failed']} "
+        f"median={statistics.median(rates):.1f} docs/sec "
+        f"min={min(rates):.1f} max={max(rates):.1f} "
+        f"force_merge={statistics.median(merges):.2f}s"
+    )
+    return statistics.median(rates)
+
+
+async def main(file_path: str, rounds: int, force_merge_segments: int):
+    original_index = settings.ELASTICSEARCH_INDEX
+    original_mode = settings.DB_INIT_MODE
+    settings.ELASTICSEARCH_INDEX = BENCHMARK_INDEX
+    settings.DB_INIT_MODE = "create"
+
+    try:
+        baseline = report("bulk_load=off", [await run(file_path, False, 0) for _ in range(rounds)])
+        tuned = report("bulk_load=on", [await run(file_path, True, force_merge_segments) for _ in range(rounds)])
+        print(f"색인 처리량 변화: {tuned / baseline:.2f}x" if baseline else "기준 처리량을 측정하지 못했습니다")
+    finally:
+        settings.ELASTICSEARCH_INDEX = original_index
+        settings.DB_INIT_MODE = original_mode
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="벌크 적재 모드 벤치마크")
+    parser.add_argument("--file", default=settings.DATA_FILE_PATH, help="데이터 파일 경로")
+    parser.add_argument("--rounds", type=int, default=3, help="모드별 반복 횟수")
+    parser.add_argument("--force-merge-segments", type=int, default=1, help="적재 후 병합할 세그먼트 수")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.file, args.rounds, args.force_merge_segments))
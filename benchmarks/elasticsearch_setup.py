@@ -0,0 +1,51 @@
+"""
+벤치마크용 Elasticsearch 선택
+
+Elasticsearch가 필요한 벤치마크는 앱 모듈을 임포트하기 전에 setup_benchmark_elasticsearch()를 호출합니다.
+
+- BENCHMARK_ELASTICSEARCH=live (기본값): ELASTICSEARCH_HOST/PORT의 실제 Elasticsearch 사용
+- BENCHMARK_ELASTICSEARCH=fake: 프로세스 내 가짜 서버(tests/fake_elasticsearch.py)를 띄우고
+  DATA_FILE_PATH의 데이터를 적재한 뒤 사용 (Elasticsearch 없이 실행 가능)
+- BENCHMARK_ELASTICSEARCH_LATENCY_MS: 가짜 서버의 요청당 지연 시간(ms, 기본값 0)
+
+가짜 서버는 같은 프로세스에서 요청을 직렬로 처리하므로 절대 수치가 아닌 설정 간 비교나 회귀 확인에 사용합니다.
+지연 시간을 주면 Elasticsearch 처리 시간이 있는 상황(동시 요청 대기, 요청 병합 효과 등)을 재현할 수 있습니다.
+
+실행 예:
+    BENCHMARK_ELASTICSEARCH=fake BENCHMARK_ELASTICSEARCH_LATENCY_MS=5 python -m benchmarks.search_concurrency
+"""
+import asyncio
+import os
+
+
+def setup_benchmark_elasticsearch(load_data: bool = True):
+    """
+    BENCHMARK_ELASTICSEARCH=fake이면 가짜 Elasticsearch 서버 시작
+
+    Args:
+        load_data (bool): 가짜 서버에 DATA_FILE_PATH 데이터를 적재할지 여부
+
+    Returns:
+        가짜 서버 (실제 Elasticsearch를 사용하면 None)
+    """
+    if os.getenv("BENCHMARK_ELASTICSEARCH", "live").lower() != "fake":
+        return None
+
+    from tests.fake_elasticsearch import start_fake_elasticsearch
+
+    server = start_fake_elasticsearch(latency_ms=float(os.getenv("BENCHMARK_ELASTICSEARCH_LATENCY_MS", "0")))
+    if load_data:
+        # 적재 중에는 지연 없이 처리
+        latency_ms = server.latency_ms
+        server.latency_ms = 0
+
+        from app.core.config import settings
+        from app.domain.trademark.index.create_trademark_index import create_trademark_index
+        from app.domain.trademark.services.load_trademark_data import load_trademark_data
+
+        create_trademark_index()
+        asyncio.run(load_trademark_data(settings.DATA_FILE_PATH))
+        server.latency_ms = latency_ms
+
+    print(f"가짜 Elasticsearch 사용: {server.url} (요청당 지연 {server.latency_ms}ms)")
+    return server
@@ -0,0 +1,155 @@
+"""
+로깅 오버헤드 벤치마크
+
+search_trademarks를 Elasticsearch 대신 고정 응답을 반환하는 클라이언트로 반복 실행하여
+로깅 설정별 검색 한 건당 처리 시간을 비교합니다. 라우터가 검색마다 남기는 INFO 로그 두 줄도 함께 기록합니다.
+
+- no sinks: 싱크 없음 (기준)
+- legacy: 기존 설정 (콘솔 2개 + DEBUG 파일/에러 파일/성능 파일/초성 필터 파일, enqueue)
+- current: setup_logging() (콘솔 + 모아서 기록하는 JSON 파일 하나, LOG_LEVEL 이하 호출은 메시지 생성 전에 버림)
+
+콘솔 출력은 측정에서 제외하기 위해 버리는 스트림으로 바꾸고, 파일은 임시 디렉토리에 기록합니다.
+
+실행 방법 (Elasticsearch 불필요):
+    python -m benchmarks.logging_overhead --searches 5000
+"""
+import argparse
+import asyncio
+import importlib
+import io
+import statistics
+import sys
+import tempfile
+import time
+from typing import List
+
+from loguru import logger
+
+from app.core.config import settings
+from app.core.logging_config import setup_logging
+from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams
+
+# 서비스 패키지가 동명의 함수를 노출하므로 모듈 객체를 직접 가져옴
+search_module = importlib.import_module("app.domain.trademark.services.search_trademarks")
+
+FAKE_RESPONSE = {
+    "took": 3,
+    "hits": {
+        "total": {"value": 10},
+        "hits": [
+            {"_source": {"pid": f"p{i}", "productName": f"프레스카{i}", "applicationNumber": f"40-2023-{i:07d}"}}
+            for i in range(10)
+        ]
+    }
+}
+
+
+class FakeClient:
+    """고정 응답을 반환하는 Elasticsearch 클라이언트"""
+
+    async def search(self, *args, **kwargs):
+        return FAKE_RESPONSE
+
+
+class NullStream(io.StringIO):
+    """쓰기를 버리는 콘솔 스트림"""
+
+    def write(self, message):
+        return len(message)
+
+
+def setup_legacy_logging(log_dir: str):
+    """기존 setup_logging과 같은 싱크 구성"""
+    logger.remove()
+    console = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}"
+    logger.add(sys.stdout, colorize=True, format=console, level="INFO")
+    logger.add(sys.stderr, colorize=True, format=console, level="ERROR")
+    logger.add(f"{log_dir}/legacy.log", format=console, level="DEBUG", enqueue=True, catch=True)
+    logger.add(f"{log_dir}/legacy_error.log", format=console, level="ERROR", enqueue=True, catch=True)
+    logger.add(
+        f"{log_dir}/legacy_performance.log",
+        format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {message}",
+        filter=lambda record: record["extra"].get("performance", False),
+        level="INFO",
+        enqueue=True
+    )
+    logger.add(
+        f"{log_dir}/legacy_chosung.log",
+        format=console,
+        filter=lambda record: "chosung" in record["message"].lower(),
+        level="DEBUG",
+        enqueue=True
+    )
+
+
+async def measure(searches: int) -> List[float]:
+    """검색 searches회의 건당 처리 시간(us) 목록 반환"""
+    params = TrademarkSearchParams(query="프레스카", page=1, size=10)
+    latencies = []
+    for _ in range(searches):
+        start = time.perf_counter_ns()
+        logger.info(f"상표 검색 요청 - 검색어: '{params.query}', 페이지: {params.page}")
+        result = await search_module.search_trademarks(params)
+        logger.info(f"검색 완료 - 총 {result['total']}개 결과")
+        latencies.append((time.perf_counter_ns() - start) / 1000)
+    return latencies
+
+
+def report(label: str, latencies: List[float], baseline: float = None) -> float:
+    """처리 시간 분포 출력 (baseline이 있으면 검색당 로깅 오버헤드 포함)"""
+    ordered = sorted(latencies)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    overhead = f" logging={p50 - baseline:.1f}us/search" if baseline is not None else ""
+    print(f"[{label}] n={len(latencies)} mean={statistics.mean(latencies):.1f}us p50={p50:.1f}us p99={p99:.1f}us{overhead}")
+    return p50
+
+
+async def main(searches: int):
+    original_stdout, original_stderr = sys.stdout, sys.stderr
+    original_client = search_module.get_async_es_client
+    original_cache, original_flight = settings.SEARCH_CACHE_ENABLED, settings.SINGLE_FLIGHT_ENABLED
+    original_log_dir = settings.LOG_DIR
+
+    # Elasticsearch와 캐시/요청 병합을 제외하고 검색 경로만 실행
+    search_module.get_async_es_client = lambda: FakeClient()
+    settings.SEARCH_CACHE_ENABLED = False
+    settings.SINGLE_FLIGHT_ENABLED = False
+
+    try:
+        with tempfile.TemporaryDirectory() as log_dir:
+            results = []
+            sys.stdout, sys.stderr = NullStream(), NullStream()
+            try:
+                logger.remove()
+                await measure(200)  # 워밍업
+                results.append(("no sinks", await measure(searches)))
+
+                setup_legacy_logging(log_dir)
+                await measure(200)
+                results.append(("legacy", await measure(searches)))
+
+                settings.LOG_DIR = log_dir
+                setup_logging()
+                await measure(200)
+                results.append(("current", await measure(searches)))
+                logger.remove()
+            finally:
+                sys.stdout, sys.stderr = original_stdout, original_stderr
+
+            baseline = None
+            for label, latencies in results:
+                p50 = report(label, latencies, baseline)
+                baseline = p50 if baseline is None else baseline
+    finally:
+        search_module.get_async_es_client = original_client
+        settings.SEARCH_CACHE_ENABLED, settings.SINGLE_FLIGHT_ENABLED = original_cache, original_flight
+        settings.LOG_DIR = original_log_dir
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로깅 오버헤드 벤치마크")
+    parser.add_argument("--searches", type=int, default=5000, help="설정별 검색 횟수")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.searches))
@@ -0,0 +1,124 @@
+"""
+요청 미들웨어 오버헤드 벤치마크
+
+빈 응답을 반환하는 엔드포인트 하나를 미들웨어 없이, 기존 @app.middleware("http") 방식
+(BaseHTTPMiddleware, 요청당 로그 두 줄), 순수 ASGI RequestTimingMiddleware로 각각 감싸
+ASGI 호출을 직접 반복하며 요청당 처리 시간을 비교합니다.
+네트워크와 로그 I/O를 제외하기 위해 로그는 버리는 싱크로만 기록합니다 (메시지 포맷 비용은 포함).
+
+실행 방법 (Elasticsearch 불필요):
+    python -m benchmarks.middleware_overhead --requests 20000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from fastapi import FastAPI, Request
+from loguru import logger
+
+from app.core.middleware import RequestTimingMiddleware
+
+
+def build_app(mode: str) -> FastAPI:
+    """벤치마크용 앱 (mode: none, http, asgi)"""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    if mode == "http":
+        # 기존 main.py의 add_process_time_header와 같은 동작
+        @app.middleware("http")
+        async def add_process_time_header(request: Request, call_next):
+            start_time = time.time()
+            request_id = str(time.time_ns())[-6:]
+            logger.bind(request_id=request_id).info(
+                f"Request start - Method: {request.method}, Path: {request.url.path}"
+            )
+            response = await call_next(request)
+            process_time = time.time() - start_time
+            response.headers["X-Process-Time"] = str(process_time)
+            response.headers["X-Request-ID"] = request_id
+            logger.bind(performance=True).info(
+                f"Request completed - Path: {request.url.path}, "
+                f"Time: {process_time:.3f}s, Status: {response.status_code}"
+            )
+            return response
+    elif mode == "asgi":
+        app.add_middleware(RequestTimingMiddleware)
+
+    return app
+
+
+async def call(app: FastAPI) -> float:
+    """GET /ping 한 번을 ASGI로 직접 호출하고 처리 시간(us) 반환"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    received = False
+    response_complete = asyncio.Event()
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # 응답을 마칠 때까지 연결 유지 (TestClient와 같은 방식)
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and not message.get("more_body", False):
+            response_complete.set()
+
+    start = time.perf_counter_ns()
+    await app(scope, receive, send)
+    return (time.perf_counter_ns() - start) / 1000
+
+
+async def measure(app: FastAPI, requests: int) -> List[float]:
+    for _ in range(min(requests, 1000)):  # 워밍업
+        await call(app)
+    return [await call(app) for _ in range(requests)]
+
+
+def report(label: str, latencies: List[float], baseline: float = None) -> float:
+    """지연 시간 분포 출력 (baseline이 있으면 요청당 오버헤드 포함)"""
+    ordered = sorted(latencies)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    overhead = f" overhead={p50 - baseline:.1f}us" if baseline is not None else ""
+    print(f"[{label}] n={len(latencies)} mean={statistics.mean(latencies):.1f}us p50={p50:.1f}us p99={p99:.1f}us{overhead}")
+    return p50
+
+
+async def main(requests: int):
+    logger.remove()
+    logger.add(lambda message: None, level="INFO")
+
+    baseline = report("no middleware", await measure(build_app("none"), requests))
+    report("@app.middleware(http)", await measure(build_app("http"), requests), baseline)
+    report("RequestTimingMiddleware", await measure(build_app("asgi"), requests), baseline)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요청 미들웨어 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=20000, help="방식별 요청 수")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests))
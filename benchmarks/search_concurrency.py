@@ -0,0 +1,100 @@
+"""
+검색 동시성 벤치마크
+
+동기 클라이언트(이벤트 루프 블로킹)와 비동기 클라이언트로 각각
+동일한 search_trademarks 호출을 동시에 실행하여 지연 시간 분포(p50/p95/p99)를 비교합니다.
+
+실행 방법 (Elasticsearch 실행 및 데이터 적재 후):
+    python -m benchmarks.search_concurrency --concurrency 200 --query 프레스카
+
+가짜 Elasticsearch로 실행 (데이터 적재 포함, benchmarks/elasticsearch_setup.py 참고):
+    BENCHMARK_ELASTICSEARCH=fake python -m benchmarks.search_concurrency --concurrency 200 --query 프레스카
+"""
+import argparse
+import asyncio
+import importlib
+import statistics
+import time
+from typing import List
+
+from benchmarks.elasticsearch_setup import setup_benchmark_elasticsearch
+
+# 앱 모듈은 임포트 시 Elasticsearch에 접속하므로 먼저 접속 대상을 정함
+setup_benchmark_elasticsearch()
+
+from app.core.config import settings
+from app.core.elasticsearch import es_client, close_async_es_client
+from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams
+
+# 서비스 패키지가 동명의 함수를 노출하므로 모듈 객체를 직접 가져옴
+search_module = importlib.import_module("app.domain.trademark.services.search_trademarks")
+
+
+class BlockingClientAdapter:
+    """동기 클라이언트를 async 인터페이스로 감싼 어댑터 (기존 동작 재현용)"""
+
+    async def search(self, *args, **kwargs):
+        return es_client.search(*args, **kwargs)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """정렬된 값 목록에서 백분위수 계산"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_round(params: TrademarkSearchParams, concurrency: int) -> List[float]:
+    """동시 검색 요청 한 라운드 실행 후 요청별 지연 시간(ms) 반환"""
+    async def one() -> float:
+        start = time.perf_counter()
+        await search_module.search_trademarks(params)
+        return (time.perf_counter() - start) * 1000
+
+    return await asyncio.gather(*(one() for _ in range(concurrency)))
+
+
+def report(label: str, latencies: List[float], wall: float):
+    """지연 시간 분포 출력"""
+    print(
+        f"[{label}] n={len(latencies)} wall={wall:.1f}ms "
+        f"mean={statistics.mean(latencies):.1f}ms "
+        f"p50={percentile(latencies, 50):.1f}ms "
+        f"p95={percentile(latencies, 95):.1f}ms "
+        f"p99={percentile(latencies, 99):.1f}ms"
+    )
+
+
+async def main(concurrency: int, query: str):
+    params = TrademarkSearchParams(query=query, page=1, size=10)
+    original_getter = search_module.get_async_es_client
+
+    # 클라이언트 동시성만 비교하도록 결과 캐시와 요청 병합은 끔
+    settings.SEARCH_CACHE_ENABLED = False
+    settings.SINGLE_FLIGHT_ENABLED = False
+
+    for label, getter in (
+        ("sync (before)", lambda: BlockingClientAdapter()),
+        ("async (after)", original_getter),
+    ):
+        search_module.get_async_es_client = getter
+        try:
+            # 워밍업
+            await run_round(params, 10)
+
+            start = time.perf_counter()
+            latencies = await run_round(params, concurrency)
+            report(label, latencies, (time.perf_counter() - start) * 1000)
+        finally:
+            search_module.get_async_es_client = original_getter
+
+    await close_async_es_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="검색 동시성 벤치마크")
+    parser.add_argument("--concurrency", type=int, default=200, help="동시 검색 요청 수")
+    parser.add_argument("--query", default="프레스카", help="검색어")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.concurrency, args.query))
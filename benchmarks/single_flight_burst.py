@@ -0,0 +1,99 @@
+"""
+요청 병합(single-flight) 부하 테스트
+
+같은 검색/자동완성 요청을 동시에 burst개 보내고, 요청 병합 사용/미사용 시
+실제 Elasticsearch 호출 수와 지연 시간을 비교합니다.
+병합 효과만 보기 위해 검색 결과 캐시와 메모리 자동완성 인덱스는 끕니다.
+
+실행 방법 (Elasticsearch 실행 및 데이터 적재 후):
+    python -m benchmarks.single_flight_burst --burst 500 --query 프레스카
+
+가짜 Elasticsearch로 실행 (데이터 적재 포함, benchmarks/elasticsearch_setup.py 참고):
+    BENCHMARK_ELASTICSEARCH=fake python -m benchmarks.single_flight_burst --burst 500 --query 프레스카
+"""
+import argparse
+import asyncio
+import importlib
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from benchmarks.elasticsearch_setup import setup_benchmark_elasticsearch
+
+# 앱 모듈은 임포트 시 Elasticsearch에 접속하므로 먼저 접속 대상을 정함
+setup_benchmark_elasticsearch()
+
+from app.core.config import settings
+from app.core.elasticsearch import get_async_es_client, close_async_es_client
+from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams
+from app.domain.trademark.services.single_flight import search_flight, autocomplete_flight
+
+# 서비스 패키지가 동명의 함수를 노출하므로 모듈 객체를 직접 가져옴
+search_module = importlib.import_module("app.domain.trademark.services.search_trademarks")
+autocomplete_module = importlib.import_module("app.domain.trademark.services.autocomplete_service")
+
+
+class CountingClient:
+    """search 호출 수를 세는 클라이언트 래퍼"""
+
+    def __init__(self):
+        self.searches = 0
+
+    async def search(self, *args, **kwargs):
+        self.searches += 1
+        return await get_async_es_client().search(*args, **kwargs)
+
+
+async def burst(call: Callable[[], Awaitable], size: int) -> List[float]:
+    """같은 요청을 동시에 size개 실행하고 요청별 지연 시간(ms) 반환"""
+    async def one() -> float:
+        start = time.perf_counter()
+        await call()
+        return (time.perf_counter() - start) * 1000
+
+    return await asyncio.gather(*(one() for _ in range(size)))
+
+
+async def run(label: str, module, call: Callable[[], Awaitable], size: int):
+    """요청 병합 사용/미사용 각각 실행하여 Elasticsearch 호출 수 비교"""
+    for enabled in (False, True):
+        settings.SINGLE_FLIGHT_ENABLED = enabled
+        counter = CountingClient()
+        module.get_async_es_client = lambda: counter
+        try:
+            start = time.perf_counter()
+            latencies = await burst(call, size)
+            wall = (time.perf_counter() - start) * 1000
+        finally:
+            module.get_async_es_client = get_async_es_client
+
+        print(
+            f"[{label} single_flight={'on' if enabled else 'off'}] requests={size} "
+            f"es_calls={counter.searches} wall={wall:.1f}ms "
+            f"p50={statistics.median(latencies):.1f}ms max={max(latencies):.1f}ms"
+        )
+
+
+async def main(size: int, query: str):
+    settings.SEARCH_CACHE_ENABLED = False
+    settings.AUTOCOMPLETE_INDEX_ENABLED = False
+
+    params = TrademarkSearchParams(query=query, page=1, size=10)
+    await search_module.search_trademarks(params)  # 워밍업
+
+    await run("search", search_module, lambda: search_module.search_trademarks(params), size)
+    await run("autocomplete", autocomplete_module, lambda: autocomplete_module.get_autocomplete_suggestions(query, 10), size)
+
+    print(f"search: {search_flight.stats()}")
+    print(f"autocomplete: {autocomplete_flight.stats()}")
+
+    await close_async_es_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요청 병합 부하 테스트")
+    parser.add_argument("--burst", type=int, default=500, help="동시 요청 수")
+    parser.add_argument("--query", default="프레스카", help="검색어")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.burst, args.query))
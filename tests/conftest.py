@@ -7,6 +7,7 @@ import pytest
 import asyncio
 import os
 import sys
+import anyio
 from httpx import AsyncClient
 from fastapi.testclient import TestClient
 
@@ -15,26 +16,51 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
 sys.path.insert(0, project_root)
 
-# 환경 변수 강제 설정
-os.environ["ELASTICSEARCH_HOST"] = "127.0.0.1"  # localhost 대신 127.0.0.1 사용
-os.environ["ELASTICSEARCH_PORT"] = "9200"
+# 테스트용 Elasticsearch 선택
+# 기본값은 프로세스 내 가짜 서버(tests/fake_elasticsearch.py)이며, TEST_ELASTICSEARCH=live이면 실제 Elasticsearch 사용
+# Elasticsearch 클라이언트는 처음 사용할 때 설정값으로 접속하므로 앱을 임포트하기 전에 접속 대상을 정함
+# (병렬 전처리 작업 프로세스는 Elasticsearch에 접속하지 않으므로 가짜 서버로도 테스트됨)
+if os.getenv("TEST_ELASTICSEARCH", "fake").lower() == "live":
+    # 환경 변수 강제 설정
+    os.environ["ELASTICSEARCH_HOST"] = "127.0.0.1"  # localhost 대신 127.0.0.1 사용
+    os.environ["ELASTICSEARCH_PORT"] = "9200"
+    fake_es = None
+else:
+    from tests.fake_elasticsearch import start_fake_elasticsearch
+    fake_es = start_fake_elasticsearch(latency_ms=float(os.getenv("TEST_ELASTICSEARCH_LATENCY_MS", "0")))
 
 from app.main import app
 from app.core.config import settings
-from app.core.elasticsearch import es_client
+from app.core.elasticsearch import es_client, close_async_es_client
 from app.domain.trademark.services.chosung_utils import extract_chosung
+from app.domain.trademark.services.search_cache import bump_index_generation
+from app.domain.trademark.index.index_versions import delete_index_versions
 
 @pytest.fixture(scope="session")
 def event_loop():
     """이벤트 루프 픽스처"""
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
+    # 비동기 테스트에서 생성한 비동기 Elasticsearch 클라이언트는 루프를 닫기 전에 닫음
+    loop.run_until_complete(close_async_es_client())
     loop.close()
 
 @pytest.fixture
 def test_client():
-    """FastAPI 테스트 클라이언트"""
-    return TestClient(app)
+    """FastAPI 테스트 클라이언트
+
+    요청마다 새 이벤트 루프를 만들지 않도록 테스트 동안 하나의 루프(포털)에서 요청을 처리하고,
+    종료 시 그 루프에서 생성된 비동기 Elasticsearch 클라이언트를 닫습니다.
+    (앱 시작 시 데이터를 자동 적재하지 않도록 lifespan은 실행하지 않음)
+    """
+    client = TestClient(app)
+    with anyio.from_thread.start_blocking_portal(**client.async_backend) as portal:
+        client.portal = portal
+        try:
+            yield client
+        finally:
+            portal.call(close_async_es_client)
+            client.portal = None
 
 @pytest.fixture
 async def async_client():
@@ -43,24 +69,25 @@ async def async_client():
         yield client
 
 @pytest.fixture(autouse=True)
-async def setup_test_database():
+def setup_test_database():
     """테스트용 데이터베이스 설정"""
     # 테스트용 인덱스 이름으로 변경
     test_index = f"{settings.ELASTICSEARCH_INDEX}_test"
     original_index = settings.ELASTICSEARCH_INDEX
     settings.ELASTICSEARCH_INDEX = test_index
     
+    # 이전 테스트의 검색 캐시가 남지 않도록 무효화
+    bump_index_generation()
+    
     try:
         # 테스트 인덱스 삭제 (있다면)
-        if es_client.indices.exists(index=test_index):
-            es_client.indices.delete(index=test_index)
+        delete_index_versions(test_index)
         
         yield
         
     finally:
         # 테스트 인덱스 정리
-        if es_client.indices.exists(index=test_index):
-            es_client.indices.delete(index=test_index)
+        delete_index_versions(test_index)
         
         # 원래 인덱스 이름 복구
         settings.ELASTICSEARCH_INDEX = original_index
@@ -0,0 +1,2088 @@
+"""
+가짜 Elasticsearch 서버
+
+이 모듈은 실제 Elasticsearch(nori 플러그인) 없이 테스트와 벤치마크를 실행하기 위한 프로세스 내 HTTP 서버를 제공합니다.
+elasticsearch-py 7.x 동기/비동기 클라이언트가 보내는 요청 중 이 프로젝트가 사용하는 부분만 구현합니다.
+
+- 인덱스: 생성/삭제/존재 확인, 설정/매핑 조회·변경, 별칭, refresh/forcemerge, 클러스터 상태
+- 문서: index/create, get/mget, update(doc, upsert, 스크립트), delete, bulk, reindex, delete_by_query
+- 검색: search/msearch/count, scroll, PIT, search_after, slice, collapse, 정렬, 하이라이트, 집계(max/min/sum/avg/value_count/terms)
+- 쿼리: bool, term, terms, ids, match, multi_match, match_phrase, match_phrase_prefix, prefix, range, exists,
+  match_all, constant_score
+
+실제 Elasticsearch와 다른 점:
+- 분석기는 인덱스 설정의 tokenizer/filter 정의를 근사합니다. nori 토크나이저는 공백/문장부호 기준으로 나누고
+  nori 필터(품사, 읽기 형태)는 무시하며, lowercase/asciifolding/trim/ngram/edge_ngram만 적용합니다.
+- 점수는 단일 샤드 BM25로 계산하므로 같은 데이터와 쿼리에 항상 같은 순서를 반환합니다 (점수 값은 실제와 다름).
+- 모든 쓰기는 즉시 검색에 반영됩니다 (refresh 설정 무시).
+- painless 스크립트는 실행하지 않으며, register_script()로 스크립트 원문에 대응하는 Python 함수를 등록해야 합니다.
+
+latency_ms를 지정하면 요청마다 응답 전에 지연 시간을 추가합니다 (응답의 took에 포함).
+
+사용 예:
+    server = FakeElasticsearchServer(latency_ms=2).start()
+    # ELASTICSEARCH_HOST/PORT를 server.host/server.port로 지정한 뒤 앱 모듈 임포트
+    ...
+    server.stop()
+"""
+import base64
+import fnmatch
+import functools
+import itertools
+import json
+import math
+import re
+import threading
+import time
+import unicodedata
+import zlib
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# info 응답의 버전 (elasticsearch-py 7.14 이상은 응답 헤더와 버전으로 서버를 확인)
+VERSION = "7.17.9"
+
+# 한 번에 조회할 수 있는 최대 결과 위치 (index.max_result_window 기본값)
+MAX_RESULT_WINDOW = 10000
+
+# 퍼지 검색어 하나가 확장되는 최대 토큰 수 (match 쿼리 max_expansions 기본값)
+_MAX_EXPANSIONS = 50
+
+# BM25 매개변수
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+# standard/nori 토크나이저 근사 (문자/숫자 연속 구간)
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# 스크립트 함수 (ctx, params) -> 반환값
+ScriptFunction = Callable[[Dict[str, Any], Dict[str, Any]], Any]
+
+
+class FakeElasticsearchError(Exception):
+    """Elasticsearch 오류 응답 (status, type, reason)"""
+
+    def __init__(self, status: int, error_type: str, reason: str, **extra: Any):
+        super().__init__(reason)
+        self.status = status
+        self.error_type = error_type
+        self.reason = reason
+        self.extra = extra
+
+    def to_body(self) -> Dict[str, Any]:
+        cause = {"type": self.error_type, "reason": self.reason, **self.extra}
+        return {"error": {"root_cause": [cause], **cause}, "status": self.status}
+
+
+def _index_not_found(name: str) -> FakeElasticsearchError:
+    return FakeElasticsearchError(
+        404, "index_not_found_exception", f"no such index [{name}]",
+        index=name, **{"resource.type": "index_or_alias", "resource.id": name}
+    )
+
+
+def _bad_request(reason: str, error_type: str = "illegal_argument_exception") -> FakeElasticsearchError:
+    return FakeElasticsearchError(400, error_type, reason)
+
+
+# ---------------------------------------------------------------------------
+# 분석기
+# ---------------------------------------------------------------------------
+
+def _ascii_fold(token: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", token)
+    folded = "".join(char for char in decomposed if not unicodedata.combining(char))
+    # 한글 등 결합 문자를 제거하면 의미가 바뀌는 문자는 다시 조합
+    return unicodedata.normalize("NFKC", folded)
+
+
+def _ngrams(token: str, min_gram: int, max_gram: int, edge: bool) -> List[str]:
+    grams = []
+    starts = [0] if edge else range(len(token))
+    for start in starts:
+        for size in range(min_gram, max_gram + 1):
+            if start + size > len(token):
+                break
+            grams.append(token[start:start + size])
+    return grams
+
+
+class Analyzer:
+    """tokenizer와 token filter 목록으로 구성한 분석기"""
+
+    def __init__(self, tokenizer: str, filters: List[Dict[str, Any]]):
+        self.tokenizer = tokenizer
+        self.filters = filters
+
+    def __call__(self, text: Any) -> List[str]:
+        text = str(text)
+        if self.tokenizer == "keyword":
+            tokens = [text]
+        elif self.tokenizer == "whitespace":
+            tokens = text.split()
+        else:
+            tokens = _WORD_PATTERN.findall(text)
+
+        for token_filter in self.filters:
+            kind = token_filter.get("type")
+            if kind == "lowercase":
+                tokens = [token.lower() for token in tokens]
+            elif kind == "asciifolding":
+                tokens = [_ascii_fold(token) for token in tokens]
+            elif kind == "trim":
+                tokens = [token.strip() for token in tokens]
+            elif kind in ("ngram", "edge_ngram", "edgeNGram", "nGram"):
+                edge = kind in ("edge_ngram", "edgeNGram")
+                min_gram = int(token_filter.get("min_gram", 1))
+                max_gram = int(token_filter.get("max_gram", 2))
+                tokens = [gram for token in tokens for gram in _ngrams(token, min_gram, max_gram, edge)]
+            # nori_readingform, nori_part_of_speech 등 나머지 필터는 적용하지 않음
+        return [token for token in tokens if token]
+
+
+_BUILTIN_ANALYZERS = {
+    "standard": Analyzer("standard", [{"type": "lowercase"}]),
+    "simple": Analyzer("standard", [{"type": "lowercase"}]),
+    "keyword": Analyzer("keyword", []),
+    "whitespace": Analyzer("whitespace", []),
+}
+
+
+# ---------------------------------------------------------------------------
+# 설정/날짜/값 변환
+# ---------------------------------------------------------------------------
+
+def _flatten_settings(settings: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """중첩 설정을 'index.'으로 시작하는 평면 키로 변환 (값은 문자열, 목록은 문자열 목록)"""
+    flat = {}
+    for key, value in settings.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten_settings(value, f"{path}."))
+        else:
+            if not path.startswith("index."):
+                path = f"index.{path}"
+            if value is None:
+                flat[path] = None
+            elif isinstance(value, list):
+                flat[path] = [str(item) for item in value]
+            elif isinstance(value, bool):
+                flat[path] = "true" if value else "false"
+            else:
+                flat[path] = str(value)
+    return flat
+
+
+def _nest(flat: Dict[str, Any]) -> Dict[str, Any]:
+    nested: Dict[str, Any] = {}
+    for key, value in flat.items():
+        node = nested
+        parts = key.split(".")
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = value
+    return nested
+
+
+_DATE_FORMATS = ("%Y%m%d", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d %H:%M:%S")
+
+
+def _parse_date(value: Any) -> Optional[int]:
+    """날짜 값을 epoch millis로 변환 (숫자는 epoch millis로 간주)"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return int(value)
+    text = str(value).strip()
+    if text.endswith("Z"):
+        text = text[:-1]
+    for date_format in _DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(text, date_format)
+            return int(parsed.replace(tzinfo=timezone.utc).timestamp() * 1000)
+        except ValueError:
+            continue
+    if text.lstrip("-").isdigit():
+        return int(text)
+    raise _bad_request(f"failed to parse date field [{value}]", "parse_exception")
+
+
+def _format_date(millis: int, date_format: Optional[str]) -> Any:
+    if not date_format:
+        return millis
+    moment = datetime.fromtimestamp(millis / 1000, tz=timezone.utc)
+    python_format = (
+        date_format.split("||")[0]
+        .replace("yyyy", "%Y").replace("MM", "%m").replace("dd", "%d")
+        .replace("HH", "%H").replace("mm", "%M").replace("ss", "%S")
+    )
+    return moment.strftime(python_format)
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [item for item in value if item is not None]
+    return [value]
+
+
+def _source_value(source: Dict[str, Any], path: str) -> Any:
+    """문서 원본에서 점 표기 경로의 값 (없으면 None)"""
+    if path in source:
+        return source[path]
+    node: Any = source
+    for part in path.split("."):
+        if isinstance(node, dict) and part in node:
+            node = node[part]
+        else:
+            return None
+    return node
+
+
+def _filter_source(source: Dict[str, Any], spec: Any) -> Optional[Dict[str, Any]]:
+    """_source 필터 적용 (True/False, 필드 목록, includes/excludes, 와일드카드)"""
+    if spec is None or spec is True:
+        return source
+    if spec is False:
+        return None
+    if isinstance(spec, str):
+        spec = [field.strip() for field in spec.split(",") if field.strip()]
+    includes, excludes = (spec, []) if isinstance(spec, list) else (
+        _as_list(spec.get("includes", spec.get("include"))),
+        _as_list(spec.get("excludes", spec.get("exclude")))
+    )
+
+    def matches(key: str, patterns: List[str]) -> bool:
+        return any(fnmatch.fnmatchcase(key, pattern) or pattern.startswith(f"{key}.") for pattern in patterns)
+
+    return {
+        key: value for key, value in source.items()
+        if (not includes or matches(key, includes)) and not matches(key, excludes)
+    }
+
+
+def _edit_distance(left: str, right: str, limit: int) -> int:
+    """레벤슈타인 거리 (limit를 넘으면 limit + 1)"""
+    if abs(len(left) - len(right)) > limit:
+        return limit + 1
+    previous = list(range(len(right) + 1))
+    for i, left_char in enumerate(left, 1):
+        current = [i]
+        for j, right_char in enumerate(right, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (left_char != right_char)
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def _fuzziness(value: Any, token: str) -> int:
+    if value is None:
+        return 0
+    text = str(value).upper()
+    if text.startswith("AUTO"):
+        low, high = 3, 6
+        if ":" in text:
+            low, high = (int(part) for part in text.split(":", 1)[1].split(","))
+        return 0 if len(token) < low else 1 if len(token) < high else 2
+    return int(float(text))
+
+
+# ---------------------------------------------------------------------------
+# 인덱스와 문서
+# ---------------------------------------------------------------------------
+
+class Document:
+    """저장된 문서 (쓰기마다 새 객체를 만들므로 PIT/scroll 스냅샷에서 공유 가능)"""
+
+    __slots__ = ("id", "source", "version", "seq_no", "order", "_terms")
+
+    def __init__(self, doc_id: str, source: Dict[str, Any], version: int, seq_no: int, order: int):
+        self.id = doc_id
+        self.source = source
+        self.version = version
+        self.seq_no = seq_no
+        self.order = order
+        self._terms: Dict[Tuple[str, str], Tuple[Counter, int]] = {}
+
+    def terms(self, index: "FakeIndex", field: "FieldInfo", analyzer_name: str) -> Tuple[Counter, int]:
+        """필드 값을 분석한 (토큰별 빈도, 토큰 수) (문서는 바뀌지 않으므로 한 번만 분석)"""
+        key = (field.name, analyzer_name)
+        terms = self._terms.get(key)
+        if terms is None:
+            analyzer = index.analyzer(analyzer_name)
+            tokens = []
+            for value in _as_list(_source_value(self.source, field.values_path)):
+                tokens.extend(analyzer(value))
+            terms = (Counter(tokens), len(tokens))
+            self._terms[key] = terms
+        return terms
+
+
+class FieldInfo:
+    """필드 매핑 정보 (하위 필드는 부모 필드 값을 사용)"""
+
+    __slots__ = ("name", "type", "values_path", "index_analyzer", "search_analyzer", "format")
+
+    def __init__(self, name: str, mapping: Dict[str, Any], values_path: str):
+        self.name = name
+        self.type = mapping.get("type", "object")
+        self.values_path = values_path
+        self.index_analyzer = mapping.get("analyzer", "standard")
+        self.search_analyzer = mapping.get("search_analyzer", self.index_analyzer)
+        self.format = mapping.get("format")
+
+    @property
+    def is_text(self) -> bool:
+        return self.type == "text"
+
+
+class FakeIndex:
+    """인덱스 하나 (단일 샤드)"""
+
+    def __init__(self, name: str, settings: Dict[str, Any], mappings: Dict[str, Any]):
+        self.name = name
+        self.settings = {
+            "index.number_of_shards": "1",
+            "index.number_of_replicas": "1",
+            "index.provided_name": name,
+            "index.uuid": base64.urlsafe_b64encode(zlib.crc32(name.encode()).to_bytes(4, "big")).decode().rstrip("="),
+            "index.creation_date": str(int(time.time() * 1000)),
+            "index.version.created": "7170999",
+            **_flatten_settings(settings)
+        }
+        self.settings = {key: value for key, value in self.settings.items() if value is not None}
+        self.properties: Dict[str, Any] = dict(mappings.get("properties", {}))
+        self.docs: Dict[str, Document] = {}
+        self.seq_no = -1
+        self.order = itertools.count()
+        self.generation = 0
+        self._analyzers: Dict[str, Analyzer] = {}
+        self._fields: Dict[str, Optional[FieldInfo]] = {}
+        self._stats: Dict[Tuple[str, str], Tuple[int, float, Counter]] = {}
+        self._stats_generation = 0
+
+    # 매핑/분석기 -------------------------------------------------------------
+
+    def analyzer(self, name: str) -> Analyzer:
+        analyzer = self._analyzers.get(name)
+        if analyzer is None:
+            analysis = _nest({
+                key[len("index.analysis."):]: value
+                for key, value in self.settings.items()
+                if key.startswith("index.analysis.")
+            })
+            definition = analysis.get("analyzer", {}).get(name)
+            if definition is None:
+                analyzer = _BUILTIN_ANALYZERS.get(name, _BUILTIN_ANALYZERS["standard"])
+            else:
+                tokenizer_name = definition.get("tokenizer", "standard")
+                tokenizer = analysis.get("tokenizer", {}).get(tokenizer_name, {}).get("type", tokenizer_name)
+                filters = []
+                for filter_name in _as_list(definition.get("filter")):
+                    filters.append(analysis.get("filter", {}).get(filter_name, {"type": filter_name}))
+                analyzer = Analyzer(tokenizer, filters)
+            self._analyzers[name] = analyzer
+        return analyzer
+
+    def field(self, name: str) -> Optional[FieldInfo]:
+        """필드 매핑 조회 ('a.b'는 객체 하위 속성 또는 다중 필드)"""
+        if name in self._fields:
+            return self._fields[name]
+
+        info = None
+        properties = self.properties
+        parts = name.split(".")
+        for i, part in enumerate(parts):
+            mapping = properties.get(part)
+            if mapping is None:
+                break
+            if i == len(parts) - 1:
+                info = FieldInfo(name, mapping, name)
+                break
+            if "properties" in mapping:
+                properties = mapping["properties"]
+                continue
+            sub_name = ".".join(parts[i + 1:])
+            sub_mapping = mapping.get("fields", {}).get(sub_name)
+            if sub_mapping is not None:
+                info = FieldInfo(name, sub_mapping, ".".join(parts[:i + 1]))
+            break
+
+        self._fields[name] = info
+        return info
+
+    def add_dynamic_mappings(self, source: Dict[str, Any]):
+        """매핑에 없는 최상위 필드를 동적 매핑 규칙으로 추가"""
+        for key, value in source.items():
+            if key in self.properties:
+                continue
+            sample = next(iter(_as_list(value)), None)
+            if sample is None:
+                continue
+            if isinstance(sample, bool):
+                mapping: Dict[str, Any] = {"type": "boolean"}
+            elif isinstance(sample, int):
+                mapping = {"type": "long"}
+            elif isinstance(sample, float):
+                mapping = {"type": "float"}
+            elif isinstance(sample, dict):
+                mapping = {"properties": {}}
+            else:
+                mapping = {"type": "text", "fields": {"keyword": {"type": "keyword", "ignore_above": 256}}}
+            self.properties[key] = mapping
+            self._fields.clear()
+
+    def put_mapping(self, body: Dict[str, Any]):
+        for key, mapping in body.get("properties", {}).items():
+            existing = self.properties.get(key)
+            if existing is not None and existing.get("type", "object") != mapping.get("type", "object"):
+                raise _bad_request(
+                    f"mapper [{key}] cannot be changed from type [{existing.get('type')}] to [{mapping.get('type')}]"
+                )
+            self.properties[key] = {**(existing or {}), **mapping}
+        self._fields.clear()
+
+    def put_settings(self, body: Dict[str, Any]):
+        for key, value in _flatten_settings(body.get("settings", body)).items():
+            if value is None:
+                self.settings.pop(key, None)
+            else:
+                self.settings[key] = value
+        self._analyzers.clear()
+
+    # 문서 -----------------------------------------------------------------
+
+    def write(self, doc_id: str, source: Dict[str, Any]) -> Document:
+        previous = self.docs.get(doc_id)
+        self.seq_no += 1
+        self.add_dynamic_mappings(source)
+        document = Document(
+            doc_id,
+            source,
+            previous.version + 1 if previous else 1,
+            self.seq_no,
+            previous.order if previous else next(self.order)
+        )
+        self.docs[doc_id] = document
+        self.generation += 1
+        return document
+
+    def delete(self, doc_id: str) -> Optional[Document]:
+        document = self.docs.pop(doc_id, None)
+        if document is not None:
+            self.seq_no += 1
+            self.generation += 1
+        return document
+
+    # 점수 계산 통계 -----------------------------------------------------------
+
+    def field_stats(self, field: FieldInfo, analyzer_name: str) -> Tuple[int, float, Counter]:
+        """현재 문서 기준 필드 통계 (문서가 바뀔 때까지 캐시)"""
+        if self._stats_generation != self.generation:
+            self._stats.clear()
+            self._stats_generation = self.generation
+
+        key = (field.name, analyzer_name)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = compute_field_stats(self, self.docs.values(), field, analyzer_name)
+            self._stats[key] = stats
+        return stats
+
+
+def compute_field_stats(index: FakeIndex, docs: Iterable[Document], field: FieldInfo, analyzer_name: str) -> Tuple[int, float, Counter]:
+    """(필드가 있는 문서 수, 평균 토큰 수, 토큰별 문서 빈도)"""
+    count, length, frequencies = 0, 0, Counter()
+    for document in docs:
+        terms, size = document.terms(index, field, analyzer_name)
+        if size:
+            count += 1
+            length += size
+            frequencies.update(terms.keys())
+    return count, length / count if count else 0.0, frequencies
+
+
+# ---------------------------------------------------------------------------
+# 쿼리 실행
+# ---------------------------------------------------------------------------
+
+class QueryContext:
+    """쿼리 하나를 실행하는 동안의 인덱스/문서 집합"""
+
+    def __init__(self, index: FakeIndex, docs: List[Document], scripts: Dict[str, ScriptFunction], snapshot: bool = False):
+        self.index = index
+        self.docs = docs
+        self.scripts = scripts
+        # PIT 검색은 열 때의 문서로 통계를 계산 (인덱스 캐시는 현재 문서 기준)
+        self.snapshot = snapshot
+        self._stats: Dict[Tuple[str, str], Tuple[int, float, Counter]] = {}
+        self._analyzed: Dict[Tuple[str, str], List[str]] = {}
+        self._expansions: Dict[Tuple[str, str, int, int], Dict[str, int]] = {}
+
+    def field(self, name: str) -> FieldInfo:
+        info = self.index.field(name)
+        if info is None:
+            # 매핑에 없는 필드는 keyword처럼 원본 값과 비교
+            info = FieldInfo(name, {"type": "keyword"}, name)
+        return info
+
+    def values(self, document: Document, field: FieldInfo) -> List[Any]:
+        return _as_list(_source_value(document.source, field.values_path))
+
+    def analyze(self, analyzer_name: str, text: Any) -> List[str]:
+        """검색어 분석 (같은 검색어를 문서마다 다시 분석하지 않도록 캐시)"""
+        key = (analyzer_name, str(text))
+        tokens = self._analyzed.get(key)
+        if tokens is None:
+            tokens = self.index.analyzer(analyzer_name)(text)
+            self._analyzed[key] = tokens
+        return tokens
+
+    def terms(self, document: Document, field: FieldInfo) -> Tuple[Counter, int]:
+        return document.terms(self.index, field, field.index_analyzer)
+
+    def stats(self, field: FieldInfo) -> Tuple[int, float, Counter]:
+        if not self.snapshot:
+            return self.index.field_stats(field, field.index_analyzer)
+        key = (field.name, field.index_analyzer)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = compute_field_stats(self.index, self.docs, field, field.index_analyzer)
+            self._stats[key] = stats
+        return stats
+
+    def expansions(self, field: FieldInfo, token: str, limit: int, prefix_length: int) -> Dict[str, int]:
+        """
+        퍼지 검색어의 후보 토큰과 편집 거리 (필드 전체 토큰에서 한 번만 계산)
+
+        Lucene FuzzyQuery와 같이 편집 거리가 가까운 순으로 최대 50개까지만 사용합니다.
+        """
+        key = (field.name, token, limit, prefix_length)
+        expansions = self._expansions.get(key)
+        if expansions is None:
+            prefix = token[:prefix_length]
+            candidates = []
+            for candidate in self.stats(field)[2]:
+                if candidate.startswith(prefix):
+                    distance = _edit_distance(token, candidate, limit)
+                    if distance <= limit:
+                        candidates.append((distance, candidate))
+            expansions = {candidate: distance for distance, candidate in sorted(candidates)[:_MAX_EXPANSIONS]}
+            self._expansions[key] = expansions
+        return expansions
+
+    def bm25(self, document: Document, field: FieldInfo, term: str, tf: float) -> float:
+        count, average_length, frequencies = self.stats(field)
+        doc_length = self.terms(document, field)[1]
+        df = frequencies.get(term, 0)
+        idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+        norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * doc_length / average_length) if average_length else _BM25_K1
+        return idf * tf * (_BM25_K1 + 1) / (tf + norm)
+
+
+Score = Optional[float]
+
+
+def evaluate(query: Dict[str, Any], document: Document, context: QueryContext) -> Score:
+    """문서가 쿼리와 일치하면 점수, 아니면 None"""
+    if not query:
+        return 1.0
+    if len(query) != 1:
+        raise _bad_request(f"[{', '.join(query)}] malformed query, expected a single query type", "parsing_exception")
+    kind, spec = next(iter(query.items()))
+    handler = _QUERY_HANDLERS.get(kind)
+    if handler is None:
+        raise _bad_request(f"unknown query [{kind}]", "parsing_exception")
+    return handler(spec, document, context)
+
+
+def _field_spec(spec: Dict[str, Any], value_key: str) -> Tuple[str, Dict[str, Any]]:
+    """{필드: 값} 또는 {필드: {value_key: 값, ...}} 형식 해석"""
+    options = {key: value for key, value in spec.items() if key in ("boost", "_name")}
+    fields = [key for key in spec if key not in ("boost", "_name")]
+    if len(fields) != 1:
+        raise _bad_request(f"query expects exactly one field, got {fields}", "parsing_exception")
+    name = fields[0]
+    body = spec[name]
+    if not isinstance(body, dict):
+        body = {value_key: body}
+    return name, {**options, **body}
+
+
+def _boost(spec: Dict[str, Any]) -> float:
+    return float(spec.get("boost", 1.0))
+
+
+def _query_bool(spec: Dict[str, Any], document: Document, context: QueryContext) -> Score:
+    score = 0.0
+    for clause in _as_list(spec.get("must")):
+        clause_score = evaluate(clause, document, context)
+        if clause_score is None:
+            return None
+        score += clause_score
+    for clause in _as_list(spec.get("filter")):
+        if evaluate(clause, document, context) is None:
+            return None
+    for clause in _as_list(spec.get("must_not")):
+        if evaluate(clause, document, context) is not None:
+            return None
+
+    should = _as_list(spec.get("should"))
+    matched = 0
+    for clause in should:
+        clause_score = evaluate(clause, document, context)
+        if clause_score is not None:
+            matched += 1
+            score += clause_score
+
+    minimum = spec.get("minimum_should_match")
+    if minimum is None:
+        minimum = 1 if should and not spec.get("must") and not spec.get("filter") else 0
+    elif isinstance(minimum, str) and minimum.endswith("%"):
+        minimum = math.floor(len(should) * int(minimum[:-1]) / 100)
+    else:
+        minimum = int(minimum)
+        if minimum < 0:
+            minimum = max(len(should) + minimum, 0)
+    if matched < minimum:
+        return None
+
+    # 점수 없는 절(filter/must_not)만 있으면 ES와 같이 0점
+    return score * _boost(spec)
+
+
+def _query_match_all(spec: Dict[str, Any], document: Document, context: QueryContext) -> Score:
+    return _boost(spec or {})
+
+
+def _query_constant_score(spec: Dict[str, Any], document: Document, context: QueryContext) -> Score:
+    if evaluate(spec["filter"], document, context) is None:
+        return None
+    return _boost(spec)
+
+
+def _keyword_equals(field: FieldInfo, document_value: Any, value: Any) -> bool:
+    if field.type == "date":
+        return _parse_date(document_value) == _parse_date(value)
+    if field.type in ("long", "integer", "short", "byte", "float", "double", "scaled_float"):
+        try:
+            return float(document_value) == float(value)
+        except (TypeError, ValueError):
+            return False
+    if field.type == "boolean":
+        return str(document_value).lower() == str(value).lower()
+    return str(document_value) == str(value)
+
+
+def _term_matches(field: FieldInfo, document: Document, value: Any, context: QueryContext) -> bool:
+    if field.is_text:
+        return str(value) in context.terms(document, field)[0]
+    return any(_keyword_equals(field, item, value) for item in context.values(document, field))
+
+
+def _query_term(spec: Dict[str, Any], document: Document, context: QueryContext) -> Score:
+    name, options = _field_spec(spec, "value")
+    field = context.field(name)
+    return _boost(options) if _term_matches(field, document, options["value"], context) else None
+
+
+def _query_terms(spec: Dict[str, Any], document: Document, context: QueryContext) -> Score:
+    options = {key: value for key, value in spec.items() if key == "boost"}
+    fields = [key for key in spec if key != "boost"]
+    if len(fields) != 1:
+        raise _bad_request("[terms] query requires exactly one field", "parsing_exception")
+    field = context.field(fields[0])
+    values = spec[fields[0]]
+    if any(_term_matches(field, document, value, context) for value in values):
+        return _boost(options)
+    return None
+
+
+def _query_ids(spec: Dict[str, Any], document: Document, context: QueryContext) -> Score:
+    return _boost(spec) if document.id in {str(value) for value in spec.get("values", [])} else None
+
+
+def _query_exists(spec: Dict[str, Any], document: Document, context: QueryContext) -> Score:
+    field = context.field(spec["field"])
+    return _boost(spec) if context.values(document, field) else None
+
+
+def _query_prefix(spec: Dict[str, Any], document: Document, context: QueryContext) -> Score:
+    name, options = _field_spec(spec, "value")
+    field = context.field(name)
+    prefix = str(options["value"])
+    if options.get("case_insensitive"):
+        prefix = prefix.lower()
+    if field.is_text:
+        candidates = list(context.terms(document, field)[0])
+    else:
+        candidates = [str(value) for value in context.values(document, field)]
+    if options.get("case_insensitive"):
+        candidates = [candidate.lower() for candidate in candidates]
+    return _boost(options) if any(candidate.startswith(prefix) for candidate in candidates) else None
+
+
+def _query_range(spec: Dict[str, Any], document: Document, context: QueryContext) -> Score:
+    name, options = _field_spec(spec, "gte")
+    field = context.field(name)
+
+    if field.type == "date":
+        convert: Callable[[Any], Any] = _parse_date
+    elif field.type in ("long", "integer", "short", "byte", "float", "double", "scaled_float"):
+        convert = float
+    else:
+        convert = str
+
+    bounds = []
+    for operator in ("gt", "gte", "lt", "lte"):
+        if options.get(operator) is not None:
+            bounds.append((operator, convert(options[operator])))
+    for key, operator in (("from", "gte"), ("to", "lte")):
+        if options.get(key) is not None:
+            bounds.append((operator, convert(options[key])))
+
+    for value in context.values(document, field):
+        try:
+            value = convert(value)
+        except FakeElasticsearchError:
+            continue
+        if all(
+            (operator == "gt" and value > bound) or (operator == "gte" and value >= bound)
+            or (operator == "lt" and value < bound) or (operator == "lte" and value <= bound)
+            for operator, bound in bounds
+        ):
+            return _boost(options)
+    return None
+
+
+def _match_field(
+    field: FieldInfo,
+    text: Any,
+    document: Document,
+    context: QueryContext,
+    operator: str = "or",
+    fuzziness: Any = None,
+    prefix_length: int = 0,
+    analyzer: Optional[str] = None
+) -> Score:
+    """match 쿼리 한 필드의 점수 (검색어를 분석한 토큰별 BM25 합)"""
+    if not field.is_text:
+        # keyword 등은 검색어 전체와 값 비교
+        return 1.0 if _term_matches(field, document, text, context) else None
+
+    query_tokens = context.analyze(analyzer or field.search_analyzer, text)
+    if not query_tokens:
+        return None
+
+    frequencies, size = context.terms(document, field)
+    if not size:
+        return None
+
+    score, matched = 0.0, 0
+    for token in query_tokens:
+        tf = frequencies.get(token, 0)
+        if tf:
+            matched += 1
+            score += context.bm25(document, field, token, tf)
+            continue
+
+        limit = _fuzziness(fuzziness, token)
+        if limit:
+            best = None
+            for candidate, distance in context.expansions(field, token, limit, prefix_length).items():
+                candidate_tf = frequencies.get(candidate, 0)
+                if candidate_tf:
+                    candidate_score = context.bm25(document, field, candidate, candidate_tf) * (1 - distance / max(len(token), 1))
+                    best = candidate_score if best is None else max(best, candidate_score)
+            if best is not None:
+                matched += 1
+                score += best
+
+    if matched == 0 or (operator.lower() == "and" and matched < len(query_tokens)):
+        return None
+    return score
+
+
+def _query_match(spec: Dict[str, Any], document: Document, context: QueryContext) -> Score:
+    name, options = _field_spec(spec, "query")
+    score = _match_field(
+        context.field(name), options["query"], document, context,
+        operator=options.get("operator", "or"),
+        fuzziness=options.get("fuzziness"),
+        prefix_length=int(options.get("prefix_length", 0)),
+        analyzer=options.get("analyzer")
+    )
+    return None if score is None else score * _boost(options)
+
+
+def _phrase_positions(field: FieldInfo, text: Any, document: Document, context: QueryContext, prefix: bool) -> bool:
+    query_tokens = context.analyze(field.search_analyzer, text) if field.is_text else [str(text)]
+    if not query_tokens:
+        return False
+    if field.is_text:
+        sequences = [
+            context.index.analyzer(field.index_analyzer)(value)
+            for value in context.values(document, field)
+        ]
+    else:
+        sequences = [[str(value)] for value in context.values(document, field)]
+
+    size = len(query_tokens)
+    for tokens in sequences:
+        for start in range(len(tokens) - size + 1):
+            window = tokens[start:start + size]
+            if window[:-1] != query_tokens[:-1]:
+                continue
+            last = window[-1]
+            if last == query_tokens[-1] or (prefix and last.startswith(query_tokens[-1])):
+                return True
+    return False
+
+
+def _phrase_score(field: FieldInfo, text: Any, document: Document, context: QueryContext) -> float:
+    if not field.is_text:
+        return 1.0
+    tokens = context.analyze(field.search_analyzer, text)
+    frequencies = context.terms(document, field)[0]
+    score = sum(context.bm25(document, field, token, frequencies[token]) for token in tokens if frequencies.get(token))
+    # 접두어로만 일치한 경우에도 0점이 되지 않도록 최소 점수 부여
+    return max(score, 1.0)
+
+
+def _query_match_phrase(spec: Dict[str, Any], document: Document, context: QueryContext, prefix: bool = False) -> Score:
+    name, options = _field_spec(spec, "query")
+    field = context.field(name)
+    if not _phrase_positions(field, options["query"], document, context, prefix):
+        return None
+    return _phrase_score(field, options["query"], document, context) * _boost(options)
+
+
+def _query_match_phrase_prefix(spec: Dict[str, Any], document: Document, context: QueryContext) -> Score:
+    return _query_match_phrase(spec, document, context, prefix=True)
+
+
+def _parse_field_boost(name: str) -> Tuple[str, float]:
+    if "^" in name:
+        field, boost = name.rsplit("^", 1)
+        return field, float(boost)
+    return name, 1.0
+
+
+def _query_multi_match(spec: Dict[str, Any], document: Document, context: QueryContext) -> Score:
+    match_type = spec.get("type", "best_fields")
+    scores = []
+    for name in spec.get("fields", ["*"]):
+        field_name, field_boost = _parse_field_boost(name)
+        field = context.field(field_name)
+        if match_type in ("phrase", "phrase_prefix"):
+            if not _phrase_positions(field, spec["query"], document, context, match_type == "phrase_prefix"):
+                continue
+            score: Score = _phrase_score(field, spec["query"], document, context)
+        else:
+            score = _match_field(
+                field, spec["query"], document, context,
+                operator=spec.get("operator", "or"),
+                fuzziness=spec.get("fuzziness"),
+                prefix_length=int(spec.get("prefix_length", 0)),
+                analyzer=spec.get("analyzer")
+            )
+        if score is not None:
+            scores.append(score * field_boost)
+
+    if not scores:
+        return None
+    if match_type in ("most_fields", "cross_fields"):
+        combined = sum(scores)
+    else:
+        best = max(scores)
+        combined = best + float(spec.get("tie_breaker", 0.0)) * (sum(scores) - best)
+    return combined * _boost(spec)
+
+
+_QUERY_HANDLERS: Dict[str, Callable[[Dict[str, Any], Document, QueryContext], Score]] = {
+    "bool": _query_bool,
+    "match_all": _query_match_all,
+    "constant_score": _query_constant_score,
+    "term": _query_term,
+    "terms": _query_terms,
+    "ids": _query_ids,
+    "exists": _query_exists,
+    "prefix": _query_prefix,
+    "range": _query_range,
+    "match": _query_match,
+    "match_phrase": _query_match_phrase,
+    "match_phrase_prefix": _query_match_phrase_prefix,
+    "multi_match": _query_multi_match,
+}
+
+# profile 응답의 쿼리 타입 이름
+_PROFILE_TYPES = {
+    "bool": "BooleanQuery", "match_all": "MatchAllDocsQuery", "constant_score": "ConstantScoreQuery",
+    "term": "TermQuery", "terms": "TermInSetQuery", "ids": "TermInSetQuery", "exists": "FieldExistsQuery",
+    "prefix": "PrefixQuery", "range": "IndexOrDocValuesQuery", "match": "TermQuery",
+    "match_phrase": "PhraseQuery", "match_phrase_prefix": "MultiPhrasePrefixQuery", "multi_match": "DisjunctionMaxQuery",
+}
+
+
+def _profile_tree(query: Dict[str, Any], total_nanos: int) -> Dict[str, Any]:
+    """쿼리 구조를 profile 응답의 query 노드로 변환 (측정 시간은 최상위 노드에만 기록)"""
+    kind, spec = next(iter(query.items())) if query else ("match_all", {})
+    children = []
+    if kind == "bool":
+        for occur in ("must", "filter", "should", "must_not"):
+            children.extend(_profile_tree(clause, 0) for clause in _as_list(spec.get(occur)))
+    node = {
+        "type": _PROFILE_TYPES.get(kind, kind),
+        "description": json.dumps(query, ensure_ascii=False, sort_keys=True),
+        "time_in_nanos": total_nanos,
+        "breakdown": {}
+    }
+    if children:
+        node["children"] = children
+    return node
+
+
+# ---------------------------------------------------------------------------
+# 정렬
+# ---------------------------------------------------------------------------
+
+class SortField:
+    """정렬 조건 하나"""
+
+    __slots__ = ("field", "descending", "format", "missing_first", "info")
+
+    def __init__(self, spec: Any, index: Optional[FakeIndex]):
+        if isinstance(spec, str):
+            name, options = spec, {}
+        else:
+            name, options = next(iter(spec.items()))
+            if isinstance(options, str):
+                options = {"order": options}
+        self.field = name
+        default_order = "desc" if name == "_score" else "asc"
+        self.descending = options.get("order", default_order) == "desc"
+        self.format = options.get("format")
+        self.missing_first = options.get("missing") == "_first"
+        self.info = index.field(name) if index is not None and not name.startswith("_") else None
+
+    def key(self, document: Document, score: float) -> Any:
+        """비교용 값 (값이 없으면 None)"""
+        if self.field == "_score":
+            return score
+        if self.field in ("_doc", "_shard_doc"):
+            return document.order
+        if self.field == "_id":
+            return document.id
+        values = _as_list(_source_value(document.source, self.info.values_path if self.info else self.field))
+        if not values:
+            return None
+        converted = [self.convert(value) for value in values]
+        return max(converted) if self.descending else min(converted)
+
+    def convert(self, value: Any) -> Any:
+        field_type = self.info.type if self.info else None
+        if field_type == "date":
+            return _parse_date(value)
+        if field_type in ("long", "integer", "short", "byte"):
+            return int(value)
+        if field_type in ("float", "double", "scaled_float"):
+            return float(value)
+        return value if isinstance(value, (int, float)) and not isinstance(value, bool) else str(value)
+
+    def response_value(self, key: Any) -> Any:
+        """응답의 sort 값 (날짜는 format이 있으면 문자열, 없으면 epoch millis)"""
+        if key is None:
+            return None
+        if self.info is not None and self.info.type == "date":
+            return _format_date(key, self.format)
+        return key
+
+    def compare(self, left: Any, right: Any) -> int:
+        if left is None or right is None:
+            if left is None and right is None:
+                return 0
+            # 값이 없는 문서는 기본적으로 정렬 방향과 무관하게 마지막
+            return (-1 if self.missing_first else 1) * (1 if left is None else -1)
+        if left == right:
+            return 0
+        result = -1 if left < right else 1
+        return -result if self.descending else result
+
+
+def _compare_keys(sort_fields: List[SortField], left: List[Any], right: List[Any]) -> int:
+    for sort_field, left_value, right_value in zip(sort_fields, left, right):
+        result = sort_field.compare(left_value, right_value)
+        if result:
+            return result
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# 서버 상태와 API
+# ---------------------------------------------------------------------------
+
+class FakeElasticsearch:
+    """가짜 Elasticsearch 상태와 REST API 처리 (HTTP 계층과 분리)"""
+
+    def __init__(self):
+        self.indices: Dict[str, FakeIndex] = {}
+        self.aliases: Dict[str, List[str]] = {}
+        self.scripts: Dict[str, ScriptFunction] = {}
+        self.request_counts: Counter = Counter()
+        self._scrolls: Dict[str, Tuple[List[Dict[str, Any]], int, int, Dict[str, Any]]] = {}
+        self._pits: Dict[str, List[Tuple[FakeIndex, List[Document]]]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def register_script(self, source: str, function: ScriptFunction):
+        """
+        painless 스크립트 원문에 대응하는 Python 함수 등록
+
+        함수는 (ctx, params)를 받습니다. update/reindex 스크립트의 ctx는 {"_source", "_id", "op"}이며
+        ctx를 직접 수정하고, 집계 스크립트의 ctx는 {"_source", "_id"}이며 값을 반환합니다.
+        """
+        self.scripts[source.strip()] = function
+
+    def reset(self):
+        """모든 인덱스/별칭/scroll/PIT 삭제 (등록한 스크립트는 유지)"""
+        with self._lock:
+            self.indices.clear()
+            self.aliases.clear()
+            self._scrolls.clear()
+            self._pits.clear()
+            self.request_counts.clear()
+
+    # 요청 처리 -------------------------------------------------------------
+
+    def handle(self, method: str, path: str, params: Dict[str, str], body: Optional[bytes]) -> Tuple[int, Any]:
+        """REST 요청 처리 -> (상태 코드, 응답 본문)"""
+        parts = [unquote(part) for part in path.strip("/").split("/") if part]
+        endpoint = next((part for part in reversed(parts) if part.startswith("_")), "index" if parts else "root")
+        self.request_counts[endpoint] += 1
+
+        try:
+            with self._lock:
+                return self._route(method, parts, params, body)
+        except FakeElasticsearchError as e:
+            return e.status, e.to_body()
+
+    def _route(self, method: str, parts: List[str], params: Dict[str, str], raw: Optional[bytes]) -> Tuple[int, Any]:
+        if not parts:
+            return 200, self._info()
+
+        first = parts[0]
+        if first == "_search" and len(parts) == 2 and parts[1] == "scroll":
+            return self._scroll_api(method, params, self._json(raw))
+        if first == "_pit":
+            return self._close_pit(self._json(raw))
+        if first == "_cluster":
+            return 200, {"cluster_name": "fake", "status": "green", "timed_out": False,
+                         "number_of_nodes": 1, "active_shards": len(self.indices)}
+        if first == "_aliases":
+            return self._update_aliases(self._json(raw))
+        if first == "_alias":
+            return self._get_alias(None, parts[1] if len(parts) > 1 else None, method)
+        if first == "_reindex":
+            return self._reindex(self._json(raw))
+
+        target = None if first.startswith("_") else first
+        rest = parts[1:] if target is not None else parts
+        action = rest[0] if rest else None
+
+        if action is None:
+            return self._index_api(method, target, params, self._json(raw))
+        if action in ("_doc", "_create") and len(rest) <= 2:
+            doc_id = rest[1] if len(rest) == 2 else None
+            if action == "_create":
+                params = {**params, "op_type": "create"}
+            return self._document_api(method, target, doc_id, params, self._json(raw))
+        if action == "_update":
+            return self._update(target, rest[1], params, self._json(raw))
+        if action == "_search":
+            return self._search_api(target, params, self._json(raw))
+        if action == "_msearch":
+            return self._msearch(target, params, raw)
+        if action == "_count":
+            return self._count(target, self._json(raw))
+        if action == "_mget":
+            return self._mget(target, params, self._json(raw))
+        if action == "_bulk":
+            return self._bulk(target, raw)
+        if action == "_delete_by_query":
+            return self._delete_by_query(target, self._json(raw))
+        if action == "_settings":
+            return self._settings_api(method, target, params, self._json(raw))
+        if action == "_mapping":
+            return self._mapping_api(method, target, self._json(raw))
+        if action in ("_refresh", "_forcemerge", "_flush"):
+            names = self._resolve(target or "_all")
+            return 200, {"_shards": {"total": len(names), "successful": len(names), "failed": 0}}
+        if action in ("_alias", "_aliases"):
+            return self._alias_api(method, target, rest[1] if len(rest) > 1 else None)
+        if action == "_pit":
+            return self._open_pit(target)
+        raise _bad_request(f"unsupported request [{method} /{'/'.join(parts)}]")
+
+    @staticmethod
+    def _json(raw: Optional[bytes]) -> Dict[str, Any]:
+        if not raw:
+            return {}
+        try:
+            return json.loads(raw)
+        except ValueError as e:
+            raise _bad_request(f"failed to parse request body: {e}", "parse_exception")
+
+    @staticmethod
+    def _info() -> Dict[str, Any]:
+        return {
+            "name": "fake-node",
+            "cluster_name": "fake",
+            "cluster_uuid": "fake",
+            "version": {"number": VERSION, "build_flavor": "default", "build_type": "docker",
+                        "lucene_version": "8.11.1", "minimum_wire_compatibility_version": "6.8.0",
+                        "minimum_index_compatibility_version": "6.0.0-beta1"},
+            "tagline": "You Know, for Search"
+        }
+
+    # 인덱스/별칭 이름 해석 ------------------------------------------------------
+
+    def _resolve(self, expression: str, ignore_unavailable: bool = False) -> List[str]:
+        """인덱스 식(쉼표, 와일드카드, 별칭, _all)을 실제 인덱스 이름 목록으로 변환"""
+        names: List[str] = []
+        for part in expression.split(","):
+            part = part.strip()
+            if part in ("_all", "*"):
+                candidates = sorted(self.indices)
+            elif "*" in part or "?" in part:
+                candidates = sorted(name for name in self.indices if fnmatch.fnmatchcase(name, part))
+                for alias, targets in sorted(self.aliases.items()):
+                    if fnmatch.fnmatchcase(alias, part):
+                        candidates.extend(targets)
+            elif part in self.indices:
+                candidates = [part]
+            elif part in self.aliases:
+                candidates = list(self.aliases[part])
+            elif ignore_unavailable:
+                candidates = []
+            else:
+                raise _index_not_found(part)
+            names.extend(name for name in candidates if name not in names)
+        return names
+
+    def _single_index(self, expression: str, create: bool = False) -> FakeIndex:
+        """쓰기 대상 인덱스 (별칭은 인덱스 하나를 가리켜야 함, create면 없을 때 자동 생성)"""
+        if expression in self.aliases:
+            targets = self.aliases[expression]
+            if len(targets) != 1:
+                raise _bad_request(f"no write index is defined for alias [{expression}]")
+            return self.indices[targets[0]]
+        index = self.indices.get(expression)
+        if index is None:
+            if not create:
+                raise _index_not_found(expression)
+            index = self._create_index(expression, {})
+        return index
+
+    def _create_index(self, name: str, body: Dict[str, Any]) -> FakeIndex:
+        if name in self.indices or name in self.aliases:
+            raise FakeElasticsearchError(
+                400, "resource_already_exists_exception", f"index [{name}] already exists", index=name
+            )
+        if name != name.lower() or name.startswith(("_", "-", "+")):
+            raise _bad_request(f"Invalid index name [{name}], must be lowercase", "invalid_index_name_exception")
+        index = FakeIndex(name, body.get("settings", {}), body.get("mappings", {}))
+        self.indices[name] = index
+        for alias in body.get("aliases", {}):
+            self.aliases.setdefault(alias, []).append(name)
+        return index
+
+    def _delete_index(self, name: str):
+        self.indices.pop(name, None)
+        for alias in list(self.aliases):
+            targets = [target for target in self.aliases[alias] if target != name]
+            if targets:
+                self.aliases[alias] = targets
+            else:
+                del self.aliases[alias]
+
+    def _index_api(self, method: str, target: str, params: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any]:
+        if method == "HEAD":
+            try:
+                return (200, None) if self._resolve(target) else (404, None)
+            except FakeElasticsearchError:
+                return 404, None
+        if method == "PUT":
+            self._create_index(target, body)
+            return 200, {"acknowledged": True, "shards_acknowledged": True, "index": target}
+        if method == "DELETE":
+            for part in target.split(","):
+                if part in self.aliases:
+                    raise _bad_request(
+                        f"The provided expression [{part}] matches an alias, specify the corresponding concrete indices instead."
+                    )
+            for name in self._resolve(target, ignore_unavailable=params.get("ignore_unavailable") == "true"):
+                self._delete_index(name)
+            return 200, {"acknowledged": True}
+        if method == "GET":
+            return 200, {
+                name: {
+                    "aliases": {alias: {} for alias, targets in self.aliases.items() if name in targets},
+                    "mappings": {"properties": self.indices[name].properties},
+                    "settings": _nest(self.indices[name].settings)
+                }
+                for name in self._resolve(target)
+            }
+        raise _bad_request(f"unsupported request [{method} /{target}]")
+
+    def _settings_api(self, method: str, target: Optional[str], params: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any]:
+        names = self._resolve(target or "_all")
+        if method == "PUT":
+            for name in names:
+                self.indices[name].put_settings(body)
+            return 200, {"acknowledged": True}
+
+        patterns = [pattern for pattern in params.get("name", "").split(",") if pattern]
+        response = {}
+        for name in names:
+            settings = {
+                key: value for key, value in self.indices[name].settings.items()
+                if not patterns or any(fnmatch.fnmatchcase(key, pattern) for pattern in patterns)
+            }
+            response[name] = {"settings": settings if params.get("flat_settings") == "true" else _nest(settings)}
+        return 200, response
+
+    def _mapping_api(self, method: str, target: Optional[str], body: Dict[str, Any]) -> Tuple[int, Any]:
+        names = self._resolve(target or "_all")
+        if method in ("PUT", "POST"):
+            for name in names:
+                self.indices[name].put_mapping(body)
+            return 200, {"acknowledged": True}
+        return 200, {name: {"mappings": {"properties": self.indices[name].properties}} for name in names}
+
+    def _get_alias(self, target: Optional[str], name: Optional[str], method: str) -> Tuple[int, Any]:
+        indices = self._resolve(target, ignore_unavailable=True) if target else sorted(self.indices)
+        response = {}
+        for index_name in indices:
+            aliases = {
+                alias: {} for alias, targets in self.aliases.items()
+                if index_name in targets and (name is None or any(
+                    fnmatch.fnmatchcase(alias, pattern) for pattern in name.split(",")
+                ))
+            }
+            if aliases or name is None:
+                response[index_name] = {"aliases": aliases}
+
+        if name is not None and not response:
+            if method == "HEAD":
+                return 404, None
+            return 404, {"error": f"alias [{name}] missing", "status": 404}
+        return (200, None) if method == "HEAD" else (200, response)
+
+    def _alias_api(self, method: str, target: str, name: Optional[str]) -> Tuple[int, Any]:
+        if method in ("GET", "HEAD"):
+            return self._get_alias(target, name, method)
+        names = self._resolve(target)
+        if method == "PUT" or method == "POST":
+            for index_name in names:
+                targets = self.aliases.setdefault(name, [])
+                if index_name not in targets:
+                    targets.append(index_name)
+            return 200, {"acknowledged": True}
+        if method == "DELETE":
+            for index_name in names:
+                targets = self.aliases.get(name, [])
+                if index_name not in targets:
+                    raise FakeElasticsearchError(404, "aliases_not_found_exception", f"aliases [{name}] missing")
+                targets.remove(index_name)
+                if not targets:
+                    del self.aliases[name]
+            return 200, {"acknowledged": True}
+        raise _bad_request(f"unsupported alias request [{method}]")
+
+    def _update_aliases(self, body: Dict[str, Any]) -> Tuple[int, Any]:
+        """별칭 변경 요청 (모든 동작을 검증한 뒤 한 번에 적용)"""
+        aliases = {alias: list(targets) for alias, targets in self.aliases.items()}
+        actions = [next(iter(action.items())) for action in body.get("actions", [])]
+        # 같은 요청에서 삭제되는 인덱스와 같은 이름의 별칭은 추가할 수 있음
+        removed_indices = [
+            name
+            for kind, spec in actions if kind == "remove_index"
+            for pattern in _as_list(spec.get("indices")) or _as_list(spec.get("index"))
+            for name in self._resolve(pattern)
+        ]
+        for kind, spec in actions:
+            index_names = _as_list(spec.get("indices")) or _as_list(spec.get("index"))
+            alias_names = _as_list(spec.get("aliases")) or _as_list(spec.get("alias"))
+            resolved = [name for pattern in index_names for name in self._resolve(pattern)]
+            if kind == "add":
+                for alias in alias_names:
+                    if alias in self.indices and alias not in removed_indices:
+                        raise FakeElasticsearchError(
+                            400, "invalid_alias_name_exception",
+                            f"Invalid alias name [{alias}]: an index or data stream exists with the same name as the alias"
+                        )
+                    targets = aliases.setdefault(alias, [])
+                    targets.extend(name for name in resolved if name not in targets)
+            elif kind == "remove":
+                for alias in alias_names:
+                    targets = aliases.get(alias, [])
+                    for name in resolved:
+                        if name not in targets:
+                            raise FakeElasticsearchError(404, "aliases_not_found_exception", f"aliases [{alias}] missing")
+                        targets.remove(name)
+                    if not targets:
+                        aliases.pop(alias, None)
+            elif kind == "remove_index":
+                continue
+            else:
+                raise _bad_request(f"unknown alias action [{kind}]")
+
+        for name in removed_indices:
+            self.indices.pop(name, None)
+            for targets in aliases.values():
+                if name in targets:
+                    targets.remove(name)
+        self.aliases = {alias: targets for alias, targets in aliases.items() if targets}
+        return 200, {"acknowledged": True}
+
+    # 문서 API ---------------------------------------------------------------
+
+    @staticmethod
+    def _doc_meta(index: FakeIndex, document: Document) -> Dict[str, Any]:
+        return {
+            "_index": index.name,
+            "_type": "_doc",
+            "_id": document.id,
+            "_version": document.version,
+            "_seq_no": document.seq_no,
+            "_primary_term": 1
+        }
+
+    def _check_concurrency(self, index: FakeIndex, doc_id: str, params: Dict[str, Any]):
+        existing = index.docs.get(doc_id)
+        if params.get("op_type") == "create" and existing is not None:
+            raise FakeElasticsearchError(
+                409, "version_conflict_engine_exception",
+                f"[{doc_id}]: version conflict, document already exists (current version [{existing.version}])",
+                index=index.name
+            )
+        if params.get("if_seq_no") is not None:
+            if existing is None or existing.seq_no != int(params["if_seq_no"]) or int(params.get("if_primary_term", 1)) != 1:
+                current = existing.seq_no if existing else -2
+                raise FakeElasticsearchError(
+                    409, "version_conflict_engine_exception",
+                    f"[{doc_id}]: version conflict, required seqNo [{params['if_seq_no']}], "
+                    f"primary term [{params.get('if_primary_term')}]. current document has seqNo [{current}]",
+                    index=index.name
+                )
+
+    def _index_document(self, target: str, doc_id: Optional[str], source: Dict[str, Any], params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        index = self._single_index(target, create=True)
+        if doc_id is None:
+            doc_id = f"fake{next(self._ids):016d}"
+            params = {**params, "op_type": "create"}
+        self._check_concurrency(index, doc_id, params)
+        created = doc_id not in index.docs
+        document = index.write(doc_id, source)
+        return (201 if created else 200), {
+            **self._doc_meta(index, document),
+            "result": "created" if created else "updated",
+            "_shards": {"total": 1, "successful": 1, "failed": 0}
+        }
+
+    def _document_api(self, method: str, target: str, doc_id: Optional[str], params: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any]:
+        if method in ("PUT", "POST"):
+            return self._index_document(target, doc_id, body, params)
+
+        index_names = self._resolve(target)
+        index = self.indices[index_names[0]] if index_names else None
+        document = index.docs.get(doc_id) if index else None
+
+        if method == "HEAD":
+            return (200 if document else 404), None
+        if method == "DELETE":
+            if document is None:
+                return 404, {"_index": target, "_type": "_doc", "_id": doc_id, "result": "not_found"}
+            self._check_concurrency(index, doc_id, params)
+            index.delete(doc_id)
+            return 200, {**self._doc_meta(index, document), "_version": document.version + 1, "result": "deleted"}
+        if document is None:
+            return 404, {"_index": index.name, "_type": "_doc", "_id": doc_id, "found": False}
+        return 200, self._get_response(index, document, self._source_spec(params, None))
+
+    def _get_response(self, index: FakeIndex, document: Document, source_spec: Any) -> Dict[str, Any]:
+        response = {**self._doc_meta(index, document), "found": True}
+        source = _filter_source(document.source, source_spec)
+        if source is not None:
+            response["_source"] = source
+        return response
+
+    @staticmethod
+    def _source_spec(params: Dict[str, str], body_spec: Any) -> Any:
+        if "_source_includes" in params or "_source_excludes" in params:
+            return {
+                "includes": [field for field in params.get("_source_includes", "").split(",") if field],
+                "excludes": [field for field in params.get("_source_excludes", "").split(",") if field]
+            }
+        if "_source" in params:
+            value = params["_source"]
+            if value in ("true", "false"):
+                return value == "true"
+            return value.split(",")
+        return body_spec
+
+    def _mget(self, target: Optional[str], params: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any]:
+        requests = body.get("docs") or [{"_id": doc_id} for doc_id in body.get("ids", [])]
+        docs = []
+        for request in requests:
+            index_expression = request.get("_index", target)
+            doc_id = str(request["_id"])
+            try:
+                index = self.indices[self._resolve(index_expression)[0]]
+            except (FakeElasticsearchError, IndexError):
+                error = _index_not_found(index_expression).to_body()["error"]
+                docs.append({"_index": index_expression, "_type": "_doc", "_id": doc_id, "error": error})
+                continue
+            document = index.docs.get(doc_id)
+            if document is None:
+                docs.append({"_index": index.name, "_type": "_doc", "_id": doc_id, "found": False})
+            else:
+                source_spec = request.get("_source", self._source_spec(params, None))
+                docs.append(self._get_response(index, document, source_spec))
+        return 200, {"docs": docs}
+
+    def _run_script(self, script: Dict[str, Any], ctx: Dict[str, Any]) -> Any:
+        source = script.get("source", script.get("inline", "")) if isinstance(script, dict) else str(script)
+        function = self.scripts.get(source.strip())
+        if function is None:
+            raise _bad_request(
+                "painless scripts are not executed by the fake server; register the script with register_script()",
+                "script_exception"
+            )
+        params = script.get("params", {}) if isinstance(script, dict) else {}
+        return function(ctx, params)
+
+    def _apply_update(self, index: FakeIndex, doc_id: str, body: Dict[str, Any], params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        existing = index.docs.get(doc_id)
+        self._check_concurrency(index, doc_id, params)
+
+        if existing is None:
+            if body.get("doc_as_upsert") and "doc" in body:
+                source = dict(body["doc"])
+            elif "upsert" in body:
+                source = dict(body["upsert"])
+                if body.get("scripted_upsert") and "script" in body:
+                    ctx = {"_source": source, "_id": doc_id, "op": "create"}
+                    self._run_script(body["script"], ctx)
+            else:
+                raise FakeElasticsearchError(
+                    404, "document_missing_exception", f"[_doc][{doc_id}]: document missing",
+                    index=index.name, shard="0"
+                )
+            document = index.write(doc_id, source)
+            return 201, {**self._doc_meta(index, document), "result": "created"}
+
+        source = json.loads(json.dumps(existing.source))
+        if "script" in body:
+            ctx = {"_source": source, "_id": doc_id, "op": "index"}
+            self._run_script(body["script"], ctx)
+            if ctx.get("op") in ("noop", "none"):
+                return 200, {**self._doc_meta(index, existing), "result": "noop"}
+            if ctx.get("op") == "delete":
+                index.delete(doc_id)
+                return 200, {**self._doc_meta(index, existing), "result": "deleted"}
+            source = ctx["_source"]
+        elif "doc" in body:
+            _merge(source, body["doc"])
+        if source == existing.source and body.get("detect_noop", True):
+            return 200, {**self._doc_meta(index, existing), "result": "noop"}
+
+        document = index.write(doc_id, source)
+        return 200, {**self._doc_meta(index, document), "result": "updated"}
+
+    def _update(self, target: str, doc_id: str, params: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any]:
+        index = self._single_index(target, create=bool(body.get("upsert") or body.get("doc_as_upsert")))
+        status, response = self._apply_update(index, doc_id, body, params)
+        return status, {**response, "_shards": {"total": 1, "successful": 1, "failed": 0}}
+
+    def _bulk(self, target: Optional[str], raw: Optional[bytes]) -> Tuple[int, Any]:
+        lines = [line for line in (raw or b"").decode("utf-8").split("\n") if line.strip()]
+        items = []
+        errors = False
+        position = 0
+        while position < len(lines):
+            action = json.loads(lines[position])
+            position += 1
+            op_type, meta = next(iter(action.items()))
+            source = None
+            if op_type != "delete":
+                source = json.loads(lines[position])
+                position += 1
+
+            index_name = meta.get("_index", target)
+            doc_id = None if meta.get("_id") is None else str(meta["_id"])
+            params = {key: meta[key] for key in ("if_seq_no", "if_primary_term") if key in meta}
+            try:
+                if index_name is None:
+                    raise _bad_request("index is missing")
+                if op_type in ("index", "create"):
+                    if op_type == "create":
+                        params["op_type"] = "create"
+                    status, result = self._index_document(index_name, doc_id, source, params)
+                elif op_type == "update":
+                    index = self._single_index(index_name, create=bool(source.get("upsert") or source.get("doc_as_upsert")))
+                    status, result = self._apply_update(index, doc_id, source, params)
+                elif op_type == "delete":
+                    status, result = self._document_api("DELETE", index_name, doc_id, params, {})
+                else:
+                    raise _bad_request(f"unknown bulk action [{op_type}]")
+                result = {**result, "status": status}
+                if status >= 400:
+                    errors = True
+            except FakeElasticsearchError as e:
+                errors = True
+                result = {"_index": index_name, "_type": "_doc", "_id": doc_id, "status": e.status,
+                          "error": {"type": e.error_type, "reason": e.reason, **e.extra}}
+            items.append({op_type: result})
+        return 200, {"took": 1, "errors": errors, "items": items}
+
+    def _reindex(self, body: Dict[str, Any]) -> Tuple[int, Any]:
+        source_spec = body.get("source", {})
+        dest = body.get("dest", {})
+        created = updated = 0
+        for index_name in self._resolve(",".join(_as_list(source_spec.get("index")))):
+            index = self.indices[index_name]
+            context = QueryContext(index, list(index.docs.values()), self.scripts)
+            query = source_spec.get("query", {"match_all": {}})
+            for document in list(context.docs):
+                if evaluate(query, document, context) is None:
+                    continue
+                ctx = {"_source": json.loads(json.dumps(document.source)), "_id": document.id, "op": "index"}
+                if "script" in body:
+                    self._run_script(body["script"], ctx)
+                    if ctx.get("op") in ("noop", "delete"):
+                        continue
+                status, _ = self._index_document(
+                    dest["index"], str(ctx["_id"]), ctx["_source"], {"op_type": dest.get("op_type", "index")}
+                )
+                if status == 201:
+                    created += 1
+                else:
+                    updated += 1
+        return 200, {"took": 1, "timed_out": False, "total": created + updated, "created": created,
+                     "updated": updated, "deleted": 0, "batches": 1, "noops": 0, "failures": []}
+
+    def _delete_by_query(self, target: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        deleted = 0
+        for index_name in self._resolve(target):
+            index = self.indices[index_name]
+            context = QueryContext(index, list(index.docs.values()), self.scripts)
+            for document in list(context.docs):
+                if evaluate(body.get("query", {"match_all": {}}), document, context) is not None:
+                    index.delete(document.id)
+                    deleted += 1
+        return 200, {"took": 1, "timed_out": False, "total": deleted, "deleted": deleted,
+                     "batches": 1, "version_conflicts": 0, "noops": 0, "failures": []}
+
+    # 검색 API ---------------------------------------------------------------
+
+    def _snapshot(self, target: Optional[str], body: Dict[str, Any]) -> Tuple[List[Tuple[FakeIndex, List[Document]]], Optional[str]]:
+        """검색 대상 (인덱스, 문서 목록) (PIT 검색이면 PIT를 열 때의 문서)"""
+        pit = body.get("pit")
+        if pit is not None:
+            if target:
+                raise _bad_request("[indices] cannot be used with point in time", "action_request_validation_exception")
+            snapshot = self._pits.get(pit["id"])
+            if snapshot is None:
+                raise FakeElasticsearchError(404, "search_context_missing_exception", f"No search context found for id [{pit['id']}]")
+            return snapshot, pit["id"]
+        return [(self.indices[name], list(self.indices[name].docs.values())) for name in self._resolve(target or "_all")], None
+
+    def _open_pit(self, target: str) -> Tuple[int, Any]:
+        snapshot = [(self.indices[name], list(self.indices[name].docs.values())) for name in self._resolve(target)]
+        pit_id = base64.urlsafe_b64encode(f"pit-{next(self._ids)}".encode()).decode()
+        self._pits[pit_id] = snapshot
+        return 200, {"id": pit_id}
+
+    def _close_pit(self, body: Dict[str, Any]) -> Tuple[int, Any]:
+        if self._pits.pop(body.get("id"), None) is None:
+            return 404, {"succeeded": True, "num_freed": 0}
+        return 200, {"succeeded": True, "num_freed": 1}
+
+    def _search_api(self, target: Optional[str], params: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any]:
+        for key in ("size", "from"):
+            if key in params:
+                body[key] = int(params[key])
+        if "track_total_hits" in params:
+            value = params["track_total_hits"]
+            body["track_total_hits"] = value == "true" if value in ("true", "false") else int(value)
+        body["_source"] = self._source_spec(params, body.get("_source"))
+
+        if "scroll" in params:
+            return 200, self._start_scroll(target, body)
+        return 200, self.search(target, body)
+
+    def search(self, target: Optional[str], body: Dict[str, Any], window: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+        """검색 실행 (window가 있으면 (from, size) 대신 사용)"""
+        start = time.perf_counter_ns()
+        snapshot, pit_id = self._snapshot(target, body)
+
+        query = body.get("query", {"match_all": {}})
+        offset = int(body.get("from", 0))
+        size = int(body.get("size", 10))
+        if window is not None:
+            offset, size = window
+        elif offset + size > MAX_RESULT_WINDOW:
+            raise _bad_request(
+                f"Result window is too large, from + size must be less than or equal to: [{MAX_RESULT_WINDOW}] "
+                f"but was [{offset + size}]."
+            )
+
+        sort_specs = _as_list(body.get("sort"))
+        first_index = snapshot[0][0] if snapshot else None
+        sort_fields = [SortField(spec, first_index) for spec in sort_specs]
+        if pit_id is not None and sort_fields and not any(field.field == "_shard_doc" for field in sort_fields):
+            # PIT 검색은 _shard_doc 순서를 마지막 정렬 기준으로 자동 추가
+            sort_fields.append(SortField("_shard_doc", first_index))
+
+        slice_spec = body.get("slice")
+        matches: List[Tuple[FakeIndex, Document, float, List[Any]]] = []
+        for index, docs in snapshot:
+            context = QueryContext(index, docs, self.scripts, snapshot=pit_id is not None)
+            for document in docs:
+                if slice_spec is not None and zlib.crc32(document.id.encode()) % int(slice_spec["max"]) != int(slice_spec["id"]):
+                    continue
+                score = evaluate(query, document, context)
+                if score is None:
+                    continue
+                keys = [sort_field.key(document, score) for sort_field in sort_fields]
+                matches.append((index, document, score, keys))
+
+        total = len(matches)
+        if body.get("min_score") is not None:
+            matches = [match for match in matches if match[2] >= float(body["min_score"])]
+
+        if sort_fields:
+            matches.sort(key=functools.cmp_to_key(
+                lambda left, right: _compare_keys(sort_fields, left[3], right[3]) or (left[1].order - right[1].order)
+            ))
+        else:
+            matches.sort(key=lambda match: (-match[2], match[1].order))
+
+        search_after = body.get("search_after")
+        if search_after is not None:
+            after = [
+                sort_field.convert(value) if value is not None and sort_field.field not in ("_score", "_doc", "_shard_doc") else value
+                for sort_field, value in zip(sort_fields, search_after)
+            ]
+            matches = [match for match in matches if _compare_keys(sort_fields, match[3], after) > 0]
+
+        collapse = body.get("collapse")
+        if collapse is not None:
+            seen = set()
+            collapsed = []
+            for match in matches:
+                value = next(iter(_as_list(_source_value(match[1].source, collapse["field"]))), None)
+                if value in seen:
+                    continue
+                seen.add(value)
+                collapsed.append(match)
+            matches = collapsed
+
+        aggregations = self._aggregate(body.get("aggs", body.get("aggregations")), matches)
+        page = matches[offset:offset + size]
+
+        score_tracked = not sort_fields or any(field.field == "_score" for field in sort_fields) or body.get("track_scores")
+        hits = []
+        for index, document, score, keys in page:
+            hit: Dict[str, Any] = {
+                "_index": index.name,
+                "_type": "_doc",
+                "_id": document.id,
+                "_score": score if score_tracked else None
+            }
+            source = _filter_source(document.source, body.get("_source"))
+            if source is not None:
+                hit["_source"] = source
+            if sort_fields:
+                hit["sort"] = [sort_field.response_value(key) for sort_field, key in zip(sort_fields, keys)]
+            if collapse is not None:
+                hit["fields"] = {collapse["field"]: _as_list(_source_value(document.source, collapse["field"]))[:1]}
+            if body.get("highlight"):
+                highlight = _highlight(body["highlight"], query, document, index)
+                if highlight:
+                    hit["highlight"] = highlight
+            if body.get("seq_no_primary_term"):
+                hit["_seq_no"], hit["_primary_term"] = document.seq_no, 1
+            hits.append(hit)
+
+        elapsed_nanos = time.perf_counter_ns() - start
+        hits_section: Dict[str, Any] = {
+            "max_score": max((match[2] for match in page), default=None) if score_tracked else None,
+            "hits": hits
+        }
+        track_total_hits = body.get("track_total_hits", MAX_RESULT_WINDOW)
+        if track_total_hits is not False:
+            limit = None if track_total_hits is True else int(track_total_hits)
+            if limit is not None and total > limit:
+                hits_section["total"] = {"value": limit, "relation": "gte"}
+            else:
+                hits_section["total"] = {"value": total, "relation": "eq"}
+
+        response: Dict[str, Any] = {
+            "took": elapsed_nanos // 1_000_000,
+            "timed_out": False,
+            "_shards": {"total": len(snapshot), "successful": len(snapshot), "skipped": 0, "failed": 0},
+            "hits": {key: hits_section[key] for key in ("total", "max_score", "hits") if key in hits_section}
+        }
+        if pit_id is not None:
+            response["pit_id"] = pit_id
+        if aggregations is not None:
+            response["aggregations"] = aggregations
+        if body.get("profile"):
+            response["profile"] = {"shards": [
+                {
+                    "id": f"[fake-node][{index.name}][0]",
+                    "searches": [{
+                        "query": [_profile_tree(query, elapsed_nanos)],
+                        "rewrite_time": 0,
+                        "collector": [{"name": "SimpleTopScoreDocCollector", "reason": "search_top_hits",
+                                       "time_in_nanos": 0}]
+                    }],
+                    "aggregations": []
+                }
+                for index, _ in snapshot
+            ]}
+        return response
+
+    def _aggregate(self, aggs: Optional[Dict[str, Any]], matches: List[Tuple[FakeIndex, Document, float, List[Any]]]) -> Optional[Dict[str, Any]]:
+        if not aggs:
+            return None
+        results = {}
+        for name, spec in aggs.items():
+            kind = next(key for key in spec if key not in ("aggs", "aggregations", "meta"))
+            options = spec[kind]
+            values: List[Any] = []
+            for index, document, _, _ in matches:
+                if "script" in options:
+                    value = self._run_script(options["script"], {"_source": document.source, "_id": document.id})
+                    values.extend(_as_list(value))
+                else:
+                    info = index.field(options["field"])
+                    path = info.values_path if info else options["field"]
+                    for value in _as_list(_source_value(document.source, path)):
+                        values.append(_parse_date(value) if info is not None and info.type == "date" else value)
+
+            if kind in ("max", "min", "sum", "avg"):
+                numbers = [float(value) for value in values]
+                if kind == "sum":
+                    result: Any = sum(numbers)
+                elif not numbers:
+                    result = None
+                elif kind == "avg":
+                    result = sum(numbers) / len(numbers)
+                else:
+                    result = max(numbers) if kind == "max" else min(numbers)
+                results[name] = {"value": result}
+            elif kind == "value_count":
+                results[name] = {"value": len(values)}
+            elif kind == "terms":
+                counts = Counter(values)
+                buckets = sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))[:int(options.get("size", 10))]
+                results[name] = {
+                    "doc_count_error_upper_bound": 0,
+                    "sum_other_doc_count": sum(counts.values()) - sum(count for _, count in buckets),
+                    "buckets": [{"key": key, "doc_count": count} for key, count in buckets]
+                }
+            else:
+                raise _bad_request(f"unsupported aggregation [{kind}]", "parsing_exception")
+        return results
+
+    def _count(self, target: Optional[str], body: Dict[str, Any]) -> Tuple[int, Any]:
+        count = 0
+        names = self._resolve(target or "_all")
+        for name in names:
+            index = self.indices[name]
+            context = QueryContext(index, list(index.docs.values()), self.scripts)
+            query = body.get("query", {"match_all": {}})
+            count += sum(1 for document in context.docs if evaluate(query, document, context) is not None)
+        return 200, {"count": count, "_shards": {"total": len(names), "successful": len(names), "skipped": 0, "failed": 0}}
+
+    def _msearch(self, target: Optional[str], params: Dict[str, str], raw: Optional[bytes]) -> Tuple[int, Any]:
+        lines = [line for line in (raw or b"").decode("utf-8").split("\n") if line.strip()]
+        responses = []
+        for header_line, body_line in zip(lines[0::2], lines[1::2]):
+            header = json.loads(header_line)
+            index_expression = header.get("index", target)
+            if isinstance(index_expression, list):
+                index_expression = ",".join(index_expression)
+            try:
+                response = self.search(index_expression, json.loads(body_line))
+                responses.append({**response, "status": 200})
+            except FakeElasticsearchError as e:
+                responses.append({**e.to_body()})
+        return 200, {"took": 1, "responses": responses}
+
+    def _start_scroll(self, target: Optional[str], body: Dict[str, Any]) -> Dict[str, Any]:
+        size = int(body.get("size", 10))
+        everything = self.search(target, body, window=(0, MAX_RESULT_WINDOW * 100))
+        scroll_id = base64.urlsafe_b64encode(f"scroll-{next(self._ids)}".encode()).decode()
+        hits = everything["hits"]["hits"]
+        self._scrolls[scroll_id] = (hits, size, size, everything["hits"].get("total", {}))
+        return {**everything, "_scroll_id": scroll_id, "hits": {**everything["hits"], "hits": hits[:size]}}
+
+    def _scroll_api(self, method: str, params: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any]:
+        if method == "DELETE":
+            scroll_ids = _as_list(body.get("scroll_id")) or _as_list(params.get("scroll_id"))
+            freed = sum(1 for scroll_id in scroll_ids if self._scrolls.pop(scroll_id, None) is not None)
+            return (200 if freed else 404), {"succeeded": True, "num_freed": freed}
+
+        scroll_id = body.get("scroll_id") or params.get("scroll_id")
+        state = self._scrolls.get(scroll_id)
+        if state is None:
+            raise FakeElasticsearchError(404, "search_context_missing_exception", f"No search context found for id [{scroll_id}]")
+        hits, size, position, total = state
+        self._scrolls[scroll_id] = (hits, size, position + size, total)
+        return 200, {
+            "_scroll_id": scroll_id,
+            "took": 0,
+            "timed_out": False,
+            "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+            "hits": {"total": total, "max_score": None, "hits": hits[position:position + size]}
+        }
+
+
+def _merge(target: Dict[str, Any], changes: Dict[str, Any]):
+    """부분 문서 병합 (객체는 재귀 병합)"""
+    for key, value in changes.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+
+def _query_texts(query: Any, found: List[Tuple[str, Any]]):
+    """하이라이트용 (필드, 검색어) 목록 수집"""
+    if isinstance(query, list):
+        for item in query:
+            _query_texts(item, found)
+        return
+    if not isinstance(query, dict):
+        return
+    for kind, spec in query.items():
+        if kind in ("match", "match_phrase", "match_phrase_prefix", "term", "prefix") and isinstance(spec, dict):
+            for field, value in spec.items():
+                if field in ("boost", "_name"):
+                    continue
+                text = value.get("query", value.get("value")) if isinstance(value, dict) else value
+                found.append((field, text))
+        elif kind == "terms" and isinstance(spec, dict):
+            for field, values in spec.items():
+                if field != "boost":
+                    found.extend((field, value) for value in _as_list(values))
+        elif kind == "multi_match" and isinstance(spec, dict):
+            for name in spec.get("fields", []):
+                found.append((_parse_field_boost(name)[0], spec.get("query")))
+        elif isinstance(spec, (dict, list)):
+            _query_texts(spec, found)
+
+
+def _highlight(spec: Dict[str, Any], query: Dict[str, Any], document: Document, index: FakeIndex) -> Dict[str, List[str]]:
+    """하이라이트 (검색어 토큰이 나타나는 부분을 태그로 감싼 필드 값 전체)"""
+    texts: List[Tuple[str, Any]] = []
+    _query_texts(query, texts)
+
+    result = {}
+    for field_name, options in spec.get("fields", {}).items():
+        options = options or {}
+        pre_tag = _as_list(options.get("pre_tags", spec.get("pre_tags", ["<em>"])))[0]
+        post_tag = _as_list(options.get("post_tags", spec.get("post_tags", ["</em>"])))[0]
+        info = index.field(field_name)
+        base = info.values_path if info else field_name
+
+        tokens = set()
+        for queried_field, text in texts:
+            queried = index.field(queried_field)
+            if text is None or (queried.values_path if queried else queried_field) != base:
+                continue
+            analyzer = index.analyzer(queried.search_analyzer) if queried and queried.is_text else _BUILTIN_ANALYZERS["keyword"]
+            tokens.update(token for token in analyzer(text) if token)
+        if not tokens:
+            continue
+
+        pattern = re.compile("|".join(re.escape(token) for token in sorted(tokens, key=len, reverse=True)), re.IGNORECASE)
+        fragments = []
+        for value in _as_list(_source_value(document.source, base)):
+            text = str(value)
+            highlighted = pattern.sub(lambda match: f"{pre_tag}{match.group(0)}{post_tag}", text)
+            if highlighted != text:
+                fragments.append(highlighted)
+        if fragments:
+            result[field_name] = fragments
+    return result
+
+
+# ---------------------------------------------------------------------------
+# HTTP 서버
+# ---------------------------------------------------------------------------
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """elasticsearch-py 요청을 FakeElasticsearch로 전달하는 HTTP 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+    server: "FakeElasticsearchServer"
+
+    def _handle(self):
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query, keep_blank_values=True).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+
+        latency_ms = self.server.latency_for(self.command, url.path)
+        if latency_ms > 0:
+            time.sleep(latency_ms / 1000)
+
+        status, response = self.server.backend.handle(self.command, url.path, params, body)
+        if isinstance(response, dict) and "took" in response and latency_ms > 0:
+            # 주입한 지연은 Elasticsearch 내부 처리 시간으로 간주
+            response["took"] += int(latency_ms)
+        payload = b"" if response is None else json.dumps(response, ensure_ascii=False).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("X-Elastic-Product", "Elasticsearch")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _handle
+
+    def log_message(self, format: str, *args: Any):
+        # 요청마다 stderr에 기록하지 않음
+        pass
+
+
+class FakeElasticsearchServer(ThreadingHTTPServer):
+    """
+    가짜 Elasticsearch HTTP 서버 (백그라운드 스레드에서 실행)
+
+    Args:
+        host (str): 바인드 주소
+        port (int): 포트 (0이면 빈 포트 자동 선택)
+        latency_ms: 요청마다 추가할 지연 시간(ms) 또는 (method, path) -> ms 함수
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: Union[float, Callable[[str, str], float]] = 0.0
+    ):
+        super().__init__((host, port), _RequestHandler)
+        self.backend = FakeElasticsearch()
+        self.latency_ms = latency_ms
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return self.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def latency_for(self, method: str, path: str) -> float:
+        latency = self.latency_ms
+        return float(latency(method, path) if callable(latency) else latency)
+
+    def register_script(self, source: str, function: ScriptFunction):
+        self.backend.register_script(source, function)
+
+    def reset(self):
+        self.backend.reset()
+
+    def start(self) -> "FakeElasticsearchServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="fake-elasticsearch", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+def register_app_scripts(server: FakeElasticsearchServer):
+    """
+    앱이 사용하는 painless 스크립트를 Python 함수로 등록
+
+    앱 모듈을 임포트하므로 Elasticsearch 접속 설정을 이 서버로 바꾼 뒤 호출해야 합니다.
+    """
+    from app.domain.trademark.index.migrate_document_ids import REINDEX_ID_SCRIPT
+    from app.domain.trademark.services import pid_utils
+    from app.domain.trademark.services.delta_ingest import DELTA_UPSERT_SCRIPT
+    from app.domain.trademark.services.view_count_service import INCREMENT_SCRIPT
+
+    def increment_view_count(ctx: Dict[str, Any], params: Dict[str, Any]):
+        source = ctx["_source"]
+        source["viewCount"] = (source.get("viewCount") or 0) + params["n"]
+
+    def replace_keeping_view_count(ctx: Dict[str, Any], params: Dict[str, Any]):
+        view_count = ctx["_source"].get("viewCount")
+        ctx["_source"] = dict(params["doc"])
+        if view_count is not None:
+            ctx["_source"]["viewCount"] = view_count
+
+    def application_number_id(ctx: Dict[str, Any], params: Dict[str, Any]):
+        source = ctx["_source"]
+        if source.get("applicationNumber") is not None:
+            ctx["_id"] = source["applicationNumber"]
+        elif source.get("pid") is not None:
+            ctx["_id"] = source["pid"]
+
+    def numeric_pid(ctx: Dict[str, Any], params: Dict[str, Any]) -> int:
+        pid = ctx["_source"].get("pid")
+        try:
+            return int(pid) if pid is not None else 0
+        except ValueError:
+            return 0
+
+    server.register_script(INCREMENT_SCRIPT, increment_view_count)
+    server.register_script(DELTA_UPSERT_SCRIPT, replace_keeping_view_count)
+    server.register_script(REINDEX_ID_SCRIPT, application_number_id)
+    server.register_script(pid_utils._MAX_NUMERIC_PID_SCRIPT, numeric_pid)
+
+
+def start_fake_elasticsearch(latency_ms: Union[float, Callable[[str, str], float]] = 0.0) -> FakeElasticsearchServer:
+    """
+    가짜 Elasticsearch 서버를 시작하고 앱 설정(ELASTICSEARCH_HOST/PORT)을 이 서버로 변경
+
+    app.core.elasticsearch의 클라이언트(LazyElasticsearch, 비동기 클라이언트)는 처음 사용할 때
+    설정값으로 접속하므로, Elasticsearch를 처음 사용하기 전(앱 시작, 첫 요청 전)에 호출하면 됩니다.
+    설정은 현재 프로세스에서만 바뀌므로 다른 프로세스에서는 이 서버에 접속하지 않습니다.
+    """
+    from app.core.config import settings
+
+    server = FakeElasticsearchServer(latency_ms=latency_ms).start()
+    settings.ELASTICSEARCH_HOST = server.host
+    settings.ELASTICSEARCH_PORT = server.port
+    register_app_scripts(server)
+    return server
@@ -8,6 +8,8 @@ import json
 import time
 from fastapi import status
 
+from app.core.config import settings
+
 # 테스트용 더미 데이터 세트
 TEST_DATA = [
     {
@@ -89,6 +91,89 @@ async def test_status_endpoint(test_client):
     assert "elasticsearch" in data
     assert "index" in data
 
+@pytest.mark.asyncio
+async def test_request_id_header(test_client):
+    """요청 ID/처리 시간 헤더 테스트"""
+    response = test_client.get("/")
+    assert len(response.headers["X-Request-ID"]) == 32
+    assert float(response.headers["X-Process-Time"]) >= 0
+    
+    # 올바른 형식의 요청 ID는 그대로 전달
+    response = test_client.get("/", headers={"X-Request-ID": "trace-123"})
+    assert response.headers["X-Request-ID"] == "trace-123"
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(test_client, setup_test_data):
+    """Prometheus 지표 엔드포인트 테스트"""
+    setup_test_data()
+    test_client.get("/api/trademarks/?query=테스트")
+    
+    response = test_client.get("/metrics")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    
+    # 라우트 템플릿 라벨로 요청/단계 지표 기록
+    body = response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/trademarks/"}' in body
+    assert 'route="/api/trademarks/",stage="es_round_trip"' in body
+    assert 'route="/api/trademarks/",stage="serialization"' in body
+    assert "trademark_cache_requests_total" in body
+
+@pytest.mark.asyncio
+async def test_profile_report(test_client, setup_test_data, monkeypatch):
+    """관리자 요청 프로파일링 테스트"""
+    setup_test_data()
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "test-admin-token")
+    admin_headers = {"X-Admin-Token": "test-admin-token"}
+    
+    # 관리자 토큰 없이 요청하면 프로파일링하지 않음
+    response = test_client.get("/api/trademarks/?query=테스트&profile=true")
+    assert "X-Profile-Report" not in response.headers
+    
+    response = test_client.get("/api/trademarks/?query=테스트", headers={**admin_headers, "X-Profile": "true"})
+    assert response.status_code == status.HTTP_200_OK
+    request_id = response.headers["X-Request-ID"]
+    assert response.headers["X-Profile-Report"] == f"/admin/profiles/{request_id}"
+    
+    # Python 함수별 시간, 단계별 시간, Elasticsearch 샤드별 프로파일
+    report = test_client.get(f"/admin/profiles/{request_id}", headers=admin_headers).json()
+    assert report["status"] == 200
+    assert report["python"]["functions"]
+    assert {stage["stage"] for stage in report["stages"]} >= {"query_build", "es_round_trip", "serialization"}
+    assert report["elasticsearch"][0]["shards"][0]["searches"][0]["query"]
+    
+    # 관리자 토큰 없이 보고서 조회 불가
+    assert test_client.get(f"/admin/profiles/{request_id}").status_code == status.HTTP_403_FORBIDDEN
+    assert test_client.get("/admin/profiles/unknown", headers=admin_headers).status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.asyncio
+async def test_slow_query_report(test_client, setup_test_data, monkeypatch):
+    """쿼리 지문별 느린 쿼리 통계 테스트"""
+    setup_test_data()
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "test-admin-token")
+    monkeypatch.setattr(settings, "SEARCH_CACHE_ENABLED", False)
+    admin_headers = {"X-Admin-Token": "test-admin-token"}
+    test_client.delete("/admin/slow-queries", headers=admin_headers)
+    
+    # 검색어만 다른 검색은 같은 지문, 초성 전용 검색은 다른 지문
+    for query in ["테스트", "등록", "ㅌㅅㅌ"]:
+        test_client.get(f"/api/trademarks/?query={query}")
+    
+    response = test_client.get("/admin/slow-queries", headers=admin_headers)
+    assert response.status_code == status.HTTP_200_OK
+    queries = response.json()["queries"]
+    assert sorted(item["count"] for item in queries) == [1, 2]
+    
+    stats = next(item for item in queries if item["count"] == 2)
+    assert stats["wall_ms"]["p50"] <= stats["wall_ms"]["p99"]
+    assert stats["took_ms"] is not None
+    assert stats["routes"] == {"/api/trademarks/": 2}
+    assert stats["example"]["body"]["query"]
+    assert stats["example"]["index"] == settings.ELASTICSEARCH_INDEX
+    assert "테스트" not in str(stats["shape"])
+    
+    assert test_client.get("/admin/slow-queries").status_code == status.HTTP_403_FORBIDDEN
+
 @pytest.mark.asyncio
 async def test_search_empty(test_client, create_test_index):
     """빈 검색 결과 테스트"""
@@ -256,6 +341,48 @@ async def test_search_invalid_parameters(test_client):
     response = test_client.get("/api/trademarks/search?size=1000")
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
+@pytest.mark.asyncio
+async def test_search_cursor_pagination(test_client, setup_test_data):
+    """커서 페이지네이션 테스트"""
+    setup_test_data()
+    
+    response = test_client.get("/api/trademarks/?size=3&cursor=*")
+    assert response.status_code == status.HTTP_200_OK
+    
+    data = response.json()
+    assert data["total"] == 4
+    assert len(data["results"]) == 3
+    assert data["next_cursor"]
+    
+    # 다음 페이지 (마지막 페이지이므로 next_cursor 없음)
+    response = test_client.get("/api/trademarks/", params={"size": 3, "cursor": data["next_cursor"]})
+    assert response.status_code == status.HTTP_200_OK
+    
+    data = response.json()
+    assert len(data["results"]) == 1
+    assert data["page"] == 2
+    assert data["next_cursor"] is None
+    
+    # 잘못된 커서
+    response = test_client.get("/api/trademarks/?cursor=invalid")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+@pytest.mark.asyncio
+async def test_export_endpoint(test_client, setup_test_data):
+    """내보내기 엔드포인트는 조건에 맞는 전체 상표를 NDJSON으로 스트리밍"""
+    setup_test_data()
+    
+    response = test_client.get("/api/trademarks/export?fields=applicationNumber")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 4
+    assert all(set(line) <= {"applicationNumber"} for line in lines)
+    
+    response = test_client.get("/api/trademarks/export?format=xml")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
 @pytest.mark.asyncio
 async def test_search_no_results(test_client, setup_test_data):
     """검색 결과 없음 테스트"""
@@ -270,8 +397,10 @@ async def test_search_no_results(test_client, setup_test_data):
     assert data["results"] == []
 
 @pytest.mark.asyncio
-async def test_load_data_endpoint(test_client, tmp_path):
-    """데이터 로드 엔드포인트 테스트"""
+async def test_load_data_endpoint(test_client, tmp_path, monkeypatch):
+    """데이터 로드 엔드포인트는 백그라운드 작업을 시작하고 작업 상태를 바로 반환"""
+    monkeypatch.setattr(settings, "INGEST_JOB_DIR", str(tmp_path / "jobs"))
+    
     # 임시 JSON 파일 생성
     test_data = [{"productName": "테스트", "applicationNumber": "40-2023-0000001"}]
     test_file = tmp_path / "test_data.json"
@@ -281,9 +410,30 @@ async def test_load_data_endpoint(test_client, tmp_path):
     
     # 데이터 로드 테스트
     response = test_client.post(f"/api/trademarks/load-data?file_path={test_file}")
-    assert response.status_code == status.HTTP_200_OK
-    
-    data = response.json()
-    assert "message" in data
-    assert data["success"] == 1
-    assert isinstance(data["failed"], (int, list))
\ No newline at end of file
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    job_id = response.json()["job_id"]
+    
+    # 작업이 끝날 때까지 대기
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        data = test_client.get(f"/api/trademarks/load-data/jobs/{job_id}").json()
+        if data["status"] not in ("pending", "running"):
+            break
+        time.sleep(0.1)
+    
+    assert data["status"] == "completed"
+    assert data["result"]["success"] == 1
+    assert data["result"]["failed"] == 0
+@pytest.mark.asyncio
+async def test_load_job_endpoints(test_client, tmp_path):
+    """백그라운드 적재 작업 엔드포인트 테스트"""
+    # 존재하지 않는 파일
+    response = test_client.post(f"/api/trademarks/load-data/jobs?file_path={tmp_path / 'missing.json'}")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    
+    # 존재하지 않는 작업
+    response = test_client.get("/api/trademarks/load-data/jobs/missingjob")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    
+    response = test_client.post("/api/trademarks/load-data/jobs/missingjob/cancel")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,137 @@
+"""
+메모리 자동완성 인덱스 테스트 모듈
+"""
+import time
+
+import pytest
+
+from app.domain.trademark.services.autocomplete_index import AutocompleteIndex
+from app.domain.trademark.services.autocomplete_service import get_autocomplete_suggestions
+from app.domain.trademark.services.search_cache import search_cache
+from app.domain.trademark.services.chosung_utils import extract_chosung
+
+RECORDS = [
+    {"productName": "프레스카", "productNameEng": "FRESCA", "viewCount": 3},
+    {"productName": "프레시안", "productNameEng": "PRESSIAN", "viewCount": 10},
+    {"productName": "간호사 타이쿤", "productNameEng": None, "viewCount": 0},
+    {"productName": "프레스카", "productNameEng": "FRESCA", "viewCount": 2},
+    {"productName": None, "productNameEng": "C Fresh", "viewCount": 0}
+]
+
+@pytest.fixture
+def index():
+    """샘플 레코드로 빌드한 자동완성 인덱스"""
+    records = []
+    for record in RECORDS:
+        record = dict(record)
+        if record["productName"]:
+            record["productName_chosung"] = extract_chosung(record["productName"])
+        records.append(record)
+
+    autocomplete = AutocompleteIndex()
+    autocomplete.build(records, "trademarks_test", search_cache.generation)
+    return autocomplete
+
+def test_prefix_match(index):
+    """상표명 접두사 일치 및 하이라이트"""
+    suggestions = index.suggest("프레스", 10)
+
+    assert [s.text for s in suggestions] == ["프레스카"]
+    assert suggestions[0].highlight == {"productName": ["<mark>프레스</mark>카"]}
+
+def test_duplicate_names_are_merged(index):
+    """같은 상표명/영문명 조합은 한 번만 제안"""
+    suggestions = index.suggest("프레", 10)
+
+    assert sorted(s.text for s in suggestions) == ["프레스카", "프레시안"]
+
+def test_chosung_match(index):
+    """초성 접두사 일치"""
+    suggestions = index.suggest("ㄱㅎㅅ", 10)
+
+    assert suggestions[0].text == "간호사 타이쿤"
+    assert "productName_chosung" in suggestions[0].highlight
+
+def test_word_start_and_english_match(index):
+    """중간 단어 시작 일치 및 대소문자 무시 영문 일치"""
+    assert index.suggest("타이", 10)[0].text == "간호사 타이쿤"
+
+    english = [s.text for s in index.suggest("fres", 10)]
+    assert english[0] == "프레스카"
+    assert "C Fresh" in english
+
+def test_size_limit_and_view_count_tiebreak(index):
+    """size 제한, 같은 점수면 조회수가 높은 상표 우선"""
+    suggestions = index.suggest("ㅍ", 1)
+
+    assert len(suggestions) == 1
+    assert suggestions[0].text == "프레시안"
+
+def test_no_match(index):
+    """일치하는 키가 없으면 빈 목록"""
+    assert index.suggest("없는상표", 10) == []
+    assert index.suggest("   ", 10) == []
+
+def test_not_ready_after_generation_change(index):
+    """데이터가 바뀌면(세대 변경) 다시 빌드하기 전까지 사용하지 않음"""
+    assert index.is_ready("trademarks_test")
+    assert not index.is_ready("other_index")
+
+    search_cache.bump_generation()
+
+    assert not index.is_ready("trademarks_test")
+
+def test_expires_after_ttl(index, monkeypatch):
+    """유효 시간이 지나면 만료되어 사용하지 않음 (0이면 만료 없음)"""
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "AUTOCOMPLETE_INDEX_TTL", 0)
+    assert index.is_ready("trademarks_test")
+    assert not index.is_expired("trademarks_test")
+
+    monkeypatch.setattr(settings, "AUTOCOMPLETE_INDEX_TTL", 0.01)
+    time.sleep(0.02)
+
+    assert index.is_expired("trademarks_test")
+    assert not index.is_ready("trademarks_test")
+    assert not index.is_expired("other_index")
+
+@pytest.mark.asyncio
+async def test_service_rebuilds_expired_index(create_test_index, index_test_data, monkeypatch):
+    """다른 워커가 바꾼 데이터도 만료 후에는 Elasticsearch로 조회하고 백그라운드에서 재빌드"""
+    from app.core.config import settings
+    from app.domain.trademark.services.autocomplete_index import autocomplete_index
+
+    create_test_index()
+    index_test_data({"productName": "프레스카", "productNameEng": "FRESCA", "applicationNumber": "4019950043843"})
+    autocomplete_index.rebuild(settings.ELASTICSEARCH_INDEX)
+
+    # 검색 캐시 세대를 바꾸지 않는 변경 (다른 워커의 적재)
+    index_test_data({"productName": "프레시안", "productNameEng": "PRESSIAN", "applicationNumber": "4020200000001"})
+    monkeypatch.setattr(settings, "AUTOCOMPLETE_INDEX_TTL", 0.01)
+    time.sleep(0.02)
+
+    result = await get_autocomplete_suggestions("프레", 10)
+    assert sorted(s.text for s in result.suggestions) == ["프레스카", "프레시안"]
+
+    # 재빌드가 끝나면 메모리 인덱스에도 반영됨
+    deadline = time.time() + 10
+    while len(autocomplete_index.suggest("프레", 10)) < 2 and time.time() < deadline:
+        time.sleep(0.05)
+
+    assert sorted(s.text for s in autocomplete_index.suggest("프레", 10)) == ["프레스카", "프레시안"]
+
+@pytest.mark.asyncio
+async def test_service_uses_memory_index(create_test_index, index_test_data):
+    """재빌드 후 자동완성 서비스가 메모리 인덱스 결과를 반환"""
+    from app.core.config import settings
+    from app.domain.trademark.services.autocomplete_index import autocomplete_index
+
+    create_test_index()
+    index_test_data({"productName": "프레스카", "productNameEng": "FRESCA", "applicationNumber": "4019950043843"})
+    autocomplete_index.rebuild(settings.ELASTICSEARCH_INDEX)
+
+    result = await get_autocomplete_suggestions("프레", 10)
+
+    assert result.total == 1
+    assert result.suggestions[0].highlight == {"productName": ["<mark>프레</mark>스카"]}
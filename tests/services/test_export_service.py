@@ -0,0 +1,122 @@
+"""
+검색 결과 내보내기 테스트 모듈
+"""
+import csv
+import io
+import json
+
+import pytest
+from elasticsearch import TransportError
+
+from app.core.elasticsearch import get_async_es_client
+from app.domain.trademark.services.export_service import open_export, resolve_export_fields, EXPORT_FIELDS
+from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams
+from app.core.exceptions import InvalidParameterError, IndexNotFoundError
+from app.core.config import settings
+
+async def read_all(body) -> str:
+    return "".join([chunk async for chunk in body])
+
+def test_resolve_export_fields():
+    """필드 목록 검증 (기본값은 전체 필드)"""
+    assert resolve_export_fields(None) == EXPORT_FIELDS
+    assert resolve_export_fields("pid, productName") == ["pid", "productName"]
+
+    with pytest.raises(InvalidParameterError):
+        resolve_export_fields("pid,unknownField")
+
+@pytest.mark.asyncio
+async def test_export_ndjson_all_slices(create_test_index, index_test_data):
+    """여러 slice와 배치로 나누어도 조건에 맞는 모든 문서를 한 번씩 내보냄"""
+    create_test_index()
+    for i in range(12):
+        index_test_data({"pid": f"pid_{i}", "productName": f"내보내기 {i}", "registerStatus": "등록"}, refresh=False)
+    index_test_data({"pid": "pid_x", "productName": "출원 상표", "registerStatus": "출원"})
+
+    original = settings.EXPORT_SLICES, settings.EXPORT_BATCH_SIZE
+    settings.EXPORT_SLICES, settings.EXPORT_BATCH_SIZE = 2, 5
+    try:
+        body = await open_export(TrademarkSearchParams(status="등록"), "ndjson", ["pid"])
+        lines = (await read_all(body)).splitlines()
+    finally:
+        settings.EXPORT_SLICES, settings.EXPORT_BATCH_SIZE = original
+
+    pids = sorted(json.loads(line)["pid"] for line in lines)
+    assert pids == sorted(f"pid_{i}" for i in range(12))
+
+@pytest.mark.asyncio
+async def test_export_csv(create_test_index, index_test_data):
+    """CSV는 헤더와 리스트 필드('|' 연결)를 포함"""
+    create_test_index()
+    index_test_data({"pid": "pid_1", "productName": "쉼표, 상표", "asignProductMainCodeList": ["35", "42"]})
+
+    body = await open_export(TrademarkSearchParams(), "csv", ["pid", "productName", "asignProductMainCodeList"])
+    rows = list(csv.reader(io.StringIO((await read_all(body)).lstrip("\ufeff"))))
+
+    assert rows == [
+        ["pid", "productName", "asignProductMainCodeList"],
+        ["pid_1", "쉼표, 상표", "35|42"]
+    ]
+
+@pytest.mark.asyncio
+async def test_export_index_not_found():
+    """인덱스가 없으면 스트리밍 전에 IndexNotFoundError"""
+    with pytest.raises(IndexNotFoundError):
+        await open_export(TrademarkSearchParams(), "ndjson", ["pid"])
+
+@pytest.mark.asyncio
+async def test_export_slice_failure_aborts_stream(create_test_index, index_test_data, monkeypatch):
+    """스트리밍 중 slice 하나가 실패하면 스트림이 정상 종료되지 않고 오류 발생"""
+    create_test_index()
+    for i in range(6):
+        index_test_data({"pid": f"pid_{i}", "productName": f"내보내기 {i}"}, refresh=False)
+    index_test_data({"pid": "pid_6", "productName": "내보내기 6"})
+
+    client = get_async_es_client()
+    search = client.search
+
+    async def failing_search(*args, body=None, **kwargs):
+        if body.get("slice", {}).get("id") == 1:
+            raise TransportError(500, "search_phase_execution_exception")
+        return await search(*args, body=body, **kwargs)
+
+    monkeypatch.setattr(client, "search", failing_search)
+    monkeypatch.setattr(settings, "EXPORT_SLICES", 2)
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+
+    body = await open_export(TrademarkSearchParams(), "ndjson", ["pid"])
+    with pytest.raises(TransportError):
+        await read_all(body)
+
+@pytest.mark.asyncio
+async def test_export_closes_pit_when_not_fully_read(create_test_index, index_test_data, monkeypatch):
+    """본문을 읽지 않거나 CSV 헤더만 읽고 닫아도 PIT를 한 번만 닫음"""
+    create_test_index()
+    index_test_data({"pid": "pid_1", "productName": "내보내기"})
+
+    client = get_async_es_client()
+    close_point_in_time = client.close_point_in_time
+    closed = []
+
+    async def tracking_close(*args, body=None, **kwargs):
+        closed.append(body["id"])
+        return await close_point_in_time(*args, body=body, **kwargs)
+
+    monkeypatch.setattr(client, "close_point_in_time", tracking_close)
+
+    # 응답을 시작하기 전에 연결이 끊긴 경우
+    body = await open_export(TrademarkSearchParams(), "ndjson", ["pid"])
+    await body.aclose()
+    assert len(closed) == 1
+
+    # CSV 헤더만 전송하고 끊긴 경우
+    body = await open_export(TrademarkSearchParams(), "csv", ["pid"])
+    assert (await body.__anext__()).startswith("\ufeff")
+    await body.aclose()
+    assert len(closed) == 2
+
+    # 끝까지 읽으면 닫고, 응답 후 aclose()를 다시 호출해도 중복으로 닫지 않음
+    body = await open_export(TrademarkSearchParams(), "ndjson", ["pid"])
+    await read_all(body)
+    await body.aclose()
+    assert len(closed) == 3
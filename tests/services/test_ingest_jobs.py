@@ -0,0 +1,193 @@
+"""
+백그라운드 데이터 적재 작업 테스트 모듈
+"""
+import pytest
+import json
+import time
+
+from app.core.config import settings
+from app.core.elasticsearch import es_client
+from app.core.exceptions import IngestJobNotFoundError, IngestJobConflictError
+from app.domain.trademark.services.ingest_jobs import IngestJob, IngestJobManager, JOB_COMPLETED, JOB_FAILED
+
+def wait_for_job(manager, job_id, timeout=30):
+    """작업이 끝날 때까지 대기"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.get(job_id)
+        if job.status not in ("pending", "running"):
+            return job
+        time.sleep(0.1)
+    raise TimeoutError(job_id)
+
+def write_ndjson(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+@pytest.fixture
+def job_manager(tmp_path, monkeypatch):
+    """체크포인트를 임시 디렉토리에 기록하는 작업 관리자"""
+    monkeypatch.setattr(settings, "INGEST_JOB_DIR", str(tmp_path / "jobs"))
+    monkeypatch.setattr(settings, "DB_INIT_MODE", "update")
+    manager = IngestJobManager()
+    yield manager
+    manager.shutdown()
+
+def test_ingest_job_completes(tmp_path, job_manager, create_test_index):
+    """적재 작업 완료 및 진행 상황 테스트"""
+    create_test_index()
+
+    records = [
+        {"productName": f"작업 상표{i}", "applicationNumber": f"40-2023-000000{i}"}
+        for i in range(3)
+    ]
+    test_file = tmp_path / "job_data.ndjson"
+    write_ndjson(test_file, records)
+
+    job = job_manager.start(str(test_file))
+    job = wait_for_job(job_manager, job.job_id)
+    status = job.to_dict()
+
+    assert status["status"] == JOB_COMPLETED
+    assert status["processed"] == 3
+    assert status["failed"] == 0
+    assert status["progress"] == 1.0
+    assert status["result"]["success"] == 3
+
+def test_ingest_job_resume_from_checkpoint(tmp_path, job_manager, create_test_index):
+    """실패한 작업을 체크포인트 오프셋부터 이어서 적재하는지 테스트"""
+    create_test_index()
+
+    records = [
+        {"productName": f"재개 상표{i}", "applicationNumber": f"40-2023-100000{i}"}
+        for i in range(3)
+    ]
+    test_file = tmp_path / "resume_data.ndjson"
+    write_ndjson(test_file, records)
+
+    # 첫 번째 레코드까지 처리하고 실패한 작업의 체크포인트
+    first_line_bytes = len((json.dumps(records[0], ensure_ascii=False) + "\n").encode("utf-8"))
+    checkpoint_dir = tmp_path / "jobs"
+    checkpoint_dir.mkdir()
+    with open(checkpoint_dir / "resumejob.json", "w", encoding="utf-8") as f:
+        json.dump({
+            "job_id": "resumejob",
+            "file_path": str(test_file),
+            "mode": "update",
+            "status": JOB_FAILED,
+            "offset": first_line_bytes,
+            "processed": 1,
+            "failed": 0,
+            "index": None
+        }, f)
+
+    job_manager.resume("resumejob")
+    job = wait_for_job(job_manager, "resumejob")
+
+    assert job.status == JOB_COMPLETED
+    assert job.processed == 3
+
+    # 남은 두 레코드만 적재
+    es_client.indices.refresh(index=settings.ELASTICSEARCH_INDEX)
+    assert es_client.count(index=settings.ELASTICSEARCH_INDEX)["count"] == 2
+
+    # 완료된 작업은 다시 재개할 수 없음
+    with pytest.raises(IngestJobConflictError):
+        job_manager.resume("resumejob")
+
+def test_ingest_job_resume_without_index_restarts(tmp_path, job_manager, monkeypatch):
+    """create 모드 작업의 새 버전 인덱스가 삭제된 뒤 재개하면 처음부터 다시 적재"""
+    from app.domain.trademark.index.index_versions import create_index_version, get_alias_targets
+
+    monkeypatch.setattr(settings, "DB_INIT_MODE", "create")
+    alias = settings.ELASTICSEARCH_INDEX
+
+    records = [
+        {"productName": f"재적재 상표{i}", "applicationNumber": f"40-2023-200000{i}"}
+        for i in range(3)
+    ]
+    test_file = tmp_path / "restart_data.ndjson"
+    write_ndjson(test_file, records)
+
+    # 첫 번째 레코드까지 적재하고 실패한 작업의 인덱스를 삭제
+    job_index = create_index_version(alias)
+    es_client.indices.delete(index=job_index)
+    first_line_bytes = len((json.dumps(records[0], ensure_ascii=False) + "\n").encode("utf-8"))
+    checkpoint_dir = tmp_path / "jobs"
+    checkpoint_dir.mkdir()
+    with open(checkpoint_dir / "restartjob.json", "w", encoding="utf-8") as f:
+        json.dump({
+            "job_id": "restartjob",
+            "file_path": str(test_file),
+            "mode": "create",
+            "status": JOB_FAILED,
+            "offset": first_line_bytes,
+            "processed": 1,
+            "failed": 0,
+            "index": job_index
+        }, f)
+
+    job_manager.resume("restartjob")
+    job = wait_for_job(job_manager, "restartjob")
+
+    assert job.status == JOB_COMPLETED
+    assert job.processed == 3
+    assert get_alias_targets(alias) == [job.index_name]
+    assert es_client.count(index=alias)["count"] == 3
+
+def test_old_version_cleanup_keeps_resumable_job_index(tmp_path, job_manager, monkeypatch):
+    """재적재 후 오래된 버전 정리는 재개할 수 있는 작업의 인덱스를 삭제하지 않고 보존 수에도 포함하지 않음"""
+    import asyncio
+    from app.domain.trademark.index.index_versions import create_index_version, list_index_versions
+    from app.domain.trademark.services.load_trademark_data import load_trademark_data
+
+    monkeypatch.setattr(settings, "DB_INIT_MODE", "create")
+    monkeypatch.setattr(settings, "INDEX_RETAINED_VERSIONS", 1)
+    alias = settings.ELASTICSEARCH_INDEX
+
+    test_file = tmp_path / "reload_data.ndjson"
+    write_ndjson(test_file, [{"productName": "재적재 상표", "applicationNumber": "40-2023-3000000"}])
+
+    asyncio.run(load_trademark_data(str(test_file)))
+    rollback_index = list_index_versions(alias)[-1][1]
+
+    # 적재 중 실패한 작업의 새 버전 인덱스 (별칭으로 전환된 적 없음)
+    job_index = create_index_version(alias)
+    checkpoint_dir = tmp_path / "jobs"
+    checkpoint_dir.mkdir()
+    with open(checkpoint_dir / "pausedjob.json", "w", encoding="utf-8") as f:
+        json.dump({
+            "job_id": "pausedjob",
+            "file_path": str(test_file),
+            "mode": "create",
+            "status": JOB_FAILED,
+            "offset": 0,
+            "processed": 0,
+            "failed": 0,
+            "index": job_index
+        }, f)
+
+    asyncio.run(load_trademark_data(str(test_file)))
+
+    remaining = [index_name for _, index_name in list_index_versions(alias)]
+    assert job_index in remaining
+    assert rollback_index in remaining
+    assert len(remaining) == 3
+
+def test_ingest_job_conflict(tmp_path, job_manager):
+    """실행 중인 작업이 있으면 새 작업을 시작할 수 없음"""
+    test_file = tmp_path / "conflict_data.ndjson"
+    write_ndjson(test_file, [{"productName": "충돌 상표", "applicationNumber": "40-2023-4000000"}])
+
+    job_manager._jobs["runningjob"] = IngestJob("runningjob", str(test_file), "update")
+    with pytest.raises(IngestJobConflictError):
+        job_manager.start(str(test_file))
+
+def test_ingest_job_not_found(job_manager):
+    """존재하지 않는 작업 조회 테스트"""
+    with pytest.raises(IngestJobNotFoundError):
+        job_manager.get("missingjob")
+
+    with pytest.raises(IngestJobNotFoundError):
+        job_manager.get("../etc/passwd")
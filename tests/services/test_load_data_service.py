@@ -95,4 +95,140 @@ async def test_load_data_update_mode(tmp_path, create_test_index, index_test_dat
         assert count == 2  # 기존 1개 + 새로운 1개
         
     finally:
-        settings.DB_INIT_MODE = original_mode
\ No newline at end of file
+        settings.DB_INIT_MODE = original_mode
+@pytest.mark.asyncio
+async def test_load_data_parallel_preprocess(tmp_path, create_test_index):
+    """작업 프로세스 병렬 전처리로 적재해도 모든 문서가 전처리되어 색인됨"""
+    create_test_index()
+    
+    test_data = [
+        {"productName": f"테스트 상표{i}", "productNameEng": "FRESCA", "applicationNumber": f"40-2023-{i:07d}"}
+        for i in range(25)
+    ]
+    test_file = tmp_path / "parallel_data.json"
+    with open(test_file, "w", encoding="utf-8") as f:
+        json.dump(test_data, f)
+    
+    original_batch_size = settings.INGEST_PREPROCESS_BATCH_SIZE
+    settings.INGEST_PREPROCESS_BATCH_SIZE = 4
+    
+    try:
+        result = await load_trademark_data(str(test_file), preprocess_workers=2)
+    finally:
+        settings.INGEST_PREPROCESS_BATCH_SIZE = original_batch_size
+    
+    assert result["success"] == 25
+    assert result["failed"] == 0
+    
+    from app.core.elasticsearch import es_client
+    doc = es_client.get(index=settings.ELASTICSEARCH_INDEX, id="40-2023-0000007")["_source"]
+    assert doc["productName_chosung"] == "ㅌㅅㅌ ㅅㅍ7"
+    assert doc["productNameEngPronunciation"] == "프레스카"
+    assert doc["pid"]
+
+@pytest.mark.asyncio
+async def test_load_data_create_mode_swaps_alias(tmp_path, create_test_index):
+    """create 모드 재적재는 새 버전 인덱스에 적재한 뒤 별칭을 전환하고 오래된 버전을 정리"""
+    from app.core.elasticsearch import es_client
+    from app.domain.trademark.index.index_versions import get_alias_targets, list_index_versions
+    
+    create_test_index()
+    alias = settings.ELASTICSEARCH_INDEX
+    
+    results = []
+    for i in range(3):
+        test_file = tmp_path / f"reload_{i}.json"
+        with open(test_file, "w", encoding="utf-8") as f:
+            json.dump([{"productName": f"재적재 상표{i}", "applicationNumber": f"40-2024-000000{i}"}], f)
+        results.append(await load_trademark_data(str(test_file)))
+    
+    # 별칭은 마지막 버전만 가리키고, 직전 버전 하나만 롤백용으로 남음
+    assert get_alias_targets(alias) == [results[-1]["index"]]
+    assert [name for _, name in list_index_versions(alias)] == [results[-2]["index"], results[-1]["index"]]
+    assert es_client.count(index=alias)["count"] == 1
+    assert es_client.get(index=alias, id="40-2024-0000002")["_source"]["productName"] == "재적재 상표2"
+    
+    # 적재용 설정은 복원됨
+    index_settings = es_client.indices.get_settings(index=results[-1]["index"])[results[-1]["index"]]["settings"]["index"]
+    assert index_settings["refresh_interval"] == "5s"
+
+@pytest.mark.asyncio
+async def test_load_data_failure_keeps_live_index(create_test_index, index_test_data):
+    """재적재가 실패하면 별칭은 기존 버전을 유지하고 만들던 인덱스는 삭제"""
+    from app.domain.trademark.index.index_versions import get_alias_targets, list_index_versions
+    
+    create_test_index()
+    index_test_data({"productName": "기존 상표", "applicationNumber": "40-2022-0000001"})
+    alias = settings.ELASTICSEARCH_INDEX
+    live = get_alias_targets(alias)
+    
+    with pytest.raises(Exception):
+        await load_trademark_data("non_existent_file.json")
+    
+    assert get_alias_targets(alias) == live
+    assert [name for _, name in list_index_versions(alias)] == live
+
+def test_bulk_load_mode_restores_settings_on_failure(create_test_index):
+    """벌크 적재 모드는 적재 중 설정을 바꾸고, 예외가 나도 원래 설정으로 복원"""
+    from app.core.elasticsearch import es_client
+    from app.domain.trademark.index.bulk_load_mode import bulk_load_mode
+    
+    create_test_index()
+    index_name = settings.ELASTICSEARCH_INDEX
+    
+    def current_settings():
+        response = es_client.indices.get_settings(index=index_name, flat_settings=True)
+        return next(iter(response.values()))["settings"]
+    
+    with pytest.raises(RuntimeError):
+        with bulk_load_mode(index_name, async_translog=True, enabled=True):
+            tuned = current_settings()
+            assert tuned["index.refresh_interval"] == "-1"
+            assert tuned["index.number_of_replicas"] == "0"
+            assert tuned["index.translog.durability"] == "async"
+            raise RuntimeError("적재 실패")
+    
+    restored = current_settings()
+    assert restored["index.refresh_interval"] == "5s"
+    assert "index.translog.durability" not in restored
+
+@pytest.mark.asyncio
+async def test_load_data_delta_mode(tmp_path, create_test_index):
+    """증분 적재는 바뀐 레코드만 반영하고 pid/조회수를 유지하며, 선택적으로 누락 문서를 삭제"""
+    from app.core.elasticsearch import es_client
+    from app.domain.trademark.services.delta_ingest import load_trademark_delta
+    
+    create_test_index()
+    base_data = [
+        {"productName": "유지 상표", "applicationNumber": "40-2023-0000001"},
+        {"productName": "변경 전 상표", "applicationNumber": "40-2023-0000002"},
+        {"productName": "삭제될 상표", "applicationNumber": "40-2023-0000003"}
+    ]
+    base_file = tmp_path / "base.json"
+    base_file.write_text(json.dumps(base_data, ensure_ascii=False), encoding="utf-8")
+    await load_trademark_data(str(base_file))
+    
+    alias = settings.ELASTICSEARCH_INDEX
+    before = es_client.get(index=alias, id="40-2023-0000002")["_source"]
+    es_client.update(index=alias, id="40-2023-0000002", body={"doc": {"viewCount": 7}}, refresh=True)
+    
+    # 같은 레코드의 키 순서만 바뀐 경우는 미변경으로 처리
+    delta_data = [
+        {"applicationNumber": "40-2023-0000001", "productName": "유지 상표"},
+        {"productName": "변경 후 상표", "applicationNumber": "40-2023-0000002"},
+        {"productName": "새 상표", "applicationNumber": "40-2023-0000004"}
+    ]
+    delta_file = tmp_path / "delta.json"
+    delta_file.write_text(json.dumps(delta_data, ensure_ascii=False), encoding="utf-8")
+    
+    result = await load_trademark_delta(str(delta_file), delete_missing=True)
+    
+    assert (result["unchanged"], result["updated"], result["created"], result["deleted"]) == (1, 1, 1, 1)
+    
+    changed = es_client.get(index=alias, id="40-2023-0000002")["_source"]
+    assert changed["productName"] == "변경 후 상표"
+    assert changed["productName_chosung"] == "ㅂㄱ ㅎ ㅅㅍ"
+    assert changed["viewCount"] == 7
+    assert changed["pid"] == before["pid"]
+    assert not es_client.exists(index=alias, id="40-2023-0000003")
+    assert es_client.count(index=alias)["count"] == 3
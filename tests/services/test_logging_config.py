@@ -0,0 +1,91 @@
+"""
+로깅 설정 테스트 모듈
+"""
+import json
+import os
+import random
+from datetime import datetime, timedelta
+
+from loguru import logger
+
+from app.core.logging_config import BatchedJsonSink, LogSampler
+
+def test_sampler_prefix_rate_resolution():
+    """하위 모듈은 가장 가까운 상위 이름의 비율을 따르고, 설정이 없으면 샘플링하지 않음"""
+    sampler = LogSampler.from_setting("app.domain=0.5, app.domain.trademark.routers=0.1,")
+
+    assert sampler.rates == {"app.domain": 0.5, "app.domain.trademark.routers": 0.1}
+    assert sampler._rate_for("app.domain.trademark.routers.trademark_router") == 0.1
+    assert sampler._rate_for("app.domain.trademark.services.search_trademarks") == 0.5
+    assert sampler._rate_for("app.domainx") is None
+    assert sampler._rate_for("app.core.middleware") is None
+    assert LogSampler.from_setting("").rates == {}
+
+def test_sampler_decides_once_for_all_sinks():
+    """샘플링 여부는 레코드마다 한 번 정해져 모든 싱크에 같은 로그가 남고, WARNING 이상은 항상 기록"""
+    sampler = LogSampler({})
+
+    def sink_filter(record):
+        return record["extra"].get("sampler_test", False) and sampler(record)
+
+    # 콘솔, 파일처럼 같은 필터를 쓰는 두 싱크
+    sinks = ([], [])
+    handler_ids = [logger.add(sink.append, format="{message}", filter=sink_filter) for sink in sinks]
+    test_logger = logger.patch(sampler.decide).bind(sampler_test=True, sample_rate=0.5)
+
+    random.seed(0)
+    try:
+        for i in range(200):
+            test_logger.info("info {}", i)
+        test_logger.warning("warning")
+    finally:
+        for handler_id in handler_ids:
+            logger.remove(handler_id)
+
+    console, json_file = [[message.strip() for message in sink] for sink in sinks]
+    assert console == json_file
+    assert 0 < len(console) < 201
+    assert console[-1] == "warning"
+
+def test_json_sink_flushes_on_stop(tmp_path):
+    """logger.remove() 시 큐에 남은 로그를 모두 기록 (샘플링 결정 키는 기록하지 않음)"""
+    sink = BatchedJsonSink(str(tmp_path), batch_size=8)
+    handler_id = logger.add(sink, format="{message}", filter=lambda record: record["extra"].get("sink_test"))
+
+    test_logger = logger.bind(sink_test=True, _sampled=True)
+    for i in range(100):
+        test_logger.info("기록 {}", i)
+    logger.remove(handler_id)
+
+    path = tmp_path / f"trademark_api_{datetime.now():%Y%m%d}.jsonl"
+    entries = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [entry["message"] for entry in entries] == [f"기록 {i}" for i in range(100)]
+    assert entries[0]["extra"] == {"sink_test": True}
+
+def test_json_sink_rotates_by_date_and_removes_expired(tmp_path):
+    """날짜별 파일로 나누어 기록하고, 보관 기간이 지난 파일은 삭제"""
+    now = datetime.now().astimezone()
+    yesterday = now - timedelta(days=1)
+    expired = tmp_path / f"trademark_api_{now - timedelta(days=10):%Y%m%d}.jsonl"
+    retained = tmp_path / f"trademark_api_{now - timedelta(days=3):%Y%m%d}.jsonl"
+    other = tmp_path / f"other_{now - timedelta(days=10):%Y%m%d}.jsonl"
+    for path in (expired, retained, other):
+        path.write_text("{}\n", encoding="utf-8")
+
+    sink = BatchedJsonSink(str(tmp_path), retention_days=7)
+    try:
+        sink._write_batch([
+            (yesterday, "INFO", "test", "fn", 1, "어제", {"request_id": "-"}, None),
+            (now, "INFO", "test", "fn", 2, "오늘", {"request_id": "req"}, None)
+        ])
+    finally:
+        sink.stop()
+
+    yesterday_lines = (tmp_path / f"trademark_api_{yesterday:%Y%m%d}.jsonl").read_text(encoding="utf-8").splitlines()
+    today_lines = (tmp_path / f"trademark_api_{now:%Y%m%d}.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["message"] for line in yesterday_lines] == ["어제"]
+    assert json.loads(today_lines[0])["request_id"] == "req"
+
+    assert not expired.exists()
+    assert retained.exists()
+    assert os.path.exists(other)
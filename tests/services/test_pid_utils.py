@@ -0,0 +1,53 @@
+"""
+pid 시퀀스 테스트 모듈
+"""
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.config import settings
+from app.core.elasticsearch import es_client
+from app.domain.trademark.services.pid_utils import PidSequence, is_valid_pid
+
+@pytest.fixture
+def clean_sequence():
+    """테스트 인덱스의 pid 카운터 문서 정리"""
+    def _delete():
+        if es_client.indices.exists(index=settings.PID_SEQUENCE_INDEX):
+            es_client.delete(
+                index=settings.PID_SEQUENCE_INDEX,
+                id=settings.ELASTICSEARCH_INDEX,
+                ignore=[404]
+            )
+    _delete()
+    yield
+    _delete()
+
+def test_pid_sequence_is_sequential(clean_sequence):
+    """블록 내 pid는 1부터 순차 증가"""
+    sequence = PidSequence(settings.ELASTICSEARCH_INDEX, block_size=5)
+
+    pids = [sequence.next_pid() for _ in range(12)]
+
+    assert pids == [str(i) for i in range(1, 13)]
+    assert all(is_valid_pid(pid) for pid in pids)
+
+def test_pid_sequence_unique_across_instances(clean_sequence):
+    """서로 다른 인스턴스(다른 프로세스 역할)가 번갈아 임대해도 pid가 중복되지 않음"""
+    first = PidSequence(settings.ELASTICSEARCH_INDEX, block_size=3)
+    second = PidSequence(settings.ELASTICSEARCH_INDEX, block_size=3)
+
+    pids = []
+    for _ in range(10):
+        pids.append(first.next_pid())
+        pids.append(second.next_pid())
+
+    assert len(set(pids)) == len(pids)
+
+def test_pid_sequence_thread_safe(clean_sequence):
+    """여러 스레드에서 동시에 pid를 발급해도 중복되지 않음"""
+    sequence = PidSequence(settings.ELASTICSEARCH_INDEX, block_size=50)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pids = list(executor.map(lambda _: sequence.next_pid(), range(400)))
+
+    assert len(set(pids)) == 400
@@ -0,0 +1,44 @@
+"""
+발음 변환 캐시 테스트 모듈
+"""
+from app.domain.trademark.services.pronunciation_cache import PronunciationCache
+
+def test_memory_hit_and_miss(tmp_path):
+    """저장 전에는 미스, 저장 후에는 메모리 적중"""
+    cache = PronunciationCache(str(tmp_path / "cache.sqlite3"), memory_size=10)
+
+    assert cache.get("fresca") is None
+    cache.put("fresca", "프레스카")
+    assert cache.get("FRESCA ") == "프레스카"
+
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["memory_hits"] == 1
+    assert stats["hit_rate"] == 0.5
+
+def test_persisted_across_instances(tmp_path):
+    """flush한 결과는 새 인스턴스(프로세스 재시작)에서 디스크 적중"""
+    path = str(tmp_path / "cache.sqlite3")
+    cache = PronunciationCache(path, memory_size=10)
+    cache.put("samsung", "삼성")
+    cache.flush()
+
+    reopened = PronunciationCache(path, memory_size=10)
+
+    assert reopened.get("samsung") == "삼성"
+    assert reopened.stats()["disk_hits"] == 1
+    # 디스크에서 읽은 값은 메모리에 올라감
+    assert reopened.get("samsung") == "삼성"
+    assert reopened.stats()["memory_hits"] == 1
+
+def test_memory_lru_limit(tmp_path):
+    """메모리 LRU는 상한을 넘으면 오래된 항목부터 제거(디스크에는 남음)"""
+    cache = PronunciationCache(str(tmp_path / "cache.sqlite3"), memory_size=2)
+    cache.put("a", "에이")
+    cache.put("b", "비")
+    cache.put("c", "시")
+    cache.flush()
+
+    assert cache.stats()["memory_entries"] == 2
+    assert cache.get("a") == "에이"
+    assert cache.stats()["disk_hits"] == 1
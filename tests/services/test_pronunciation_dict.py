@@ -0,0 +1,56 @@
+"""
+발음 사전 테스트 모듈
+"""
+import json
+import os
+
+from app.domain.trademark.services.pronunciation_dict import PronunciationDict, tokenize
+
+def write_dict(path, entries, mtime=None):
+    path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+def test_longest_match(tmp_path):
+    """여러 단어 항목은 가장 긴 항목으로 일치"""
+    path = tmp_path / "dict.json"
+    write_dict(path, {"andy": "앤디", "andy warhol": "앤디 워홀", "dr. system": "닥터 시스템"})
+    pronunciation_dict = PronunciationDict(str(path))
+
+    words = tokenize("Andy Warhol Dr. System Andy")
+
+    assert pronunciation_dict.match(words, 0) == ("앤디 워홀", 2)
+    assert pronunciation_dict.match(words, 2) == ("닥터 시스템", 2)
+    assert pronunciation_dict.match(words, 4) == ("앤디", 1)
+    assert pronunciation_dict.match(tokenize("warhol"), 0) is None
+
+def test_hot_reload(tmp_path):
+    """파일이 바뀌면 확인 간격 이후 재로드"""
+    path = tmp_path / "dict.json"
+    write_dict(path, {"fresca": "프레스카"}, mtime=1000)
+    pronunciation_dict = PronunciationDict(str(path), reload_interval=0)
+    assert pronunciation_dict.match(["fresca"], 0) == ("프레스카", 1)
+
+    write_dict(path, {"fresca": "후레스카"}, mtime=2000)
+
+    assert pronunciation_dict.match(["fresca"], 0) == ("후레스카", 1)
+
+def test_missing_file(tmp_path):
+    """파일이 없으면 빈 사전으로 동작"""
+    pronunciation_dict = PronunciationDict(str(tmp_path / "missing.json"))
+
+    assert pronunciation_dict.match(["fresca"], 0) is None
+    assert pronunciation_dict.stats()["entries"] == 0
+
+def test_conversion_uses_dict_first():
+    """발음 변환 시 사전 항목 우선, 사전 사용 비율 집계"""
+    from app.domain.trademark.services.pronunciation_dict import pronunciation_dict
+    from app.domain.trademark.services.pronunciation_utils import english_to_korean_pronunciation
+
+    before = pronunciation_dict.stats()
+
+    assert english_to_korean_pronunciation("Andy Warhol") == "앤디 워홀"
+
+    after = pronunciation_dict.stats()
+    assert after["dict_words"] - before["dict_words"] == 2
+    assert after["dict_share"] > 0
@@ -0,0 +1,50 @@
+"""
+일괄 검색 테스트 모듈
+"""
+import pytest
+
+from app.core.config import settings
+from app.domain.trademark.services.search_batch import search_trademarks_batch
+from app.domain.trademark.services.search_trademarks import search_trademarks
+from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams
+
+@pytest.mark.asyncio
+async def test_batch_search_matches_single_search(create_test_index, index_test_data, monkeypatch):
+    """일괄 검색 결과는 요청 순서대로 개별 검색 결과와 같음"""
+    # 개별 검색이 일괄 검색이 캐시한 결과를 그대로 반환하지 않도록 캐시를 끄고 비교
+    monkeypatch.setattr(settings, "SEARCH_CACHE_ENABLED", False)
+    create_test_index()
+    index_test_data({"pid": "pid_1", "productName": "삼성전자", "registerStatus": "등록"}, refresh=False)
+    index_test_data({"pid": "pid_2", "productName": "삼성물산", "registerStatus": "출원"}, refresh=False)
+    index_test_data({"pid": "pid_3", "productName": "엘지전자", "registerStatus": "등록"})
+
+    params_list = [
+        TrademarkSearchParams(query="삼성"),
+        TrademarkSearchParams(status="등록"),
+        TrademarkSearchParams(query="없는상표")
+    ]
+
+    responses = await search_trademarks_batch(params_list)
+
+    assert [response["status"] for response in responses] == [200, 200, 200]
+    for response, params in zip(responses, params_list):
+        single = await search_trademarks(params)
+        assert response["result"]["total"] == single["total"]
+        assert [tm["pid"] for tm in response["result"]["results"]] == [tm["pid"] for tm in single["results"]]
+
+@pytest.mark.asyncio
+async def test_batch_search_reports_errors_per_query(create_test_index, index_test_data):
+    """하위 쿼리 하나가 실패해도 나머지 결과는 반환"""
+    create_test_index()
+    index_test_data({"pid": "pid_1", "productName": "삼성전자", "registerStatus": "등록"})
+
+    responses = await search_trademarks_batch([
+        TrademarkSearchParams(status="등록"),
+        # max_result_window(10000)를 넘는 페이지는 Elasticsearch에서 거부
+        TrademarkSearchParams(status="등록", page=2000, size=10)
+    ])
+
+    assert responses[0]["status"] == 200
+    assert responses[0]["result"]["total"] == 1
+    assert responses[1]["status"] >= 400
+    assert responses[1]["error"]
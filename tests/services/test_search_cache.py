@@ -0,0 +1,95 @@
+"""
+검색 결과 캐시 테스트 모듈
+"""
+from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams, SortOption, SortField
+from app.domain.trademark.services.search_cache import SearchResultCache, make_fingerprint, estimate_size
+
+class FakeClock:
+    """TTL 테스트용 시계"""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def make_result(name: str, padding: int = 0):
+    return {"total": 1, "page": 1, "size": 10, "results": [{"productName": name + "x" * padding}]}
+
+def test_fingerprint_is_canonical():
+    """공백/키 순서가 달라도 같은 조건이면 같은 지문"""
+    first = TrademarkSearchParams(query=" 프레스카 ", status="등록")
+    second = TrademarkSearchParams(status="등록", query="프레스카")
+    other_page = TrademarkSearchParams(query="프레스카", status="등록", page=2)
+
+    assert make_fingerprint("trademarks", first.dict()) == make_fingerprint("trademarks", second.dict())
+    assert make_fingerprint("trademarks", first.dict()) != make_fingerprint("trademarks", other_page.dict())
+    assert make_fingerprint("trademarks", first.dict()) != make_fingerprint("other", first.dict())
+
+def test_fingerprint_includes_sort():
+    """정렬 조건이 다르면 다른 지문"""
+    params = TrademarkSearchParams(query="프레스카")
+    sorted_params = TrademarkSearchParams(query="프레스카", sort=[SortOption(field=SortField.VIEW_COUNT)])
+
+    assert make_fingerprint("trademarks", params.dict()) != make_fingerprint("trademarks", sorted_params.dict())
+
+def test_cache_hit_and_miss():
+    """저장 후 조회 시 적중, 없는 키는 미스"""
+    cache = SearchResultCache(max_bytes=10000, ttl_seconds=60)
+    generation = cache.generation
+
+    assert cache.get("a") is None
+    cache.put("a", make_result("a"), generation)
+    assert cache.get("a") == make_result("a")
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+def test_cache_ttl_expiration():
+    """TTL이 지나면 만료"""
+    clock = FakeClock()
+    cache = SearchResultCache(max_bytes=10000, ttl_seconds=5, clock=clock)
+    cache.put("a", make_result("a"), cache.generation)
+
+    clock.now = 4.9
+    assert cache.get("a") is not None
+
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+def test_cache_lru_eviction_by_bytes():
+    """바이트 상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거"""
+    entry_size = estimate_size(make_result("a"))
+    cache = SearchResultCache(max_bytes=entry_size * 2, ttl_seconds=60)
+    generation = cache.generation
+
+    cache.put("a", make_result("a"), generation)
+    cache.put("b", make_result("b"), generation)
+    cache.get("a")  # a를 최근 사용으로 갱신
+    cache.put("c", make_result("c"), generation)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] <= entry_size * 2
+
+def test_oversized_entry_not_cached():
+    """상한보다 큰 항목은 저장하지 않음"""
+    cache = SearchResultCache(max_bytes=100, ttl_seconds=60)
+    cache.put("big", make_result("big", padding=500), cache.generation)
+
+    assert cache.stats()["entries"] == 0
+
+def test_generation_bump_invalidates():
+    """세대 변경 시 기존 항목 무효화, 이전 세대로 시작한 검색 결과는 저장하지 않음"""
+    cache = SearchResultCache(max_bytes=10000, ttl_seconds=60)
+    old_generation = cache.generation
+    cache.put("a", make_result("a"), old_generation)
+
+    new_generation = cache.bump_generation()
+
+    assert cache.get("a") is None
+    cache.put("b", make_result("b"), old_generation)
+    assert cache.get("b") is None
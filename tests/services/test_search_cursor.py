@@ -0,0 +1,65 @@
+"""
+커서 페이지네이션 테스트 모듈
+"""
+import pytest
+
+from app.domain.trademark.services.search_cursor import (
+    search_trademarks_by_cursor,
+    encode_cursor,
+    decode_cursor,
+    CURSOR_START
+)
+from app.domain.trademark.schemas.trademark_search_params import TrademarkSearchParams
+from app.core.exceptions import InvalidCursorError
+from app.core.slow_query_log import slow_query_log
+
+def test_cursor_token_roundtrip():
+    """커서 토큰 인코딩/디코딩"""
+    state = {"pit": "abc==", "after": [1.5, "pid_1", 7], "fp": "f", "page": 3, "total": 42}
+
+    assert decode_cursor(encode_cursor(state)) == state
+
+@pytest.mark.parametrize("token", ["not-a-cursor", encode_cursor({"pit": "abc"}), ""])
+def test_invalid_cursor_token(token):
+    """형식이 잘못된 커서는 InvalidCursorError"""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token)
+
+@pytest.mark.asyncio
+async def test_cursor_walks_all_pages(create_test_index, index_test_data):
+    """커서로 끝까지 조회하면 모든 문서를 중복 없이 한 번씩 반환"""
+    create_test_index()
+    for i in range(7):
+        index_test_data({"pid": f"pid_{i}", "productName": f"커서 상표 {i}", "registerStatus": "등록"}, refresh=False)
+    index_test_data({"pid": "pid_x", "productName": "다른 상표", "registerStatus": "출원"})
+
+    slow_query_log.clear()
+    params = TrademarkSearchParams(status="등록", size=3)
+    seen = []
+    cursor = CURSOR_START
+    pages = 0
+    while cursor:
+        result = await search_trademarks_by_cursor(params, cursor)
+        assert result["total"] == 7
+        seen.extend(tm["pid"] for tm in result["results"])
+        cursor = result["next_cursor"]
+        pages += 1
+
+    assert pages == 3
+    assert seen == sorted(seen)
+    assert len(seen) == len(set(seen)) == 7
+
+    # 경로에 인덱스가 없는 PIT 검색은 느린 쿼리 로그에 인덱스 없이 기록
+    assert [item["example"]["index"] for item in slow_query_log.snapshot()] == [None]
+
+@pytest.mark.asyncio
+async def test_cursor_rejects_changed_params(create_test_index, index_test_data):
+    """커서를 발급한 검색 조건과 다른 조건으로 요청하면 거부"""
+    create_test_index()
+    for i in range(3):
+        index_test_data({"pid": f"pid_{i}", "productName": f"커서 상표 {i}", "registerStatus": "등록"})
+
+    first = await search_trademarks_by_cursor(TrademarkSearchParams(status="등록", size=2), CURSOR_START)
+
+    with pytest.raises(InvalidCursorError):
+        await search_trademarks_by_cursor(TrademarkSearchParams(status="출원", size=2), first["next_cursor"])
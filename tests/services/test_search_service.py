@@ -9,6 +9,7 @@ from app.domain.trademark.schemas.trademark_search_params import TrademarkSearch
 from app.core.exceptions import IndexNotFoundError, SearchQueryError
 from app.core.elasticsearch import es_client
 from app.core.config import settings
+from app.domain.trademark.index.index_versions import delete_index_versions
 
 # 테스트용 더미 데이터 세트
 SAMPLE_DATA = [
@@ -75,8 +76,7 @@ def setup_test_data(create_test_index, index_test_data):
 async def test_search_without_index():
     """존재하지 않는 인덱스에서 검색 시 예외 처리 테스트"""
     # Elasticsearch 인덱스가 없는 상태에서 검색
-    if es_client.indices.exists(index=settings.ELASTICSEARCH_INDEX):
-        es_client.indices.delete(index=settings.ELASTICSEARCH_INDEX)
+    delete_index_versions(settings.ELASTICSEARCH_INDEX)
     
     search_params = TrademarkSearchParams(query="테스트", page=1, size=10)
     
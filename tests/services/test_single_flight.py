@@ -0,0 +1,76 @@
+"""
+요청 병합(single-flight) 테스트 모듈
+"""
+import asyncio
+
+import pytest
+
+from app.domain.trademark.services.single_flight import SingleFlight
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    """같은 키의 동시 호출은 한 번만 실행하고 결과를 공유"""
+    flight = SingleFlight("test")
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"total": 1}
+
+    results = await asyncio.gather(*(flight.do("q", fetch) for _ in range(50)))
+
+    assert calls == 1
+    assert all(result == {"total": 1} for result in results)
+    stats = flight.stats()
+    assert stats["calls"] == 50
+    assert stats["executions"] == 1
+    assert stats["coalescing_ratio"] == 0.98
+    assert stats["in_flight"] == 0
+
+@pytest.mark.asyncio
+async def test_different_keys_and_sequential_calls_execute_separately():
+    """키가 다르거나 이전 호출이 끝난 뒤의 호출은 각각 실행"""
+    flight = SingleFlight("test")
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0)
+        return key
+
+    assert await asyncio.gather(flight.do("a", lambda: fetch("a")), flight.do("b", lambda: fetch("b"))) == ["a", "b"]
+    assert await flight.do("a", lambda: fetch("a")) == "a"
+    assert calls == ["a", "b", "a"]
+
+@pytest.mark.asyncio
+async def test_exception_is_shared():
+    """실행 중 예외는 대기 중인 모든 호출에 전달"""
+    flight = SingleFlight("test")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("es error")
+
+    results = await asyncio.gather(*(flight.do("q", fail) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.stats()["executions"] == 1
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_others():
+    """먼저 들어온 요청이 취소되어도 나머지 요청은 결과를 받음"""
+    flight = SingleFlight("test")
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    first = asyncio.ensure_future(flight.do("q", fetch))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(flight.do("q", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "ok"
@@ -0,0 +1,120 @@
+"""
+상표 상세 조회 서비스 테스트 모듈
+"""
+import json
+import pytest
+
+from app.core.config import settings
+from app.core.elasticsearch import es_client
+from app.domain.trademark.services.load_trademark_data import load_trademark_data
+from app.domain.trademark.services.trademark_detail_service import (
+    get_trademark_by_application_number,
+    get_trademarks_by_application_numbers
+)
+from app.domain.trademark.index.migrate_document_ids import migrate_document_ids
+from app.domain.trademark.index.index_versions import delete_index_versions
+from app.core.exceptions import IndexNotFoundError, InvalidParameterError
+
+TEST_DATA = [
+    {"productName": "프레스카", "productNameEng": "FRESCA", "applicationNumber": "4019950043843"},
+    {"productName": "간호사 타이쿤", "applicationNumber": "4020200000001"}
+]
+
+@pytest.mark.asyncio
+async def test_loaded_documents_use_application_number_as_id(tmp_path, create_test_index):
+    """적재된 문서의 _id가 출원번호이고 GET으로 조회되는지 테스트"""
+    create_test_index()
+
+    test_file = tmp_path / "detail.json"
+    test_file.write_text(json.dumps(TEST_DATA, ensure_ascii=False), encoding="utf-8")
+    await load_trademark_data(str(test_file))
+
+    doc = es_client.get(index=settings.ELASTICSEARCH_INDEX, id="4019950043843")
+    assert doc["_source"]["productName"] == "프레스카"
+
+    trademark = await get_trademark_by_application_number("4020200000001")
+    assert trademark["productName"] == "간호사 타이쿤"
+
+    assert await get_trademark_by_application_number("4000000000000") is None
+
+@pytest.mark.asyncio
+async def test_legacy_auto_id_lookup(create_test_index, index_test_data):
+    """자동 생성 _id로 색인된 문서도 출원번호로 조회되는지 테스트"""
+    create_test_index()
+    index_test_data({"productName": "기존 상표", "applicationNumber": "40-2022-0000001"})
+
+    trademark = await get_trademark_by_application_number("40-2022-0000001")
+
+    assert trademark["productName"] == "기존 상표"
+
+@pytest.mark.asyncio
+async def test_detail_without_index():
+    """인덱스가 없으면 IndexNotFoundError 발생"""
+    delete_index_versions(settings.ELASTICSEARCH_INDEX)
+
+    with pytest.raises(IndexNotFoundError):
+        await get_trademark_by_application_number("4019950043843")
+
+@pytest.mark.asyncio
+async def test_batch_lookup_keeps_input_order(tmp_path, create_test_index, index_test_data):
+    """일괄 조회는 요청 순서대로 반환하고, 청크 경계/기존 _id 문서/없는 출원번호를 처리"""
+    create_test_index()
+    test_file = tmp_path / "detail.json"
+    test_file.write_text(json.dumps(TEST_DATA, ensure_ascii=False), encoding="utf-8")
+    await load_trademark_data(str(test_file))
+    index_test_data({"productName": "기존 상표", "applicationNumber": "40-2022-0000001"})
+
+    original_chunk_size = settings.DETAIL_BATCH_CHUNK_SIZE
+    settings.DETAIL_BATCH_CHUNK_SIZE = 2
+    try:
+        results, not_found = await get_trademarks_by_application_numbers(
+            ["4020200000001", "4000000000000", "40-2022-0000001", "4019950043843", "4020200000001"],
+            fields=["productName"]
+        )
+    finally:
+        settings.DETAIL_BATCH_CHUNK_SIZE = original_chunk_size
+
+    assert results == [
+        {"productName": "간호사 타이쿤"},
+        {"productName": "기존 상표"},
+        {"productName": "프레스카"}
+    ]
+    assert not_found == ["4000000000000"]
+
+@pytest.mark.asyncio
+async def test_batch_lookup_rejects_unknown_fields():
+    """응답 모델에 없는 필드는 거부"""
+    with pytest.raises(InvalidParameterError):
+        await get_trademarks_by_application_numbers(["4019950043843"], fields=["password"])
+
+def test_migrate_document_ids(create_test_index, index_test_data):
+    """기존 인덱스를 출원번호 _id 인덱스로 마이그레이션"""
+    create_test_index()
+    index_test_data({"productName": "기존 상표", "applicationNumber": "40-2022-0000001"})
+
+    dest_index = f"{settings.ELASTICSEARCH_INDEX}_migrated"
+    try:
+        result = migrate_document_ids(dest_index=dest_index)
+
+        assert result["created"] == 1
+        doc = es_client.get(index=dest_index, id="40-2022-0000001")
+        assert doc["_source"]["productName"] == "기존 상표"
+    finally:
+        es_client.indices.delete(index=dest_index, ignore=[404])
+
+def test_migrate_document_ids_swap(index_test_data):
+    """별칭 도입 이전의 물리 인덱스는 같은 요청에서 삭제하고 원본 이름을 별칭으로 전환"""
+    source_index = settings.ELASTICSEARCH_INDEX
+    es_client.indices.create(index=source_index)
+    index_test_data({"productName": "기존 상표", "applicationNumber": "40-2022-0000002"})
+
+    dest_index = f"{source_index}_migrated"
+    try:
+        result = migrate_document_ids(dest_index=dest_index, swap=True)
+
+        assert result["swapped"]
+        assert list(es_client.indices.get_alias(name=source_index)) == [dest_index]
+        doc = es_client.get(index=source_index, id="40-2022-0000002")
+        assert doc["_source"]["productName"] == "기존 상표"
+    finally:
+        es_client.indices.delete(index=dest_index, ignore=[404])
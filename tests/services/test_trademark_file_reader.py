@@ -0,0 +1,93 @@
+"""
+상표 데이터 파일 스트리밍 리더 테스트 모듈
+"""
+import json
+import pytest
+
+from app.domain.trademark.services import trademark_file_reader
+from app.domain.trademark.services.trademark_file_reader import iter_trademark_records
+
+SAMPLE_RECORDS = [
+    {"productName": "프레스카", "productNameEng": "FRESCA", "applicationNumber": "4019950043843"},
+    {"productName": "간호사 타이쿤", "applicationNumber": "4020200000001", "asignProductMainCodeList": ["41"]},
+    {"productName": "중괄호 {} 와 [배열] 포함", "applicationNumber": "4020200000002"}
+]
+
+def test_iter_json_array(tmp_path):
+    """JSON 배열 파일을 작은 버퍼로 읽어도 모든 레코드를 순서대로 반환하는지 테스트"""
+    test_file = tmp_path / "array.json"
+    with open(test_file, "w", encoding="utf-8") as f:
+        json.dump(SAMPLE_RECORDS, f, ensure_ascii=False, indent=2)
+
+    # 레코드가 버퍼 경계에 걸리도록 아주 작은 읽기 단위 사용
+    records = list(iter_trademark_records(str(test_file), read_size=7))
+
+    assert records == SAMPLE_RECORDS
+
+def test_iter_ndjson(tmp_path):
+    """NDJSON 파일 읽기 테스트 (빈 줄은 무시)"""
+    test_file = tmp_path / "records.ndjson"
+    with open(test_file, "w", encoding="utf-8") as f:
+        for record in SAMPLE_RECORDS:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n\n")
+
+    records = list(iter_trademark_records(str(test_file)))
+
+    assert records == SAMPLE_RECORDS
+
+def test_iter_empty_array(tmp_path):
+    """빈 JSON 배열 테스트"""
+    test_file = tmp_path / "empty.json"
+    test_file.write_text("  [ ]  ", encoding="utf-8")
+
+    assert list(iter_trademark_records(str(test_file))) == []
+
+def test_iter_truncated_array(tmp_path):
+    """닫히지 않은 JSON 배열은 예외 발생"""
+    test_file = tmp_path / "truncated.json"
+    test_file.write_text('[{"productName": "테스트"}, {"productName"', encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        list(iter_trademark_records(str(test_file)))
+
+def test_iter_malformed_element_stops_at_max_record_size(tmp_path):
+    """잘못된 원소는 파일 나머지를 읽지 않고 최대 레코드 크기에서 바이트 오프셋과 함께 예외 발생"""
+    test_file = tmp_path / "malformed.json"
+    first = json.dumps(SAMPLE_RECORDS[0], ensure_ascii=False)
+    rest = ", ".join(json.dumps(record, ensure_ascii=False) for record in SAMPLE_RECORDS * 200)
+    test_file.write_text(f'[{first}, {{"productName": 테스트}}, {rest}]', encoding="utf-8")
+    malformed_offset = len(f"[{first}, ".encode("utf-8"))
+
+    reads = []
+
+    class CountingFile:
+        """읽은 바이트 수를 기록하는 파일 래퍼"""
+        def __init__(self, f):
+            self._f = f
+        def read(self, size=-1):
+            data = self._f.read(size)
+            reads.append(len(data))
+            return data
+        def __getattr__(self, name):
+            return getattr(self._f, name)
+
+    with open(test_file, "rb") as f:
+        records = trademark_file_reader._iter_json_array(CountingFile(f), read_size=64, max_record_size=256)
+        assert next(records)[0] == SAMPLE_RECORDS[0]
+        with pytest.raises(ValueError, match=f"바이트 오프셋 {malformed_offset}"):
+            next(records)
+
+    # 파일 크기(수십 KB)와 관계없이 최대 레코드 크기 근처까지만 읽음
+    assert test_file.stat().st_size > 10000
+    assert sum(reads) < 1024
+
+def test_iter_ndjson_line_too_long(tmp_path):
+    """최대 레코드 크기보다 긴 NDJSON 줄은 예외 발생"""
+    test_file = tmp_path / "long.ndjson"
+    lines = [json.dumps(record, ensure_ascii=False) for record in SAMPLE_RECORDS]
+    test_file.write_text(lines[0] + "\n" + "x" * 1000 + "\n", encoding="utf-8")
+
+    records = iter_trademark_records(str(test_file), max_record_size=256)
+    assert next(records) == SAMPLE_RECORDS[0]
+    with pytest.raises(ValueError, match=f"바이트 오프셋 {len(lines[0].encode('utf-8')) + 1}"):
+        next(records)
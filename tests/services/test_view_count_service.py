@@ -0,0 +1,93 @@
+"""
+조회수 버퍼 서비스 테스트 모듈
+"""
+import pytest
+
+from app.core.config import settings
+from app.core.elasticsearch import es_client
+from app.domain.trademark.services.view_count_service import ViewCountBuffer
+
+@pytest.fixture
+def indexed_trademark(create_test_index, index_test_data):
+    """조회수 테스트용 상표 문서 색인"""
+    create_test_index()
+    result = index_test_data({
+        "pid": "1001",
+        "productName": "조회수 상표",
+        "applicationNumber": "40-2023-0009999",
+        "viewCount": 2
+    })
+    return result["_id"]
+
+@pytest.mark.asyncio
+async def test_buffer_aggregates_increments(indexed_trademark):
+    """같은 pid의 증가분은 하나로 합쳐져 flush 시 한 번에 반영"""
+    buffer = ViewCountBuffer(flush_interval=60, max_pending=100)
+
+    for _ in range(3):
+        buffer.add("1001")
+
+    stats = buffer.stats()
+    assert stats["pending_trademarks"] == 1
+    assert stats["pending_views"] == 3
+
+    flushed = await buffer.flush()
+    assert flushed == 3
+    assert buffer.stats()["pending_views"] == 0
+
+    doc = es_client.get(index=settings.ELASTICSEARCH_INDEX, id=indexed_trademark)
+    assert doc["_source"]["viewCount"] == 5
+
+@pytest.mark.asyncio
+async def test_buffer_close_flushes_pending(indexed_trademark):
+    """종료 시 대기 중인 조회수 반영"""
+    buffer = ViewCountBuffer(flush_interval=60, max_pending=100)
+    buffer.start()
+    buffer.add("1001")
+
+    await buffer.close()
+
+    doc = es_client.get(index=settings.ELASTICSEARCH_INDEX, id=indexed_trademark)
+    assert doc["_source"]["viewCount"] == 3
+    assert buffer.stats()["flush_count"] == 1
+
+@pytest.mark.asyncio
+async def test_flush_empty_buffer():
+    """대기 중인 조회수가 없으면 아무 작업도 하지 않음"""
+    buffer = ViewCountBuffer()
+
+    assert await buffer.flush() == 0
+    assert buffer.stats()["flush_lag_seconds"] == 0.0
+
+@pytest.mark.asyncio
+async def test_flush_requeues_failed_updates(indexed_trademark, index_test_data, monkeypatch):
+    """벌크 업데이트에 실패한 증가분은 재시도 가능하면 버퍼에 되돌리고, 아니면 반영 수에서 제외하고 버림"""
+    from app.domain.trademark.services import view_count_service
+
+    missing_id = index_test_data({"pid": "1002", "productName": "삭제될 상표", "viewCount": 0})["_id"]
+
+    async def failing_bulk(client, actions, **kwargs):
+        errors = []
+        for action in actions:
+            status = 429 if action["_id"] == indexed_trademark else 404
+            errors.append({"update": {"_index": "physical", "_id": action["_id"], "status": status, "error": {}}})
+        return 0, errors
+
+    monkeypatch.setattr(view_count_service, "async_bulk", failing_bulk)
+
+    buffer = ViewCountBuffer(flush_interval=60, max_pending=100)
+    buffer.add("1001", 2)
+    buffer.add("1002", 3)
+
+    assert await buffer.flush() == 0
+    stats = buffer.stats()
+    assert stats["flushed_views"] == 0
+    assert stats["dropped_views"] == 3
+    assert stats["pending_views"] == 2  # 429는 재시도 대상
+
+    # 다음 flush에서 재시도하여 반영
+    monkeypatch.undo()
+    assert await buffer.flush() == 2
+    doc = es_client.get(index=settings.ELASTICSEARCH_INDEX, id=indexed_trademark)
+    assert doc["_source"]["viewCount"] == 4
+    assert es_client.get(index=settings.ELASTICSEARCH_INDEX, id=missing_id)["_source"]["viewCount"] == 0